@@ -1,12 +1,15 @@
 from flask import Flask, render_template, request, jsonify, send_file, Response
 from datetime import datetime
-from vedic.core import compute_chart
+from vedic.core import chart_static_tables, compute_chart_model, get_ephemeris_backend
 from timezonefinder import TimezoneFinder
 from zoneinfo import ZoneInfo
 from local_geocoder import LocalGeocoder
+from payload_encoding import dumps_json, encode_payload, JSON_MIMETYPE
+from compression import (COMPRESS_MIN_BYTES, COMPRESSIBLE_MIMETYPES, IMMUTABLE_CACHE_CONTROL, StaticAssets,
+                         choose_encoding, compress, precompress)
+import hashlib
 import os
 import time
-import json
 from io import StringIO
 
 tf = TimezoneFinder()
@@ -14,13 +17,76 @@ local_geocoder = LocalGeocoder()  # Initialize local geocoder
 
 app = Flask(__name__)
 
+# CSS and JS under static/, served from content-hashed URLs with precompressed bodies
+static_assets = StaticAssets(os.path.join(app.root_path, 'static'))
+
 # Simple in-memory cache for place queries: { query_lower: (timestamp, [ {name,lat,lon}, ... ]) }
 PLACES_CACHE = {}
 PLACES_CACHE_TTL = 60 * 60  # 1 hour
 
+@app.context_processor
+def inject_asset_url():
+    return {'asset_url': static_assets.url}
+
+def precompressed_response(variants, mimetype, headers=None):
+    """Serve the best of a body's precompress() variants for the request's Accept-Encoding."""
+    encoding = choose_encoding(request.accept_encodings, [e for e in variants if e is not None])
+    response = Response(variants[encoding], mimetype=mimetype, headers=headers or {})
+    if encoding is not None:
+        response.headers['Content-Encoding'] = encoding
+    response.vary.add('Accept-Encoding')
+    return response
+
+def cache_headers(tag, cache_control):
+    """Weak ETag (one body is served in several Content-Encodings) plus Cache-Control."""
+    return {'ETag': f'W/"{tag}"', 'Cache-Control': cache_control}
+
+def not_modified(tag):
+    """If-None-Match uses weak comparison, so both W/"tag" and "tag" match."""
+    return request.if_none_match.contains_weak(tag)
+
+# The page has no per-request content: render and compress it once (every request in debug)
+PAGE_CACHE = {}
+
 @app.route('/')
 def index():
-    return render_template('index.html')
+    if not PAGE_CACHE or app.debug:
+        html = render_template('index.html').encode('utf-8')
+        PAGE_CACHE['etag'] = hashlib.sha256(html).hexdigest()[:12]
+        PAGE_CACHE['variants'] = precompress(html)
+    headers = cache_headers(PAGE_CACHE['etag'], 'no-cache')
+    if not_modified(PAGE_CACHE['etag']):
+        return Response(status=304, headers=headers)
+    return precompressed_response(PAGE_CACHE['variants'], 'text/html', headers)
+
+@app.route('/assets/<path:hashed_path>')
+def asset(hashed_path):
+    """Static file by content-hashed path; the URL changes with the content, so it never expires."""
+    found = static_assets.get(hashed_path)
+    if found is None:
+        return Response(status=404)
+    return precompressed_response(found['variants'], found['mimetype'], {'Cache-Control': IMMUTABLE_CACHE_CONTROL})
+
+@app.after_request
+def compress_response(response):
+    """Compress API responses of at least COMPRESS_MIN_BYTES for clients accepting br or gzip."""
+    if (response.status_code != 200 or response.direct_passthrough
+            or 'Content-Encoding' in response.headers or response.mimetype not in COMPRESSIBLE_MIMETYPES):
+        return response
+    response.vary.add('Accept-Encoding')
+    body = response.get_data()
+    encoding = choose_encoding(request.accept_encodings)
+    if len(body) < COMPRESS_MIN_BYTES or encoding is None:
+        return response
+    response.set_data(compress(body, encoding))
+    response.headers['Content-Encoding'] = encoding
+    return response
+
+def encoded_response(data, headers=None):
+    """Response in the encoding the client accepts (minified JSON, MessagePack); ?pretty=1 indents JSON."""
+    pretty = request.args.get('pretty', '').lower() in ('1', 'true', 'yes')
+    body, mimetype = encode_payload(data, request.accept_mimetypes, pretty)
+    return Response(body, mimetype=mimetype, headers={'Vary': 'Accept', **(headers or {})})
 
 @app.route('/api/chart', methods=['POST'])
 def api_chart():
@@ -37,6 +103,14 @@ def api_chart():
         ayanamsa = (data.get('ayanamsa') or 'lahiri')
         system = (data.get('house_system') or 'equal')
         node_type = (data.get('node_type') or 'mean')
+        # Ephemeris precision: 'precise' (SWIEPH files when available) or 'moshier'
+        precision = (data.get('precision') or 'precise')
+        # Optional extra sidereal frames computed from the same tropical positions
+        ayanamsas = data.get('ayanamsas') or None
+        # Optional extra house systems sharing the same sidereal time
+        house_systems = data.get('house_systems') or None
+        # 'normalized' sends each repeated fact once; the page expands it on arrival
+        normalized = (data.get('payload') or 'full') == 'normalized'
 
         # If place provided, geocode to lat/lon using multi-source geocoder
         place = data.get('place')
@@ -69,22 +143,27 @@ def api_chart():
         else:
             tz_offset = float(raw_tz)
 
-        print(f"DEBUG: About to call compute_chart with:")
+        print(f"DEBUG: About to call compute_chart_model with:")
         print(f"  birth_dt: {birth_dt}")
         print(f"  lat: {lat}, lon: {lon}")
         print(f"  tz_offset: {tz_offset}")
         print(f"  ayanamsa: {ayanamsa}, system: {system}")
         
-        result = compute_chart(birth_dt, lat, lon, tz_offset, ayanamsa, system, node_type=node_type)
+        chart = compute_chart_model(birth_dt, lat, lon, tz_offset, ayanamsa, system, node_type=node_type,
+                                    precision=precision, ayanamsas=ayanamsas,
+                                    house_systems=house_systems)
         
-        print(f"DEBUG: compute_chart returned successfully")
-        print(f"DEBUG: Result keys: {list(result.keys())}")
+        # Keep the compact model for downloads; it pins "now", so downloads show the same
+        # transits and current periods as the page
+        global last_chart_model
+        last_chart_model = chart
+        # Static reference tables are served once by /api/meta instead of in every chart
+        result = chart.to_dict(include_static=False, normalized=normalized)
         
-        # Store data for download functionality
-        global last_chart_data
-        last_chart_data = result
+        print(f"DEBUG: compute_chart_model returned successfully")
+        print(f"DEBUG: Result keys: {list(result.keys())}")
         
-        return jsonify({ 'ok': True, 'data': result })
+        return encoded_response({ 'ok': True, 'data': result })
     except Exception as e:
         print(f"DEBUG: Exception in api_chart: {str(e)}")
         print(f"DEBUG: Exception type: {type(e)}")
@@ -154,22 +233,41 @@ def api_tz():
     except Exception as e:
         return jsonify({ 'ok': False, 'error': str(e) }), 400
 
+# Serialized and precompressed /api/meta body and its version, built on first request
+META_CACHE = {}
+
+@app.route('/api/meta')
+def api_meta():
+    """Static chart reference tables; immutable when requested with ?v=<version>."""
+    if not META_CACHE:
+        meta = chart_static_tables()
+        META_CACHE['version'] = meta['version']
+        META_CACHE['variants'] = precompress(dumps_json({'ok': True, 'data': meta}))
+    if request.args.get('v') == META_CACHE['version']:
+        cache_control = IMMUTABLE_CACHE_CONTROL
+    else:
+        cache_control = 'no-cache'
+    headers = cache_headers(META_CACHE['version'], cache_control)
+    if not_modified(META_CACHE['version']):
+        return Response(status=304, headers=headers)
+    return precompressed_response(META_CACHE['variants'], JSON_MIMETYPE, headers)
+
 @app.route('/api/health')
 def health():
-    return jsonify({'ok': True})
+    return jsonify({'ok': True, 'ephemeris': get_ephemeris_backend().describe()})
 
-# Store the last chart data for downloads
-last_chart_data = {}
+# Store the last chart (as a compact ChartModel) for downloads
+last_chart_model = None
 
 @app.route('/api/download/<section>')
 def download_section(section):
     """Download specific section data as formatted JSON."""
-    global last_chart_data
-    
-    if not last_chart_data:
+    if last_chart_model is None:
         return jsonify({'ok': False, 'error': 'No chart data available. Generate a chart first.'}), 400
     
     try:
+        last_chart_data = last_chart_model.to_dict()
+        
         # Define section mappings
         section_data = {}
         
@@ -213,7 +311,8 @@ def download_section(section):
         elif section == 'mahadasha':
             section_data = {
                 'vimshottari': last_chart_data.get('vimshottari', {}),
-                'current_period_analysis': _analyze_current_period(last_chart_data.get('vimshottari', {}))
+                'current_period_analysis': _analyze_current_period(last_chart_data.get('vimshottari', {}),
+                                                                   last_chart_model.now_local)
             }
         elif section == 'yearly_dasha':
             section_data = {
@@ -234,24 +333,22 @@ def download_section(section):
             'content': section_data
         }
         
-        # Create response
-        json_str = json.dumps(formatted_data, indent=2, ensure_ascii=False)
-        
-        return Response(
-            json_str,
-            mimetype='application/json',
-            headers={'Content-Disposition': f'attachment; filename="astrology_{section}_{datetime.now().strftime("%Y%m%d_%H%M%S")}.json"'}
-        )
+        # Create response (indented only with ?pretty=1, which the page's download buttons send)
+        response = encoded_response(formatted_data)
+        extension = 'json' if response.mimetype == JSON_MIMETYPE else 'msgpack'
+        response.headers['Content-Disposition'] = f'attachment; filename="astrology_{section}_{datetime.now().strftime("%Y%m%d_%H%M%S")}.{extension}"'
+        return response
         
     except Exception as e:
         return jsonify({'ok': False, 'error': str(e)}), 400
 
-def _analyze_current_period(vim_data):
-    """Analyze current dasha period."""
+def _analyze_current_period(vim_data, current_date=None):
+    """Analyze current dasha period (at current_date, default now)."""
     if not vim_data or 'mahadashas' not in vim_data:
         return {}
     
-    current_date = datetime.now()
+    if current_date is None:
+        current_date = datetime.now()
     
     for md in vim_data['mahadashas']:
         md_start = datetime.fromisoformat(md['start'].replace('Z', '+00:00')) if 'Z' in md['start'] else datetime.fromisoformat(md['start'])
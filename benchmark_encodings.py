@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""Benchmark response encodings for a chart payload: bytes and serialization time.
+
+Usage: python benchmark_encodings.py [repeats]
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import json
+import time
+from datetime import datetime
+
+from flask import Flask, jsonify
+
+import payload_encoding
+from payload_encoding import dumps_json, dumps_msgpack
+from vedic.core import compute_chart_model
+
+
+def measure(encode, repeats):
+    body = encode()
+    start = time.perf_counter()
+    for _ in range(repeats):
+        encode()
+    return len(body), (time.perf_counter() - start) / repeats * 1000
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    model = compute_chart_model(datetime(1990, 5, 3, 4, 15), 13.0827, 80.2707, 5.5, 'lahiri', 'placidus')
+    app = Flask(__name__)
+
+    for label, payload in (('full', model.to_dict(include_static=False)),
+                           ('normalized', model.to_dict(include_static=False, normalized=True))):
+        data = {'ok': True, 'data': payload}
+        encoders = [
+            ('jsonify (Flask default)', lambda: jsonify(data).get_data()),
+            ('json.dumps indent=2', lambda: json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')),
+            ('json.dumps minified', lambda: json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')),
+        ]
+        if payload_encoding.orjson is not None:
+            encoders.append(('orjson minified', lambda: dumps_json(data)))
+        if payload_encoding.msgpack is not None:
+            encoders.append(('msgpack', lambda: dumps_msgpack(data)))
+
+        print(f"\n{label} chart payload ({repeats} runs each)")
+        print(f"{'encoding':<26}{'bytes':>10}{'ms':>10}")
+        with app.app_context():
+            for name, encode in encoders:
+                size, ms = measure(encode, repeats)
+                print(f"{name:<26}{size:>10}{ms:>10.2f}")
+
+
+if __name__ == '__main__':
+    main()
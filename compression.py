@@ -0,0 +1,96 @@
+"""
+Response compression and content-hashed, precompressed static assets.
+
+Responses above COMPRESS_MIN_BYTES are compressed per request with brotli (when the brotli
+package is installed) or gzip, whichever the client accepts, at fast levels. Bodies that
+never change (static files, the rendered page, /api/meta) are compressed once at the
+highest levels with precompress().
+
+StaticAssets reads every file under static/ at startup and serves it from a URL carrying
+its content hash (js/app.js -> /assets/js/app.<hash>.js), so those URLs can be cached as
+immutable: changing a file changes its URL.
+"""
+
+import gzip
+import hashlib
+import mimetypes
+import os
+from typing import Dict, List, Optional
+
+try:
+    import brotli
+except ImportError:  # optional: gzip only
+    brotli = None
+
+COMPRESS_MIN_BYTES = 1024
+COMPRESSIBLE_MIMETYPES = {
+    'application/json', 'application/msgpack', 'application/javascript', 'text/javascript',
+    'text/css', 'text/html', 'text/plain', 'image/svg+xml',
+}
+# Per-request compression favours speed; bodies compressed once use the smallest output
+DYNAMIC_LEVELS = {'br': 5, 'gzip': 6}
+STATIC_LEVELS = {'br': 11, 'gzip': 9}
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+
+def supported_encodings() -> List[str]:
+    """Content-Encodings this server can produce, preferred first."""
+    return (['br'] if brotli is not None else []) + ['gzip']
+
+
+def choose_encoding(accept_encodings, available: Optional[List[str]] = None) -> Optional[str]:
+    """Best encoding in a werkzeug Accept-Encoding header, or None for identity."""
+    return accept_encodings.best_match(available if available is not None else supported_encodings())
+
+
+def compress(body: bytes, encoding: str, levels: Dict[str, int] = DYNAMIC_LEVELS) -> bytes:
+    if encoding == 'br':
+        return brotli.compress(body, quality=levels['br'])
+    return gzip.compress(body, compresslevel=levels['gzip'], mtime=0)
+
+
+def precompress(body: bytes) -> Dict[Optional[str], bytes]:
+    """Identity body (key None) plus every supported encoding that makes it smaller."""
+    variants: Dict[Optional[str], bytes] = {None: body}
+    for encoding in supported_encodings():
+        compressed = compress(body, encoding, STATIC_LEVELS)
+        if len(compressed) < len(body):
+            variants[encoding] = compressed
+    return variants
+
+
+class StaticAssets:
+    """Files under a directory, keyed by content-hashed path, with precompressed variants."""
+
+    def __init__(self, root: str, url_prefix: str = '/assets/'):
+        self.root = root
+        self.url_prefix = url_prefix
+        self._hashed_paths: Dict[str, str] = {}
+        self._assets: Dict[str, Dict] = {}
+        self._load()
+
+    def _load(self) -> None:
+        if not os.path.isdir(self.root):
+            return
+        for directory, _, files in os.walk(self.root):
+            for filename in sorted(files):
+                full_path = os.path.join(directory, filename)
+                path = os.path.relpath(full_path, self.root).replace(os.sep, '/')
+                with open(full_path, 'rb') as f:
+                    body = f.read()
+                digest = hashlib.sha256(body).hexdigest()[:10]
+                stem, ext = os.path.splitext(path)
+                hashed = f'{stem}.{digest}{ext}'
+                self._hashed_paths[path] = hashed
+                self._assets[hashed] = {
+                    'mimetype': mimetypes.guess_type(path)[0] or 'application/octet-stream',
+                    'variants': precompress(body),
+                }
+
+    def url(self, path: str) -> str:
+        """Content-hashed URL for a file under the root, e.g. 'js/app.js'."""
+        return self.url_prefix + self._hashed_paths[path]
+
+    def get(self, hashed_path: str) -> Optional[Dict]:
+        """{'mimetype', 'variants'} for a hashed path, or None."""
+        return self._assets.get(hashed_path)
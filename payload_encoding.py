@@ -0,0 +1,56 @@
+"""
+Response encodings for chart payloads, chosen from the request's Accept header.
+
+* application/json: minified, through orjson when it is installed, else the json module
+* application/msgpack: MessagePack, for service-to-service clients (needs msgpack). Map keys
+  keep their types (varga numbers stay ints), so unpack with strict_map_key=False.
+
+Pretty-printed JSON is only produced when asked for explicitly (?pretty=1).
+"""
+
+import json
+from typing import Any, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # optional: compact json.dumps is used instead
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # optional: only JSON is offered
+    msgpack = None
+
+JSON_MIMETYPE = 'application/json'
+MSGPACK_MIMETYPE = 'application/msgpack'
+MSGPACK_MIMETYPES = (MSGPACK_MIMETYPE, 'application/x-msgpack')
+
+
+def available_mimetypes() -> List[str]:
+    """Mimetypes this server can encode, preferred first."""
+    return [JSON_MIMETYPE] + (list(MSGPACK_MIMETYPES) if msgpack is not None else [])
+
+
+def dumps_json(data: Any, pretty: bool = False) -> bytes:
+    """UTF-8 JSON; minified unless pretty is set."""
+    if pretty:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def dumps_msgpack(data: Any) -> bytes:
+    if msgpack is None:
+        raise RuntimeError('msgpack is not installed')
+    return msgpack.packb(data, use_bin_type=True)
+
+
+def encode_payload(data: Any, accept=None, pretty: bool = False) -> Tuple[bytes, str]:
+    """(body, mimetype) for the best encoding in a werkzeug Accept header (JSON by default)."""
+    mimetype: Optional[str] = None
+    if accept is not None and not pretty:
+        mimetype = accept.best_match(available_mimetypes(), default=JSON_MIMETYPE)
+    if mimetype in MSGPACK_MIMETYPES:
+        return dumps_msgpack(data), MSGPACK_MIMETYPE
+    return dumps_json(data, pretty), JSON_MIMETYPE
@@ -0,0 +1,2998 @@
+    // View Management System
+    let currentChartData = null;
+    let currentBirthDetails = null;
+
+    // Check for URL parameters on page load
+    window.addEventListener('DOMContentLoaded', function() {
+      const urlParams = new URLSearchParams(window.location.search);
+      
+      if (urlParams.has('data')) {
+        try {
+          const encodedData = urlParams.get('data');
+          const decodedData = JSON.parse(atob(encodedData));
+          loadChartFromUrl(decodedData);
+        } catch (e) {
+          console.error('Error loading chart from URL:', e);
+        }
+      } else {
+        // Try to load last chart from localStorage
+        loadLastChart();
+      }
+    });
+
+    function showInputView() {
+      document.getElementById('input-view').classList.add('active');
+      document.getElementById('results-view').classList.remove('active');
+      
+      // Clear URL parameters
+      window.history.pushState({}, '', window.location.pathname);
+    }
+
+    function showResultsView() {
+      document.getElementById('input-view').classList.remove('active');
+      document.getElementById('results-view').classList.add('active');
+      
+      // Scroll to top
+      window.scrollTo({ top: 0, behavior: 'smooth' });
+    }
+
+    function showLoadingOverlay() {
+      document.getElementById('loading-overlay').classList.add('active');
+    }
+
+    function hideLoadingOverlay() {
+      document.getElementById('loading-overlay').classList.remove('active');
+    }
+
+    function saveChartToLocalStorage(birthDetails, chartData) {
+      try {
+        const dataToSave = {
+          birthDetails: birthDetails,
+          chartData: chartData,
+          timestamp: new Date().toISOString()
+        };
+        localStorage.setItem('lastChart', JSON.stringify(dataToSave));
+      } catch (e) {
+        console.error('Error saving to localStorage:', e);
+      }
+    }
+
+    function loadLastChart() {
+      try {
+        const saved = localStorage.getItem('lastChart');
+        if (saved) {
+          const data = JSON.parse(saved);
+          // Only auto-load if it's less than 24 hours old
+          const savedTime = new Date(data.timestamp);
+          const now = new Date();
+          const hoursDiff = (now - savedTime) / (1000 * 60 * 60);
+          
+          if (hoursDiff < 24) {
+            currentBirthDetails = data.birthDetails;
+            currentChartData = data.chartData;
+            renderChartResults(data.chartData);
+            updateBirthInfoChip(data.birthDetails);
+            showResultsView();
+          }
+        }
+      } catch (e) {
+        console.error('Error loading from localStorage:', e);
+      }
+    }
+
+    function loadChartFromUrl(data) {
+      // Populate form fields
+      document.getElementById('place').value = data.place || '';
+      document.getElementById('lat').value = data.lat || '';
+      document.getElementById('lon').value = data.lon || '';
+      document.getElementById('tz').value = data.tz_offset || '';
+      
+      // Parse and set date/time
+      if (data.datetime) {
+        const dt = new Date(data.datetime);
+        document.getElementById('day').value = dt.getDate();
+        document.getElementById('month').value = dt.getMonth() + 1;
+        document.getElementById('year').value = dt.getFullYear();
+        let hours = dt.getHours();
+        const ampm = hours >= 12 ? 'PM' : 'AM';
+        hours = hours % 12 || 12;
+        document.getElementById('hour').value = hours;
+        document.getElementById('minute').value = dt.getMinutes();
+        document.getElementById('ampm').value = ampm;
+        updateHiddenDatetime();
+      }
+      
+      // Set options
+      document.getElementById('ayan').value = data.ayanamsa || 'lahiri';
+      document.getElementById('house').value = data.house_system || 'equal';
+      document.getElementById('nodeType').value = data.node_type || 'mean';
+      
+      // Auto-generate chart
+      setTimeout(() => {
+        submitForm();
+      }, 500);
+    }
+
+    function updateBirthInfoChip(details) {
+      const chip = document.getElementById('result-birth-info');
+      chip.innerHTML = `
+        <strong>${details.place}</strong> • 
+        ${details.date} ${details.time} • 
+        Lat: ${details.lat}, Lon: ${details.lon}
+      `;
+    }
+
+    function openShareModal() {
+      if (!currentBirthDetails) {
+        alert('No chart data to share');
+        return;
+      }
+      
+      const shareData = {
+        place: currentBirthDetails.place,
+        lat: currentBirthDetails.lat,
+        lon: currentBirthDetails.lon,
+        datetime: currentBirthDetails.datetime,
+        tz_offset: currentBirthDetails.tz_offset,
+        ayanamsa: currentBirthDetails.ayanamsa,
+        house_system: currentBirthDetails.house_system,
+        node_type: currentBirthDetails.node_type
+      };
+      
+      const encoded = btoa(JSON.stringify(shareData));
+      const shareUrl = `${window.location.origin}${window.location.pathname}?data=${encoded}`;
+      
+      document.getElementById('share-url').textContent = shareUrl;
+      document.getElementById('share-modal').classList.add('active');
+      document.getElementById('copy-btn').textContent = 'Copy';
+      document.getElementById('copy-btn').classList.remove('copied');
+    }
+
+    function closeShareModal() {
+      document.getElementById('share-modal').classList.remove('active');
+    }
+
+    function copyShareUrl() {
+      const urlText = document.getElementById('share-url').textContent;
+      const copyBtn = document.getElementById('copy-btn');
+      
+      navigator.clipboard.writeText(urlText).then(() => {
+        copyBtn.textContent = '✓ Copied!';
+        copyBtn.classList.add('copied');
+        
+        setTimeout(() => {
+          copyBtn.textContent = 'Copy';
+          copyBtn.classList.remove('copied');
+        }, 2000);
+      }).catch(err => {
+        console.error('Failed to copy:', err);
+        alert('Failed to copy URL. Please copy manually.');
+      });
+    }
+
+    function downloadAllData() {
+      if (!currentChartData) {
+        alert('No chart data to download');
+        return;
+      }
+      
+      const dataStr = JSON.stringify(currentChartData, null, 2);
+      const blob = new Blob([dataStr], { type: 'application/json' });
+      const url = URL.createObjectURL(blob);
+      const a = document.createElement('a');
+      a.href = url;
+      a.download = `vedic_chart_${new Date().toISOString().split('T')[0]}.json`;
+      document.body.appendChild(a);
+      a.click();
+      document.body.removeChild(a);
+      URL.revokeObjectURL(url);
+    }
+
+    // Close modals when clicking outside
+    window.addEventListener('click', function(e) {
+      const shareModal = document.getElementById('share-modal');
+      if (e.target === shareModal) {
+        closeShareModal();
+      }
+    });
+
+    // Canvas chart replaced by table-based chart
+    // const canvas = document.getElementById('chart');
+    // const ctx = canvas.getContext('2d');
+    // Prefill local datetime and timezone offset (in hours)
+    (function prefillDefaults(){
+      try {
+        prefillDateTimeFields();
+        const tzHours = -new Date().getTimezoneOffset()/60; // e.g., IST => 5.5
+        document.getElementById('tz').value = tzHours;
+      } catch {}
+    })();
+
+    // Helper function to get planet short text forms
+    function getPlanetSymbol(planetName) {
+      const shortForms = {
+        'Sun': 'Su',
+        'Moon': 'Mo', 
+        'Mars': 'Ma',
+        'Mercury': 'Me',
+        'Jupiter': 'Ju',
+        'Venus': 'Ve',
+        'Saturn': 'Sa',
+        'Rahu': 'Ra',
+        'Ketu': 'Ke'
+      };
+      return shortForms[planetName] || planetName.substring(0, 2);
+    }
+    
+    // Helper function to get planet display name (uses short text forms by default)
+    function getPlanetDisplayName(planetName, useSymbols = false) {
+      // Always use short text forms now
+      return getPlanetSymbol(planetName);
+    }
+    
+    // Helper function to get planet type for styling
+    function getPlanetType(planetName) {
+      const luminaries = ['Sun', 'Moon'];
+      const benefics = ['Venus', 'Jupiter', 'Mercury'];
+      const malefics = ['Mars', 'Saturn', 'Rahu', 'Ketu'];
+      
+      if (luminaries.includes(planetName)) return 'luminary';
+      if (benefics.includes(planetName)) return 'benefic';
+      if (malefics.includes(planetName)) return 'malefic';
+      return '';
+    }
+    
+    // Helper function to map signs to chart positions (zodiac signs 1-12)
+    function getSignFromZodiacName(zodiacName) {
+      const zodiacToNumber = {
+        'Aries': 1, 'Taurus': 2, 'Gemini': 3, 'Cancer': 4,
+        'Leo': 5, 'Virgo': 6, 'Libra': 7, 'Scorpio': 8,
+        'Sagittarius': 9, 'Capricorn': 10, 'Aquarius': 11, 'Pisces': 12
+      };
+      return zodiacToNumber[zodiacName] || null;
+    }
+    
+    // Field navigation order
+    const fieldOrder = ['day', 'month', 'year', 'hour', 'minute', 'ampm'];
+    
+    // Handle individual date/time field input with auto-navigation
+    function handleDateFieldInput(fieldId) {
+      const field = document.getElementById(fieldId);
+      let value = field.value;
+      
+      // Auto-advance logic based on field type and value length
+      let shouldAdvance = false;
+      
+      switch (fieldId) {
+        case 'day':
+          if (value.length === 2 || (value.length === 1 && parseInt(value) > 3)) {
+            shouldAdvance = true;
+          }
+          break;
+        case 'month':
+          if (value.length === 2 || (value.length === 1 && parseInt(value) > 1)) {
+            shouldAdvance = true;
+          }
+          break;
+        case 'year':
+          if (value.length === 4) {
+            shouldAdvance = true;
+          }
+          break;
+        case 'hour':
+          if (value.length === 2 || (value.length === 1 && parseInt(value) > 1)) {
+            shouldAdvance = true;
+          }
+          break;
+        case 'minute':
+          if (value.length === 2 || (value.length === 1 && parseInt(value) > 5)) {
+            shouldAdvance = true;
+          }
+          break;
+      }
+      
+      // Move to next field if conditions are met
+      if (shouldAdvance) {
+        moveToNextField(fieldId);
+      }
+      
+      // Validate and update hidden field
+      validateAndUpdateDateTime();
+    }
+    
+    // Handle keyboard navigation
+    function handleDateFieldKey(event, fieldId) {
+      const field = document.getElementById(fieldId);
+      
+      if (event.key === 'Tab') {
+        return; // Let default tab behavior work
+      }
+      
+      if (event.key === 'Enter') {
+        event.preventDefault();
+        moveToNextField(fieldId);
+        return;
+      }
+      
+      if (event.key === 'Backspace' && field.value === '' && field.selectionStart === 0) {
+        event.preventDefault();
+        moveToPreviousField(fieldId);
+        return;
+      }
+      
+      if (event.key === 'ArrowRight' && field.selectionStart === field.value.length) {
+        event.preventDefault();
+        moveToNextField(fieldId);
+        return;
+      }
+      
+      if (event.key === 'ArrowLeft' && field.selectionStart === 0) {
+        event.preventDefault();
+        moveToPreviousField(fieldId);
+        return;
+      }
+    }
+    
+    // Move to next field in sequence
+    function moveToNextField(currentFieldId) {
+      const currentIndex = fieldOrder.indexOf(currentFieldId);
+      if (currentIndex >= 0 && currentIndex < fieldOrder.length - 1) {
+        const nextFieldId = fieldOrder[currentIndex + 1];
+        const nextField = document.getElementById(nextFieldId);
+        if (nextField) {
+          nextField.focus();
+          if (nextField.select) nextField.select();
+        }
+      }
+    }
+    
+    // Move to previous field in sequence
+    function moveToPreviousField(currentFieldId) {
+      const currentIndex = fieldOrder.indexOf(currentFieldId);
+      if (currentIndex > 0) {
+        const prevFieldId = fieldOrder[currentIndex - 1];
+        const prevField = document.getElementById(prevFieldId);
+        if (prevField) {
+          prevField.focus();
+          if (prevField.select) prevField.select();
+        }
+      }
+    }
+    
+    // Validate all fields and update hidden datetime field
+    function validateAndUpdateDateTime() {
+      const day = document.getElementById('day').value;
+      const month = document.getElementById('month').value;
+      const year = document.getElementById('year').value;
+      const hour = document.getElementById('hour').value;
+      const minute = document.getElementById('minute').value;
+      const ampm = document.getElementById('ampm').value;
+      
+      // Clear previous error states
+      fieldOrder.forEach(fieldId => {
+        const field = document.getElementById(fieldId);
+        field.classList.remove('error');
+      });
+      
+      // Check if all fields have values
+      if (!day || !month || !year || !hour || !minute || !ampm) {
+        return; // Don't validate incomplete data
+      }
+      
+      // Validate ranges
+      let isValid = true;
+      const dayNum = parseInt(day);
+      const monthNum = parseInt(month);
+      const yearNum = parseInt(year);
+      const hourNum = parseInt(hour);
+      const minuteNum = parseInt(minute);
+      
+      if (dayNum < 1 || dayNum > 31) {
+        document.getElementById('day').classList.add('error');
+        isValid = false;
+      }
+      
+      if (monthNum < 1 || monthNum > 12) {
+        document.getElementById('month').classList.add('error');
+        isValid = false;
+      }
+      
+      if (yearNum < 1900 || yearNum > 2100) {
+        document.getElementById('year').classList.add('error');
+        isValid = false;
+      }
+      
+      if (hourNum < 1 || hourNum > 12) {
+        document.getElementById('hour').classList.add('error');
+        isValid = false;
+      }
+      
+      if (minuteNum < 0 || minuteNum > 59) {
+        document.getElementById('minute').classList.add('error');
+        isValid = false;
+      }
+      
+      if (!isValid) return;
+      
+      // Convert to 24-hour format
+      let hour24 = hourNum;
+      if (ampm === 'PM' && hourNum !== 12) {
+        hour24 += 12;
+      } else if (ampm === 'AM' && hourNum === 12) {
+        hour24 = 0;
+      }
+      
+      // Create date and validate it exists
+      const testDate = new Date(yearNum, monthNum - 1, dayNum, hour24, minuteNum);
+      if (testDate.getFullYear() !== yearNum || 
+          testDate.getMonth() !== monthNum - 1 || 
+          testDate.getDate() !== dayNum) {
+        document.getElementById('day').classList.add('error');
+        document.getElementById('month').classList.add('error');
+        return;
+      }
+      
+      // Update hidden field with ISO format
+      const dayStr = String(dayNum).padStart(2, '0');
+      const monthStr = String(monthNum).padStart(2, '0');
+      const hour24Str = String(hour24).padStart(2, '0');
+      const minuteStr = String(minuteNum).padStart(2, '0');
+      
+      const isoFormat = `${yearNum}-${monthStr}-${dayStr}T${hour24Str}:${minuteStr}`;
+      document.getElementById('dt').value = isoFormat;
+    }
+    
+    // Prefill the separate date/time fields with current date/time
+    function prefillDateTimeFields() {
+      const now = new Date();
+      
+      document.getElementById('day').value = now.getDate();
+      document.getElementById('month').value = now.getMonth() + 1;
+      document.getElementById('year').value = now.getFullYear();
+      
+      let hour12 = now.getHours();
+      const ampm = hour12 >= 12 ? 'PM' : 'AM';
+      
+      if (hour12 > 12) {
+        hour12 -= 12;
+      } else if (hour12 === 0) {
+        hour12 = 12;
+      }
+      
+      document.getElementById('hour').value = hour12;
+      document.getElementById('minute').value = String(now.getMinutes()).padStart(2, '0');
+      document.getElementById('ampm').value = ampm;
+      
+      // Update hidden field
+      validateAndUpdateDateTime();
+    }
+    
+    // Update South Indian chart table with planet data
+    function drawChart(data) {
+      console.log('Drawing chart with data:', data);
+      
+      // Update ascendant display with degree and sign
+      const ascDisplay = document.getElementById('asc-display');
+      const ascSignDisplay = document.getElementById('asc-sign-display');
+      const ascPlanetsDisplay = document.getElementById('asc-planets-display');
+      
+      if (ascDisplay && data.ascendant) {
+        ascDisplay.textContent = data.ascendant.toFixed(1) + '°';
+        
+        // Calculate and display the ascendant sign
+        const ascendantSign = Math.floor(data.ascendant / 30) + 1;
+        const degreeInSign = data.ascendant % 30;
+        const signNames = ['Ari', 'Tau', 'Gem', 'Can', 'Leo', 'Vir', 'Lib', 'Sco', 'Sag', 'Cap', 'Aqu', 'Pis'];
+        const signName = signNames[ascendantSign - 1];
+        
+        if (ascSignDisplay) {
+          ascSignDisplay.textContent = `${signName} ${degreeInSign.toFixed(1)}°`;
+        }
+        
+        // Find and display planets in the ascendant sign
+        if (ascPlanetsDisplay && data.planets) {
+          const planetsInAscSign = [];
+          
+          Object.entries(data.planets).forEach(([planetName, planetData]) => {
+            const planetSignNumber = getSignFromZodiacName(planetData.sign);
+            if (planetSignNumber === ascendantSign) {
+              planetsInAscSign.push(getPlanetSymbol(planetName));
+            }
+          });
+          
+          if (planetsInAscSign.length > 0) {
+            ascPlanetsDisplay.textContent = `With: ${planetsInAscSign.join(', ')}`;
+            ascPlanetsDisplay.title = `Planets in ascendant sign: ${planetsInAscSign.join(', ')}`;
+          } else {
+            ascPlanetsDisplay.textContent = 'No planets';
+            ascPlanetsDisplay.title = 'No other planets in ascendant sign';
+          }
+        }
+      }
+      
+      // Clear all existing planets from chart and remove ascendant highlighting
+      for (let i = 1; i <= 12; i++) {
+        const container = document.getElementById(`planets-${i}`);
+        const signCell = document.getElementById(`sign-${i}`);
+        if (container) {
+          container.innerHTML = '';
+          container.className = 'planets-container';
+        }
+        if (signCell) {
+          signCell.classList.remove('ascendant-cell');
+        }
+      }
+      
+      // Highlight ascendant sign
+      if (data.ascendant) {
+        const ascendantSign = Math.floor(data.ascendant / 30) + 1; // Convert degree to sign number (1-12)
+        const ascendantCell = document.getElementById(`sign-${ascendantSign}`);
+        if (ascendantCell) {
+          ascendantCell.classList.add('ascendant-cell');
+          console.log(`Ascendant highlighted in sign ${ascendantSign} at ${data.ascendant.toFixed(1)}°`);
+        }
+      }
+      
+      // Place planets by zodiac sign
+      if (data.planets) {
+        console.log('Placing planets by zodiac signs:', data.planets);
+        
+        // Group planets by their zodiac signs
+        const planetsBySign = {};
+        
+        Object.entries(data.planets).forEach(([planetName, planetData]) => {
+          const signNumber = getSignFromZodiacName(planetData.sign);
+          if (signNumber) {
+            if (!planetsBySign[signNumber]) {
+              planetsBySign[signNumber] = [];
+            }
+            planetsBySign[signNumber].push({
+              name: planetName,
+              data: planetData
+            });
+          }
+        });
+        
+        // Place planets in their respective sign containers
+        Object.entries(planetsBySign).forEach(([signNumber, planets]) => {
+          const container = document.getElementById(`planets-${signNumber}`);
+          if (container) {
+            // Add size class for dynamic font scaling
+            const sizeClass = planets.length === 1 ? 'size-1' :
+                            planets.length === 2 ? 'size-2' :
+                            planets.length === 3 ? 'size-3' : 'size-4plus';
+            container.className = `planets-container ${sizeClass}`;
+            
+            planets.forEach(planet => {
+              const planetElement = document.createElement('div');
+              planetElement.className = `planet-item ${getPlanetType(planet.name)}`;
+              
+              // Use symbols for better visual appeal
+              planetElement.textContent = getPlanetDisplayName(planet.name, true);
+              
+              // Add tooltip with full planet info
+              planetElement.title = `${planet.name} in ${planet.data.sign} (${planet.data.degInSign.toFixed(1)}°)`;
+              
+              container.appendChild(planetElement);
+            });
+          }
+        });
+        
+        console.log('Planets placed by sign:', planetsBySign);
+      }
+      
+      // Fallback: if no planets data but planetsByHouse exists, try to use that
+      else if (data.planetsByHouse) {
+        console.log('Using planetsByHouse data:', data.planetsByHouse);
+        // This would be for house-based placement if needed as fallback
+      }
+    }
+
+    async function submitForm() {
+      const err = document.getElementById('err');
+      err.textContent = '';
+      const dt = document.getElementById('dt').value;
+      const place = document.getElementById('place').value;
+      const lat = document.getElementById('lat').value;
+      const lon = document.getElementById('lon').value;
+      const tz = document.getElementById('tz').value;
+      const ayan = document.getElementById('ayan').value;
+      const house = document.getElementById('house').value;
+      const nodeType = document.getElementById('nodeType').value;
+      
+      // Enhanced validation
+      if (!dt) { err.textContent = 'Please set date/time.'; return; }
+      
+      // Check if we have either a place OR lat/lon coordinates
+      if (!place && (!lat || !lon)) {
+        err.textContent = 'Please enter a place name OR provide latitude and longitude coordinates.'; 
+        return; 
+      }
+      
+      // If lat/lon provided, validate they are numbers
+      if (lat && isNaN(parseFloat(lat))) {
+        err.textContent = 'Latitude must be a valid number.'; 
+        return; 
+      }
+      
+      if (lon && isNaN(parseFloat(lon))) {
+        err.textContent = 'Longitude must be a valid number.'; 
+        return; 
+      }
+      
+      // Show loading overlay
+      showLoadingOverlay();
+      
+      // Debug logging
+      console.log('DEBUG: Submitting with values:');
+      console.log('dt:', dt);
+      console.log('place:', place);
+      console.log('lat:', lat);
+      console.log('lon:', lon);
+      console.log('tz:', tz);
+      
+      try {
+        const res = await fetch('/api/chart', {
+          method: 'POST', headers: { 'Content-Type': 'application/json' },
+          body: JSON.stringify({ datetime: dt, place, lat, lon, tz_offset: tz, ayanamsa: ayan, house_system: house, node_type: nodeType, payload: 'normalized' })
+        });
+        const json = await res.json();
+        if (!json.ok) throw new Error(json.error || 'Failed');
+        
+        // Store birth details
+        const dateObj = new Date(dt);
+        const timeStr = dateObj.toLocaleTimeString('en-US', { hour: '2-digit', minute: '2-digit', hour12: true });
+        const dateStr = dateObj.toLocaleDateString('en-US', { year: 'numeric', month: 'short', day: 'numeric' });
+        
+        currentBirthDetails = {
+          place: place,
+          lat: lat,
+          lon: lon,
+          datetime: dt,
+          date: dateStr,
+          time: timeStr,
+          tz_offset: tz,
+          ayanamsa: ayan,
+          house_system: house,
+          node_type: nodeType
+        };
+        
+        currentChartData = await hydrateChartData(json.data);
+        
+        // Save to localStorage
+        saveChartToLocalStorage(currentBirthDetails, currentChartData);
+        
+        // Render results
+        renderChartResults(currentChartData);
+        
+        // Update birth info chip
+        updateBirthInfoChip(currentBirthDetails);
+        
+        // Hide loading and show results view
+        hideLoadingOverlay();
+        showResultsView();
+        
+        document.getElementById('out').textContent = JSON.stringify(json.data, null, 2);
+      } catch (e) {
+        console.error('DEBUG: Error in submitForm:', e);
+        console.error('DEBUG: Full error:', e.message);
+        err.textContent = e.message;
+        hideLoadingOverlay();
+      }
+    }
+
+    function renderChartResults(data) {
+      drawChart(data);
+      renderAllSections(data);
+    }
+
+    // Static reference tables from /api/meta, fetched once per version
+    let chartMeta = null;
+
+    async function loadChartMeta(version) {
+      if (chartMeta && chartMeta.version === version) return chartMeta;
+      const res = await fetch(`/api/meta?v=${encodeURIComponent(version)}`);
+      const json = await res.json();
+      if (!json.ok) throw new Error(json.error || 'Failed to load chart reference tables');
+      chartMeta = json.data;
+      return chartMeta;
+    }
+
+    // Put the static tables back where the chart sections expect them
+    async function hydrateChartData(data) {
+      const version = data?.meta?.static_tables;
+      if (!version) return data;
+      const meta = await loadChartMeta(version);
+      const fill = (node, path, table, key) => {
+        if (!node || typeof node !== 'object') return;
+        const [head, ...rest] = path;
+        if (!rest.length) {
+          const value = meta.tables[table];
+          if (value !== undefined) node[head] = key === undefined ? value : value[key];
+          return;
+        }
+        const keys = head === '*' ? Object.keys(node) : (head in node ? [head] : []);
+        for (const k of keys) fill(node[k], rest, table, head === '*' ? k : key);
+      };
+      for (const field of meta.fields) {
+        fill(data, field.path, field.table, undefined);
+      }
+      return expandChartData(data, meta.normalization);
+    }
+
+    // Call visit(parent, key, keys matched by each '*') for every field on a chart path
+    function walkChartPath(node, path, visit, bound = []) {
+      if (!node || typeof node !== 'object') return;
+      const [head, ...rest] = path;
+      const keys = head === '*' ? Object.keys(node) : (head in node ? [head] : []);
+      for (const k of keys) {
+        const keysSoFar = head === '*' ? [...bound, k] : bound;
+        if (rest.length) walkChartPath(node[k], rest, visit, keysSoFar);
+        else visit(node, k, keysSoFar);
+      }
+    }
+
+    // Value at a chart path whose '$' parts take the given keys in order
+    function resolveChartPath(data, path, bound) {
+      let node = data, i = 0;
+      for (const part of path) {
+        const key = part === '$' ? bound[i++] : part;
+        if (!node || typeof node !== 'object' || !(key in node)) return undefined;
+        node = node[key];
+      }
+      return node;
+    }
+
+    // Restore the fields a normalized chart sends only once (payload: 'normalized')
+    function expandChartData(data, rules) {
+      if (!data?.meta?.normalized || !rules) return data;
+      delete data.meta.normalized;
+      // Dasha periods start where the previous one ends, or with their parent
+      for (const path of rules.chains) {
+        walkChartPath(data, path, (parent, key) => {
+          let previousEnd = parent.start;
+          parent[key] = parent[key].map(period => {
+            if (!('start' in period)) period = { start: previousEnd, ...period };
+            previousEnd = period.end;
+            return period;
+          });
+        });
+      }
+      // planetsByHouse entries sent as body names
+      for (const group of rules.body_groups) {
+        walkChartPath(data, group.path, (parent, key, bound) => {
+          const positions = resolveChartPath(data, group.source, bound) || {};
+          parent[key] = parent[key].map(entry => {
+            if (typeof entry !== 'string') return entry;
+            const body = { name: entry, abbr: rules.abbreviations[entry] || entry.slice(0, 2) };
+            for (const field of group.fields) body[field] = positions[entry]?.[field];
+            return body;
+          });
+        });
+      }
+      // Fields copied from the section that holds them
+      for (const { target, source } of rules.duplicates) {
+        const field = target[target.length - 1];
+        walkChartPath(data, target.slice(0, -1), (parent, key, bound) => {
+          const node = parent[key];
+          if (!node || typeof node !== 'object' || field in node) return;
+          const value = resolveChartPath(data, source, bound);
+          if (value !== undefined) node[field] = value;
+        });
+      }
+      return data;
+    }
+
+    // Simple place autosuggest with caching and fast selection
+    let placeTimer;
+    const placeCache = new Map(); // q(lower) -> [{name,lat,lon}]
+    // New Autocomplete Implementation
+    let autocompleteCache = new Map();
+    let autocompleteTimer = null;
+
+    async function onPlaceInput() {
+      const input = document.getElementById('place');
+      const query = input.value.trim();
+      const dropdownContainer = document.getElementById('place-list');
+      
+      // Clear previous timer
+      if (autocompleteTimer) {
+        clearTimeout(autocompleteTimer);
+      }
+      
+      // Clear dropdown if less than 3 characters
+      if (query.length < 3) {
+        dropdownContainer.innerHTML = '';
+        dropdownContainer.style.display = 'none';
+        return;
+      }
+      
+      // Show loading state
+      showLoadingDropdown(dropdownContainer);
+      
+      // Debounce the API call
+      autocompleteTimer = setTimeout(async () => {
+        await fetchAndShowPlaces(query, dropdownContainer);
+      }, 300);
+    }
+
+    function showLoadingDropdown(container) {
+      container.style.display = 'block';
+      container.innerHTML = `
+        <div style="padding: 12px; text-align: center; background: var(--bg-card); border: 1px solid var(--border-color); border-radius: 8px; color: var(--text-secondary);">
+          <div class="loading" style="margin: 0 auto 8px;"></div>
+          <div>Searching places...</div>
+        </div>
+      `;
+    }
+
+    async function fetchAndShowPlaces(query, container) {
+      const cacheKey = query.toLowerCase();
+      
+      try {
+        let places;
+        
+        // Check cache first
+        if (autocompleteCache.has(cacheKey)) {
+          places = autocompleteCache.get(cacheKey);
+        } else {
+          // Fetch from API
+          const response = await fetch(`/api/places?q=${encodeURIComponent(query)}`);
+          const data = await response.json();
+          
+          if (data.ok && data.data) {
+            places = data.data;
+            // Cache the results
+            autocompleteCache.set(cacheKey, places);
+          } else {
+            places = [];
+          }
+        }
+        
+        // Display results
+        displayPlaceDropdown(container, places);
+        
+      } catch (error) {
+        console.error('Error fetching places:', error);
+        container.innerHTML = `
+          <div style="padding: 12px; background: var(--bg-card); border: 1px solid var(--border-color); border-radius: 8px; color: var(--text-secondary);">
+            Error loading places. Please try again.
+          </div>
+        `;
+      }
+    }
+
+    function displayPlaceDropdown(container, places) {
+      if (!places || places.length === 0) {
+        container.innerHTML = `
+          <div style="padding: 12px; background: var(--bg-card); border: 1px solid var(--border-color); border-radius: 8px; color: var(--text-secondary);">
+            No places found. Try a different search.
+          </div>
+        `;
+        return;
+      }
+      
+      // Create dropdown with places
+      const dropdownHTML = places.map(place => `
+        <div class="autocomplete-item" 
+             data-name="${place.name}" 
+             data-lat="${place.lat}" 
+             data-lon="${place.lon}"
+             style="padding: 12px; cursor: pointer; border-bottom: 1px solid var(--border-color); background: var(--bg-card); color: var(--text-primary); transition: all 0.2s;">
+          ${place.name}
+        </div>
+      `).join('');
+      
+      container.innerHTML = `
+        <div style="background: var(--bg-card); border: 1px solid var(--border-color); border-radius: 8px; overflow: hidden; max-height: 300px; overflow-y: auto; box-shadow: 0 8px 32px var(--shadow-color); backdrop-filter: blur(20px);">
+          ${dropdownHTML}
+        </div>
+      `;
+      
+      // Add click handlers
+      const items = container.querySelectorAll('.autocomplete-item');
+      items.forEach(item => {
+        item.addEventListener('mouseenter', function() {
+          this.style.background = 'var(--bg-card-hover)';
+          this.style.paddingLeft = '16px';
+        });
+        item.addEventListener('mouseleave', function() {
+          this.style.background = 'var(--bg-card)';
+          this.style.paddingLeft = '12px';
+        });
+        item.addEventListener('click', function() {
+          selectPlace(this);
+        });
+      });
+      
+      container.style.display = 'block';
+    }
+
+    function selectPlace(element) {
+      const name = element.getAttribute('data-name');
+      const lat = element.getAttribute('data-lat');
+      const lon = element.getAttribute('data-lon');
+      
+      // Set values
+      document.getElementById('place').value = name;
+      document.getElementById('lat').value = parseFloat(lat).toFixed(4);
+      document.getElementById('lon').value = parseFloat(lon).toFixed(4);
+      
+      // Hide dropdown
+      const dropdownContainer = document.getElementById('place-list');
+      dropdownContainer.innerHTML = '';
+      dropdownContainer.style.display = 'none';
+      
+      // Fetch timezone
+      fetchTimezone(lat, lon);
+    }
+
+    async function fetchTimezone(lat, lon) {
+      try {
+        const dt = document.getElementById('dt').value;
+        const response = await fetch(`/api/tz?datetime=${encodeURIComponent(dt)}&lat=${lat}&lon=${lon}`);
+        const data = await response.json();
+        if (data.ok) {
+          document.getElementById('tz').value = data.data.tz_offset;
+        }
+      } catch (error) {
+        console.error('Error fetching timezone:', error);
+      }
+    }
+
+    // Close dropdown when clicking outside
+    document.addEventListener('click', function(e) {
+      const placeInput = document.getElementById('place');
+      const dropdownContainer = document.getElementById('place-list');
+      if (placeInput && dropdownContainer && e.target !== placeInput && !dropdownContainer.contains(e.target)) {
+        dropdownContainer.innerHTML = '';
+        dropdownContainer.style.display = 'none';
+      }
+    });
+
+
+    function onPlaceKey(ev){
+      const dropdownContainer = document.getElementById('place-list');
+      
+      if (ev.key === 'Enter'){
+        ev.preventDefault();
+        const firstItem = dropdownContainer.querySelector('.autocomplete-item');
+        if (firstItem) {
+          selectPlace(firstItem);
+        } else {
+          applyPlace();
+        }
+      }
+      
+      if (ev.key === 'Escape'){
+        dropdownContainer.innerHTML = '';
+        dropdownContainer.style.display = 'none';
+      }
+      
+      // Arrow key navigation
+      if (ev.key === 'ArrowDown' || ev.key === 'ArrowUp') {
+        ev.preventDefault();
+        const items = dropdownContainer.querySelectorAll('.autocomplete-item');
+        if (items.length === 0) return;
+        
+        let currentIndex = -1;
+        items.forEach((item, index) => {
+          if (item.style.background === 'var(--bg-card-hover)') {
+            currentIndex = index;
+            item.style.background = 'var(--bg-card)';
+            item.style.paddingLeft = '12px';
+          }
+        });
+        
+        if (ev.key === 'ArrowDown') {
+          currentIndex = (currentIndex + 1) % items.length;
+        } else {
+          currentIndex = currentIndex <= 0 ? items.length - 1 : currentIndex - 1;
+        }
+        
+        items[currentIndex].style.background = 'var(--bg-card-hover)';
+        items[currentIndex].style.paddingLeft = '16px';
+        items[currentIndex].scrollIntoView({ block: 'nearest' });
+      }
+    }
+
+    async function applyPlace(){
+      const q = document.getElementById('place').value.trim();
+      if (!q) return;
+      const list = document.getElementById('place-list');
+      try {
+        const res = await fetch(`/api/places?q=${encodeURIComponent(q)}`);
+        const json = await res.json();
+        if (json.ok && json.data && json.data.length){
+          const best = json.data[0];
+          document.getElementById('place').value = best.name;
+          const lat = parseFloat(best.lat);
+          const lon = parseFloat(best.lon);
+          document.getElementById('lat').value = lat.toFixed(4);
+          document.getElementById('lon').value = lon.toFixed(4);
+          list.innerHTML='';
+          try {
+            const dt = document.getElementById('dt').value;
+            const tzRes = await fetch(`/api/tz?datetime=${encodeURIComponent(dt)}&lat=${lat}&lon=${lon}`);
+            const tzJson = await tzRes.json();
+            if (tzJson.ok) document.getElementById('tz').value = tzJson.data.tz_offset;
+          } catch {}
+        } else {
+          list.innerHTML='';
+        }
+      } catch { list.innerHTML=''; }
+    }
+      async function applyPlace(){
+        const q = document.getElementById('place').value.trim();
+        const list = document.getElementById('place-list');
+        if (!q || q.length < 3){
+          list.innerHTML = `<div style="background:#fff; border:1px solid #ddd; padding:8px">Type at least 3 characters</div>`;
+          return;
+        }
+        // If suggestions are already visible, pick the first instantly
+        const first = list.querySelector('.item');
+        if (first) { first.dispatchEvent(new Event('mousedown')); return; }
+        // Use cache if available for instant response
+        const key = q.toLowerCase();
+        if (placeCache.has(key) && placeCache.get(key).length){
+          const best = placeCache.get(key)[0];
+          document.getElementById('place').value = best.name;
+          const lat = parseFloat(best.lat);
+          const lon = parseFloat(best.lon);
+          document.getElementById('lat').value = lat.toFixed(4);
+          document.getElementById('lon').value = lon.toFixed(4);
+          list.innerHTML='';
+          try {
+            const dt = document.getElementById('dt').value;
+            const tzRes = await fetch(`/api/tz?datetime=${encodeURIComponent(dt)}&lat=${lat}&lon=${lon}`);
+            const tzJson = await tzRes.json();
+            if (tzJson.ok) document.getElementById('tz').value = tzJson.data.tz_offset;
+          } catch {}
+          return;
+        }
+        try {
+          const res = await fetch(`/api/places?q=${encodeURIComponent(q)}`);
+          const json = await res.json();
+          if (json.ok && json.data && json.data.length){
+            const best = json.data[0];
+            document.getElementById('place').value = best.name;
+            const lat = parseFloat(best.lat);
+            const lon = parseFloat(best.lon);
+            document.getElementById('lat').value = lat.toFixed(4);
+            document.getElementById('lon').value = lon.toFixed(4);
+            list.innerHTML='';
+            try {
+              const dt = document.getElementById('dt').value;
+              const tzRes = await fetch(`/api/tz?datetime=${encodeURIComponent(dt)}&lat=${lat}&lon=${lon}`);
+              const tzJson = await tzRes.json();
+              if (tzJson.ok) document.getElementById('tz').value = tzJson.data.tz_offset;
+            } catch {}
+          } else {
+            list.innerHTML = `<div style="background:#fff; border:1px solid #ddd; padding:8px">No results. Try a different name.</div>`;
+          }
+        } catch {
+          list.innerHTML = `<div style="background:#fff; border:1px solid #ddd; padding:8px">Lookup failed. Check connection.</div>`;
+        }
+      }
+
+    // Collapsible sections functionality
+    function toggleSection(sectionId) {
+      const section = document.getElementById(`section-${sectionId}`);
+      const content = document.getElementById(`${sectionId}-content`);
+      const icon = document.getElementById(`${sectionId}-icon`);
+      
+      section.classList.toggle('section-expanded');
+      
+      if (section.classList.contains('section-expanded')) {
+        content.style.maxHeight = content.scrollHeight + 'px';
+      } else {
+        content.style.maxHeight = '0';
+      }
+    }
+
+    function downloadSection(sectionName) {
+      const url = `/api/download/${sectionName}?pretty=1`;
+      const link = document.createElement('a');
+      link.href = url;
+      link.download = `astrology_${sectionName}_${new Date().toISOString().slice(0,19).replace(/:/g,'-')}.json`;
+      document.body.appendChild(link);
+      link.click();
+      document.body.removeChild(link);
+    }
+
+    function renderAllSections(data) {
+      // Store data globally for modal access
+      window.lastChartData = data;
+      
+      // Show the sections container
+      document.getElementById('sections-container').style.display = 'block';
+      
+      // Render each section
+      renderChartSection(data);
+      renderDivisionalChartsSection(data);
+      renderPanchadhaMaitriSection(data);
+      renderPlanetsSection(data);
+      renderShadbalaSection(data);
+      renderShadbalaCalculatorSection(data);
+      renderHousesSection(data);
+      renderNakshatrasSection(data);
+      renderTransitsSection(data);
+      renderMahadashSection(data);
+      renderYearlySection(data);
+      
+      // Update summaries
+      updateSectionSummaries(data);
+    }
+
+    function renderChartSection(data) {
+      const content = document.getElementById('chart-details');
+      const birthInfo = data.birth_info || {};
+      
+      content.innerHTML = `
+        <div class="data-grid">
+          <div class="data-card">
+            <h4>Birth Details</h4>
+            <p><strong>Date & Time:</strong> ${new Date(birthInfo.datetime).toLocaleString()}</p>
+            <p><strong>Location:</strong> ${birthInfo.latitude}°N, ${birthInfo.longitude}°E</p>
+            <p><strong>Timezone:</strong> UTC${birthInfo.timezone_offset >= 0 ? '+' : ''}${birthInfo.timezone_offset} hours</p>
+          </div>
+          <div class="data-card">
+            <h4>Chart Settings</h4>
+            <p><strong>Ayanamsa:</strong> ${birthInfo.ayanamsa || 'Lahiri'}</p>
+            <p><strong>House System:</strong> ${birthInfo.house_system || 'Equal'}</p>
+            <p><strong>Node Type:</strong> ${birthInfo.node_type || 'Mean'}</p>
+            <p><strong>Ascendant:</strong> ${data.ascendant?.toFixed(2)}°</p>
+          </div>
+        </div>
+      `;
+    }
+
+    function renderPlanetsSection(data) {
+      const content = document.getElementById('planets-details');
+      const planets = data.planetary_analysis || {};
+      
+      let planetsHtml = '<table class="data-table"><thead><tr><th>Planet</th><th>Sign</th><th>Degree</th><th>House</th><th>Nakshatra</th><th>Pada</th></tr></thead><tbody>';
+      
+      Object.entries(planets).forEach(([planet, info]) => {
+        const nakshatra = info.nakshatra || {};
+        planetsHtml += `
+          <tr>
+            <td><strong>${planet}</strong></td>
+            <td>${info.sign || ''}</td>
+            <td>${info.degree_in_sign?.toFixed(2)}°</td>
+            <td>${info.house}</td>
+            <td>${nakshatra.name || ''}</td>
+            <td>${nakshatra.pada || ''}</td>
+          </tr>
+        `;
+      });
+      
+      planetsHtml += '</tbody></table>';
+      content.innerHTML = planetsHtml;
+    }
+
+    function renderHousesSection(data) {
+      const content = document.getElementById('houses-details');
+      const houses = data.house_analysis || {};
+      
+      let housesHtml = '<table class="data-table"><thead><tr><th>House</th><th>Sign</th><th>Cusp</th><th>Planets</th><th>Significance</th></tr></thead><tbody>';
+      
+      for (let i = 1; i <= 12; i++) {
+        const house = houses[i.toString()] || {};
+        const planetsText = house.planets?.join(', ') || 'Empty';
+        housesHtml += `
+          <tr>
+            <td><strong>${i}</strong></td>
+            <td>${house.sign || ''}</td>
+            <td>${house.cusp_degree?.toFixed(2)}°</td>
+            <td>${planetsText}</td>
+            <td style="font-size: 0.9rem;">${house.significances || ''}</td>
+          </tr>
+        `;
+      }
+      
+      housesHtml += '</tbody></table>';
+      content.innerHTML = housesHtml;
+    }
+
+    function renderNakshatrasSection(data) {
+      const content = document.getElementById('nakshatras-details');
+      const nakshatras = data.nakshatra_details || {};
+      
+      let nakshatrasHtml = '<table class="data-table"><thead><tr><th>Planet</th><th>Nakshatra</th><th>Lord</th><th>Pada</th><th>Degree in Nakshatra</th></tr></thead><tbody>';
+      
+      Object.entries(nakshatras).forEach(([planet, info]) => {
+        nakshatrasHtml += `
+          <tr>
+            <td><strong>${planet}</strong></td>
+            <td>${info.nakshatra_name || ''}</td>
+            <td>${info.nakshatra_lord || ''}</td>
+            <td>${info.pada || ''}</td>
+            <td>${info.degree_in_nakshatra?.toFixed(3)}°</td>
+          </tr>
+        `;
+      });
+      
+      nakshatrasHtml += '</tbody></table>';
+      content.innerHTML = nakshatrasHtml;
+    }
+
+    function renderTransitsSection(data) {
+      const content = document.getElementById('transits-details');
+      const transits = data.current_transits || {};
+      const transitData = transits.transits || {};
+      
+      let transitsHtml = `
+        <div class="highlight" style="margin-bottom: 1rem;">
+          <strong>Transit Calculation Time:</strong> ${new Date(transits.calculation_time).toLocaleString()}
+        </div>
+        <table class="data-table">
+          <thead>
+            <tr><th>Planet</th><th>Birth Position</th><th>Current Position</th><th>Current Sign</th><th>Current House</th><th>Movement</th></tr>
+          </thead>
+          <tbody>
+      `;
+      
+      Object.entries(transitData).forEach(([planet, transit]) => {
+        transitsHtml += `
+          <tr>
+            <td><strong>${planet}</strong></td>
+            <td>${transit.birth_longitude?.toFixed(2)}°</td>
+            <td>${transit.current_longitude?.toFixed(2)}°</td>
+            <td>${transit.current_sign || ''}</td>
+            <td>${transit.current_house || ''}</td>
+            <td>${transit.degree_difference?.toFixed(1)}°</td>
+          </tr>
+        `;
+      });
+      
+      transitsHtml += '</tbody></table>';
+      content.innerHTML = transitsHtml;
+    }
+
+    function renderShadbalaSection(data) {
+      const content = document.getElementById('shadbala-details');
+      const shadbala = data.shadbala?.shadbala_scores || {};
+      
+      if (!Object.keys(shadbala).length) {
+        content.innerHTML = '<p>No Shadbala data available.</p>';
+        return;
+      }
+      
+      let shadbalaHtml = `
+        <div class="highlight" style="margin-bottom: 1rem; text-align: center;">
+          <strong>Shadbala Planetary Strength Analysis</strong><br>
+          <small>Six-fold strength calculation measuring planetary power and effectiveness</small>
+        </div>
+        
+        <div class="strength-overview" style="display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 1rem; margin-bottom: 2rem;">
+      `;
+      
+      // Create strength cards for each planet
+      Object.entries(shadbala).forEach(([planet, strength]) => {
+        const percentage = strength.strength_percentage;
+        const category = strength.category;
+        
+        // Color coding based on strength
+        let cardColor = '#f8d7da'; // Weak - red
+        let textColor = '#721c24';
+        if (percentage >= 100) {
+          cardColor = '#d1f2eb'; // Strong - green
+          textColor = '#155724';
+        } else if (percentage >= 75) {
+          cardColor = '#fff3cd'; // Good - yellow
+          textColor = '#856404';
+        } else if (percentage >= 50) {
+          cardColor = '#cce5ff'; // Average - blue
+          textColor = '#004085';
+        }
+        
+        shadbalaHtml += `
+          <div class="strength-card" style="background: ${cardColor}; color: ${textColor}; padding: 1rem; border-radius: 8px; text-align: center; border: 1px solid rgba(0,0,0,0.1);">
+            <div style="font-size: 1.1rem; font-weight: 600; margin-bottom: 0.5rem;">${planet}</div>
+            <div style="font-size: 2rem; font-weight: bold; margin-bottom: 0.3rem;">${percentage.toFixed(0)}%</div>
+            <div style="font-size: 0.9rem; margin-bottom: 0.3rem;">${category}</div>
+            <div style="font-size: 0.8rem; opacity: 0.8;">
+              ${strength.total_shadbala} / ${strength.required_strength}
+            </div>
+            <div class="strength-bar" style="width: 100%; height: 4px; background: rgba(0,0,0,0.2); border-radius: 2px; margin-top: 0.5rem; overflow: hidden;">
+              <div style="width: ${Math.min(100, percentage)}%; height: 100%; background: ${textColor}; transition: width 0.3s ease;"></div>
+            </div>
+          </div>
+        `;
+      });
+      
+      shadbalaHtml += `
+        </div>
+        
+        <table class="data-table">
+          <thead>
+            <tr>
+              <th>Planet</th>
+              <th>Total Score</th>
+              <th>Percentage</th>
+              <th>Category</th>
+              <th>Sthana Bala</th>
+              <th>Dig Bala</th>
+              <th>Kala Bala</th>
+              <th>Chesta Bala</th>
+              <th>Naisargika</th>
+              <th>Drik Bala</th>
+            </tr>
+          </thead>
+          <tbody>
+      `;
+      
+      Object.entries(shadbala).forEach(([planet, strength]) => {
+        const components = strength.components;
+        const categoryClass = strength.category.toLowerCase().replace(/\s+/g, '-');
+        
+        // Check if detailed breakdown is available
+        const breakdown = strength.sthana_bala_breakdown || {};
+        const hasBreakdown = Object.keys(breakdown).length > 0;
+        
+        shadbalaHtml += `
+          <tr class="strength-row-${categoryClass}">
+            <td><strong>${planet}</strong></td>
+            <td><strong>${strength.total_shadbala}</strong></td>
+            <td><strong>${strength.strength_percentage.toFixed(1)}%</strong></td>
+            <td><span class="strength-badge strength-badge-${categoryClass}">${strength.category}</span></td>
+            <td>
+              ${components.sthana_bala}
+              ${hasBreakdown ? `<br><small style="color: #666; font-size: 0.75rem;">UchchaBala: ${breakdown.uchcha_bala || 0}</small>` : ''}
+            </td>
+            <td>${components.dig_bala}</td>
+            <td>${components.kala_bala}</td>
+            <td>${components.chesta_bala}</td>
+            <td>${components.naisargika_bala}</td>
+            <td>${components.drik_bala}</td>
+          </tr>
+        `;
+      });
+      
+      shadbalaHtml += `
+          </tbody>
+        </table>
+        
+
+        
+        <div class="strength-legend" style="margin-top: 1.5rem; padding: 1rem; background: #f8f9fa; border-radius: 6px; border-left: 4px solid #007bff;">
+          <h4 style="margin: 0 0 0.5rem 0; color: #495057;">Strength Components Explained:</h4>
+          <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(250px, 1fr)); gap: 0.5rem; font-size: 0.85rem;">
+            <div><strong>Sthana Bala:</strong> Positional strength (exaltation, own sign, etc.)</div>
+            <div><strong>UchchaBala:</strong> Distance-based strength from debilitation point</div>
+            <div><strong>Dig Bala:</strong> Directional strength (angular house placement)</div>
+            <div><strong>Kala Bala:</strong> Temporal strength (day/night, lunar phase)</div>
+            <div><strong>Chesta Bala:</strong> Motional strength (planetary speed/retrograde)</div>
+            <div><strong>Naisargika:</strong> Natural inherent strength of each planet</div>
+            <div><strong>Drik Bala:</strong> Aspectual strength (beneficial/malefic aspects)</div>
+          </div>
+        </div>
+      `;
+      
+      content.innerHTML = shadbalaHtml;
+    }
+
+    function renderShadbalaCalculatorSection(data) {
+      const content = document.getElementById('shadbala-calculator-details');
+      const shadbala = data.shadbala?.shadbala_scores || {};
+      
+      if (!shadbala || Object.keys(shadbala).length === 0) {
+        content.innerHTML = '<p>No Shadbala calculation data available.</p>';
+        return;
+      }
+      
+      let calculatorHtml = `
+        <div style="margin-bottom: 2rem;">
+          <div class="highlight" style="margin-bottom: 1.5rem; padding: 1rem; background: linear-gradient(135deg, #e3f2fd 0%, #bbdefb 100%); border-radius: 8px; border-left: 4px solid #2196f3;">
+            <h4 style="margin: 0 0 0.5rem 0; color: #1565c0;">
+              🧮 Shadbala Calculator - Detailed Component Analysis
+            </h4>
+            <p style="margin: 0; color: #424242; font-size: 0.95rem;">
+              Calculate individual strength components using classical Vedic formulas. This section provides detailed breakdowns of each Shadbala component with precise calculations and percentage strengths.
+            </p>
+          </div>
+        </div>
+        
+        <!-- UchchaBala Detailed Analysis -->
+        <div style="margin-bottom: 2rem;">
+          <h4 style="color: #495057; border-bottom: 2px solid #007bff; padding-bottom: 0.5rem; margin-bottom: 1rem;">
+            🎯 UchchaBala Analysis (Exaltation Strength)
+          </h4>
+          <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(300px, 1fr)); gap: 1rem; margin-bottom: 1.5rem;">
+      `;
+      
+      // Add UchchaBala cards for each planet
+      Object.entries(shadbala).forEach(([planet, strength]) => {
+        console.log('DEBUG: planet:', planet, 'strength:', strength);
+        const breakdown = strength.sthana_bala_breakdown || {};
+        console.log('DEBUG: breakdown:', breakdown);
+        const uchcha_bala = breakdown.uchcha_bala || 0;
+        const percentage = (uchcha_bala / 60) * 100; // Max UchchaBala is 60
+        
+        let strengthLevel = 'Very Weak';
+        let colorClass = 'weak';
+        if (percentage >= 80) {
+          strengthLevel = 'Excellent';
+          colorClass = 'excellent';
+        } else if (percentage >= 60) {
+          strengthLevel = 'Strong'; 
+          colorClass = 'strong';
+        } else if (percentage >= 40) {
+          strengthLevel = 'Good';
+          colorClass = 'good';
+        } else if (percentage >= 20) {
+          strengthLevel = 'Average';
+          colorClass = 'average';
+        }
+        
+        calculatorHtml += `
+          <div class="uchcha-card uchcha-${colorClass}" style="padding: 1rem; border-radius: 8px; border: 1px solid #ddd; background: linear-gradient(135deg, #f8f9fa 0%, #e9ecef 100%);">
+            <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 0.8rem;">
+              <h5 style="margin: 0; color: #2c3e50;">${planet}</h5>
+              <span class="uchcha-badge uchcha-badge-${colorClass}" style="padding: 0.2rem 0.6rem; border-radius: 12px; font-size: 0.75rem; font-weight: 600;">
+                ${strengthLevel}
+              </span>
+            </div>
+            <div style="font-size: 1.5rem; font-weight: bold; color: #495057; margin-bottom: 0.5rem;">
+              ${uchcha_bala.toFixed(2)} / 60
+            </div>
+            <div style="font-size: 0.9rem; color: #666; margin-bottom: 0.8rem;">
+              ${percentage.toFixed(1)}% of maximum strength
+            </div>
+            <div class="uchcha-bar" style="width: 100%; height: 6px; background: #e9ecef; border-radius: 3px; overflow: hidden;">
+              <div style="width: ${Math.min(100, percentage)}%; height: 100%; background: linear-gradient(90deg, #007bff 0%, #28a745 100%); transition: width 0.5s ease;"></div>
+            </div>
+            <div style="font-size: 0.75rem; color: #6c757d; margin-top: 0.5rem;">
+              Formula: Distance from debilitation ÷ 3
+            </div>
+          </div>
+        `;
+      });
+      
+      calculatorHtml += `
+          </div>
+          
+          <div class="uchcha-formula-explanation" style="padding: 1rem; background: #f8f9fa; border-radius: 6px; border-left: 4px solid #28a745; margin-top: 1rem;">
+            <h5 style="margin: 0 0 0.5rem 0; color: #155724;">📚 UchchaBala Formula Explanation:</h5>
+            <div style="font-size: 0.9rem; color: #495057; line-height: 1.4;">
+              <strong>Classical Formula:</strong> UchchaBala = (Planet Longitude - Debilitation Point) ÷ 3<br>
+              <strong>Maximum Value:</strong> 60 points (when planet is at exact exaltation degree)<br>
+              <strong>Minimum Value:</strong> 0 points (when planet is at exact debilitation degree)<br>
+              <strong>Interpretation:</strong> Measures strength based on distance from weakness point
+            </div>
+          </div>
+        </div>
+        
+        <!-- SaptavarigiyaBala Analysis -->
+        <div style="margin-bottom: 2rem;">
+          <h4 style="color: #495057; border-bottom: 2px solid #007bff; padding-bottom: 0.5rem; margin-bottom: 1rem;">
+            🎯 SaptavarigiyaBala Analysis (Seven-fold Divisional Strength)
+          </h4>
+      `;
+      
+      // Add SaptavarigiyaBala analysis if available
+      if (data.shadbala?._saptavargiya_analysis && data.shadbala._saptavargiya_analysis.planet_totals) {
+        const saptavargiya = data.shadbala._saptavargiya_analysis;
+        const planetTotals = saptavargiya.planet_totals;
+        const chartScores = saptavargiya.planet_chart_scores;
+        
+        calculatorHtml += `
+          <div class="saptavargiya-overview" style="margin-bottom: 1.5rem;">
+            <div class="highlight" style="padding: 1rem; background: linear-gradient(135deg, #fff3e0 0%, #ffe0b2 100%); border-radius: 8px; border-left: 4px solid #ff9800;">
+              <h5 style="margin: 0 0 0.5rem 0; color: #e65100;">📈 SaptavarigiyaBala Overview</h5>
+              <p style="margin: 0; color: #424242; font-size: 0.9rem;">
+                Classical seven-chart analysis combining Rashi, Hora, Drekkana, Saptamsa, Navamsa, Dwadasamsa, and Trimsamsa charts with Panchadha Maitri relationships to determine precise planetary strength.
+              </p>
+            </div>
+          </div>
+          
+          <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(320px, 1fr)); gap: 1rem; margin-bottom: 1.5rem;">
+        `;
+        
+        // Create cards for each planet's SaptavarigiyaBala
+        Object.entries(planetTotals).forEach(([planet, total]) => {
+          // Safety check for undefined values
+          if (total === undefined || total === null) {
+            console.warn(`SaptavarigiyaBala total undefined for ${planet}`);
+            total = 0;
+          }
+          
+          const maxPoints = 7 * 45; // Maximum possible points (7 charts × 45 Mooltrikona points)
+          const percentage = (total / maxPoints) * 100;
+          
+          let strengthLevel = 'Very Weak';
+          let colorClass = 'weak';
+          if (percentage >= 70) {
+            strengthLevel = 'Excellent';
+            colorClass = 'excellent';
+          } else if (percentage >= 55) {
+            strengthLevel = 'Strong'; 
+            colorClass = 'strong';
+          } else if (percentage >= 40) {
+            strengthLevel = 'Good';
+            colorClass = 'good';
+          } else if (percentage >= 25) {
+            strengthLevel = 'Average';
+            colorClass = 'average';
+          }
+          
+          calculatorHtml += `
+            <div class="saptavargiya-card saptavargiya-${colorClass}" style="padding: 1rem; border-radius: 8px; border: 1px solid #ddd; background: linear-gradient(135deg, #f8f9fa 0%, #e9ecef 100%);">
+              <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 0.8rem;">
+                <h5 style="margin: 0; color: #2c3e50;">${planet}</h5>
+                <span class="saptavargiya-badge saptavargiya-badge-${colorClass}" style="padding: 0.2rem 0.6rem; border-radius: 12px; font-size: 0.75rem; font-weight: 600;">
+                  ${strengthLevel}
+                </span>
+              </div>
+              <div style="font-size: 1.5rem; font-weight: bold; color: #495057; margin-bottom: 0.5rem;">
+                ${total.toFixed(1)} / ${maxPoints}
+              </div>
+              <div style="font-size: 0.9rem; color: #666; margin-bottom: 0.8rem;">
+                ${percentage.toFixed(1)}% of maximum strength
+              </div>
+              <div class="saptavargiya-bar" style="width: 100%; height: 6px; background: #e9ecef; border-radius: 3px; overflow: hidden;">
+                <div style="width: ${Math.min(100, percentage)}%; height: 100%; background: linear-gradient(90deg, #ff9800 0%, #4caf50 100%); transition: width 0.5s ease;"></div>
+              </div>
+              <button onclick="showSaptavargivaDetails('${planet}')" style="margin-top: 0.8rem; padding: 0.4rem 0.8rem; background: #007bff; color: white; border: none; border-radius: 4px; font-size: 0.8rem; cursor: pointer;">
+                View Chart Breakdown
+              </button>
+            </div>
+          `;
+        });
+        
+        calculatorHtml += `
+          </div>
+          
+          <div class="saptavargiya-formula-explanation" style="padding: 1rem; background: #f8f9fa; border-radius: 6px; border-left: 4px solid #ff9800; margin-top: 1rem;">
+            <h5 style="margin: 0 0 0.5rem 0; color: #e65100;">📚 SaptavarigiyaBala Point System:</h5>
+            <div style="font-size: 0.9rem; color: #495057; line-height: 1.4;">
+              <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 0.5rem;">
+                <div><strong>Mooltrikona:</strong> 45 points</div>
+                <div><strong>Own Sign:</strong> 30 points</div>
+                <div><strong>Extreme Friend:</strong> 22.5 points</div>
+                <div><strong>Friend:</strong> 15 points</div>
+                <div><strong>Neutral:</strong> 7.5 points</div>
+                <div><strong>Enemy:</strong> 3.75 points</div>
+                <div><strong>Extreme Enemy:</strong> 1.875 points</div>
+              </div>
+            </div>
+          </div>
+          
+          <!-- Detailed Chart Breakdown Modal (will be populated dynamically) -->
+          <div id="saptavargiya-details-modal" style="display: none; position: fixed; top: 0; left: 0; width: 100%; height: 100%; background: rgba(0,0,0,0.5); z-index: 1000;">
+            <div style="position: absolute; top: 50%; left: 50%; transform: translate(-50%, -50%); background: white; padding: 2rem; border-radius: 8px; max-width: 80%; max-height: 80%; overflow-y: auto;">
+              <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 1rem;">
+                <h4 id="saptavargiya-modal-title">Planet Chart Breakdown</h4>
+                <button onclick="closeSaptavargivaDetails()" style="background: #dc3545; color: white; border: none; border-radius: 4px; padding: 0.5rem; cursor: pointer;">×</button>
+              </div>
+              <div id="saptavargiya-modal-content"></div>
+            </div>
+          </div>
+          
+          <!-- YugmayugmaBala Details Modal -->
+          <div id="yugmayugma-details-modal" style="display: none; position: fixed; top: 0; left: 0; width: 100%; height: 100%; background: rgba(0,0,0,0.5); z-index: 1000;">
+            <div style="position: absolute; top: 50%; left: 50%; transform: translate(-50%, -50%); background: white; padding: 2rem; border-radius: 8px; max-width: 80%; max-height: 80%; overflow-y: auto;">
+              <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 1rem;">
+                <h4 id="yugmayugma-modal-title">YugmayugmaBala Analysis</h4>
+                <button onclick="closeYugmayugmaDetails()" style="background: #dc3545; color: white; border: none; border-radius: 4px; padding: 0.5rem; cursor: pointer;">×</button>
+              </div>
+              <div id="yugmayugma-modal-content"></div>
+            </div>
+          </div>
+          
+          <!-- KendraBala Details Modal -->
+          <div id="kendra-details-modal" style="display: none; position: fixed; top: 0; left: 0; width: 100%; height: 100%; background: rgba(0,0,0,0.5); z-index: 1000;">
+            <div style="position: absolute; top: 50%; left: 50%; transform: translate(-50%, -50%); background: white; padding: 2rem; border-radius: 8px; max-width: 80%; max-height: 80%; overflow-y: auto;">
+              <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 1rem;">
+                <h4 id="kendra-modal-title">KendraBala Analysis</h4>
+                <button onclick="closeKendraDetails()" style="background: #dc3545; color: white; border: none; border-radius: 4px; padding: 0.5rem; cursor: pointer;">×</button>
+              </div>
+              <div id="kendra-modal-content"></div>
+            </div>
+          </div>
+
+          <!-- DreshkonBala Details Modal -->
+          <div id="dreshkon-details-modal" style="display: none; position: fixed; top: 0; left: 0; width: 100%; height: 100%; background: rgba(0,0,0,0.5); z-index: 1000;">
+            <div style="position: absolute; top: 50%; left: 50%; transform: translate(-50%, -50%); background: white; padding: 2rem; border-radius: 8px; max-width: 80%; max-height: 80%; overflow-y: auto;">
+              <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 1rem;">
+                <h4 id="dreshkon-modal-title">DreshkonBala Analysis</h4>
+                <button onclick="closeDreshkonDetails()" style="background: #dc3545; color: white; border: none; border-radius: 4px; padding: 0.5rem; cursor: pointer;">×</button>
+              </div>
+              <div id="dreshkon-modal-content"></div>
+            </div>
+          </div>
+        `;
+      } else {
+        calculatorHtml += `
+          <div style="padding: 1rem; background: #f8f9fa; border-radius: 6px; color: #666; text-align: center;">
+            SaptavarigiyaBala analysis not available. This requires comprehensive divisional chart and Panchadha Maitri calculations.
+          </div>
+        `;
+      }
+      
+      calculatorHtml += `
+        </div>
+        
+        <!-- YugmayugmaBala Analysis -->
+        <div style="margin-bottom: 2rem;">
+          <h4 style="color: #495057; border-bottom: 2px solid #007bff; padding-bottom: 0.5rem; margin-bottom: 1rem;">
+            🎯 YugmayugmaBala Analysis (Odd/Even Sign Strength)
+          </h4>
+      `;
+      
+      // Add YugmayugmaBala analysis if available
+      if (data.shadbala?._yugmayugma_analysis) {
+        const yugmayugma = data.shadbala._yugmayugma_analysis;
+        const planetScores = yugmayugma.planet_scores || {};
+        const planetDetails = yugmayugma.planet_details || {};
+        const calculationRules = yugmayugma.calculation_rules || {};
+        
+        calculatorHtml += `
+          <div class="yugmayugma-overview" style="margin-bottom: 1.5rem;">
+            <div class="highlight" style="padding: 1rem; background: linear-gradient(135deg, #f3e5f5 0%, #e1bee7 100%); border-radius: 8px; border-left: 4px solid #9c27b0;">
+              <h5 style="margin: 0 0 0.5rem 0; color: #4a148c;">🌗 YugmayugmaBala Overview</h5>
+              <div style="font-size: 0.9rem; color: #495057; line-height: 1.4;">
+                Strength based on planetary placement in odd or even signs in Rashi and Navamsha charts.<br>
+                <strong>Odd Sign Planets:</strong> ${calculationRules.odd_sign_planets?.join(', ') || 'Not available'}<br>
+                <strong>Even Sign Planets:</strong> ${calculationRules.even_sign_planets?.join(', ') || 'Not available'}<br>
+                <strong>Max per chart:</strong> ${calculationRules.max_points_per_chart || 0} Shashtiamsa
+              </div>
+            </div>
+          </div>
+          
+          <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(300px, 1fr)); gap: 1rem; margin-bottom: 1.5rem;">
+        `;
+        
+        // Create cards for each planet's YugmayugmaBala
+        Object.entries(planetScores).forEach(([planet, totalScore]) => {
+          const details = planetDetails[planet] || {};
+          const rashi = details.rashi_chart || {};
+          const navamsha = details.navamsha_chart || {};
+          const preference = details.planet_preference || '';
+          
+          const maxPoints = calculationRules.total_max_points || 30;
+          const percentage = (totalScore / maxPoints) * 100;
+          
+          let strengthLevel = 'Weak';
+          let colorClass = 'weak';
+          if (percentage >= 80) {
+            strengthLevel = 'Excellent';
+            colorClass = 'excellent';
+          } else if (percentage >= 60) {
+            strengthLevel = 'Strong'; 
+            colorClass = 'strong';
+          } else if (percentage >= 40) {
+            strengthLevel = 'Good';
+            colorClass = 'good';
+          } else if (percentage >= 20) {
+            strengthLevel = 'Average';
+            colorClass = 'average';
+          }
+          
+          calculatorHtml += `
+            <div class="yugmayugma-card" style="padding: 1rem; border-radius: 8px; border: 1px solid #ddd; background: linear-gradient(135deg, #f8f9fa 0%, #e9ecef 100%);">
+              <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 0.8rem;">
+                <h5 style="margin: 0; color: #2c3e50;">${planet}</h5>
+                <span class="strength-badge strength-badge-${colorClass}" style="padding: 0.2rem 0.6rem; border-radius: 12px; font-size: 0.75rem; font-weight: 600;">
+                  ${strengthLevel}
+                </span>
+              </div>
+              <div style="font-size: 1.5rem; font-weight: bold; color: #495057; margin-bottom: 0.5rem;">
+                ${totalScore} / ${maxPoints}
+              </div>
+              <div style="font-size: 0.9rem; color: #666; margin-bottom: 0.8rem;">
+                ${percentage.toFixed(1)}% strength • Prefers ${preference}
+              </div>
+              <div class="yugma-bar" style="width: 100%; height: 6px; background: #e9ecef; border-radius: 3px; overflow: hidden; margin-bottom: 0.8rem;">
+                <div style="width: ${Math.min(100, percentage)}%; height: 100%; background: linear-gradient(90deg, #9c27b0 0%, #e91e63 100%); transition: width 0.5s ease;"></div>
+              </div>
+              <div style="font-size: 0.85rem; color: #495057;">
+                <div style="margin-bottom: 0.3rem;">
+                  <strong>Rashi:</strong> ${rashi.sign_name || 'N/A'} (${rashi.sign_type || 'N/A'}) → ${rashi.points || 0} pts
+                </div>
+                <div>
+                  <strong>Navamsha:</strong> ${navamsha.sign_name || 'N/A'} (${navamsha.sign_type || 'N/A'}) → ${navamsha.points || 0} pts
+                </div>
+              </div>
+              <button onclick="showYugmayugmaDetails('${planet}')" style="width: 100%; margin-top: 0.8rem; padding: 0.4rem; background: linear-gradient(135deg, #9c27b0 0%, #e91e63 100%); color: white; border: none; border-radius: 4px; font-size: 0.8rem; cursor: pointer;">
+                📊 View Details
+              </button>
+            </div>
+          `;
+        });
+        
+        calculatorHtml += `
+          </div>
+          
+          <div class="yugmayugma-formula-explanation" style="padding: 1rem; background: #f8f9fa; border-radius: 6px; border-left: 4px solid #9c27b0; margin-top: 1rem;">
+            <h5 style="margin: 0 0 0.5rem 0; color: #4a148c;">📚 YugmayugmaBala Formula Explanation:</h5>
+            <div style="font-size: 0.9rem; color: #495057; line-height: 1.4;">
+              <strong>Classical Rules:</strong><br>
+              • <strong>Moon & Venus:</strong> Get 15 Shashtiamsa for each EVEN sign (Taurus, Cancer, Virgo, Scorpio, Capricorn, Pisces)<br>
+              • <strong>Sun, Mars, Mercury, Jupiter, Saturn:</strong> Get 15 Shashtiamsa for each ODD sign (Aries, Gemini, Leo, Libra, Sagittarius, Aquarius)<br>
+              • <strong>Maximum:</strong> 30 Shashtiamsa (15 from Rashi + 15 from Navamsha)<br>
+              • <strong>Minimum:</strong> 0 Shashtiamsa (when planet is in unfavorable sign type in both charts)
+            </div>
+          </div>
+        `;
+      } else {
+        calculatorHtml += `
+          <div style="padding: 1rem; background: #f8f9fa; border-radius: 6px; color: #666; text-align: center;">
+            YugmayugmaBala analysis not available. This requires Rashi and Navamsha chart calculations.
+          </div>
+        `;
+      }
+      
+      // Add KendraBala analysis if available
+      if (data.shadbala?._kendra_analysis) {
+        const kendra = data.shadbala._kendra_analysis;
+        const planetScores = kendra.planet_scores || {};
+        const planetDetails = kendra.planet_details || {};
+        const pointSystem = kendra.point_system || {};
+        
+        calculatorHtml += `
+        <!-- KendraBala Analysis -->
+        <div style="background: #fff; border-radius: 12px; box-shadow: 0 4px 6px rgba(0,0,0,0.1); padding: 1.5rem; margin: 1rem 0; border-left: 5px solid #28a745;">
+          <h4 style="margin: 0 0 1rem 0; color: #155724; display: flex; align-items: center; gap: 0.5rem;">
+            🏛️ KendraBala Analysis (Angular House Strength)
+          </h4>
+          
+          <div class="kendra-overview" style="margin-bottom: 1.5rem;">
+            <div style="background: #d4edda; border-radius: 8px; padding: 1rem; border: 1px solid #c3e6cb;">
+              <h5 style="margin: 0 0 0.5rem 0; color: #155724;">🎯 KendraBala Overview</h5>
+              <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 1rem; margin-top: 0.8rem;">
+                <div style="text-align: center;">
+                  <div style="font-weight: bold; color: #28a745;">${pointSystem.kendra_points || 60}</div>
+                  <div style="font-size: 0.85rem; color: #666;">Kendra (1,4,7,10)</div>
+                </div>
+                <div style="text-align: center;">
+                  <div style="font-weight: bold; color: #ffc107;">${pointSystem.panapara_points || 30}</div>
+                  <div style="font-size: 0.85rem; color: #666;">Panapara (2,5,8,11)</div>
+                </div>
+                <div style="text-align: center;">
+                  <div style="font-weight: bold; color: #dc3545;">${pointSystem.apoklima_points || 15}</div>
+                  <div style="font-size: 0.85rem; color: #666;">Apoklima (3,6,9,12)</div>
+                </div>
+              </div>
+            </div>
+          </div>
+        `;
+        
+        // Create cards for each planet's KendraBala
+        Object.keys(planetScores).forEach(planet => {
+          const score = planetScores[planet] || 0;
+          const details = planetDetails[planet] || {};
+          const houseNum = details.house_number || 0;
+          const houseType = details.house_type || 'Unknown';
+          
+          // Determine strength level and color
+          let strengthLevel = 'Weak';
+          let colorClass = 'weak';
+          if (score >= 60) {
+            strengthLevel = 'Excellent';
+            colorClass = 'excellent';
+          } else if (score >= 30) {
+            strengthLevel = 'Strong';
+            colorClass = 'strong';
+          } else if (score >= 15) {
+            strengthLevel = 'Average';
+            colorClass = 'average';
+          }
+          
+          calculatorHtml += `
+            <div class="kendra-card" style="padding: 1rem; border-radius: 8px; border: 1px solid #ddd; background: linear-gradient(135deg, #f8f9fa 0%, #e9ecef 100%); margin-bottom: 1rem;">
+              <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 0.8rem;">
+                <h5 style="margin: 0; color: #2c3e50;">${planet}</h5>
+                <span class="kendra-badge kendra-badge-${colorClass}" style="padding: 0.2rem 0.6rem; border-radius: 12px; font-size: 0.75rem; font-weight: 600;">
+                  ${strengthLevel}
+                </span>
+              </div>
+              <div style="font-size: 1.5rem; font-weight: bold; color: #495057; margin-bottom: 0.5rem;">
+                ${score} Shashtiamsa
+              </div>
+              <div style="font-size: 0.9rem; color: #666; margin-bottom: 0.8rem;">
+                House ${houseNum} (${houseType} House)
+              </div>
+              <div class="kendra-details" style="background: #f8f9fa; border-radius: 6px; padding: 0.6rem;">
+                <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 0.5rem; font-size: 0.85rem;">
+                  <div><strong>Position:</strong> House ${houseNum}</div>
+                  <div><strong>Type:</strong> ${houseType}</div>
+                  <div><strong>Points:</strong> ${score}</div>
+                  <div><strong>Classification:</strong> ${houseType === 'Kendra' ? 'Angular' : houseType === 'Panapara' ? 'Succedent' : 'Cadent'}</div>
+                </div>
+              </div>
+              <button onclick="showKendraDetails('${planet}')" style="width: 100%; margin-top: 0.8rem; padding: 0.4rem; background: linear-gradient(135deg, #28a745 0%, #20c997 100%); color: white; border: none; border-radius: 4px; font-size: 0.8rem; cursor: pointer;">
+                View Details
+              </button>
+            </div>
+          `;
+        });
+        
+        calculatorHtml += `
+          <div class="kendra-formula-explanation" style="padding: 1rem; background: #f8f9fa; border-radius: 6px; border-left: 4px solid #28a745; margin-top: 1rem;">
+            <h5 style="margin: 0 0 0.5rem 0; color: #155724;">📚 KendraBala Formula Explanation:</h5>
+            <div style="font-size: 0.9rem; color: #495057; line-height: 1.4;">
+              <strong>Classical Rules:</strong><br>
+              • <strong>Kendra Houses (1, 4, 7, 10):</strong> 60 Shashtiamsa - Angular houses with maximum strength<br>
+              • <strong>Panapara Houses (2, 5, 8, 11):</strong> 30 Shashtiamsa - Succedent houses with moderate strength<br>
+              • <strong>Apoklima Houses (3, 6, 9, 12):</strong> 15 Shashtiamsa - Cadent houses with minimum strength<br>
+              • <strong>Note:</strong> Based on planet positions in Rashi chart only (not Chalit chart)
+            </div>
+          </div>
+        `;
+      } else {
+        calculatorHtml += `
+          <div style="padding: 1rem; background: #f8f9fa; border-radius: 6px; color: #666; text-align: center; margin: 1rem 0;">
+            KendraBala analysis not available. This requires house cusp calculations.
+          </div>
+        `;
+      }
+      
+      calculatorHtml += `
+        </div>
+      `;
+
+      // Add DreshkonBala analysis if available
+      const dreshkonAnalysis = data.shadbala && data.shadbala._dreshkon_analysis;
+      
+      if (dreshkonAnalysis) {
+        calculatorHtml += `
+        <!-- DreshkonBala Analysis -->
+        <div class="shadbala-subsection" style="margin: 2rem 0; padding: 1.5rem; background: linear-gradient(135deg, #fff3cd 0%, #ffeaa7 100%); border-radius: 12px; border: 2px solid #f39c12;">
+          <h4 style="margin: 0 0 1rem 0; color: #d68910; display: flex; align-items: center; gap: 0.5rem;">
+            🎭 DreshkonBala Analysis (Decanate Strength)
+          </h4>
+          <div style="background: rgba(255, 255, 255, 0.7); padding: 1rem; border-radius: 8px; margin-bottom: 1rem;">
+            <div class="row">
+              <h5 style="margin: 0 0 0.5rem 0; color: #b7950b;">🎯 DreshkonBala Overview</h5>
+              <p style="margin: 0; color: #7d6608; font-size: 0.9rem;">
+                Strength based on planetary gender and decanate position within each sign (10° segments)
+              </p>
+            </div>
+          </div>
+          
+          <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(300px, 1fr)); gap: 1rem; margin: 1rem 0;">
+        `;
+
+        // Create cards for each planet's DreshkonBala
+        const planets = ['Sun', 'Moon', 'Mars', 'Mercury', 'Jupiter', 'Venus', 'Saturn'];
+        planets.forEach(planet => {
+          if (dreshkonAnalysis.planet_details && dreshkonAnalysis.planet_details[planet]) {
+            const details = dreshkonAnalysis.planet_details[planet];
+            const score = dreshkonAnalysis.planet_scores[planet];
+            
+            let cardColor = '#f8f9fa';
+            let strengthClass = 'weak';
+            let strengthText = 'No Strength';
+            
+            if (score > 0) {
+              cardColor = '#d4edda';
+              strengthClass = 'strong';
+              strengthText = 'Has Strength';
+            }
+            
+            calculatorHtml += `
+              <div class="dreshkon-card" style="padding: 1rem; border-radius: 8px; border: 1px solid #ddd; background: ${cardColor}; cursor: pointer;" onclick="showDreshkonDetails('${planet}')">
+                <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 0.8rem;">
+                  <h5 style="margin: 0; color: #2c3e50;">${planet}</h5>
+                  <span class="dreshkon-badge" style="padding: 0.2rem 0.6rem; border-radius: 12px; font-size: 0.75rem; font-weight: 600; background: ${score > 0 ? '#d4edda' : '#f8d7da'}; color: ${score > 0 ? '#155724' : '#721c24'};">
+                    ${strengthText}
+                  </span>
+                </div>
+                <div style="font-size: 1.5rem; font-weight: bold; color: #495057; margin-bottom: 0.5rem;">
+                  ${score} Shashtiamsa
+                </div>
+                <div style="font-size: 0.9rem; color: #666; margin-bottom: 0.8rem;">
+                  ${details.planet_gender} planet in ${details.dreshkon_name} Dreshkon
+                </div>
+                <div style="font-size: 0.8rem; color: #868e96;">
+                  ${details.sign_name} ${details.degree_in_sign.toFixed(1)}° • Click for details
+                </div>
+              </div>
+            `;
+          }
+        });
+
+        calculatorHtml += `
+          </div>
+          
+          <div style="background: rgba(255, 255, 255, 0.8); padding: 1rem; border-radius: 8px; margin-top: 1.5rem;">
+            <h5 style="margin: 0 0 0.5rem 0; color: #b7950b;">📚 DreshkonBala Formula Explanation:</h5>
+            <div style="font-size: 0.9rem; color: #7d6608; line-height: 1.5;">
+              <div style="margin-bottom: 0.5rem;"><strong>Male planets</strong> (Sun, Mars, Jupiter): Get 15 Shashtiamsa in <strong>1st Dreshkon</strong> (0°-10°)</div>
+              <div style="margin-bottom: 0.5rem;"><strong>Hermaphrodite planets</strong> (Mercury, Saturn): Get 15 Shashtiamsa in <strong>2nd Dreshkon</strong> (10°-20°)</div>
+              <div><strong>Female planets</strong> (Moon, Venus): Get 15 Shashtiamsa in <strong>3rd Dreshkon</strong> (20°-30°)</div>
+            </div>
+          </div>
+        </div>
+        `;
+      } else {
+        calculatorHtml += `
+          <div style="padding: 1rem; background: #f8f9fa; border-radius: 6px; color: #666; text-align: center; margin: 1rem 0;">
+            DreshkonBala analysis not available.
+          </div>
+        `;
+      }
+      
+      content.innerHTML = calculatorHtml;
+    }
+
+    function renderDivisionalChartsSection(data) {
+      const content = document.getElementById('divisional-charts-details');
+      const divisionalCharts = data.divisional_charts || {};
+      
+      if (!divisionalCharts || Object.keys(divisionalCharts).length === 0) {
+        content.innerHTML = '<p>No divisional charts data available.</p>';
+        return;
+      }
+      
+      let chartsHtml = `
+        <div style="margin-bottom: 2rem;">
+          <div class="highlight" style="margin-bottom: 1.5rem; padding: 1rem; background: linear-gradient(135deg, #e8f5e8 0%, #d4edda 100%); border-radius: 8px; border-left: 4px solid #28a745;">
+            <h4 style="margin: 0 0 0.5rem 0; color: #155724;">
+              📊 Divisional Charts (Vargas) - BPHS Traditional Calculations
+            </h4>
+            <p style="margin: 0; color: #424242; font-size: 0.95rem;">
+              Examine planetary placements in various divisional charts using classical Vedic formulas. Each chart reveals specific aspects of life and planetary strength.
+            </p>
+          </div>
+        </div>
+      `;
+      
+      // Chart descriptions
+      const chartDescriptions = {
+        'D2': 'Wealth, family values, and material resources',
+        'D3': 'Siblings, communication, short journeys, and courage',
+        'D7': 'Children, creativity, and progeny matters',
+        'D9': 'Marriage, dharma, fortune, and spiritual path',
+        'D12': 'Parents, ancestors, and family lineage',
+        'D30': 'Struggles, obstacles, and challenges in life',
+        'D4': 'Property, home, and fixed assets',
+        'D10': 'Career, profession, and status',
+        'D16': 'Vehicles, comforts, and happiness',
+        'D20': 'Spiritual practice and devotion',
+        'D24': 'Education and learning',
+        'D27': 'Strengths and weaknesses',
+        'D40': 'Maternal legacy and auspicious effects',
+        'D45': 'Paternal legacy and character',
+        'D60': 'Past karma and overall results'
+      };
+      
+      // Create tabs for each chart
+      const chartKeys = ['D2', 'D3', 'D4', 'D7', 'D9', 'D10', 'D12', 'D16', 'D20', 'D24', 'D27', 'D30', 'D40', 'D45', 'D60'];
+      
+      // Generate tab navigation
+      chartsHtml += `
+        <div class="divisional-charts-container">
+          <div class="chart-tabs" style="display: flex; flex-wrap: wrap; gap: 0.5rem; margin-bottom: 1.5rem; border-bottom: 2px solid #e9ecef; padding-bottom: 0.5rem;">
+      `;
+      
+      chartKeys.forEach((chartKey, index) => {
+        const chart = divisionalCharts[chartKey] || {};
+        const isActive = index === 0 ? 'active' : '';
+        chartsHtml += `
+          <button class="chart-tab-btn ${isActive}" onclick="showDivisionalChart('${chartKey}')" 
+                  style="padding: 0.5rem 1rem; border: none; background: ${index === 0 ? '#007bff' : '#f8f9fa'}; 
+                         color: ${index === 0 ? 'white' : '#495057'}; border-radius: 6px; cursor: pointer; font-weight: 500; transition: all 0.3s;">
+            ${chart.name || chartKey}
+          </button>
+        `;
+      });
+      
+      chartsHtml += `
+          </div>
+          
+          <div class="chart-contents">
+      `;
+      
+      // Generate content for each chart
+      chartKeys.forEach((chartKey, index) => {
+        const chart = divisionalCharts[chartKey] || {};
+        const isActive = index === 0 ? 'block' : 'none';
+        const description = chartDescriptions[chartKey] || 'Specialized divisional analysis';
+        
+        chartsHtml += `
+          <div id="chart-${chartKey}" class="chart-content" style="display: ${isActive};">
+            <div style="margin-bottom: 1.5rem; padding: 1rem; background: #f8f9fa; border-radius: 6px; border-left: 4px solid #17a2b8;">
+              <h5 style="margin: 0 0 0.5rem 0; color: #0c5460;">
+                ${chart.name || chartKey} - ${description}
+              </h5>
+              <div style="font-size: 0.9rem; color: #6c757d;">
+                Division: ${chart.division || 'N/A'} parts per sign • Traditional ${chartKey} analysis
+              </div>
+            </div>
+        `;
+        
+        if (chart.error) {
+          chartsHtml += `
+            <div style="padding: 1rem; background: #f8d7da; color: #721c24; border-radius: 6px; border-left: 4px solid #dc3545;">
+              <strong>Calculation Error:</strong> ${chart.error}
+            </div>
+          `;
+        } else if (chart.planetsByHouse) {
+          // Render the 8x8 South Indian style chart
+          chartsHtml += `
+            <div class="divisional-chart-grid" style="margin-bottom: 2rem;">
+              <table class="south-indian-chart" style="width: 100%; border-collapse: collapse; margin: 0 auto; max-width: 600px;">
+          `;
+          
+          // Generate South Indian style chart (same format as main chart)
+          for (let row = 0; row < 4; row++) {
+            chartsHtml += '<tr>';
+            for (let col = 0; col < 4; col++) {
+              // Skip cells that are covered by the center label's colspan/rowspan
+              if ((row === 1 && col === 2) || (row === 2 && col === 1) || (row === 2 && col === 2)) {
+                continue;
+              }
+              
+              let houseNum;
+              
+              // South Indian chart house mapping
+              if (row === 0 && col === 0) houseNum = 12;
+              else if (row === 0 && col === 1) houseNum = 1;
+              else if (row === 0 && col === 2) houseNum = 2;
+              else if (row === 0 && col === 3) houseNum = 3;
+              else if (row === 1 && col === 0) houseNum = 11;
+              else if (row === 1 && col === 1) houseNum = null; // Center area with chart label
+              else if (row === 1 && col === 3) houseNum = 4;
+              else if (row === 2 && col === 0) houseNum = 10;
+              else if (row === 2 && col === 3) houseNum = 5;
+              else if (row === 3 && col === 0) houseNum = 9;
+              else if (row === 3 && col === 1) houseNum = 8;
+              else if (row === 3 && col === 2) houseNum = 7;
+              else if (row === 3 && col === 3) houseNum = 6;
+              
+              if (houseNum === null) {
+                // Center cell with chart name spanning 2x2 area
+                const chartLabel = chartKey === 'D2' ? 'HORA' : 
+                                 chartKey === 'D3' ? 'DREKKANA' :
+                                 chartKey === 'D7' ? 'SAPTAMSA' :
+                                 chartKey === 'D9' ? 'NAVAMSA' :
+                                 chartKey === 'D12' ? 'DWADASAMSA' :
+                                 chartKey === 'D30' ? 'TRIMSAMSA' : chartKey;
+                
+                chartsHtml += `<td colspan="2" rowspan="2" class="chart-label-cell" style="border: 2px solid #007bff; width: 50%; height: 160px; background: linear-gradient(135deg, #e3f2fd 0%, #bbdefb 50%, #90caf9 100%); display: table-cell; vertical-align: middle; text-align: center; position: relative;">
+                  <div style="display: flex; flex-direction: column; justify-content: center; align-items: center; height: 100%; padding: 10px;">
+                    <div style="font-weight: bold; font-size: 1.4rem; color: #0d47a1; line-height: 1.2; text-shadow: 1px 1px 2px rgba(0,0,0,0.1);">${chartLabel}</div>
+                    <div style="font-size: 0.9rem; color: #1565c0; margin-top: 4px; font-weight: 600;">(${chartKey})</div>
+                    <div style="font-size: 0.75rem; color: #424242; margin-top: 4px; opacity: 0.8;">Division: ${chart.division || 'N/A'}</div>
+                  </div>
+                </td>`;
+              } else {
+                const planetsInHouse = chart.planetsByHouse[houseNum.toString()] || [];
+                chartsHtml += `
+                  <td class="sign-cell" data-house="${houseNum}" style="border: 2px solid #495057; width: 25%; height: 80px; position: relative; background: white; vertical-align: top; padding: 4px;">
+                    <div class="sign-content" style="height: 100%; display: flex; flex-direction: column;">
+                      <div class="sign-number" style="font-weight: bold; font-size: 0.8rem; color: #6c757d; margin-bottom: 2px;">${houseNum}</div>
+                      <div class="planets-container" style="flex: 1; display: flex; flex-wrap: wrap; gap: 2px; align-content: flex-start;">
+                `;
+                
+                planetsInHouse.forEach(planet => {
+                  const isAscendant = planet.name === 'Lagna';
+                  const displayName = isAscendant ? 'ASC' : planet.abbr;
+                  const bgColor = isAscendant ? '#ffc107' : 
+                                 ['Sun', 'Mars'].includes(planet.name) ? '#dc3545' :
+                                 ['Jupiter', 'Venus'].includes(planet.name) ? '#28a745' :
+                                 '#6c757d';
+                  
+                  chartsHtml += `
+                    <span class="planet-marker ${isAscendant ? 'ascendant-marker' : ''}" style="background: ${bgColor}; color: ${isAscendant ? '#212529' : 'white'}; padding: 1px 3px; border-radius: 3px; font-size: ${isAscendant ? '0.75rem' : '0.7rem'}; font-weight: bold; line-height: 1; min-width: 16px; text-align: center; ${isAscendant ? 'border: 1px solid #ffc107;' : ''}" title="${planet.name} in ${planet.sign} (Ruler: ${planet.ruler})">
+                      ${displayName}
+                    </span>
+                  `;
+                });
+                
+                chartsHtml += `
+                      </div>
+                    </div>
+                  </td>
+                `;
+              }
+            }
+            chartsHtml += '</tr>';
+          }
+          
+          chartsHtml += `
+              </table>
+            </div>
+          `;
+          
+          // Add detailed positions table
+          chartsHtml += `
+            <div class="positions-table-container" style="margin-top: 1.5rem;">
+              <h6 style="margin-bottom: 1rem; color: #495057;">Detailed Positions in ${chart.name}:</h6>
+              <div style="overflow-x: auto;">
+                <table style="width: 100%; border-collapse: collapse; font-size: 0.9rem;">
+                  <thead style="background: #e9ecef;">
+                    <tr>
+                      <th style="border: 1px solid #dee2e6; padding: 0.5rem; text-align: left;">Planet/Point</th>
+                      <th style="border: 1px solid #dee2e6; padding: 0.5rem; text-align: left;">Sign</th>
+                      <th style="border: 1px solid #dee2e6; padding: 0.5rem; text-align: left;">Ruler</th>
+                      <th style="border: 1px solid #dee2e6; padding: 0.5rem; text-align: left;">Division</th>
+                    </tr>
+                  </thead>
+                  <tbody>
+          `;
+          
+          if (chart.positions) {
+            Object.entries(chart.positions).forEach(([body, position]) => {
+              const isLagna = body === 'Lagna';
+              const displayName = isLagna ? 'Ascendant' : body;
+              const rowColor = isLagna ? '#fff3cd' : 'white';
+              chartsHtml += `
+                <tr style="background: ${rowColor};">
+                  <td style="border: 1px solid #dee2e6; padding: 0.5rem; font-weight: ${isLagna ? 'bold' : 'normal'};">${displayName}</td>
+                  <td style="border: 1px solid #dee2e6; padding: 0.5rem;">${position.sign || 'N/A'}</td>
+                  <td style="border: 1px solid #dee2e6; padding: 0.5rem;">${position.ruler || 'N/A'}</td>
+                  <td style="border: 1px solid #dee2e6; padding: 0.5rem;">${position.division_index || 'N/A'}</td>
+                </tr>
+              `;
+            });
+          }
+          
+          chartsHtml += `
+                  </tbody>
+                </table>
+              </div>
+            </div>
+          `;
+        }
+        
+        chartsHtml += '</div>';
+      });
+      
+      chartsHtml += `
+          </div>
+        </div>
+      `;
+      
+      content.innerHTML = chartsHtml;
+    }
+
+    function showDivisionalChart(chartKey) {
+      // Hide all chart contents
+      document.querySelectorAll('.chart-content').forEach(content => {
+        content.style.display = 'none';
+      });
+      
+      // Remove active class from all tab buttons
+      document.querySelectorAll('.chart-tab-btn').forEach(btn => {
+        btn.classList.remove('active');
+        btn.style.background = '#f8f9fa';
+        btn.style.color = '#495057';
+      });
+      
+      // Show selected chart content
+      const selectedContent = document.getElementById(`chart-${chartKey}`);
+      if (selectedContent) {
+        selectedContent.style.display = 'block';
+      }
+      
+      // Add active class to clicked tab button
+      event.target.classList.add('active');
+      event.target.style.background = '#007bff';
+      event.target.style.color = 'white';
+    }
+
+    function renderPanchadhaMaitriSection(data) {
+      const content = document.getElementById('panchadha-maitri-details');
+      const maitri = data.panchadha_maitri || {};
+      
+      if (!maitri || Object.keys(maitri).length === 0) {
+        content.innerHTML = '<p>No Panchadha Maitri data available.</p>';
+        return;
+      }
+      
+      const planets = ['Sun', 'Moon', 'Mars', 'Mercury', 'Jupiter', 'Venus', 'Saturn'];
+      
+      let maitriHtml = `
+        <div style="margin-bottom: 2rem;">
+          <div class="highlight" style="margin-bottom: 1.5rem; padding: 1rem; background: linear-gradient(135deg, #e8f5e8 0%, #d4edda 100%); border-radius: 8px; border-left: 4px solid #28a745;">
+            <h4 style="margin: 0 0 0.5rem 0; color: #155724;">
+              🤝 Panchadha Maitri Analysis - Five-fold Friendship System
+            </h4>
+            <p style="margin: 0; color: #424242; font-size: 0.95rem;">
+              Classical Vedic system combining permanent (Naisargik) and temporary (Tatkalik) relationships to determine final planetary friendships.
+            </p>
+          </div>
+        </div>
+
+        <div class="maitri-tabs" style="display: flex; margin-bottom: 1.5rem; border-bottom: 2px solid #e9ecef;">
+          <button class="maitri-tab-btn active" onclick="showMaitriTable('naisargika')" style="padding: 0.75rem 1.5rem; border: none; background: #28a745; color: white; border-radius: 6px 6px 0 0; margin-right: 2px; cursor: pointer; font-weight: 600;">
+            Naisargika (Natural)
+          </button>
+          <button class="maitri-tab-btn" onclick="showMaitriTable('tatkaala')" style="padding: 0.75rem 1.5rem; border: none; background: #f8f9fa; color: #495057; border-radius: 6px 6px 0 0; margin-right: 2px; cursor: pointer; font-weight: 600;">
+            Tatkaala (Temporary)
+          </button>
+          <button class="maitri-tab-btn" onclick="showMaitriTable('panchadha')" style="padding: 0.75rem 1.5rem; border: none; background: #f8f9fa; color: #495057; border-radius: 6px 6px 0 0; cursor: pointer; font-weight: 600;">
+            Panchadha (Final)
+          </button>
+        </div>
+      `;
+
+      // Naisargika Maitri Table
+      if (maitri.naisargika_maitri) {
+        maitriHtml += `
+          <div class="maitri-content" id="maitri-naisargika" style="display: block;">
+            <h4 style="color: #28a745; margin-bottom: 1rem;">📚 Naisargika Maitri (Natural/Permanent Friendship)</h4>
+            ${generateMaitriTable(maitri.naisargika_maitri, planets, 'naisargika')}
+          </div>
+        `;
+      }
+
+      // Tatkaala Maitri Table
+      if (maitri.tatkaala_maitri) {
+        maitriHtml += `
+          <div class="maitri-content" id="maitri-tatkaala" style="display: none;">
+            <h4 style="color: #007bff; margin-bottom: 1rem;">🏠 Tatkaala Maitri (Temporary Friendship - Based on House Positions)</h4>
+            ${generateMaitriTable(maitri.tatkaala_maitri, planets, 'tatkaala')}
+            <div style="margin-top: 1rem; padding: 0.75rem; background: #f8f9fa; border-radius: 6px; border-left: 4px solid #007bff;">
+              <small style="color: #495057;">
+                <strong>House Rule:</strong> Friends in houses 2,3,4,10,11,12 | Enemies in houses 1,5,6,7,8,9
+              </small>
+            </div>
+          </div>
+        `;
+      }
+
+      // Panchadha Maitri Table
+      if (maitri.panchadha_maitri) {
+        maitriHtml += `
+          <div class="maitri-content" id="maitri-panchadha" style="display: none;">
+            <h4 style="color: #dc3545; margin-bottom: 1rem;">🎯 Panchadha Maitri (Final Combined Relationship)</h4>
+            ${generatePanchadhaMaitriTable(maitri.panchadha_maitri, planets)}
+            <div style="margin-top: 1rem; padding: 0.75rem; background: #f8f9fa; border-radius: 6px; border-left: 4px solid #dc3545;">
+              <div style="font-size: 0.85rem; color: #495057;">
+                <strong>Legend:</strong> 
+                <span style="color: #28a745; font-weight: 600;">EF</span> = Extreme Friend | 
+                <span style="color: #17a2b8; font-weight: 600;">F</span> = Friend | 
+                <span style="color: #6c757d; font-weight: 600;">N</span> = Neutral | 
+                <span style="color: #fd7e14; font-weight: 600;">E</span> = Enemy | 
+                <span style="color: #dc3545; font-weight: 600;">EE</span> = Extreme Enemy
+              </div>
+            </div>
+          </div>
+        `;
+      }
+
+      content.innerHTML = maitriHtml;
+
+      // Helper function to generate basic maitri table
+      function generateMaitriTable(tableData, planets, type) {
+        let tableHtml = `
+          <div class="table-responsive">
+            <table class="table table-bordered" style="margin-bottom: 0;">
+              <thead style="background: #f8f9fa;">
+                <tr>
+                  <th style="text-align: center; padding: 0.75rem; font-weight: 600;">From \\\\ To</th>
+        `;
+        
+        planets.forEach(planet => {
+          tableHtml += `<th style="text-align: center; padding: 0.5rem; font-weight: 600; font-size: 0.9rem;">${planet}</th>`;
+        });
+        
+        tableHtml += '</tr></thead><tbody>';
+        
+        planets.forEach(planetFrom => {
+          if (!tableData[planetFrom]) return;
+          
+          tableHtml += `<tr><td style="font-weight: 600; padding: 0.75rem; background: #f8f9fa;">${planetFrom}</td>`;
+          
+          planets.forEach(planetTo => {
+            const relationship = tableData[planetFrom][planetTo] || 'N/A';
+            const colorClass = getRelationshipColor(relationship, type);
+            
+            tableHtml += `
+              <td style="text-align: center; padding: 0.5rem; ${colorClass}">
+                <span style="font-weight: 600; font-size: 0.85rem;">${relationship}</span>
+              </td>
+            `;
+          });
+          
+          tableHtml += '</tr>';
+        });
+        
+        tableHtml += '</tbody></table></div>';
+        return tableHtml;
+      }
+
+      // Helper function to generate panchadha maitri table with codes
+      function generatePanchadhaMaitriTable(tableData, planets) {
+        let tableHtml = `
+          <div class="table-responsive">
+            <table class="table table-bordered" style="margin-bottom: 0;">
+              <thead style="background: #f8f9fa;">
+                <tr>
+                  <th style="text-align: center; padding: 0.75rem; font-weight: 600;">From \\\\ To</th>
+        `;
+        
+        planets.forEach(planet => {
+          tableHtml += `<th style="text-align: center; padding: 0.5rem; font-weight: 600; font-size: 0.9rem;">${planet}</th>`;
+        });
+        
+        tableHtml += '</tr></thead><tbody>';
+        
+        planets.forEach(planetFrom => {
+          if (!tableData[planetFrom]) return;
+          
+          tableHtml += `<tr><td style="font-weight: 600; padding: 0.75rem; background: #f8f9fa;">${planetFrom}</td>`;
+          
+          planets.forEach(planetTo => {
+            const relationData = tableData[planetFrom][planetTo] || {};
+            const code = relationData.code || 'N';
+            const resultant = relationData.resultant || 'Neutral';
+            const colorClass = getPanchadhaColor(code);
+            
+            tableHtml += `
+              <td style="text-align: center; padding: 0.5rem; ${colorClass}" title="${resultant}">
+                <span style="font-weight: 600; font-size: 0.9rem;">${code}</span>
+              </td>
+            `;
+          });
+          
+          tableHtml += '</tr>';
+        });
+        
+        tableHtml += '</tbody></table></div>';
+        return tableHtml;
+      }
+
+      // Helper function to get relationship colors
+      function getRelationshipColor(relationship, type) {
+        if (relationship === 'Self') return 'background: #6c757d; color: white;';
+        if (relationship === 'Friend') return 'background: #d4edda; color: #155724;';
+        if (relationship === 'Neutral') return 'background: #fff3cd; color: #856404;';
+        if (relationship === 'Enemy') return 'background: #f8d7da; color: #721c24;';
+        return 'background: #e2e3e5; color: #383d41;';
+      }
+
+      // Helper function to get panchadha colors
+      function getPanchadhaColor(code) {
+        switch(code) {
+          case 'EF': return 'background: #d1ecf1; color: #0c5460; border: 1px solid #bee5eb;';
+          case 'F': return 'background: #d4edda; color: #155724; border: 1px solid #c3e6cb;';
+          case 'N': return 'background: #fff3cd; color: #856404; border: 1px solid #ffeaa7;';
+          case 'E': return 'background: #f8d7da; color: #721c24; border: 1px solid #f5c6cb;';
+          case 'EE': return 'background: #f5c6cb; color: #721c24; border: 1px solid #f1b0b7;';
+          case 'S': return 'background: #6c757d; color: white; border: 1px solid #5a6268;';
+          default: return 'background: #e2e3e5; color: #383d41;';
+        }
+      }
+    }
+
+    function showMaitriTable(tableType) {
+      // Hide all maitri contents
+      document.querySelectorAll('.maitri-content').forEach(content => {
+        content.style.display = 'none';
+      });
+      
+      // Remove active class from all maitri tab buttons
+      document.querySelectorAll('.maitri-tab-btn').forEach(btn => {
+        btn.classList.remove('active');
+        btn.style.background = '#f8f9fa';
+        btn.style.color = '#495057';
+      });
+      
+      // Show selected maitri content
+      const selectedContent = document.getElementById(`maitri-${tableType}`);
+      if (selectedContent) {
+        selectedContent.style.display = 'block';
+      }
+      
+      // Add active class to clicked tab button
+      event.target.classList.add('active');
+      event.target.style.background = tableType === 'naisargika' ? '#28a745' : (tableType === 'tatkaala' ? '#007bff' : '#dc3545');
+      event.target.style.color = 'white';
+    }
+
+    function renderMahadashSection(data) {
+      const content = document.getElementById('mahadasha-details');
+      const vim = data.vimshottari || {};
+      
+      if (!vim.mahadashas) {
+        content.innerHTML = '<p>No Vimshottari dasha data available.</p>';
+        return;
+      }
+      
+      const lord = vim.nakshatraLord;
+      const balY = vim.balanceAtBirthYears || 0;
+      const y = Math.floor(balY);
+      const remDays = (balY - y) * 365.2425;
+      const m = Math.floor(remDays / 30.436875);
+      const d = Math.round(remDays - m*30.436875);
+      
+      const fmtDMY = (iso) => {
+        const dt = new Date(iso);
+        if (isNaN(dt.getTime())) return iso;
+        const dd = String(dt.getDate()).padStart(2,'0');
+        const mm = String(dt.getMonth()+1).padStart(2,'0');
+        const yyyy = dt.getFullYear();
+        return `${dd}/${mm}/${yyyy}`;
+      };
+      
+      let dashHtml = `
+        <div class="highlight" style="margin-bottom: 1rem;">
+          <strong>Nakshatra Lord at birth:</strong> ${lord || ''} • 
+          <strong>Balance at birth:</strong> ${y}y ${m}m ${d}d
+        </div>
+        <table class="data-table">
+          <thead>
+            <tr><th>Dasha Level</th><th>Lord</th><th>Start</th><th>End</th><th>Duration</th></tr>
+          </thead>
+          <tbody>
+      `;
+      
+      vim.mahadashas.forEach((md, idx) => {
+        dashHtml += `
+          <tr style="background: #f8f9fa; font-weight: bold;">
+            <td>Mahadasha</td>
+            <td>${md.lord}</td>
+            <td>${fmtDMY(md.start)}</td>
+            <td>${fmtDMY(md.end)}</td>
+            <td>${md.years}y</td>
+          </tr>
+        `;
+        
+        if (idx < 3) { // Show first 3 MDs with details
+          md.antardashas?.forEach(ad => {
+            dashHtml += `
+              <tr style="background: #fafafa;">
+                <td style="padding-left: 1rem;">→ Antardasha</td>
+                <td>${ad.lord}</td>
+                <td>${fmtDMY(ad.start)}</td>
+                <td>${fmtDMY(ad.end)}</td>
+                <td></td>
+              </tr>
+            `;
+          });
+        }
+      });
+      
+      dashHtml += '</tbody></table>';
+      content.innerHTML = dashHtml;
+    }
+
+    function renderYearlySection(data) {
+      const content = document.getElementById('yearly-details');
+      const yearly = data.yearly_dasha || {};
+      
+      if (!Object.keys(yearly).length) {
+        content.innerHTML = '<p>No yearly dasha data available.</p>';
+        return;
+      }
+      
+      let yearlyHtml = '';
+      
+      Object.entries(yearly).forEach(([year, yearData]) => {
+        const quarters = yearData.quarterly_summary || {};
+        
+        yearlyHtml += `
+          <div class="data-card" style="margin-bottom: 1rem;">
+            <h4>📅 ${year}</h4>
+            <div style="margin: 0.5rem 0;">
+              <strong>Total Periods:</strong> ${yearData.total_periods || 0}
+            </div>
+            <div class="data-grid" style="grid-template-columns: repeat(2, 1fr); gap: 0.5rem;">
+              <div><strong>Q1 (Jan-Mar):</strong><br>${quarters.Q1 || 'No periods'}</div>
+              <div><strong>Q2 (Apr-Jun):</strong><br>${quarters.Q2 || 'No periods'}</div>
+              <div><strong>Q3 (Jul-Sep):</strong><br>${quarters.Q3 || 'No periods'}</div>
+              <div><strong>Q4 (Oct-Dec):</strong><br>${quarters.Q4 || 'No periods'}</div>
+            </div>
+          </div>
+        `;
+      });
+      
+      content.innerHTML = yearlyHtml;
+    }
+
+    function updateSectionSummaries(data) {
+      // Update section summaries
+      const planetCount = Object.keys(data.planetary_analysis || {}).length;
+      document.getElementById('planets-summary').textContent = `${planetCount} planets analyzed with detailed positions`;
+      
+      // Shadbala summary
+      const shadbala = data.shadbala?.shadbala_scores || {};
+      const strongPlanets = Object.values(shadbala).filter(p => p.strength_percentage >= 100).length;
+      const totalPlanets = Object.keys(shadbala).length;
+      document.getElementById('shadbala-summary').textContent = `${strongPlanets}/${totalPlanets} planets have strong Shadbala scores`;
+      
+      const occupiedHouses = Object.values(data.house_analysis || {}).filter(h => h.is_occupied).length;
+      document.getElementById('houses-summary').textContent = `${occupiedHouses} houses occupied, 12 total analyzed`;
+      
+      const nakshatraCount = Object.keys(data.nakshatra_details || {}).length;
+      document.getElementById('nakshatras-summary').textContent = `${nakshatraCount} planetary nakshatras calculated`;
+      
+      const transitTime = data.current_transits?.calculation_time;
+      if (transitTime) {
+        document.getElementById('transits-summary').textContent = `Current positions as of ${new Date(transitTime).toLocaleDateString()}`;
+      }
+      
+      const totalMDs = data.vimshottari?.mahadashas?.length || 0;
+      document.getElementById('mahadasha-summary').textContent = `${totalMDs} mahadashas in 120-year cycle`;
+      
+      const yearsCovered = Object.keys(data.yearly_dasha || {}).length;
+      document.getElementById('yearly-summary').textContent = `${yearsCovered} years of dasha periods calculated`;
+    }
+
+    // SaptavarigiyaBala modal functions
+    function showSaptavargivaDetails(planet) {
+      const modal = document.getElementById('saptavargiya-details-modal');
+      const title = document.getElementById('saptavargiya-modal-title');
+      const content = document.getElementById('saptavargiya-modal-content');
+      
+      if (!window.lastChartData || !window.lastChartData.shadbala?._saptavargiya_analysis) {
+        alert('SaptavarigiyaBala data not available');
+        return;
+      }
+      
+      const saptavargiya = window.lastChartData.shadbala._saptavargiya_analysis;
+      const planetScores = saptavargiya.planet_chart_scores ? saptavargiya.planet_chart_scores[planet] : null;
+      let total = saptavargiya.planet_totals ? saptavargiya.planet_totals[planet] : 0;
+      
+      if (!planetScores) {
+        alert(`No SaptavarigiyaBala data available for ${planet}`);
+        return;
+      }
+      
+      // Safety check for total
+      if (total === undefined || total === null) {
+        console.warn(`SaptavarigiyaBala total undefined for ${planet} in modal`);
+        total = 0;
+      }
+      
+      title.textContent = `${planet} - SaptavarigiyaBala Chart Breakdown`;
+      
+      let detailsHtml = `
+        <div style="margin-bottom: 1rem;">
+          <h5 style="color: #2c3e50; margin: 0 0 0.5rem 0;">Total Points: ${total.toFixed(1)} / 315</h5>
+          <p style="color: #666; margin: 0; font-size: 0.9rem;">Breakdown across seven divisional charts</p>
+        </div>
+        
+        <div style="overflow-x: auto;">
+          <table style="width: 100%; border-collapse: collapse; margin-bottom: 1rem;">
+            <thead>
+              <tr style="background: #f8f9fa; border-bottom: 2px solid #dee2e6;">
+                <th style="padding: 0.75rem; text-align: left; border: 1px solid #dee2e6;">Chart</th>
+                <th style="padding: 0.75rem; text-align: left; border: 1px solid #dee2e6;">Sign</th>
+                <th style="padding: 0.75rem; text-align: left; border: 1px solid #dee2e6;">Ruler</th>
+                <th style="padding: 0.75rem; text-align: left; border: 1px solid #dee2e6;">Relationship</th>
+                <th style="padding: 0.75rem; text-align: right; border: 1px solid #dee2e6;">Points</th>
+              </tr>
+            </thead>
+            <tbody>
+      `;
+      
+      Object.entries(planetScores).forEach(([chartNum, data]) => {
+        const relationshipColor = {
+          'Mooltrikona': '#4caf50',
+          'Own': '#2196f3',
+          'Extreme Friend': '#ff9800',
+          'Friend': '#ffc107',
+          'Neutral': '#6c757d',
+          'Enemy': '#ff5722',
+          'Extreme Enemy': '#f44336'
+        }[data.relationship] || '#6c757d';
+        
+        detailsHtml += `
+          <tr style="border-bottom: 1px solid #dee2e6;">
+            <td style="padding: 0.75rem; border: 1px solid #dee2e6; font-weight: 500;">${data.chart_name}</td>
+            <td style="padding: 0.75rem; border: 1px solid #dee2e6;">${data.sign_name}</td>
+            <td style="padding: 0.75rem; border: 1px solid #dee2e6;">${data.ruler}</td>
+            <td style="padding: 0.75rem; border: 1px solid #dee2e6;">
+              <span style="color: ${relationshipColor}; font-weight: 500;">${data.relationship}</span>
+            </td>
+            <td style="padding: 0.75rem; border: 1px solid #dee2e6; text-align: right; font-weight: 600;">
+              ${data.points}
+            </td>
+          </tr>
+        `;
+      });
+      
+      detailsHtml += `
+            </tbody>
+          </table>
+        </div>
+        
+        <div style="background: #f8f9fa; padding: 1rem; border-radius: 6px; border-left: 4px solid #007bff;">
+          <h6 style="margin: 0 0 0.5rem 0; color: #495057;">Calculation Method:</h6>
+          <p style="margin: 0; font-size: 0.85rem; color: #666; line-height: 1.4;">
+            Each divisional chart position is analyzed for the planet's relationship with the sign ruler using Panchadha Maitri (Five-fold Friendship). 
+            Points are awarded based on the relationship strength, with Mooltrikona being the highest (45 points) and Extreme Enemy the lowest (1.875 points).
+          </p>
+        </div>
+      `;
+      
+      content.innerHTML = detailsHtml;
+      modal.style.display = 'block';
+    }
+    
+    function closeSaptavargivaDetails() {
+      document.getElementById('saptavargiya-details-modal').style.display = 'none';
+    }
+    
+    // YugmayugmaBala modal functions
+    function showYugmayugmaDetails(planet) {
+      const modal = document.getElementById('yugmayugma-details-modal');
+      const title = document.getElementById('yugmayugma-modal-title');
+      const content = document.getElementById('yugmayugma-modal-content');
+      
+      if (!window.lastChartData || !window.lastChartData.shadbala?._yugmayugma_analysis) {
+        alert('YugmayugmaBala data not available');
+        return;
+      }
+      
+      const yugmayugma = window.lastChartData.shadbala._yugmayugma_analysis;
+      const planetDetails = yugmayugma.planet_details ? yugmayugma.planet_details[planet] : null;
+      const planetScore = yugmayugma.planet_scores ? yugmayugma.planet_scores[planet] : 0;
+      
+      if (!planetDetails) {
+        alert(`No YugmayugmaBala data available for ${planet}`);
+        return;
+      }
+      
+      title.textContent = `${planet} - YugmayugmaBala Analysis`;
+      
+      const rashi = planetDetails.rashi_chart || {};
+      const navamsha = planetDetails.navamsha_chart || {};
+      const preference = planetDetails.planet_preference || 'Unknown';
+      
+      let detailsHtml = `
+        <div style="margin-bottom: 1.5rem;">
+          <h5 style="color: #2c3e50; margin: 0 0 0.5rem 0;">Total Points: ${planetScore} / 30 Shashtiamsa</h5>
+          <p style="color: #666; margin: 0; font-size: 0.9rem;">
+            ${planet} gets strength in <strong>${preference}</strong>
+          </p>
+        </div>
+        
+        <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 1rem; margin-bottom: 1.5rem;">
+          <div style="padding: 1rem; background: #f8f9fa; border-radius: 6px; border-left: 4px solid #007bff;">
+            <h6 style="margin: 0 0 0.8rem 0; color: #495057;">📊 Rashi Chart (D1)</h6>
+            <div style="font-size: 0.9rem; line-height: 1.5;">
+              <div style="margin-bottom: 0.5rem;">
+                <strong>Sign:</strong> ${rashi.sign_name || 'N/A'}
+              </div>
+              <div style="margin-bottom: 0.5rem;">
+                <strong>Type:</strong> ${rashi.sign_type || 'N/A'} Sign
+              </div>
+              <div style="margin-bottom: 0.5rem;">
+                <strong>Gets Strength:</strong> ${rashi.gets_strength ? 'Yes' : 'No'}
+              </div>
+              <div style="font-size: 1.2rem; font-weight: bold; color: #007bff;">
+                Points: ${rashi.points || 0}
+              </div>
+            </div>
+          </div>
+          
+          <div style="padding: 1rem; background: #f8f9fa; border-radius: 6px; border-left: 4px solid #28a745;">
+            <h6 style="margin: 0 0 0.8rem 0; color: #495057;">🌟 Navamsha Chart (D9)</h6>
+            <div style="font-size: 0.9rem; line-height: 1.5;">
+              <div style="margin-bottom: 0.5rem;">
+                <strong>Sign:</strong> ${navamsha.sign_name || 'N/A'}
+              </div>
+              <div style="margin-bottom: 0.5rem;">
+                <strong>Type:</strong> ${navamsha.sign_type || 'N/A'} Sign
+              </div>
+              <div style="margin-bottom: 0.5rem;">
+                <strong>Gets Strength:</strong> ${navamsha.gets_strength ? 'Yes' : 'No'}
+              </div>
+              <div style="font-size: 1.2rem; font-weight: bold; color: #28a745;">
+                Points: ${navamsha.points || 0}
+              </div>
+            </div>
+          </div>
+        </div>
+        
+        <div style="background: #e8f4f8; padding: 1rem; border-radius: 6px; border-left: 4px solid #17a2b8; margin-bottom: 1rem;">
+          <h6 style="margin: 0 0 0.8rem 0; color: #495057;">🎯 Calculation Logic:</h6>
+          <div style="font-size: 0.85rem; color: #495057; line-height: 1.5;">
+      `;
+      
+      if (preference.includes('Even')) {
+        detailsHtml += `
+            <strong>${planet}</strong> is an <strong>Even Sign Planet</strong> (Moon & Venus group)<br>
+            • Gets 15 Shashtiamsa when placed in <strong>Even Signs:</strong> Taurus, Cancer, Virgo, Scorpio, Capricorn, Pisces<br>
+            • Gets 0 Shashtiamsa when placed in <strong>Odd Signs:</strong> Aries, Gemini, Leo, Libra, Sagittarius, Aquarius
+        `;
+      } else {
+        detailsHtml += `
+            <strong>${planet}</strong> is an <strong>Odd Sign Planet</strong> (Sun, Mars, Mercury, Jupiter, Saturn group)<br>
+            • Gets 15 Shashtiamsa when placed in <strong>Odd Signs:</strong> Aries, Gemini, Leo, Libra, Sagittarius, Aquarius<br>
+            • Gets 0 Shashtiamsa when placed in <strong>Even Signs:</strong> Taurus, Cancer, Virgo, Scorpio, Capricorn, Pisces
+        `;
+      }
+      
+      detailsHtml += `
+          </div>
+        </div>
+        
+        <div style="background: #fff3cd; padding: 1rem; border-radius: 6px; border-left: 4px solid #ffc107;">
+          <h6 style="margin: 0 0 0.5rem 0; color: #856404;">📚 Classical Reference (BPHS):</h6>
+          <p style="margin: 0; font-size: 0.85rem; color: #856404; line-height: 1.4;">
+            "Moon and Venus are powerful in even signs in Rashi chart and Navamsha chart and they get fifteen Shashtiamsa for each. 
+            Sun, Mars, Mercury, Jupiter and Saturn get fifteen Shashtiamsa each for occupying odd Rashis in Rashi chart and Navamsha chart."
+          </p>
+        </div>
+      `;
+      
+      content.innerHTML = detailsHtml;
+      modal.style.display = 'block';
+    }
+    
+    function closeYugmayugmaDetails() {
+      document.getElementById('yugmayugma-details-modal').style.display = 'none';
+    }
+    
+    // KendraBala modal functions
+    function showKendraDetails(planet) {
+      const modal = document.getElementById('kendra-details-modal');
+      const title = document.getElementById('kendra-modal-title');
+      const content = document.getElementById('kendra-modal-content');
+      
+      if (!window.lastChartData || !window.lastChartData.shadbala?._kendra_analysis) {
+        alert('KendraBala data not available');
+        return;
+      }
+      
+      const kendra = window.lastChartData.shadbala._kendra_analysis;
+      const planetDetails = kendra.planet_details ? kendra.planet_details[planet] : null;
+      const planetScore = kendra.planet_scores ? kendra.planet_scores[planet] : 0;
+      const pointSystem = kendra.point_system || {};
+      
+      if (!planetDetails) {
+        alert(`No KendraBala data available for ${planet}`);
+        return;
+      }
+      
+      title.textContent = `${planet} - KendraBala Analysis`;
+      
+      const houseNum = planetDetails.house_number || 0;
+      const houseType = planetDetails.house_type || 'Unknown';
+      const longitude = planetDetails.longitude || 0;
+      const classification = planetDetails.house_classification || {};
+      
+      let houseDescription = '';
+      let strengthDescription = '';
+      
+      if (houseType === 'Kendra') {
+        houseDescription = 'Angular House - Most powerful position';
+        strengthDescription = 'Maximum strength - Planets in Kendra houses are considered very strong and influential.';
+      } else if (houseType === 'Panapara') {
+        houseDescription = 'Succedent House - Moderate strength position';
+        strengthDescription = 'Moderate strength - Planets in Panapara houses have balanced influence.';
+      } else if (houseType === 'Apoklima') {
+        houseDescription = 'Cadent House - Weakest position';
+        strengthDescription = 'Minimum strength - Planets in Apoklima houses have reduced influence.';
+      }
+      
+      let detailsHtml = `
+        <div style="margin-bottom: 1.5rem;">
+          <h5 style="color: #2c3e50; margin: 0 0 0.5rem 0;">KendraBala Score: ${planetScore} Shashtiamsa</h5>
+          <p style="color: #666; margin: 0; font-size: 0.9rem;">
+            ${planet} is positioned in House ${houseNum} (${houseType} type)
+          </p>
+        </div>
+        
+        <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 1rem; margin-bottom: 1.5rem;">
+          <div style="padding: 1rem; background: #f8f9fa; border-radius: 6px; border-left: 4px solid #28a745;">
+            <h6 style="margin: 0 0 0.8rem 0; color: #495057;">🏠 House Information</h6>
+            <div style="font-size: 0.9rem; line-height: 1.5;">
+              <div style="margin-bottom: 0.5rem;">
+                <strong>House Number:</strong> ${houseNum}
+              </div>
+              <div style="margin-bottom: 0.5rem;">
+                <strong>House Type:</strong> ${houseType}
+              </div>
+              <div style="margin-bottom: 0.5rem;">
+                <strong>Longitude:</strong> ${longitude.toFixed(2)}°
+              </div>
+              <div style="margin-bottom: 0.5rem;">
+                <strong>Classification:</strong> ${houseDescription}
+              </div>
+            </div>
+          </div>
+          
+          <div style="padding: 1rem; background: #f8f9fa; border-radius: 6px; border-left: 4px solid #007bff;">
+            <h6 style="margin: 0 0 0.8rem 0; color: #495057;">⚡ Strength Analysis</h6>
+            <div style="font-size: 0.9rem; line-height: 1.5;">
+              <div style="margin-bottom: 0.5rem;">
+                <strong>Points Earned:</strong> ${planetScore}
+              </div>
+              <div style="margin-bottom: 0.5rem;">
+                <strong>Maximum Possible:</strong> ${pointSystem.kendra_points || 60}
+              </div>
+              <div style="margin-bottom: 0.5rem;">
+                <strong>Percentage:</strong> ${((planetScore / (pointSystem.kendra_points || 60)) * 100).toFixed(1)}%
+              </div>
+              <div style="color: #495057; font-size: 0.85rem;">
+                ${strengthDescription}
+              </div>
+            </div>
+          </div>
+        </div>
+        
+        <div style="background: #e8f4f8; padding: 1rem; border-radius: 6px; border-left: 4px solid #17a2b8; margin-bottom: 1rem;">
+          <h6 style="margin: 0 0 0.8rem 0; color: #495057;">🎯 KendraBala Point System:</h6>
+          <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 0.8rem;">
+            <div style="text-align: center; padding: 0.5rem; background: #d4edda; border-radius: 4px;">
+              <div style="font-weight: bold; color: #28a745; font-size: 1.1rem;">${pointSystem.kendra_points || 60}</div>
+              <div style="font-size: 0.8rem; color: #155724;">Kendra (1,4,7,10)</div>
+            </div>
+            <div style="text-align: center; padding: 0.5rem; background: #fff3cd; border-radius: 4px;">
+              <div style="font-weight: bold; color: #856404; font-size: 1.1rem;">${pointSystem.panapara_points || 30}</div>
+              <div style="font-size: 0.8rem; color: #856404;">Panapara (2,5,8,11)</div>
+            </div>
+            <div style="text-align: center; padding: 0.5rem; background: #f8d7da; border-radius: 4px;">
+              <div style="font-weight: bold; color: #721c24; font-size: 1.1rem;">${pointSystem.apoklima_points || 15}</div>
+              <div style="font-size: 0.8rem; color: #721c24;">Apoklima (3,6,9,12)</div>
+            </div>
+          </div>
+        </div>
+        
+        <div style="background: #fff3cd; padding: 1rem; border-radius: 6px; border-left: 4px solid #ffc107;">
+          <h6 style="margin: 0 0 0.5rem 0; color: #856404;">📚 Classical Reference (BPHS):</h6>
+          <p style="margin: 0; font-size: 0.85rem; color: #856404; line-height: 1.4;">
+            "Planets in a kendra get 60 shashtiamsas, in Panaparas get 30 shashtiamsas, in Apoklima get 15 shashtiamsas as Kendra Bala. 
+            The calculation is based on Rashi chart positions only, not the Chalit chart. 
+            Kendras are houses 1, 4, 7 & 10. Panaparas are houses 2, 5, 8 & 11. Apoklimas are houses 3, 6, 9 & 12."
+          </p>
+        </div>
+      `;
+      
+      content.innerHTML = detailsHtml;
+      modal.style.display = 'block';
+    }
+    
+    function closeKendraDetails() {
+      document.getElementById('kendra-details-modal').style.display = 'none';
+    }
+    
+    // DreshkonBala modal functions
+    function showDreshkonDetails(planet) {
+      const modal = document.getElementById('dreshkon-details-modal');
+      const title = document.getElementById('dreshkon-modal-title');
+      const content = document.getElementById('dreshkon-modal-content');
+      
+      if (!window.lastChartData || !window.lastChartData.shadbala?._dreshkon_analysis) {
+        alert('DreshkonBala data not available');
+        return;
+      }
+      
+      const dreshkon = window.lastChartData.shadbala._dreshkon_analysis;
+      const planetDetails = dreshkon.planet_details ? dreshkon.planet_details[planet] : null;
+      const planetScore = dreshkon.planet_scores ? dreshkon.planet_scores[planet] : 0;
+      const strengthRules = dreshkon.strength_rules || {};
+      
+      if (!planetDetails) {
+        alert(`No DreshkonBala data available for ${planet}`);
+        return;
+      }
+      
+      title.textContent = `${planet} - DreshkonBala Analysis`;
+      
+      const dreshkonRanges = dreshkon.dreshkon_ranges || {};
+      const genderClassifications = dreshkon.gender_classifications || {};
+      
+      let strengthDescription = '';
+      if (planetScore > 0) {
+        strengthDescription = `${planet} gets full strength (15 Shashtiamsa) in this decanate position.`;
+      } else {
+        strengthDescription = `${planet} does not get strength in this decanate position.`;
+      }
+      
+      const detailsHtml = `
+        <div style="max-height: 70vh; overflow-y: auto;">
+          <div style="background: linear-gradient(135deg, #fff3cd 0%, #ffeaa7 100%); padding: 1.5rem; border-radius: 8px; margin-bottom: 1rem;">
+            <h5 style="color: #2c3e50; margin: 0 0 0.5rem 0;">DreshkonBala Score: ${planetScore} Shashtiamsa</h5>
+            <div style="font-size: 0.9rem; color: #6c757d; margin-bottom: 1rem;">
+              ${strengthDescription}
+            </div>
+            
+            <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 1rem;">
+              <div>
+                <h6 style="margin: 0 0 0.3rem 0; color: #495057;">📍 Position Details</h6>
+                <div style="font-size: 0.85rem; color: #6c757d;">
+                  <div><strong>Sign:</strong> ${planetDetails.sign_name}</div>
+                  <div><strong>Degree:</strong> ${planetDetails.degree_in_sign.toFixed(2)}°</div>
+                  <div><strong>Dreshkon:</strong> ${planetDetails.dreshkon_name}</div>
+                </div>
+              </div>
+              
+              <div>
+                <h6 style="margin: 0 0 0.3rem 0; color: #495057;">⚧ Gender Classification</h6>
+                <div style="font-size: 0.85rem; color: #6c757d;">
+                  <div><strong>Planet Gender:</strong> ${planetDetails.planet_gender}</div>
+                  <div><strong>Gets Strength:</strong> ${planetDetails.gets_strength ? 'Yes ✓' : 'No ✗'}</div>
+                </div>
+              </div>
+            </div>
+          </div>
+          
+          <div style="background: #f8f9fa; padding: 1rem; border-radius: 6px; margin-bottom: 1rem;">
+            <h6 style="margin: 0 0 0.8rem 0; color: #495057;">🎯 DreshkonBala System Explanation:</h6>
+            <div style="font-size: 0.9rem; color: #6c757d; line-height: 1.5;">
+              <div style="margin-bottom: 0.5rem;">Each sign is divided into 3 Dreshkons (decanates) of 10° each:</div>
+              <div style="margin-bottom: 0.5rem;">• <strong>1st Dreshkon (0°-10°):</strong> Male planets get 15 Shashtiamsa</div>
+              <div style="margin-bottom: 0.5rem;">• <strong>2nd Dreshkon (10°-20°):</strong> Hermaphrodite planets get 15 Shashtiamsa</div>
+              <div>• <strong>3rd Dreshkon (20°-30°):</strong> Female planets get 15 Shashtiamsa</div>
+            </div>
+          </div>
+          
+          <div style="background: #e8f4f8; padding: 1rem; border-radius: 6px; border-left: 4px solid #17a2b8; margin-bottom: 1rem;">
+            <h6 style="margin: 0 0 0.8rem 0; color: #495057;">🏷️ Gender Classifications:</h6>
+            <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(150px, 1fr)); gap: 0.8rem;">
+              <div style="text-align: center; padding: 0.5rem; background: #d4edda; border-radius: 4px;">
+                <div style="font-weight: bold; color: #28a745; font-size: 0.9rem;">Male Planets</div>
+                <div style="font-size: 0.7rem; color: #155724;">${genderClassifications.male_planets ? genderClassifications.male_planets.join(', ') : 'Sun, Mars, Jupiter'}</div>
+              </div>
+              <div style="text-align: center; padding: 0.5rem; background: #fff3cd; border-radius: 4px;">
+                <div style="font-weight: bold; color: #856404; font-size: 0.9rem;">Hermaphrodite</div>
+                <div style="font-size: 0.7rem; color: #533f03;">${genderClassifications.hermaphrodite_planets ? genderClassifications.hermaphrodite_planets.join(', ') : 'Mercury, Saturn'}</div>
+              </div>
+              <div style="text-align: center; padding: 0.5rem; background: #f8d7da; border-radius: 4px;">
+                <div style="font-weight: bold; color: #721c24; font-size: 0.9rem;">Female Planets</div>
+                <div style="font-size: 0.7rem; color: #491217;">${genderClassifications.female_planets ? genderClassifications.female_planets.join(', ') : 'Moon, Venus'}</div>
+              </div>
+            </div>
+          </div>
+        </div>
+      `;
+      
+      content.innerHTML = detailsHtml;
+      modal.style.display = 'block';
+    }
+    
+    function closeDreshkonDetails() {
+      document.getElementById('dreshkon-details-modal').style.display = 'none';
+    }
+    
+    // Close modal when clicking outside
+    document.addEventListener('click', function(event) {
+      const modal = document.getElementById('saptavargiya-details-modal');
+      const yugmayugmaModal = document.getElementById('yugmayugma-details-modal');
+      const kendraModal = document.getElementById('kendra-details-modal');
+      const dreshkonModal = document.getElementById('dreshkon-details-modal');
+      
+      if (event.target === modal) {
+        closeSaptavargivaDetails();
+      }
+      if (event.target === yugmayugmaModal) {
+        closeYugmayugmaDetails();
+      }
+      if (event.target === kendraModal) {
+        closeKendraDetails();
+      }
+      if (event.target === dreshkonModal) {
+        closeDreshkonDetails();
+      }
+    });
+
+    // Theme Toggle Functionality
+    function toggleTheme() {
+      const html = document.documentElement;
+      const themeIcon = document.getElementById('theme-icon');
+      const currentTheme = html.getAttribute('data-theme');
+      
+      if (currentTheme === 'light') {
+        html.removeAttribute('data-theme');
+        themeIcon.textContent = '🌙';
+        localStorage.setItem('theme', 'dark');
+      } else {
+        html.setAttribute('data-theme', 'light');
+        themeIcon.textContent = '☀️';
+        localStorage.setItem('theme', 'light');
+      }
+    }
+
+    // Load saved theme on page load
+    document.addEventListener('DOMContentLoaded', function() {
+      const savedTheme = localStorage.getItem('theme');
+      const themeIcon = document.getElementById('theme-icon');
+      
+      if (savedTheme === 'light') {
+        document.documentElement.setAttribute('data-theme', 'light');
+        themeIcon.textContent = '☀️';
+      } else {
+        themeIcon.textContent = '🌙';
+      }
+    });
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""Test Ashtakavarga bitmask bindus against the BPHS totals and a direct count."""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+from datetime import datetime
+from vedic.core import (compute_chart, bhinnashtakavarga_batch, bhinnashtakavarga_matrix,
+                        daily_ashtakavarga_transits, ASHTAKAVARGA_BINDU_HOUSES,
+                        ASHTAKAVARGA_CONTRIBUTORS, MAITRI_PLANETS, ZODIAC_SIGNS)
+
+# Test data: DOB 22/08/1996 - 12:23 PM, Coimbatore
+chart = compute_chart(datetime(1996, 8, 22, 12, 23), 11.0055, 76.9661, 5.5, 'lahiri', 'placidus')
+ashtakavarga = chart['ashtakavarga']
+
+print("Testing Bhinnashtakavarga totals...")
+expected_totals = {'Sun': 48, 'Moon': 49, 'Mars': 39, 'Mercury': 54, 'Jupiter': 56, 'Venus': 52, 'Saturn': 39}
+for planet, total in expected_totals.items():
+    print(f"{planet}: {ashtakavarga['bhinnashtakavarga_totals'][planet]}")
+    assert ashtakavarga['bhinnashtakavarga_totals'][planet] == total
+    assert sum(ashtakavarga['bhinnashtakavarga'][planet].values()) == total
+assert ashtakavarga['sarvashtakavarga_total'] == 337
+assert sum(ashtakavarga['sarvashtakavarga_by_house'].values()) == 337
+
+print("Comparing bitmask bindus with a direct count...")
+rng = np.random.default_rng(0)
+sign_indices = rng.integers(0, 12, size=(300, 8))
+bindus = bhinnashtakavarga_batch(sign_indices)
+for row, signs in enumerate(sign_indices):
+    for p, planet in enumerate(MAITRI_PLANETS):
+        counts = [0] * 12
+        for c, contributor in enumerate(ASHTAKAVARGA_CONTRIBUTORS):
+            for house in ASHTAKAVARGA_BINDU_HOUSES[planet][contributor]:
+                counts[(signs[c] + house - 1) % 12] += 1
+        assert list(bindus[row, p]) == counts, (row, planet)
+
+print("Scoring daily transits against the natal Ashtakavarga...")
+assert not any(key.startswith('_') for key in ashtakavarga)
+bav = bhinnashtakavarga_matrix(ashtakavarga)
+assert bav.shape == (7, 12) and bav.sum() == 337
+daily = daily_ashtakavarga_transits(ashtakavarga, datetime(2024, 1, 1), 30)
+assert len(daily['dates']) == 30 and daily['dates'][0] == '2024-01-01'
+for planet in MAITRI_PLANETS:
+    for bindus in daily['bindus'][planet]:
+        assert bindus in bav[MAITRI_PLANETS.index(planet)]
+# The Sun is in Sagittarius on 1 January
+sun_sign = ZODIAC_SIGNS.index('Sagittarius')
+assert daily['bindus']['Sun'][0] == ashtakavarga['bhinnashtakavarga']['Sun']['Sagittarius']
+assert daily['sarvashtakavarga_bindus']['Sun'][0] == ashtakavarga['sarvashtakavarga']['Sagittarius'] == bav[:, sun_sign].sum()
+
+print("Ashtakavarga bindus match.")
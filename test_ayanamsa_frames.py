@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""Test multi-ayanamsa frames derived from one tropical computation."""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from datetime import datetime
+from vedic.core import compute_chart, _degnorm
+
+# Test data: DOB 22/08/1996 - 12:23 PM, Coimbatore
+birth_dt = datetime(1996, 8, 22, 12, 23, 0)
+lat = 11.0055
+lon = 76.9661
+tz_offset = 5.5
+ayanamsas = ['lahiri', 'raman', 'kp', 'fagan_bradley']
+
+print("Testing ayanamsa frames...")
+chart = compute_chart(birth_dt, lat, lon, tz_offset, 'lahiri', 'placidus', ayanamsas=ayanamsas)
+frames = chart['ayanamsa_frames']
+assert list(frames) == ayanamsas
+
+# The Lahiri frame must reproduce the main chart
+lahiri = frames['lahiri']
+assert lahiri['houses'] == chart['houses']
+assert lahiri['ascendant'] == chart['ascendant']
+for name, data in chart['planets'].items():
+    assert abs(lahiri['planets'][name]['longitude'] - data['longitude']) < 1e-6, name
+
+# Every other frame must match a full compute_chart with that ayanamsa
+for ayanamsa in ayanamsas[1:]:
+    full = compute_chart(birth_dt, lat, lon, tz_offset, ayanamsa, 'placidus')
+    frame = frames[ayanamsa]
+    print(f"{ayanamsa}: ayanamsa {frame['ayanamsa_value']}  Moon {frame['planets']['Moon']['longitude']}")
+    assert frame['houses'] == full['houses']
+    for name, data in full['planets'].items():
+        diff = abs(_degnorm(frame['planets'][name]['longitude'] - data['longitude'] + 180) - 180)
+        assert diff < 1e-5, f"{ayanamsa} {name} differs by {diff}"
+    assert frame['vimshottari']['nakshatraLord'] == full['vimshottari']['nakshatraLord']
+
+print("All ayanamsa frames match individual charts.")
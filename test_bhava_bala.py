@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""Test Bhava Bala with partial planet sets and for house_systems variants."""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from datetime import datetime
+import numpy as np
+from vedic.core import (BhavaBalaCalculator, BHAVA_DRISHTI_WEIGHTS, MAITRI_PLANETS,
+                        compute_chart, drishti_matrices)
+
+birth = (datetime(1990, 5, 3, 4, 15), 13.0827, 80.2707, 5.5)
+chart = compute_chart(*birth, 'lahiri', 'placidus')
+planets_sidereal = {p: chart['planets'][p]['longitude'] for p in MAITRI_PLANETS}
+cusps_map = {int(k): v for k, v in chart['houses'].items()}
+scores = chart['shadbala']['shadbala_scores']
+full = BhavaBalaCalculator().calculate_bhava_bala(planets_sidereal, cusps_map, scores)
+for house, strength in full.items():
+    assert abs(strength['total_bhava_bala'] - chart['bhava_bala'][house]['total_bhava_bala']) < 0.011, house
+
+# Without Venus: its Drishti drops out, and houses it lords get no Bhavadhipati Bala
+venus = MAITRI_PLANETS.index('Venus')
+partial_planets = {p: lon for p, lon in planets_sidereal.items() if p != 'Venus'}
+partial_scores = {p: s for p, s in scores.items() if p != 'Venus'}
+partial = BhavaBalaCalculator().calculate_bhava_bala(partial_planets, cusps_map, partial_scores)
+madhya = np.array([cusps_map[h] for h in range(1, 13)])
+lons = np.array([planets_sidereal[p] for p in MAITRI_PLANETS])
+venus_drishti = drishti_matrices(lons, madhya)[venus] * BHAVA_DRISHTI_WEIGHTS[venus]
+for i, house in enumerate(map(str, range(1, 13))):
+    expected = full[house]['bhava_drishti_bala'] - venus_drishti[i]
+    assert abs(partial[house]['bhava_drishti_bala'] - expected) < 0.011, house
+    assert partial[house]['bhava_digbala'] == full[house]['bhava_digbala']
+    if full[house]['lord'] == 'Venus':
+        assert partial[house]['bhavadhipati_bala'] == 0.0, house
+    else:
+        assert partial[house]['bhavadhipati_bala'] == full[house]['bhavadhipati_bala'], house
+    assert np.isfinite(partial[house]['total_bhava_bala'])
+print("Partial planet set: Venus Drishti and lordship removed")
+
+# Each house_systems variant carries the same Bhava Bala as a full chart in that system
+systems = ['whole', 'equal', 'koch']
+chart = compute_chart(*birth, 'lahiri', 'placidus', house_systems=systems)
+for system in systems:
+    variant = chart['house_systems'][system]
+    full_chart = compute_chart(*birth, 'lahiri', system)
+    assert variant['bhava_bala'] == full_chart['bhava_bala'], system
+    for house, analysis in variant['house_analysis'].items():
+        assert analysis['bhava_bala'] == full_chart['bhava_bala'][house]['total_bhava_bala'], (system, house)
+    print(f"{system}: Bhava Bala matches the full chart")
+
+print("Bhava Bala tests passed.")
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""Test that the compact ChartModel reproduces the compute_chart dict."""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from datetime import datetime
+import numpy as np
+from vedic.core import (Body, CHART_BODIES, MAITRI_PLANETS, compute_chart, compute_chart_model, dig_bala_batch,
+                        house_indices, _calculate_dig_bala, _get_planet_house)
+
+birth_dt = datetime(1990, 5, 3, 4, 15)
+model = compute_chart_model(birth_dt, 13.0827, 80.2707, 5.5, 'lahiri', 'placidus', house_systems=['whole'])
+assert not hasattr(model, '__dict__')
+assert model.longitudes.shape == (9,) and model.cusps.shape == (12,)
+
+chart = compute_chart(birth_dt, 13.0827, 80.2707, 5.5, 'lahiri', 'placidus', house_systems=['whole'])
+view = model.to_dict()
+# Current transits and the yearly calendar depend on today's date, not on the model
+for key in ('transits', 'current_transits', 'yearly_dasha'):
+    chart.pop(key)
+    view.pop(key)
+assert view == chart, "ChartModel.to_dict() differs from compute_chart()"
+
+for body in Body:
+    name = CHART_BODIES[body]
+    assert round(model.longitudes[body], 6) == chart['planets'][name]['longitude']
+    houses = [int(h) for h, items in chart['planetsByHouse'].items() if name in [p['name'] for p in items]]
+    print(f"{name}: house {model.house(body)}")
+    assert houses == [model.house(body)], name
+
+# The array helpers behind the Shadbala/house sections agree with the per-planet rules
+rng = np.random.default_rng(7)
+for _ in range(200):
+    cusps = np.sort(rng.uniform(0, 360, 12))
+    cusps = np.roll(cusps, rng.integers(12))
+    cusps_map = {house + 1: float(cusp) for house, cusp in enumerate(cusps)}
+    lons = rng.uniform(0, 360, 7)
+    assert house_indices(lons, cusps).tolist() == [_get_planet_house(float(l), cusps_map) for l in lons]
+    expected = [_calculate_dig_bala(p, float(l), cusps_map) for p, l in zip(MAITRI_PLANETS, lons)]
+    assert np.allclose(dig_bala_batch(lons, cusps), expected)
+
+# "now" is pinned when the model is computed
+assert model.to_dict()['current_transits'] == model.to_dict()['current_transits']
+
+print("ChartModel matches compute_chart.")
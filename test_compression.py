@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""Test response compression helpers and content-hashed static assets."""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import gzip
+import tempfile
+from werkzeug.http import parse_accept_header
+from compression import StaticAssets, choose_encoding, compress, precompress, supported_encodings
+
+body = b'{"ok": true, "data": ' + b'[1.25, 2.5, 3.75],' * 400 + b'null}'
+assert gzip.decompress(compress(body, 'gzip')) == body
+variants = precompress(body)
+assert variants[None] == body and len(variants['gzip']) < len(body)
+print(f"Encodings: {supported_encodings()}, gzip {len(body)} -> {len(variants['gzip'])} bytes")
+
+assert choose_encoding(parse_accept_header('gzip, deflate')) == 'gzip'
+assert choose_encoding(parse_accept_header('identity')) is None
+assert choose_encoding(parse_accept_header('br;q=0.5, gzip'), ['br', 'gzip']) == 'gzip'
+assert choose_encoding(parse_accept_header('gzip, br'), ['br', 'gzip']) == 'br'
+
+with tempfile.TemporaryDirectory() as root:
+    os.makedirs(os.path.join(root, 'js'))
+    with open(os.path.join(root, 'js', 'app.js'), 'wb') as f:
+        f.write(b'console.log("chart");\n' * 200)
+    assets = StaticAssets(root)
+    url = assets.url('js/app.js')
+    print(f"Asset URL: {url}")
+    assert url.startswith('/assets/js/app.') and url.endswith('.js')
+    asset = assets.get(url[len('/assets/'):])
+    assert gzip.decompress(asset['variants']['gzip']) == b'console.log("chart");\n' * 200
+    assert assets.get('js/app.js') is None
+
+    # Changing the content changes the URL
+    with open(os.path.join(root, 'js', 'app.js'), 'ab') as f:
+        f.write(b'// edited\n')
+    assert StaticAssets(root).url('js/app.js') != url
+
+# The page and /api/meta carry weak ETags: the same body goes out in several encodings
+import app
+client = app.app.test_client()
+for url in ('/', '/api/meta'):
+    response = client.get(url, headers={'Accept-Encoding': 'gzip'})
+    etag = response.headers['ETag']
+    assert response.status_code == 200 and etag.startswith('W/"'), (url, etag)
+    assert response.headers['Content-Encoding'] == 'gzip'
+    for if_none_match in (etag, etag[2:], f'"other", {etag}', '*'):
+        assert client.get(url, headers={'If-None-Match': if_none_match}).status_code == 304, (url, if_none_match)
+    assert client.get(url, headers={'If-None-Match': 'W/"other"'}).status_code == 200
+    print(f"{url}: ETag {etag}")
+
+print("Compression and static assets OK.")
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""Test Drik Bala against the standard horoscope in Reference/DRIKBALA and the batch form."""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+from vedic.core import DrikBalaCalculator, MAITRI_PLANETS, drik_bala_batch
+
+planets_sidereal = {
+    'Sun': 146.37, 'Moon': 309.50, 'Mars': 103.18, 'Mercury': 170.53,
+    'Jupiter': 170.45, 'Venus': 186.27, 'Saturn': 166.43
+}
+expected = {
+    'Sun': 11.24, 'Moon': -0.32, 'Mars': -5.10, 'Mercury': 4.29,
+    'Jupiter': 4.32, 'Venus': -2.86, 'Saturn': 5.82
+}
+
+print("Testing Drik Bala against reference values...")
+result = DrikBalaCalculator().calculate_drik_bala(planets_sidereal)
+for planet, value in expected.items():
+    drik = result['drik_bala'][planet]
+    print(f"{planet}: {drik:.2f} (reference {value})")
+    assert abs(drik - value) < 0.02, f"{planet} Drik Bala {drik:.2f} != {value}"
+
+# Special aspects: Jupiter on Moon (+30) and Saturn on Mars (+45)
+assert abs(result['aspect_matrix']['Jupiter']['Moon'] - 40.95) < 0.01
+assert abs(result['aspect_matrix']['Saturn']['Mars'] - 46.625) < 0.01
+
+# The batch form must agree with the per-chart calculator
+rng = np.random.default_rng(0)
+longitudes = rng.uniform(0, 360, size=(200, 7))
+batch = drik_bala_batch(longitudes)
+for row, values in zip(longitudes, batch):
+    single = DrikBalaCalculator().calculate_drik_bala(dict(zip(MAITRI_PLANETS, row)))['drik_bala']
+    assert np.allclose(values, [single[planet] for planet in MAITRI_PLANETS])
+
+# An absent (NaN) planet only drops out: the others keep the calculator's values
+longitudes[:50, 2] = np.nan
+batch = drik_bala_batch(longitudes[:50])
+assert np.isnan(batch[:, 2]).all()
+for row, values in zip(longitudes[:50], batch):
+    chart = {planet: lon for planet, lon in zip(MAITRI_PLANETS, row) if not np.isnan(lon)}
+    single = DrikBalaCalculator().calculate_drik_bala(chart)['drik_bala']
+    assert np.allclose(np.delete(values, 2), [single[planet] for planet in chart])
+
+print("Drik Bala matches the reference.")
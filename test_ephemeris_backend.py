@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""Test Swiss Ephemeris file detection and per-request precision flags."""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import tempfile
+from datetime import datetime
+import swisseph as swe
+from vedic.core import EphemerisBackend, compute_chart, get_ephemeris_backend, _choose_iflag
+
+with tempfile.TemporaryDirectory() as tmp:
+    empty = EphemerisBackend(tmp)
+    assert not empty.has_swieph
+    assert empty.flags('precise') == swe.FLG_MOSEPH and empty.flags('moshier') == swe.FLG_MOSEPH
+
+    with open(os.path.join(tmp, 'sepl_18.se1'), 'wb'):
+        pass
+    with_files = EphemerisBackend(tmp)
+    assert with_files.has_swieph and with_files.files == ['sepl_18.se1']
+    assert with_files.flags('precise') == swe.FLG_SWIEPH
+    assert with_files.flags(None) == swe.FLG_SWIEPH
+    assert with_files.flags('MOSHIER') == swe.FLG_MOSEPH
+    assert with_files.describe() == {'ephe_dir': os.path.abspath(tmp), 'files': ['sepl_18.se1'], 'has_swieph': True}
+
+    # 'fast' is the interpolated-table ephemeris option, not a precision
+    for precision in ('fast', 'low'):
+        try:
+            with_files.flags(precision)
+            raise AssertionError(f"Expected ValueError for precision={precision!r}")
+        except ValueError:
+            pass
+
+with tempfile.TemporaryDirectory() as tmp:
+    backend = get_ephemeris_backend(tmp)
+    assert get_ephemeris_backend(tmp) is backend, "Backend is not cached per directory"
+    assert _choose_iflag(tmp, 'moshier') == swe.FLG_SIDEREAL | swe.FLG_MOSEPH
+
+print(f"Default backend: {get_ephemeris_backend().describe()}")
+birth = datetime(1990, 5, 3, 4, 15)
+moshier = compute_chart(birth, 13.0827, 80.2707, 5.5, 'lahiri', 'equal', precision='moshier')
+precise = compute_chart(birth, 13.0827, 80.2707, 5.5, 'lahiri', 'equal', precision='precise')
+for body, data in precise['planets'].items():
+    assert abs(moshier['planets'][body]['longitude'] - data['longitude']) < 0.01, body
+
+print("Ephemeris backend flags OK.")
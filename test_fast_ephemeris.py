@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""Test the fast ephemeris table: Hermite interpolation and the Swiss Ephemeris fallback."""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import tempfile
+from datetime import datetime
+import numpy as np
+import swisseph as swe
+import vedic.fast_ephemeris as fast_ephemeris
+from vedic.fast_ephemeris import FAST_EPHEMERIS_BODIES, FastEphemeris, build_fast_ephemeris
+from vedic.core import compute_chart, _sidereal_longitude_series
+
+with tempfile.TemporaryDirectory() as tmp:
+    path = build_fast_ephemeris(os.path.join(tmp, 'fast_2000.npy'), 2000, 2000)
+    eph = FastEphemeris(path)
+    iflag = swe.FLG_SPEED | (swe.FLG_SWIEPH if eph.meta['source'] == 'SWIEPH' else swe.FLG_MOSEPH)
+
+    # Hermite interpolation between daily rows against direct calc_ut
+    jds = np.random.default_rng(1).uniform(eph.jd_start, eph.jd_end - eph.step, 200)
+    lon, speed = eph.tropical(jds)
+    for col, (name, ipl) in enumerate(FAST_EPHEMERIS_BODIES):
+        ref = np.array([swe.calc_ut(jd, ipl, iflag)[0][:4:3] for jd in jds])
+        dlon = np.abs((lon[:, col] - ref[:, 0] + 180.0) % 360.0 - 180.0).max() * 3600
+        dspeed = np.abs(speed[:, col] - ref[:, 1]).max()
+        print(f"{name:9s} max error {dlon:.3f}\" {dspeed:.1e} deg/day")
+        assert dlon < 5.0 and dspeed < 5e-3, name
+
+    # Sidereal positions match FLG_SIDEREAL output
+    swe.set_sid_mode(swe.SIDM_LAHIRI)
+    sid_lon, _ = eph.sidereal(jds[:20], swe.SIDM_LAHIRI)
+    ref = np.array([swe.calc_ut(jd, swe.MOON, iflag | swe.FLG_SIDEREAL)[0][0] for jd in jds[:20]])
+    assert np.abs((sid_lon[:, 1] - ref + 180.0) % 360.0 - 180.0).max() * 3600 < 5.0
+
+    # Range checks: instants outside the table are not covered and cannot be interpolated
+    assert eph.covers(eph.jd_start) and not eph.covers(eph.jd_end) and not eph.covers(eph.jd_start - 1)
+    try:
+        eph.tropical(eph.jd_start - 1)
+        raise AssertionError("Expected ValueError outside the table range")
+    except ValueError:
+        pass
+
+    # ephemeris='fast' uses the table inside its range and Swiss Ephemeris outside it
+    saved = fast_ephemeris.DEFAULT_FAST_EPHEMERIS_PATH
+    fast_ephemeris.DEFAULT_FAST_EPHEMERIS_PATH = path
+    fast_ephemeris._LOADED.clear()
+    try:
+        for birth in (datetime(2000, 6, 1, 12, 0), datetime(1990, 5, 3, 4, 15)):
+            fast = compute_chart(birth, 13.0827, 80.2707, 5.5, 'lahiri', 'equal', ephemeris='fast')
+            swiss = compute_chart(birth, 13.0827, 80.2707, 5.5, 'lahiri', 'equal', ephemeris='swiss')
+            for body, data in swiss['planets'].items():
+                diff = abs((fast['planets'][body]['longitude'] - data['longitude'] + 180.0) % 360.0 - 180.0)
+                assert diff < 5.0 / 3600, (birth, body, diff)
+            if birth.year == 1990:
+                assert fast['planets'] == swiss['planets'], "Outside the table the chart should use calc_ut"
+
+        # A missing table raises FileNotFoundError, and series lookups fall back to calc_ut
+        fast_ephemeris.DEFAULT_FAST_EPHEMERIS_PATH = os.path.join(tmp, 'missing.npy')
+        fast_ephemeris._LOADED.clear()
+        try:
+            fast_ephemeris.get_fast_ephemeris()
+            raise AssertionError("Expected FileNotFoundError for a missing table")
+        except FileNotFoundError:
+            pass
+        series = _sidereal_longitude_series(jds[:5], ['Sun', 'Saturn'], 'lahiri', ephemeris='fast')
+        swiss_series = _sidereal_longitude_series(jds[:5], ['Sun', 'Saturn'], 'lahiri', ephemeris='swiss')
+        assert np.array_equal(series, swiss_series)
+    finally:
+        fast_ephemeris.DEFAULT_FAST_EPHEMERIS_PATH = saved
+        fast_ephemeris._LOADED.clear()
+
+print("Fast ephemeris matches calc_ut.")
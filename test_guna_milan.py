@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""Test Guna Milan koota tables and the vectorized N x M scoring."""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+from vedic.matching import (calculate_guna_milan, guna_milan_scores, moon_pada_index,
+                            KOOTA_MAX_POINTS, KOOTA_TABLES)
+
+print("Testing Ashwini (boy) with Bharani (girl), both in Aries...")
+result = calculate_guna_milan(5.0, 20.0)
+expected = {'Varna': 1, 'Vashya': 2, 'Tara': 3, 'Yoni': 2, 'Graha Maitri': 5, 'Gana': 5, 'Bhakoot': 7, 'Nadi': 8}
+for koota, points in expected.items():
+    print(f"{koota}: {result['kootas'][koota]['points']} / {KOOTA_MAX_POINTS[koota]}")
+    assert result['kootas'][koota]['points'] == points, koota
+assert result['total_points'] == 33
+
+# Same nakshatra always carries Nadi dosha
+same = calculate_guna_milan(45.0, 46.0)
+assert same['nadi_dosha'] and same['kootas']['Nadi']['points'] == 0
+
+# Koota points stay within their maxima and the vectorized scores match single lookups
+for koota, table in KOOTA_TABLES.items():
+    assert table.min() >= 0 and table.max() <= KOOTA_MAX_POINTS[koota], koota
+
+rng = np.random.default_rng(0)
+boys, girls = rng.uniform(0, 360, 50), rng.uniform(0, 360, 40)
+scores = guna_milan_scores(moon_pada_index(boys), moon_pada_index(girls))
+assert scores.shape == (50, 40)
+for i in range(0, 50, 7):
+    for j in range(0, 40, 5):
+        assert scores[i, j] == calculate_guna_milan(boys[i], girls[j])['total_points']
+
+print("Guna Milan scores match.")
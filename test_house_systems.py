@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+"""Test that house_systems variants match full charts cast with each house system."""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from datetime import datetime
+from vedic.core import compute_chart
+
+birth = (datetime(1990, 5, 3, 4, 15), 13.0827, 80.2707, 5.5)
+systems = ['placidus', 'whole', 'equal', 'koch', 'kp']
+chart = compute_chart(*birth, 'lahiri', 'equal', house_systems=systems)
+assert list(chart['house_systems']) == systems
+
+for system in systems:
+    variant = chart['house_systems'][system]
+    full = compute_chart(*birth, 'lahiri', system)
+    assert variant['ascendant'] == full['ascendant'], system
+    assert variant['houses'] == full['houses'], system
+    assert variant['planetsByHouse'] == full['planetsByHouse'], system
+    assert variant['kendra_bala'] == full['shadbala']['_kendra_analysis'], system
+    for planet, score in full['shadbala']['shadbala_scores'].items():
+        assert variant['dig_bala'][planet] == score['components']['dig_bala'], (system, planet)
+    assert variant['house_analysis'] == full['house_analysis'], system
+    assert variant['bhava_bala'] == full['bhava_bala'], system
+    print(f"{system}: ascendant {variant['ascendant']:.4f} matches")
+
+print("House system variants match full charts.")
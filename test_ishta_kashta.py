@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""Test Ishta/Kashta Phala against Reference/KashataPhala and the batch form against the chart."""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from datetime import datetime
+import swisseph as swe
+from vedic.core import (compute_chart, ishta_kashta_phala, ishta_kashta_phala_batch,
+                        uchcha_bala_batch, MAITRI_PLANETS)
+
+# Standard horoscope: Uchcha and Chesta Bala as given in the reference
+uchcha = [14.54, 32.17, 4.94, 58.16, 34.85, 3.09, 48.81]
+chesta = [33.3, 54.38, 20.93, 28.76, 8.43, 28.18, 5.05]
+expected_ishta = [22.00, 41.83, 10.17, 40.90, 17.13, 9.33, 15.70]
+expected_kashta = [34.84, 12.51, 46.38, 7.58, 36.01, 42.55, 24.80]
+
+print("Testing Ishta/Kashta Phala against reference values...")
+ishta, kashta = ishta_kashta_phala(uchcha, chesta)
+for j, planet in enumerate(MAITRI_PLANETS):
+    print(f"{planet}: Ishta {ishta[j]:.2f} Kashta {kashta[j]:.2f}")
+    assert abs(ishta[j] - expected_ishta[j]) < 0.02
+    assert abs(kashta[j] - expected_kashta[j]) < 0.02
+
+longitudes = [146.37, 309.50, 103.18, 170.53, 170.45, 186.27, 166.43]
+for value, expected in zip(uchcha_bala_batch(longitudes), uchcha):
+    assert abs(value - expected) < 0.01
+
+# The batch form must agree with the Shadbala pass of a full chart
+chart = compute_chart(datetime(1996, 8, 22, 12, 23), 11.0055, 76.9661, 5.5, 'lahiri', 'placidus')
+jd_ut = chart['meta']['jd_ut']
+swe.set_sid_mode(swe.SIDM_LAHIRI)
+ayanamsa_value = swe.get_ayanamsa_ex_ut(jd_ut, swe.FLG_SWIEPH)[1]
+chart_lons = [chart['planets'][planet]['longitude'] for planet in MAITRI_PLANETS]
+batch_ishta, batch_kashta = ishta_kashta_phala_batch(chart_lons, jd_ut, ayanamsa_value)
+scores = chart['shadbala']['shadbala_scores']
+for j, planet in enumerate(MAITRI_PLANETS):
+    assert abs(scores[planet]['ishta_phala'] - batch_ishta[j]) < 0.01, planet
+    assert abs(scores[planet]['kashta_phala'] - batch_kashta[j]) < 0.01, planet
+
+print("Ishta/Kashta Phala match the reference.")
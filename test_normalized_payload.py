@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""Test that the normalized chart payload expands back to the full chart."""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import copy
+import json
+from datetime import datetime
+from vedic.core import compute_chart_model, expand_chart_payload, _normalize_chart
+
+model = compute_chart_model(datetime(1990, 5, 3, 4, 15), 13.0827, 80.2707, 5.5, 'lahiri', 'placidus',
+                            house_systems=['whole'], ayanamsas=['raman'])
+full = model.to_dict(include_static=False)
+normalized = copy.deepcopy(full)
+_normalize_chart(normalized)
+
+assert 'panchadha_maitri_used' not in normalized['shadbala']['_saptavargiya_analysis']
+assert 'longitude_sidereal' not in normalized['planetary_analysis']['Sun']
+assert 'start' not in normalized['vimshottari']['mahadashas'][1]
+assert all(isinstance(entry, str) for entries in normalized['planetsByHouse'].values() for entry in entries)
+
+full_bytes, normalized_bytes = len(json.dumps(full)), len(json.dumps(normalized))
+print(f"Full: {full_bytes} bytes, normalized: {normalized_bytes} bytes")
+assert normalized_bytes < 0.8 * full_bytes
+
+assert expand_chart_payload(normalized) == full, "Expanded payload differs from the full chart"
+
+# The model pins "now", so rebuilding it reports the same transits
+assert model.to_dict() == model.to_dict()
+
+# Downloads rebuild the chart from the same model, so both report the same transits
+import app
+client = app.app.test_client()
+response = client.post('/api/chart', json={'datetime': '1990-05-03T04:15:00', 'lat': 13.0827,
+                                           'lon': 80.2707, 'tz_offset': 5.5, 'payload': 'normalized'})
+chart = expand_chart_payload(response.get_json()['data'])
+download = client.get('/api/download/transits').get_json()
+assert download['content']['current_transits'] == chart['current_transits']
+
+print("Normalized payload expands to the full chart.")
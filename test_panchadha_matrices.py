@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""Test the integer Panchadha Maitri matrices against the dict-based rules."""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+from vedic.core import (MAITRI_LEVELS, MAITRI_PLANETS, PANCHADHA_LEVELS, PANCHADHA_MAITRI_RULES, PERMANENT_FRIENDSHIP,
+                        PanchadhaMaitriCalculator, VimshopakaBalaCalculator, panchadha_maitri_matrices,
+                        tatkaala_maitri_matrices)
+
+FRIEND_HOUSES = [2, 3, 4, 10, 11, 12]
+RULES = {(rule['naisargik'], rule['temporary']): rule['resultant'] for rule in PANCHADHA_MAITRI_RULES}
+
+
+def reference_tables(signs):
+    """Tatkaala and Panchadha names the way the dict calculator built them; absent pairs are omitted."""
+    tatkaala, panchadha = {}, {}
+    for data in PERMANENT_FRIENDSHIP:
+        a = data['planet']
+        if a not in signs:
+            continue
+        tatkaala[a], panchadha[a] = {}, {}
+        for b in MAITRI_PLANETS:
+            if b == a or b not in signs:
+                continue
+            house = (signs[b] - signs[a]) % 12 + 1
+            tatkaala[a][b] = 'Friend' if house in FRIEND_HOUSES else 'Enemy'
+            natural = next(level for level, key in (('Friend', 'friend'), ('Neutral', 'neutral'), ('Enemy', 'enemy'))
+                           if b in data[key])
+            panchadha[a][b] = RULES[(natural, tatkaala[a][b])]
+    return tatkaala, panchadha
+
+
+rng = np.random.default_rng(3)
+for trial in range(2000):
+    signs = rng.integers(0, 12, 7)
+    present = rng.random(7) > (0.2 if trial % 2 else 0.0)
+    sign_indices = np.where(present, signs, -1)
+    tatkaala = tatkaala_maitri_matrices(sign_indices)
+    panchadha = panchadha_maitri_matrices(sign_indices)
+    ref_tatkaala, ref_panchadha = reference_tables({p: int(s) for p, s, ok in zip(MAITRI_PLANETS, signs, present) if ok})
+    for i, a in enumerate(MAITRI_PLANETS):
+        for j, b in enumerate(MAITRI_PLANETS):
+            if i == j:
+                assert tatkaala[i, j] == -1 and panchadha[i, j] == -1
+            elif a in ref_tatkaala and b in ref_tatkaala[a]:
+                assert MAITRI_LEVELS[tatkaala[i, j]] == ref_tatkaala[a][b], (trial, a, b)
+                assert PANCHADHA_LEVELS[panchadha[i, j]] == ref_panchadha[a][b], (trial, a, b)
+            else:
+                # The dict lookups fell back to Neutral for absent planets
+                assert PANCHADHA_LEVELS[panchadha[i, j]] == 'Neutral', (trial, a, b)
+
+# A batch of charts gives the same matrices as one chart at a time
+batch = rng.integers(0, 12, (50, 7))
+assert np.array_equal(panchadha_maitri_matrices(batch), np.array([panchadha_maitri_matrices(s) for s in batch]))
+
+# Absent sign lords are Sama (Neutral) in Vimshopaka, not a relation to a planet placed in Aries
+partial = {'Sun': 45.0, 'Moon': 200.0, 'Jupiter': 100.0}
+details = VimshopakaBalaCalculator().calculate_vimshopaka_bala(partial)['planet_details']
+assert details['Moon']['D1']['relationship'] == 'Sama'  # Libra, lord Venus absent
+tables = PanchadhaMaitriCalculator().calculate_all_maitri_tables(partial)
+assert set(tables['panchadha_maitri']) == set(partial)
+
+print("Panchadha Maitri matrices match the dict-based rules.")
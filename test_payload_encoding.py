@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""Test response encoding negotiation for chart payloads."""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import json
+from werkzeug.datastructures import MIMEAccept
+from werkzeug.http import parse_accept_header
+import payload_encoding
+from payload_encoding import JSON_MIMETYPE, MSGPACK_MIMETYPE, encode_payload
+
+data = {'ok': True, 'data': {'planets': {'Sun': {'longitude': 18.535349}}, 'vargas': {9: 'Navamsa'}}}
+expected = json.loads(json.dumps(data))
+
+
+def accept(header):
+    return parse_accept_header(header, MIMEAccept)
+
+
+# No Accept header and */* both get minified JSON
+for header in (None, accept(''), accept('*/*')):
+    body, mimetype = encode_payload(data, header)
+    assert mimetype == JSON_MIMETYPE, header
+    assert json.loads(body) == expected and b'\n' not in body and b'": ' not in body
+
+# A browser-style header still prefers JSON
+assert encode_payload(data, accept('text/html,application/xhtml+xml,*/*;q=0.8'))[1] == JSON_MIMETYPE
+
+# ?pretty=1 indents JSON, even when MessagePack is accepted
+body, mimetype = encode_payload(data, accept('application/msgpack'), pretty=True)
+assert mimetype == JSON_MIMETYPE and json.loads(body) == expected and b'\n  ' in body
+
+if payload_encoding.msgpack is not None:
+    import msgpack
+    for header in ('application/msgpack', 'application/x-msgpack', 'application/json;q=0.5, application/msgpack'):
+        body, mimetype = encode_payload(data, accept(header))
+        assert mimetype == MSGPACK_MIMETYPE, header
+        assert msgpack.unpackb(body, strict_map_key=False) == data
+    print("MessagePack negotiated for application/msgpack")
+else:
+    assert encode_payload(data, accept('application/msgpack'))[1] == JSON_MIMETYPE
+
+print("Payload encoding negotiation works.")
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""Test the chart similarity index against a brute-force scan."""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+from vedic.similarity import ChartSimilarityIndex, SIMILARITY_WEIGHTS, STRENGTH_SCALE, encode_positions, feature_names
+
+rng = np.random.default_rng(0)
+n = 5000
+cusps = np.mod(rng.uniform(0, 360, (n, 1)) + np.cumsum(rng.uniform(20, 40, (n, 12)), axis=1) - 30, 360)
+encoded = encode_positions(rng.uniform(0, 360, (n, 9)), cusps[:, 0], cusps, rng.uniform(200, 700, (n, 7)))
+features, strengths = encoded['features'], encoded['strengths']
+names = feature_names()
+assert features.shape == (n, len(names))
+assert features[:, names.index('house:Sun')].max() <= 11
+
+index = ChartSimilarityIndex()
+index.add_encoded(features[:3000], strengths[:3000])
+index.add_encoded(features[3000:], strengths[3000:])
+assert len(index) == n
+
+weights = np.array([SIMILARITY_WEIGHTS[name.split(':')[0]] for name in names])
+for query in (0, 1234, 4999):
+    expected = ((features == features[query]) * weights).sum(axis=1) \
+        - np.abs(strengths.astype(int) - strengths[query]).sum(axis=1) / STRENGTH_SCALE
+    result = index.query_encoded(features[query], strengths[query], k=5)
+    print(f"Query {query}: {[r['score'] for r in result]}")
+    assert result[0]['id'] == query
+    assert np.allclose([r['score'] for r in result], np.sort(expected)[::-1][:5], atol=0.01)
+
+    # The prefilter only returns charts sharing the Lagna and Moon signs
+    lagna, moon = names.index('sign:Lagna'), names.index('sign:Moon')
+    for r in index.query_encoded(features[query], strengths[query], k=3, prefilter=True):
+        assert features[r['id'], lagna] == features[query, lagna]
+        assert features[r['id'], moon] == features[query, moon]
+
+    excluded = index.query_encoded(features[query], strengths[query], k=3, exclude_id=query)
+    assert query not in [r['id'] for r in excluded]
+
+print("Similarity index matches brute force.")
@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+"""Test Varshaphal (solar return) series against the natal Sun longitude."""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from datetime import datetime
+from vedic.core import compute_solar_returns
+
+# Test data: DOB 22/08/1996 - 12:23 PM, Coimbatore
+birth_dt = datetime(1996, 8, 22, 12, 23, 0)
+lat = 11.0055
+lon = 76.9661
+tz_offset = 5.5
+
+print("Testing solar return series (1997-2006)...")
+result = compute_solar_returns(birth_dt, lat, lon, tz_offset, 'lahiri', 'equal', 1997, 2006)
+natal_sun = result['natal_sun_longitude']
+print(f"Natal Sun: {natal_sun}")
+
+assert len(result['returns']) == 10
+for entry in result['returns']:
+    sun_lon = entry['chart']['planets']['Sun']['longitude']
+    print(f"{entry['year']}: {entry['datetime_local']}  Sun {sun_lon}")
+    assert abs(sun_lon - natal_sun) < 1e-4, f"Sun longitude mismatch in {entry['year']}"
+    assert entry['datetime_local'][:4] == str(entry['year'])
+
+print("All solar returns land on the natal Sun longitude.")
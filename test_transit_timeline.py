@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""Test the shared ingress table and the transit timeline built on it."""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from datetime import datetime
+import swisseph as swe
+from vedic.core import ZODIAC_SIGNS, compute_chart, _choose_iflag, _sign_index, _ayanamsa_mode
+from vedic.timeline import get_ingress_table, compute_transit_timeline, SADE_SATI_PHASES
+
+table = get_ingress_table('lahiri', 'mean')
+assert get_ingress_table('lahiri', 'mean') is table, "Ingress table is not cached"
+
+swe.set_sid_mode(_ayanamsa_mode('lahiri'))
+iflag = _choose_iflag(None)
+codes = {'Saturn': swe.SATURN, 'Jupiter': swe.JUPITER, 'Rahu': swe.MEAN_NODE}
+eps = 1e-4  # about 9 seconds
+for name, ipl in codes.items():
+    jds, signs = table[name]['jd'], table[name]['sign']
+    assert all(a < b for a, b in zip(jds, jds[1:])), name
+    print(f"{name}: {len(jds) - 1} ingresses")
+    for i in (1, len(jds) // 2, len(jds) - 1):
+        before = _sign_index(swe.calc_ut(jds[i] - eps, ipl, iflag)[0][0])
+        after = _sign_index(swe.calc_ut(jds[i] + eps, ipl, iflag)[0][0])
+        assert after == signs[i] and before == signs[i - 1] != after, (name, i, before, after, signs[i])
+
+chart = compute_chart(datetime(1990, 5, 3, 4, 15), 13.0827, 80.2707, 5.5, 'lahiri', 'equal')
+timeline = compute_transit_timeline(chart, span_years=60)
+moon_sign = _sign_index(chart['planets']['Moon']['longitude'])
+assert timeline['sade_sati'], "No Sade Sati found in 60 years"
+for period in timeline['sade_sati']:
+    for phase in period['phases']:
+        sign = ZODIAC_SIGNS.index(phase['sign'])
+        assert SADE_SATI_PHASES[(sign - moon_sign) % 12] == phase['phase']
+# Saturn returns about every 29.5 years and Jupiter every 12; retrograde re-entries belong to the
+# same return and the natal occupancy at birth is not one
+assert len(timeline['saturn_returns']) == 2 and len(timeline['jupiter_returns']) == 5
+for key, years in (('saturn_returns', 29.5), ('jupiter_returns', 11.9), ('rahu_returns', 18.6)):
+    starts = [datetime.fromisoformat(period['start']) for period in timeline[key]]
+    assert starts[0] > datetime.fromisoformat(timeline['span']['start']), key
+    assert all((b - a).days > 0.5 * years * 365.25 for a, b in zip(starts, starts[1:])), key
+print(f"Sade Sati periods: {len(timeline['sade_sati'])}, Saturn returns: {len(timeline['saturn_returns'])}")
+print("Ingress table and transit timeline OK.")
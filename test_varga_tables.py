@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""Test Shodashavarga lookup tables and the vectorized varga API."""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+from vedic.core import DivisionalChartCalculator, VARGA_DIVISIONS, ZODIAC_SIGNS, varga_signs
+
+# Known placements: (longitude, division, expected sign)
+cases = [
+    (1.0, 9, 'Aries'),          # Aries 1 deg -> 1st navamsa from Aries
+    (31.0, 9, 'Capricorn'),     # Taurus starts from Capricorn
+    (45.0, 2, 'Leo'),           # Taurus 15 deg -> 2nd hora, Sun's
+    (115.0, 3, 'Pisces'),       # Cancer 25 deg -> 9th from Cancer
+    (34.0, 10, 'Aquarius'),     # Taurus 4 deg -> 2nd dasamsa from Capricorn
+    (200.0, 16, 'Aquarius'),    # Libra 20 deg (movable) -> 11th from Aries
+    (93.0, 24, 'Virgo'),        # Cancer 3 deg (even) -> 3rd from Cancer
+    (270.0, 27, 'Cancer'),      # Capricorn 0 deg (earth) -> Cancer
+    (7.0, 30, 'Aquarius'),      # Aries 7 deg -> Saturn's trimsamsa
+    (359.9, 60, 'Aquarius'),    # Pisces 29.9 deg -> 60th from Pisces
+]
+
+print("Testing varga lookup tables...")
+for lon, n, expected in cases:
+    sign = ZODIAC_SIGNS[int(varga_signs(lon, [n])[0])]
+    print(f"D{n} of {lon}: {sign}")
+    assert sign == expected, f"D{n} of {lon}: expected {expected}, got {sign}"
+
+# Vectorized results must agree with the per-body calculator
+rng = np.random.default_rng(0)
+longitudes = rng.uniform(0, 360, size=(50, 9))
+signs = varga_signs(longitudes)
+assert signs.shape == (50, 9, len(VARGA_DIVISIONS))
+
+calculator = DivisionalChartCalculator()
+for lon, row in zip(longitudes.ravel(), signs.reshape(-1, len(VARGA_DIVISIONS))):
+    for k, n in enumerate(VARGA_DIVISIONS):
+        sign_index, _ = calculator.calculate_varga(int(lon // 30), lon % 30, n)
+        assert sign_index == row[k], f"D{n} mismatch at {lon}"
+
+print("All varga tables agree.")
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""Test Vimshopaka Bala: scheme weights and scores recomputed varga by varga."""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from datetime import datetime
+from vedic.core import (SHADBALA_CONSTANTS, SIGN_RULERS, VIMSHOPAKA_SCHEMES, DivisionalChartCalculator,
+                        PanchadhaMaitriCalculator, VimshopakaBalaCalculator, compute_chart)
+
+for scheme, weights in VIMSHOPAKA_SCHEMES.items():
+    assert abs(sum(weights.values()) - 20) < 1e-9, scheme
+print(f"Schemes: {', '.join(VIMSHOPAKA_SCHEMES)}")
+
+chart = compute_chart(datetime(1990, 5, 3, 4, 15), 13.0827, 80.2707, 5.5, 'lahiri', 'equal')
+planets = {name: data['longitude'] for name, data in chart['planets'].items()}
+result = VimshopakaBalaCalculator().calculate_vimshopaka_bala(planets)
+assert result['planet_scores'] == chart['shadbala']['_vimshopaka_analysis']['planet_scores']
+
+# Reference: Own sign 20, otherwise the Panchadha relation to the varga sign's lord
+points = {'Extreme Friend': 18, 'Friend': 15, 'Neutral': 10, 'Enemy': 7, 'Extreme Enemy': 5}
+panchadha = PanchadhaMaitriCalculator().calculate_all_maitri_tables(planets)['panchadha_maitri']
+divisional = DivisionalChartCalculator()
+for planet, scores in result['planet_scores'].items():
+    lon = planets[planet]
+    for scheme, weights in VIMSHOPAKA_SCHEMES.items():
+        total = 0.0
+        for n, weight in weights.items():
+            sign, _ = divisional.calculate_varga(int(lon // 30), lon % 30, n)
+            if sign in SHADBALA_CONSTANTS['own_signs'][planet]:
+                total += 20 * weight
+            else:
+                total += points[panchadha[planet][SIGN_RULERS[sign]]['resultant']] * weight
+        assert abs(scores[scheme] - total / 20) < 0.006, (planet, scheme, scores[scheme], total / 20)
+        assert 0 < scores[scheme] <= 20
+    print(f"{planet}: {scores}")
+
+# Charts without any of the seven planets (only the nodes) score nothing instead of failing
+empty = VimshopakaBalaCalculator().calculate_vimshopaka_bala({'Rahu': 10.0, 'Ketu': 190.0})
+assert empty['planet_scores'] == {} and empty['planet_details'] == {}
+
+print("Vimshopaka Bala matches the reference computation.")
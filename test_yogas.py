@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Test the compiled yoga programs against a direct interpretation of the rule tuples."""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+from vedic.core import SIGN_RULERS
+from vedic.yogas import (ASPECT_TABLE, DIGNITY_TABLES, YOGA_BODIES, YOGA_RULES,
+                         compile_yoga_rules, detect_yogas_batch)
+
+
+def interpret(expr, signs, lagna):
+    """Evaluate one rule tuple on a {body: sign} chart without compiling it."""
+    def who(ref):
+        return ref if ref in signs else SIGN_RULERS[(lagna + int(ref[1:]) - 1) % 12]
+
+    def offset(ref, base):
+        return (signs[who(ref)] - signs[who(base)]) % 12
+
+    op, args = expr[0], expr[1:]
+    if op == 'all':
+        return all(interpret(child, signs, lagna) for child in args)
+    if op == 'any':
+        return any(interpret(child, signs, lagna) for child in args)
+    if op == 'not':
+        return not interpret(args[0], signs, lagna)
+    if op == 'house':
+        return offset(args[0], 'Lagna') + 1 in args[1]
+    if op == 'from':
+        return offset(args[0], args[1]) + 1 in args[2]
+    if op == 'dignity':
+        return bool(DIGNITY_TABLES[args[1]][YOGA_BODIES.index(who(args[0])), signs[who(args[0])]])
+    if op == 'exchange' and args[0] not in signs and args[1] not in signs:
+        return (offset(args[0], 'Lagna') + 1 == int(args[1][1:])
+                and offset(args[1], 'Lagna') + 1 == int(args[0][1:]))
+    a, b = who(args[0]), who(args[1])
+    if op == 'same':
+        return a == b
+    if op == 'conjunct':
+        return a != b and signs[a] == signs[b]
+    if op == 'exchange':
+        return a != b and SIGN_RULERS[signs[a]] == b and SIGN_RULERS[signs[b]] == a
+    if op == 'aspects':
+        return bool(ASPECT_TABLE[YOGA_BODIES.index(a), offset(b, a)])
+    if op == 'mutual_aspect':
+        return interpret(('aspects',) + args, signs, lagna) and interpret(('aspects', args[1], args[0]), signs, lagna)
+    raise ValueError(op)
+
+
+engine = compile_yoga_rules()
+rng = np.random.default_rng(0)
+body_signs = rng.integers(0, 12, size=(500, 9))
+lagna_signs = rng.integers(0, 12, size=500)
+vector = engine.evaluate(body_signs, lagna_signs)
+assert vector.shape == (500, len(YOGA_RULES))
+for row in range(500):
+    scalar = engine.evaluate_one([int(s) for s in body_signs[row]], int(lagna_signs[row]))
+    assert list(scalar) == list(vector[row]), row
+    chart = dict(zip(YOGA_BODIES, [int(s) for s in body_signs[row]] + [int(lagna_signs[row])]))
+    expected = [interpret(rule['rule'], chart, int(lagna_signs[row])) for rule in YOGA_RULES]
+    assert expected == [bool(x) for x in vector[row]], (row, [r['name'] for r, e, v in
+                                                          zip(YOGA_RULES, expected, vector[row]) if e != v])
+print(f"Scalar, vector and interpreted results agree on 500 charts ({vector.sum()} yogas)")
+
+# Aries Lagna, Moon in Aries, Jupiter (L9) with Mars (L1) in Cancer
+longitudes = {'Sun': 45.0, 'Moon': 10.0, 'Mars': 100.0, 'Mercury': 50.0, 'Jupiter': 105.0,
+              'Venus': 70.0, 'Saturn': 300.0, 'Rahu': 200.0, 'Ketu': 20.0}
+hits = detect_yogas_batch([[longitudes[body] for body in YOGA_BODIES[:-1]]], [5.0])[0]
+present = {rule['name'] for rule, hit in zip(YOGA_RULES, hits) if hit}
+assert 'Gajakesari' in present
+assert 'Raja (L1-L9 conjunction)' in present
+print("Aries Lagna:", ', '.join(sorted(present)))
+
+# Cancer Lagna: Mars lords the 5th and 10th, a Yogakaraka whatever its placement
+present = {yoga['name'] for yoga in engine.detect(longitudes, 95.0)}
+assert 'Yogakaraka (L10-L5)' in present
+assert 'Gajakesari' in present
+
+# One exchange is one Parivartana, even when the two lords own further houses
+def parivartanas(chart, asc):
+    return [yoga['name'] for yoga in engine.detect(chart, asc) if yoga['category'] == 'Parivartana']
+
+# Aries Lagna, Mars (L1, L8) in Cancer and Moon (L4) in Aries
+exchange = dict(longitudes, Mars=100.0, Moon=10.0, Mercury=140.0)
+assert parivartanas(exchange, 5.0) == ['Maha Parivartana (L1-L4)'], parivartanas(exchange, 5.0)
+# Aries Lagna, Mercury (L3, L6) in Libra and Venus (L2, L7) in Gemini
+exchange = dict(longitudes, Mars=280.0, Mercury=190.0, Venus=70.0)
+assert parivartanas(exchange, 5.0) == ['Khala Parivartana (L3-L7)'], parivartanas(exchange, 5.0)
+assert not any('exchange' in yoga['name'] for yoga in engine.detect(exchange, 5.0))
+
+print("Yoga detection tests passed.")
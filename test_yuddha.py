@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""Test the planetary war sweep against a brute-force search over every pair."""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from datetime import datetime, timezone
+from itertools import combinations
+import numpy as np
+from vedic.core import (YUDDHA_ORB, YUDDHA_PLANETS, _jd_to_datetime, _julday, _sidereal_longitude_series,
+                        find_planetary_wars, planetary_wars_in_range, yuddha_pairs)
+
+
+def brute_force_wars(lons, orb=YUDDHA_ORB):
+    """{(row, winner, loser): separation} comparing every pair on the circle."""
+    wars = {}
+    for row, values in enumerate(np.mod(lons, 360.0)):
+        for a, b in combinations(range(len(values)), 2):
+            diff = abs(values[a] - values[b])
+            separation = min(diff, 360.0 - diff)
+            if separation < orb:
+                winner, loser = (a, b) if values[a] < values[b] else (b, a)
+                wars[(row, winner, loser)] = separation
+    return wars
+
+
+# Random charts, a third of them with planets clustered so several wars (and ties across 0 Aries) occur
+rng = np.random.default_rng(0)
+longitudes = rng.uniform(0, 360, size=(3000, 5))
+clustered = rng.uniform(-1.5, 1.5, size=(1000, 5)) + rng.choice([0.0, 120.0, 359.5], size=(1000, 1))
+longitudes[:1000] = np.mod(clustered, 360.0)
+rows, winners, losers, separations = yuddha_pairs(longitudes)
+swept = {(int(r), int(w), int(l)): float(s) for r, w, l, s in zip(rows, winners, losers, separations)}
+expected = brute_force_wars(longitudes)
+assert swept.keys() == expected.keys(), len(swept.keys() ^ expected.keys())
+for key, separation in expected.items():
+    assert abs(swept[key] - separation) < 1e-9, key
+print(f"yuddha_pairs: {len(swept)} wars match the brute-force search")
+
+# The planet with the lesser longitude wins, also when the pair straddles 0 Aries
+chart = {'Mars': 100.2, 'Mercury': 100.9, 'Jupiter': 359.8, 'Venus': 0.3, 'Saturn': 200.0}
+wars = {(war['winner'], war['loser']) for war in find_planetary_wars(chart)}
+assert wars == {('Mars', 'Mercury'), ('Venus', 'Jupiter')}, wars
+assert find_planetary_wars({'Mars': 10.0, 'Mercury': 11.0, 'Jupiter': 50.0, 'Venus': 90.0, 'Saturn': 130.0}) == []
+
+# planetary_wars_in_range groups the same per-sample wars into contiguous periods
+start = datetime(2020, 1, 1, tzinfo=timezone.utc)
+end = datetime(2021, 1, 1, tzinfo=timezone.utc)
+periods = planetary_wars_in_range(start, end, step_hours=6.0)
+jds = np.arange(_julday(start), _julday(end), 6.0 / 24.0)
+samples = brute_force_wars(_sidereal_longitude_series(jds, YUDDHA_PLANETS, 'lahiri'))
+expected_runs = {}
+for (row, a, b), separation in sorted(samples.items()):
+    runs = expected_runs.setdefault(tuple(sorted((YUDDHA_PLANETS[a], YUDDHA_PLANETS[b]),
+                                                 key=YUDDHA_PLANETS.index)), [])
+    if runs and runs[-1][-1][0] == row - 1:
+        runs[-1].append((row, separation))
+    else:
+        runs.append([(row, separation)])
+expected_periods = {(pair, _jd_to_datetime(jds[run[0][0]]).isoformat(), _jd_to_datetime(jds[run[-1][0]]).isoformat(),
+                     round(min(sep for _, sep in run), 4))
+                    for pair, runs in expected_runs.items() for run in runs}
+got_periods = {(tuple(p['planets']), p['start'], p['end'], p['min_separation']) for p in periods}
+assert len(periods) == len(expected_periods) and got_periods == expected_periods
+for period in periods:
+    print(f"{' / '.join(period['planets'])}: {period['start'][:10]} to {period['end'][:10]}, "
+          f"closest {period['min_separation']:.4f}, winner {period['winner_at_closest']}")
+jupiter_saturn = [p for p in periods if p['planets'] == ['Jupiter', 'Saturn']]
+assert jupiter_saturn and jupiter_saturn[0]['closest'].startswith('2020-12-2'), jupiter_saturn
+
+print("Planetary war sweep matches the brute-force search.")
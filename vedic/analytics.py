@@ -0,0 +1,364 @@
+"""Columnar analytics over birth cohorts without building chart dicts.
+
+A cohort is a dict of equal-length arrays (see ``cohort_from_births``). ``compute_fields``
+derives only the requested fields for a slice of it, as arrays with one row per birth:
+
+    longitudes          (n, 9)  sidereal, SYNASTRY_BODIES order
+    signs, nakshatras   (n, 9)  0-based indices
+    ayanamsa            (n,)
+    ascendant, lagna_sign (n,)
+    cusps               (n, 12) sidereal
+    houses              (n, 9)  0-based house of each body
+    shadbala            (n, 7)  total Shadbala in virupas, MAITRI_PLANETS order
+    shadbala_category   (n, 7)  index into SHADBALA_CATEGORIES
+    mahadasha           (n, A)  VIM_SEQUENCE index of the Mahadasha lord at each age
+
+Planet positions are one vectorized fast ephemeris query per chunk; cusps take one
+``swe.houses_ex`` call per birth and Shadbala the full per-chart calculation, so both are
+only run when a requested field needs them.
+
+``CohortPipeline`` splits a cohort into chunks, computes fields chunk by chunk across a
+process pool and feeds them to streaming aggregations (Histogram, Mean, CrossTab). Workers
+return only the aggregation state, which the parent merges.
+"""
+
+import copy
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Any, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+import swisseph as swe
+
+from .core import (
+    MAITRI_PLANETS, NAK_LEN_DEG, NAK_LORDS, PLANET_ORDER, VIM_MD_YEARS, VIM_SEQUENCE,
+    _ayanamsa_mode, _calculate_shadbala, _choose_iflag, _house_system_code, _jd_to_datetime, _julday,
+    _select_fast_ephemeris, _sidereal_cusps, _sidereal_positions,
+)
+from .synastry import SYNASTRY_BODIES, cusp_index
+
+SHADBALA_CATEGORIES = ['Weak', 'Average', 'Good', 'Strong', 'Excellent']
+
+# Column names of the multi-column fields, so aggregations can pick a column by name
+FIELD_COLUMNS = {
+    'longitudes': SYNASTRY_BODIES,
+    'signs': SYNASTRY_BODIES,
+    'nakshatras': SYNASTRY_BODIES,
+    'houses': SYNASTRY_BODIES,
+    'shadbala': MAITRI_PLANETS,
+    'shadbala_category': MAITRI_PLANETS,
+}
+
+# Fields each field is derived from
+FIELD_DEPENDENCIES = {
+    'longitudes': [],
+    'ayanamsa': [],
+    'signs': ['longitudes'],
+    'nakshatras': ['longitudes'],
+    'cusps': ['ayanamsa'],
+    'ascendant': ['cusps'],
+    'lagna_sign': ['ascendant'],
+    'houses': ['longitudes', 'cusps'],
+    'shadbala': ['longitudes', 'cusps', 'ayanamsa'],
+    'shadbala_category': ['shadbala'],  # filled in by the same pass
+    'mahadasha': ['longitudes'],
+}
+
+_VIM_START = np.array([VIM_SEQUENCE.index(lord) for lord in NAK_LORDS])
+_VIM_YEARS = np.array([VIM_MD_YEARS[lord] for lord in VIM_SEQUENCE], dtype=np.float64)
+# Cumulative Mahadasha end years for a cycle starting at each lord, shaped (9, 9)
+_VIM_CUMULATIVE = np.array([np.cumsum(np.roll(_VIM_YEARS, -start)) for start in range(9)])
+
+
+def cohort_from_births(birth_dts_local: Sequence[datetime], lats, lons, tz_offsets_hours) -> Dict[str, np.ndarray]:
+    """Columnar cohort (jd_ut, lat, lon, tz_offset) from local birth times."""
+    tz = np.asarray(tz_offsets_hours, dtype=np.float64) * np.ones(len(birth_dts_local))
+    return {
+        'jd_ut': np.array([_julday((dt - timedelta(hours=float(offset))).replace(tzinfo=timezone.utc))
+                           for dt, offset in zip(birth_dts_local, tz)], dtype=np.float64),
+        'lat': np.asarray(lats, dtype=np.float64) * np.ones(len(tz)),
+        'lon': np.asarray(lons, dtype=np.float64) * np.ones(len(tz)),
+        'tz_offset': tz,
+    }
+
+
+def mahadasha_at_ages(moon_longitudes, ages_years) -> np.ndarray:
+    """VIM_SEQUENCE index of the Vimshottari Mahadasha lord at each age, shaped (n, len(ages)).
+
+    Ages are in years of 365.2425 days from birth, matching the fractional part of
+    ``_compute_vimshottari``.
+    """
+    moon = np.mod(np.asarray(moon_longitudes, dtype=np.float64), 360.0)
+    nak = np.minimum((moon // NAK_LEN_DEG).astype(np.int64), 26)
+    start = _VIM_START[nak]
+    elapsed = _VIM_YEARS[start] * (moon - nak * NAK_LEN_DEG) / NAK_LEN_DEG
+    t = np.mod(elapsed[:, None] + np.asarray(ages_years, dtype=np.float64)[None, :], 120.0)
+    steps = (t[:, :, None] >= _VIM_CUMULATIVE[start][:, None, :]).sum(axis=-1)
+    return (start[:, None] + steps) % 9
+
+
+def _longitudes(jds: np.ndarray, ayanamsa: str, node_type: str, ephemeris: str) -> np.ndarray:
+    mean_node = node_type.lower() in ('mean', 'm')
+    try:
+        fast_eph = _select_fast_ephemeris(ephemeris)
+    except FileNotFoundError:
+        fast_eph = None
+    if fast_eph is not None and fast_eph.covers(jds):
+        lons = fast_eph.sidereal(jds, _ayanamsa_mode(ayanamsa))[0]
+        cols = [fast_eph.body_index(name) for name, _ in PLANET_ORDER]
+        cols.append(fast_eph.body_index('MeanNode' if mean_node else 'TrueNode'))
+        out = lons[:, cols + cols[-1:]]
+        out[:, -1] += 180.0  # Ketu
+    else:
+        iflag = _choose_iflag(None)
+        out = np.array([[positions[body] for body in SYNASTRY_BODIES]
+                        for positions in (_sidereal_positions(jd, iflag, node_type, ayanamsa) for jd in jds)])
+    return np.mod(out, 360.0).reshape(len(jds), len(SYNASTRY_BODIES))
+
+
+def _ayanamsa_values(jds: np.ndarray, ayanamsa: str, ephemeris: str) -> np.ndarray:
+    try:
+        fast_eph = _select_fast_ephemeris(ephemeris)
+    except FileNotFoundError:
+        fast_eph = None
+    if fast_eph is not None and fast_eph.covers(jds):
+        return fast_eph.ayanamsa(jds, _ayanamsa_mode(ayanamsa))
+    return np.array([swe.get_ayanamsa_ut(jd) for jd in jds], dtype=np.float64).reshape(len(jds))
+
+
+def _cusps(cohort: Dict[str, np.ndarray], ayanamsa_values: np.ndarray, house_system: str) -> np.ndarray:
+    hsys = _house_system_code(house_system)
+    tropical_iflag = _choose_iflag(None) & ~swe.FLG_SIDEREAL
+    cusps = np.empty((len(ayanamsa_values), 12), dtype=np.float64)
+    for i, (jd, lat, lon, aya) in enumerate(zip(cohort['jd_ut'], cohort['lat'], cohort['lon'], ayanamsa_values)):
+        tropical, ascmc = swe.houses_ex(jd, lat, lon, hsys, tropical_iflag)
+        cusps_map = _sidereal_cusps(tropical, ascmc[0], aya, house_system)[1]
+        cusps[i] = [cusps_map[h] for h in range(1, 13)]
+    return cusps
+
+
+def _shadbala(cohort: Dict[str, np.ndarray], fields: Dict[str, np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+    """Total Shadbala and its category code per birth, from the full per-chart calculation."""
+    totals = np.empty((len(cohort['jd_ut']), len(MAITRI_PLANETS)), dtype=np.float64)
+    categories = np.empty(totals.shape, dtype=np.int8)
+    for i, jd in enumerate(cohort['jd_ut']):
+        # Round away the Julian day round trip so Kala Bala sees the recorded birth second
+        birth_dt_local = _jd_to_datetime(jd) + timedelta(hours=float(cohort['tz_offset'][i]), microseconds=500000)
+        birth_dt_local = birth_dt_local.replace(tzinfo=None, microsecond=0)
+        planets = dict(zip(SYNASTRY_BODIES, fields['longitudes'][i].tolist()))
+        cusps_map = {h + 1: float(c) for h, c in enumerate(fields['cusps'][i])}
+        scores = _calculate_shadbala(planets, cusps_map, birth_dt_local, float(cohort['lat'][i]),
+                                     float(cohort['lon'][i]), jd_ut=float(jd),
+                                     ayanamsa_value=float(fields['ayanamsa'][i]))['shadbala_scores']
+        totals[i] = [scores[planet]['total_shadbala'] for planet in MAITRI_PLANETS]
+        categories[i] = [SHADBALA_CATEGORIES.index(scores[planet]['category']) for planet in MAITRI_PLANETS]
+    return totals, categories
+
+
+def compute_fields(cohort: Dict[str, np.ndarray], fields: Sequence[str], ayanamsa: str = 'lahiri',
+                   house_system: str = 'placidus', node_type: str = 'mean', ephemeris: str = 'fast',
+                   dasha_ages: Sequence[float] = ()) -> Dict[str, np.ndarray]:
+    """Compute the requested fields (and what they depend on) for every birth in ``cohort``."""
+    unknown = set(fields) - set(FIELD_DEPENDENCIES)
+    if unknown:
+        raise ValueError(f"Unknown analytics fields: {sorted(unknown)}")
+    swe.set_sid_mode(_ayanamsa_mode(ayanamsa))
+    jds = np.asarray(cohort['jd_ut'], dtype=np.float64)
+    out: Dict[str, np.ndarray] = {}
+
+    def need(name):
+        if name in out:
+            return
+        for dependency in FIELD_DEPENDENCIES[name]:
+            need(dependency)
+        if name == 'longitudes':
+            out[name] = _longitudes(jds, ayanamsa, node_type, ephemeris)
+        elif name == 'ayanamsa':
+            out[name] = _ayanamsa_values(jds, ayanamsa, ephemeris)
+        elif name == 'signs':
+            out[name] = (out['longitudes'] // 30.0).astype(np.int8)
+        elif name == 'nakshatras':
+            out[name] = np.minimum(out['longitudes'] // NAK_LEN_DEG, 26).astype(np.int8)
+        elif name == 'cusps':
+            out[name] = _cusps(cohort, out['ayanamsa'], house_system)
+        elif name == 'ascendant':
+            out[name] = out['cusps'][:, 0].copy()
+        elif name == 'lagna_sign':
+            out[name] = (out['ascendant'] // 30.0).astype(np.int8)
+        elif name == 'houses':
+            offsets = np.mod(out['longitudes'] - out['cusps'][:, :1], 360.0)
+            index = cusp_index(out['cusps'])
+            out[name] = ((offsets[:, :, None] >= index[:, None, :]).sum(axis=-1) - 1).astype(np.int8)
+        elif name == 'shadbala':
+            out['shadbala'], out['shadbala_category'] = _shadbala(cohort, out)
+        elif name == 'mahadasha':
+            out[name] = mahadasha_at_ages(out['longitudes'][:, 1], dasha_ages).astype(np.int8)
+
+    for field in fields:
+        need(field)
+    return {field: out[field] for field in fields}
+
+
+def _column(field: str, column) -> Optional[int]:
+    if column is None or isinstance(column, (int, np.integer)):
+        return column
+    return FIELD_COLUMNS[field].index(column)
+
+
+def _select(columns: Dict[str, np.ndarray], field: str, column: Optional[int]) -> np.ndarray:
+    values = columns[field]
+    return values if column is None else values[:, column]
+
+
+class Histogram:
+    """Counts of integer codes 0..bins-1 (or of values binned by ``edges``) per column.
+
+    The result has the field's trailing shape plus a last axis of length ``bins``; values
+    outside the edges are not counted.
+    """
+
+    def __init__(self, field: str, bins: Optional[int] = None, edges: Optional[Sequence[float]] = None,
+                 column=None):
+        if bins is None and edges is None:
+            raise ValueError("Histogram needs bins or edges")
+        self.field = field
+        self.column = _column(field, column)
+        self.edges = None if edges is None else np.asarray(edges, dtype=np.float64)
+        self.bins = len(self.edges) - 1 if self.edges is not None else int(bins)
+        self.counts: Optional[np.ndarray] = None
+
+    @property
+    def fields(self) -> List[str]:
+        return [self.field]
+
+    def update(self, columns: Dict[str, np.ndarray]) -> None:
+        values = _select(columns, self.field, self.column)
+        tail = values.shape[1:]
+        if self.edges is not None:
+            codes = np.searchsorted(self.edges, values, side='right') - 1
+            valid = (values >= self.edges[0]) & (values <= self.edges[-1])
+            codes = np.where(values == self.edges[-1], self.bins - 1, codes)
+        else:
+            codes = values.astype(np.int64)
+            valid = (codes >= 0) & (codes < self.bins)
+        slots = int(np.prod(tail))
+        flat = np.where(valid, codes, 0).reshape(len(values), slots) + self.bins * np.arange(slots)
+        counts = np.bincount(flat.ravel(), weights=valid.reshape(-1), minlength=slots * self.bins)
+        counts = counts.astype(np.int64).reshape(tail + (self.bins,))
+        self.counts = counts if self.counts is None else self.counts + counts
+
+    def merge(self, other: 'Histogram') -> None:
+        if other.counts is not None:
+            self.counts = other.counts if self.counts is None else self.counts + other.counts
+
+    def result(self) -> np.ndarray:
+        return self.counts
+
+
+class Mean:
+    """Running count, mean and standard deviation per column."""
+
+    def __init__(self, field: str, column=None):
+        self.field = field
+        self.column = _column(field, column)
+        self.count = 0
+        self.total = 0.0
+        self.total_sq = 0.0
+
+    @property
+    def fields(self) -> List[str]:
+        return [self.field]
+
+    def update(self, columns: Dict[str, np.ndarray]) -> None:
+        values = _select(columns, self.field, self.column).astype(np.float64)
+        self.count += len(values)
+        self.total = self.total + values.sum(axis=0)
+        self.total_sq = self.total_sq + np.square(values).sum(axis=0)
+
+    def merge(self, other: 'Mean') -> None:
+        self.count += other.count
+        self.total = self.total + other.total
+        self.total_sq = self.total_sq + other.total_sq
+
+    def result(self) -> Dict[str, Any]:
+        if not self.count:
+            return {'count': 0, 'mean': None, 'std': None}
+        mean = self.total / self.count
+        return {'count': self.count, 'mean': mean,
+                'std': np.sqrt(np.maximum(self.total_sq / self.count - np.square(mean), 0.0))}
+
+
+class CrossTab:
+    """Joint counts of two integer-coded columns, shaped (bins_a, bins_b)."""
+
+    def __init__(self, field_a: str, field_b: str, bins_a: int, bins_b: int, column_a=None, column_b=None):
+        self.field_a, self.field_b = field_a, field_b
+        self.column_a, self.column_b = _column(field_a, column_a), _column(field_b, column_b)
+        self.bins_a, self.bins_b = bins_a, bins_b
+        self.counts = np.zeros((bins_a, bins_b), dtype=np.int64)
+
+    @property
+    def fields(self) -> List[str]:
+        return [self.field_a, self.field_b]
+
+    def update(self, columns: Dict[str, np.ndarray]) -> None:
+        a = _select(columns, self.field_a, self.column_a).astype(np.int64).ravel()
+        b = _select(columns, self.field_b, self.column_b).astype(np.int64).ravel()
+        if a.size != b.size:
+            raise ValueError("CrossTab columns must have the same shape")
+        valid = (a >= 0) & (a < self.bins_a) & (b >= 0) & (b < self.bins_b)
+        self.counts += np.bincount(a[valid] * self.bins_b + b[valid],
+                                   minlength=self.bins_a * self.bins_b).reshape(self.bins_a, self.bins_b)
+
+    def merge(self, other: 'CrossTab') -> None:
+        self.counts += other.counts
+
+    def result(self) -> np.ndarray:
+        return self.counts
+
+
+def _run_chunk(chunk: Dict[str, np.ndarray], aggregations: Dict[str, Any], options: Dict[str, Any]) -> Dict[str, Any]:
+    """Worker entry point: compute one chunk's fields and return the updated aggregations."""
+    fields = sorted({field for aggregation in aggregations.values() for field in aggregation.fields})
+    columns = compute_fields(chunk, fields, **options)
+    for aggregation in aggregations.values():
+        aggregation.update(columns)
+    return aggregations
+
+
+class CohortPipeline:
+    """Stream a cohort through chunked field computation into mergeable aggregations.
+
+    ``aggregations`` maps result names to Histogram, Mean or CrossTab instances (or any
+    object with ``fields``, ``update``, ``merge`` and ``result``). ``workers`` > 1 runs
+    chunks in a process pool; 0 or 1 runs them in this process.
+    """
+
+    def __init__(self, aggregations: Dict[str, Any], ayanamsa: str = 'lahiri', house_system: str = 'placidus',
+                 node_type: str = 'mean', ephemeris: str = 'fast', dasha_ages: Sequence[float] = (),
+                 chunk_size: int = 20000, workers: Optional[int] = None):
+        self.aggregations = aggregations
+        self.options = {'ayanamsa': ayanamsa, 'house_system': house_system, 'node_type': node_type,
+                        'ephemeris': ephemeris, 'dasha_ages': tuple(dasha_ages)}
+        self.chunk_size = chunk_size
+        self.workers = workers
+
+    def chunks(self, cohort: Dict[str, np.ndarray]) -> Iterator[Dict[str, np.ndarray]]:
+        size = len(cohort['jd_ut'])
+        for start in range(0, size, self.chunk_size):
+            yield {key: np.asarray(values)[start:start + self.chunk_size] for key, values in cohort.items()}
+
+    def run(self, cohort: Dict[str, np.ndarray]) -> Dict[str, Any]:
+        """Aggregate the whole cohort and return each aggregation's result."""
+        merged = copy.deepcopy(self.aggregations)
+        empty = copy.deepcopy(self.aggregations)
+        if self.workers is not None and self.workers <= 1:
+            for chunk in self.chunks(cohort):
+                _run_chunk(chunk, merged, self.options)
+        else:
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                futures = [pool.submit(_run_chunk, chunk, empty, self.options) for chunk in self.chunks(cohort)]
+                for future in futures:
+                    for name, partial in future.result().items():
+                        merged[name].merge(partial)
+        return {name: aggregation.result() for name, aggregation in merged.items()}
@@ -1,6 +1,11 @@
 from datetime import datetime, timezone, timedelta
-from typing import Dict, Any, List, Optional
+from enum import IntEnum
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
+import hashlib
+import json
 import math
+import numpy as np
 import swisseph as swe
 import os
 
@@ -13,10 +18,27 @@ PLANET_ORDER = [
     ('Jupiter', swe.JUPITER), ('Venus', swe.VENUS), ('Saturn', swe.SATURN)
 ]
 
+# Bodies of a chart in array order, as used by ChartModel
+CHART_BODIES = ['Sun', 'Moon', 'Mars', 'Mercury', 'Jupiter', 'Venus', 'Saturn', 'Rahu', 'Ketu']
+
+
+class Body(IntEnum):
+    SUN = 0
+    MOON = 1
+    MARS = 2
+    MERCURY = 3
+    JUPITER = 4
+    VENUS = 5
+    SATURN = 6
+    RAHU = 7
+    KETU = 8
+
+
 ABBR = {'Sun':'Su','Moon':'Mo','Mars':'Ma','Mercury':'Me','Jupiter':'Ju','Venus':'Ve','Saturn':'Sa','Rahu':'Ra','Ketu':'Ke'}
 
 # Vimshottari dasha constants
 NAK_LEN_DEG = 360.0 / 27.0  # 13°20'
+SIDEREAL_YEAR_DAYS = 365.256363  # Mean sidereal year, used to seed solar return solves
 VIM_MD_YEARS = {
     'Ketu': 7,
     'Venus': 20,
@@ -28,6 +50,13 @@ VIM_MD_YEARS = {
     'Saturn': 19,
     'Mercury': 17,
 }
+NAKSHATRA_NAMES = [
+    "Ashwini", "Bharani", "Krittika", "Rohini", "Mrigashira", "Ardra", "Punarvasu",
+    "Pushya", "Ashlesha", "Magha", "Purva Phalguni", "Uttara Phalguni", "Hasta",
+    "Chitra", "Swati", "Vishakha", "Anuradha", "Jyeshtha", "Mula", "Purva Ashadha",
+    "Uttara Ashadha", "Shravana", "Dhanishta", "Shatabhisha", "Purva Bhadrapada",
+    "Uttara Bhadrapada", "Revati"
+]
 VIM_SEQUENCE = ['Ketu','Venus','Sun','Moon','Mars','Rahu','Jupiter','Saturn','Mercury']
 NAK_LORDS = [
     'Ketu','Venus','Sun','Moon','Mars','Rahu','Jupiter','Saturn','Mercury', # Ashwini..Ashlesha (0..8)
@@ -75,6 +104,178 @@ PANCHADHA_MAITRI_RULES = [
     {"naisargik": "Enemy", "temporary": "Enemy", "resultant": "Extreme Enemy", "code": "EE"}
 ]
 
+# Integer form of the Maitri tables. Planets are indexed in MAITRI_PLANETS order; -1 marks
+# a planet's relation to itself.
+MAITRI_PLANETS = ['Sun', 'Moon', 'Mars', 'Mercury', 'Jupiter', 'Venus', 'Saturn']
+MAITRI_LEVELS = ['Friend', 'Neutral', 'Enemy']                       # naisargika / tatkaala codes 0-2
+PANCHADHA_LEVELS = ['Extreme Friend', 'Friend', 'Neutral', 'Enemy', 'Extreme Enemy']
+PANCHADHA_CODES = ['EF', 'F', 'N', 'E', 'EE']
+TATKAALA_FRIEND_OFFSETS = [1, 2, 3, 9, 10, 11]                      # 2nd, 3rd, 4th, 10th, 11th, 12th sign
+
+
+def _build_naisargika_matrix() -> np.ndarray:
+    matrix = np.full((7, 7), 1, dtype=np.int8)
+    for planet_data in PERMANENT_FRIENDSHIP:
+        i = MAITRI_PLANETS.index(planet_data["planet"])
+        for level, key in ((0, "friend"), (1, "neutral"), (2, "enemy")):
+            for other in planet_data[key]:
+                matrix[i, MAITRI_PLANETS.index(other)] = level
+    np.fill_diagonal(matrix, -1)
+    return matrix
+
+
+NAISARGIKA_MATRIX = _build_naisargika_matrix()
+
+# PANCHADHA_LOOKUP[naisargika, tatkaala] -> PANCHADHA_LEVELS index, from PANCHADHA_MAITRI_RULES
+PANCHADHA_LOOKUP = np.zeros((3, 3), dtype=np.int8)
+for _rule in PANCHADHA_MAITRI_RULES:
+    PANCHADHA_LOOKUP[MAITRI_LEVELS.index(_rule["naisargik"]), MAITRI_LEVELS.index(_rule["temporary"])] = \
+        PANCHADHA_LEVELS.index(_rule["resultant"])
+
+# Lord of each sign as a MAITRI_PLANETS index
+SIGN_LORD_INDEX = np.array([MAITRI_PLANETS.index(SIGN_RULERS[i]) for i in range(12)])
+
+_TATKAALA_BY_OFFSET = np.array([0 if d in TATKAALA_FRIEND_OFFSETS else 2 for d in range(12)], dtype=np.int8)
+
+
+def _absent_pairs(signs: np.ndarray) -> np.ndarray:
+    """(..., 7, 7) mask of pairs where either planet is absent (negative sign index)."""
+    absent = signs < 0
+    return absent[..., :, None] | absent[..., None, :]
+
+
+def tatkaala_maitri_matrices(sign_indices) -> np.ndarray:
+    """Tatkaala codes for sign indices shaped (..., 7) in MAITRI_PLANETS order -> (..., 7, 7).
+
+    A negative sign index marks an absent planet; its relations are Neutral.
+    """
+    signs = np.asarray(sign_indices, dtype=np.int64)
+    offsets = (signs[..., None, :] - signs[..., :, None]) % 12
+    tatkaala = _TATKAALA_BY_OFFSET[offsets]
+    tatkaala[_absent_pairs(signs)] = MAITRI_LEVELS.index('Neutral')
+    tatkaala[..., np.arange(7), np.arange(7)] = -1
+    return tatkaala
+
+
+def panchadha_maitri_matrices(sign_indices) -> np.ndarray:
+    """Panchadha codes (PANCHADHA_LEVELS indices) for sign indices shaped (..., 7) -> (..., 7, 7).
+
+    Batch form of PanchadhaMaitriCalculator: pass one row of Rashi sign indices per chart.
+    """
+    signs = np.asarray(sign_indices, dtype=np.int64)
+    tatkaala = tatkaala_maitri_matrices(signs)
+    naisargika = np.broadcast_to(NAISARGIKA_MATRIX, tatkaala.shape)
+    panchadha = PANCHADHA_LOOKUP[np.maximum(naisargika, 0), np.maximum(tatkaala, 0)]
+    # Nothing to combine for an absent planet: Neutral, as the named tables' default
+    panchadha[_absent_pairs(signs)] = PANCHADHA_LEVELS.index('Neutral')
+    panchadha[..., np.arange(7), np.arange(7)] = -1
+    return panchadha
+
+
+def drishti_matrices(aspecting_longitudes, aspected_longitudes) -> np.ndarray:
+    """Drishti values of the seven planets (MAITRI_PLANETS order) onto arbitrary points.
+
+    ``aspecting_longitudes`` is shaped (..., 7) and ``aspected_longitudes`` (..., M); the
+    result is (..., 7, M) with entry [i, j] the aspect of planet i on point j, including the
+    special aspects of Mars, Jupiter and Saturn. Leading axes batch several charts.
+    """
+    aspecting = np.asarray(aspecting_longitudes, dtype=np.float64)
+    aspected = np.asarray(aspected_longitudes, dtype=np.float64)
+    kendra = np.mod(aspected[..., None, :] - aspecting[..., :, None], 360.0)
+    values = np.interp(kendra, *DRISHTI_KNOTS)
+    for planet, (extra, arcs) in SPECIAL_DRISHTI.items():
+        i = MAITRI_PLANETS.index(planet)
+        row = kendra[..., i, :]
+        in_arc = np.zeros(row.shape, dtype=bool)
+        for start, end in arcs:
+            in_arc |= (row >= start) & (row < end)
+        values[..., i, :] += extra * in_arc
+    return values
+
+
+def benefic_signs(longitudes) -> np.ndarray:
+    """+1 for benefic, -1 for malefic Drishti per planet, for longitudes shaped (..., 7).
+
+    Jupiter and Venus are benefic; Sun, Mars and Saturn malefic. The Moon is benefic while
+    waxing (BENEFIC_MOON_ELONGATION). Mercury is benefic unless the planets sharing its sign
+    include more malefics than benefics.
+    """
+    lons = np.asarray(longitudes, dtype=np.float64)
+    signs = np.empty(lons.shape, dtype=np.int8)
+    for planet in MAITRI_PLANETS:
+        signs[..., MAITRI_PLANETS.index(planet)] = 1 if planet in ('Jupiter', 'Venus', 'Mercury', 'Moon') else -1
+    sun, moon, mercury = (MAITRI_PLANETS.index(p) for p in ('Sun', 'Moon', 'Mercury'))
+    elongation = np.mod(lons[..., moon] - lons[..., sun], 360.0)
+    start, end = BENEFIC_MOON_ELONGATION
+    signs[..., moon] = np.where((elongation >= start) & (elongation < end), 1, -1)
+    rasi = np.mod(lons, 360.0) // 30.0  # NaN for an absent planet, never equal to Mercury's
+    together = rasi == rasi[..., mercury:mercury + 1]
+    together[..., mercury] = False
+    balance = np.sum(together * signs, axis=-1)
+    signs[..., mercury] = np.where(balance < 0, -1, 1)
+    return signs
+
+
+def drik_bala_batch(longitudes) -> np.ndarray:
+    """Drik Bala (Drishti Pinda / 4) for planet longitudes shaped (..., 7) in MAITRI_PLANETS order.
+
+    A NaN longitude marks an absent planet, as in DrikBalaCalculator: it casts and receives no
+    Drishti, its own Drik Bala is NaN and the other planets' values are unaffected.
+    """
+    lons = np.asarray(longitudes, dtype=np.float64)
+    values = np.nan_to_num(drishti_matrices(lons, lons))
+    values[..., np.arange(7), np.arange(7)] = 0.0
+    pinda = np.sum(values * benefic_signs(lons)[..., :, None], axis=-2)
+    return np.where(np.isnan(lons), np.nan, pinda / 4.0)
+
+
+def bhava_digbala(bhava_madhya) -> np.ndarray:
+    """Bhava Digbala for Bhava Madhya longitudes shaped (..., 12), houses I to XII in order."""
+    madhya = np.mod(np.asarray(bhava_madhya, dtype=np.float64), 360.0)
+    category = BHAVA_DIG_CATEGORY_BY_HALF_SIGN[(madhya // 15.0).astype(np.int64) % 24]
+    distance = np.mod(np.arange(1, 13) - BHAVA_DIG_STRONGEST_HOUSE[category], 12)
+    return 60.0 - 10.0 * np.minimum(distance, 12 - distance)
+
+
+def bhava_drishti(longitudes, bhava_madhya) -> np.ndarray:
+    """Bhava Drishti Bala of planets shaped (..., 7) onto Bhava Madhya shaped (..., 12).
+
+    Same Drishti as Drik Bala, except Mercury always counts as benefic and only Mercury and
+    Jupiter aspect in full (BHAVA_DRISHTI_WEIGHTS).
+    """
+    lons = np.asarray(longitudes, dtype=np.float64)
+    signs = benefic_signs(lons)
+    signs[..., MAITRI_PLANETS.index('Mercury')] = 1
+    weights = signs * BHAVA_DRISHTI_WEIGHTS
+    # nansum: an absent (NaN) planet casts no Drishti
+    return np.nansum(drishti_matrices(lons, bhava_madhya) * weights[..., :, None], axis=-2)
+
+
+def house_indices(longitudes, cusps) -> np.ndarray:
+    """House (1-12) of each longitude for one chart's 12 cusps, as _get_planet_house places it.
+
+    House i runs from cusp i (inclusive) to cusp i+1 along the zodiac: the cusps are unrolled
+    from the 1st cusp and every longitude is placed with one sorted search.
+    """
+    cusps = np.asarray(cusps, dtype=np.float64)
+    index = np.mod(cusps - cusps[0], 360.0)
+    offsets = np.mod(np.asarray(longitudes, dtype=np.float64) - cusps[0], 360.0)
+    return np.searchsorted(index, offsets, side='right')
+
+
+def bhava_bala_batch(longitudes, bhava_madhya, shadbala_totals) -> np.ndarray:
+    """Bhava Bala in shashtiamsas for arrays of charts.
+
+    ``longitudes`` and ``shadbala_totals`` are shaped (..., 7) in MAITRI_PLANETS order and
+    ``bhava_madhya`` (..., 12). Returns (..., 12): Bhavadhipati Bala + Bhava Digbala + Bhava Drishti.
+    """
+    madhya = np.asarray(bhava_madhya, dtype=np.float64)
+    totals = np.asarray(shadbala_totals, dtype=np.float64)
+    lords = SIGN_LORD_INDEX[(np.mod(madhya, 360.0) // 30.0).astype(np.int64) % 12]
+    adhipati = np.take_along_axis(totals, lords, axis=-1)
+    return adhipati + bhava_digbala(madhya) + bhava_drishti(longitudes, madhya)
+
+
 SHADBALA_CONSTANTS = {
     'naisargika_bala': {
         'Sun': 60, 'Moon': 51.43, 'Mars': 17.14, 'Mercury': 25.71,
@@ -131,6 +332,106 @@ SAPTAVARGIYA_POINTS = {
     'Bitter Enemy': 1.875       # Bitter Enemy's sign (Adhi Shatru Rashi) = 1.875 Shashtiamsa
 }
 
+# Vimshopaka Bala: varga weights per scheme (each scheme totals 20) and points per relationship
+VIMSHOPAKA_SCHEMES = {
+    'shadvarga': {1: 6, 2: 2, 3: 4, 9: 5, 12: 2, 30: 1},
+    'saptavarga': {1: 5, 2: 2, 3: 3, 7: 2.5, 9: 4.5, 12: 2, 30: 1},
+    'dashavarga': {1: 3, 2: 1.5, 3: 1.5, 7: 1.5, 9: 1.5, 10: 1.5, 12: 1.5, 16: 1.5, 30: 1.5, 60: 5},
+    'shodashavarga': {1: 3.5, 2: 1, 3: 1, 4: 0.5, 7: 0.5, 9: 3, 10: 0.5, 12: 0.5, 16: 2, 20: 0.5,
+                      24: 0.5, 27: 0.5, 30: 1, 40: 0.5, 45: 0.5, 60: 4},
+}
+VIMSHOPAKA_RELATIONSHIPS = ['Own', 'Adhi Mitra', 'Mitra', 'Sama', 'Shatru', 'Adhi Shatru']
+VIMSHOPAKA_POINTS = [20, 18, 15, 10, 7, 5]
+
+# Drishti (Reference/DRIKBALA): aspect value in shashtiamsas is piecewise linear in the
+# Drishti Kendra (aspected minus aspecting longitude), zero from 300 to 30 degrees
+DRISHTI_KNOTS = ([0.0, 30.0, 60.0, 90.0, 120.0, 150.0, 180.0, 300.0, 360.0],
+                 [0.0, 0.0, 15.0, 45.0, 30.0, 0.0, 60.0, 0.0, 0.0])
+# Vishesha Drishti additions: planet -> (added value, Drishti Kendra arcs)
+SPECIAL_DRISHTI = {
+    'Mars': (15.0, [(90.0, 120.0), (210.0, 240.0)]),
+    'Jupiter': (30.0, [(120.0, 150.0), (240.0, 270.0)]),
+    'Saturn': (45.0, [(60.0, 90.0), (270.0, 300.0)]),
+}
+# Waxing Moon (benefic) runs from the 8th tithi of Shukla to the 7th of Krishna Paksha
+BENEFIC_MOON_ELONGATION = (84.0, 264.0)
+
+# Bhava Digbala (Reference/BhavaBala.txt): Rashi category of each half sign and the house
+# in which each category is strongest. Sagittarius and Capricorn change category mid-sign.
+BHAVA_DIG_CATEGORIES = ['Nara', 'Jalachara', 'Chatushpada', 'Keeta']
+BHAVA_DIG_STRONGEST_HOUSE = np.array([1, 4, 10, 7])
+BHAVA_DIG_CATEGORY_BY_HALF_SIGN = np.array([
+    2, 2,  # Aries
+    2, 2,  # Taurus
+    0, 0,  # Gemini
+    1, 1,  # Cancer
+    2, 2,  # Leo
+    0, 0,  # Virgo
+    0, 0,  # Libra
+    3, 3,  # Scorpio
+    0, 2,  # Sagittarius
+    2, 1,  # Capricorn
+    0, 0,  # Aquarius
+    1, 1,  # Pisces
+])
+# Bhava Drishti takes Mercury and Jupiter in full and the other planets at one quarter
+BHAVA_DRISHTI_WEIGHTS = np.array([1.0 if planet in ('Mercury', 'Jupiter') else 0.25
+                                  for planet in MAITRI_PLANETS])
+# Dig Bala: house whose cusp is each planet's powerless point (MAITRI_PLANETS order)
+DIG_BALA_POWERLESS_HOUSE = np.array([4, 10, 4, 7, 7, 10, 1])
+
+# Ashtakavarga (BPHS): houses, counted from each contributor, in which it gives a bindu to
+# the planet's Bhinnashtakavarga. Contributors are the seven planets and the Lagna.
+ASHTAKAVARGA_CONTRIBUTORS = MAITRI_PLANETS + ['Lagna']
+ASHTAKAVARGA_BINDU_HOUSES = {
+    'Sun': {
+        'Sun': [1, 2, 4, 7, 8, 9, 10, 11], 'Moon': [3, 6, 10, 11], 'Mars': [1, 2, 4, 7, 8, 9, 10, 11],
+        'Mercury': [3, 5, 6, 9, 10, 11, 12], 'Jupiter': [5, 6, 9, 11], 'Venus': [6, 7, 12],
+        'Saturn': [1, 2, 4, 7, 8, 9, 10, 11], 'Lagna': [3, 4, 6, 10, 11, 12],
+    },
+    'Moon': {
+        'Sun': [3, 6, 7, 8, 10, 11], 'Moon': [1, 3, 6, 7, 10, 11], 'Mars': [2, 3, 5, 6, 9, 10, 11],
+        'Mercury': [1, 3, 4, 5, 7, 8, 10, 11], 'Jupiter': [1, 4, 7, 8, 10, 11, 12],
+        'Venus': [3, 4, 5, 7, 9, 10, 11], 'Saturn': [3, 5, 6, 11], 'Lagna': [3, 6, 10, 11],
+    },
+    'Mars': {
+        'Sun': [3, 5, 6, 10, 11], 'Moon': [3, 6, 11], 'Mars': [1, 2, 4, 7, 8, 10, 11],
+        'Mercury': [3, 5, 6, 11], 'Jupiter': [6, 10, 11, 12], 'Venus': [6, 8, 11, 12],
+        'Saturn': [1, 4, 7, 8, 9, 10, 11], 'Lagna': [1, 3, 6, 10, 11],
+    },
+    'Mercury': {
+        'Sun': [5, 6, 9, 11, 12], 'Moon': [2, 4, 6, 8, 10, 11], 'Mars': [1, 2, 4, 7, 8, 9, 10, 11],
+        'Mercury': [1, 3, 5, 6, 9, 10, 11, 12], 'Jupiter': [6, 8, 11, 12],
+        'Venus': [1, 2, 3, 4, 5, 8, 9, 11], 'Saturn': [1, 2, 4, 7, 8, 9, 10, 11],
+        'Lagna': [1, 2, 4, 6, 8, 10, 11],
+    },
+    'Jupiter': {
+        'Sun': [1, 2, 3, 4, 7, 8, 9, 10, 11], 'Moon': [2, 5, 7, 9, 11], 'Mars': [1, 2, 4, 7, 8, 10, 11],
+        'Mercury': [1, 2, 4, 5, 6, 9, 10, 11], 'Jupiter': [1, 2, 3, 4, 7, 8, 10, 11],
+        'Venus': [2, 5, 6, 9, 10, 11], 'Saturn': [3, 5, 6, 12], 'Lagna': [1, 2, 4, 5, 6, 7, 9, 10, 11],
+    },
+    'Venus': {
+        'Sun': [8, 11, 12], 'Moon': [1, 2, 3, 4, 5, 8, 9, 11, 12], 'Mars': [3, 5, 6, 9, 11, 12],
+        'Mercury': [3, 5, 6, 9, 11], 'Jupiter': [5, 8, 9, 10, 11], 'Venus': [1, 2, 3, 4, 5, 8, 9, 10, 11],
+        'Saturn': [3, 4, 5, 8, 9, 10, 11], 'Lagna': [1, 2, 3, 4, 5, 8, 9, 11],
+    },
+    'Saturn': {
+        'Sun': [1, 2, 4, 7, 8, 10, 11], 'Moon': [3, 6, 11], 'Mars': [3, 5, 6, 10, 11, 12],
+        'Mercury': [6, 8, 9, 10, 11, 12], 'Jupiter': [5, 6, 11, 12], 'Venus': [6, 11, 12],
+        'Saturn': [3, 5, 6, 11], 'Lagna': [1, 3, 4, 6, 10, 11],
+    },
+}
+# Bit h-1 of a mask is set when house h (from the contributor) carries a bindu
+ASHTAKAVARGA_MASKS = np.array([
+    [sum(1 << (house - 1) for house in ASHTAKAVARGA_BINDU_HOUSES[planet][contributor])
+     for contributor in ASHTAKAVARGA_CONTRIBUTORS]
+    for planet in MAITRI_PLANETS
+], dtype=np.int64)
+POPCOUNT_12 = np.array([bin(mask).count('1') for mask in range(1 << 12)], dtype=np.int64)
+
+# Panchadha Maitri levels as named in the Saptavargiya Bala point system
+SAPTAVARGIYA_RELATIONSHIPS = ['Fast Friend', 'Friend', 'Neutral', 'Enemy', 'Bitter Enemy']
+
 # Kala Bala constants and data for classical calculation
 WEEKDAY_LORDS = ['Moon', 'Mars', 'Mercury', 'Jupiter', 'Venus', 'Saturn', 'Sun']  # Monday=0, Sunday=6
 
@@ -155,12 +456,373 @@ PLANETARY_DISC_DIAMETERS = {
     'Mars': 9.4, 'Mercury': 6.6, 'Jupiter': 190.4, 'Venus': 16.6, 'Saturn': 158.0
 }
 
+# Graha Yuddha (Reference/KALABala.txt): Mars to Saturn within one degree are at war; the
+# luminaries never take part
+YUDDHA_PLANETS = ['Mars', 'Mercury', 'Jupiter', 'Venus', 'Saturn']
+YUDDHA_ORB = 1.0
+
+# Chesta Bala (Reference/Chestabala.txt): nirayana mean longitudes of Sun, Mars, Jupiter and
+# Saturn and Seeghrochcha of Mercury and Venus, from the epoch 1900-01-01 0h at Ujjain (76E)
+CHESTA_EPOCH_JD = swe.julday(1900, 1, 1, 0.0) - 76.0 / 360.0
+CHESTA_MEAN_MOTIONS = {  # degrees per day
+    'Sun': 0.98560266, 'Mars': 0.5240195, 'Jupiter': 0.0830965, 'Saturn': 0.0334395,
+    'Mercury': 4.092318, 'Venus': 1.6021465
+}
+CHESTA_EPOCH_LONGITUDES = {
+    'Sun': 257.4568, 'Mars': 270.22, 'Jupiter': 220.04, 'Saturn': 236.74,
+    'Mercury': 164.00, 'Venus': 328.51
+}
+CHESTA_CORRECTIONS = {  # (constant, per year since 1900)
+    'Jupiter': (-3.33, -0.0067), 'Saturn': (5.0, 0.001), 'Mercury': (6.67, -0.00133), 'Venus': (-5.0, -0.0001)
+}
+
+# Shodashavarga (sixteen divisional charts)
+VARGA_DIVISIONS = [1, 2, 3, 4, 7, 9, 10, 12, 16, 20, 24, 27, 30, 40, 45, 60]
+VARGA_NAMES = {
+    1: "Rasi (D1)", 2: "Hora (D2)", 3: "Drekkana (D3)", 4: "Chaturthamsa (D4)",
+    7: "Saptamsa (D7)", 9: "Navamsa (D9)", 10: "Dasamsa (D10)", 12: "Dwadasamsa (D12)",
+    16: "Shodasamsa (D16)", 20: "Vimsamsa (D20)", 24: "Chaturvimsamsa (D24)", 27: "Bhamsa (D27)",
+    30: "Trimsamsa (D30)", 40: "Khavedamsa (D40)", 45: "Akshavedamsa (D45)", 60: "Shashtiamsa (D60)"
+}
+
+# Trimsamsa signs per whole degree: odd signs Mars/Saturn/Jupiter/Mercury/Venus over
+# 5/5/8/7/5 degrees, even signs Venus/Mercury/Jupiter/Saturn/Mars over 5/7/8/5/5 degrees
+_D30_ODD = [0] * 5 + [10] * 5 + [8] * 8 + [2] * 7 + [1] * 5
+_D30_EVEN = [6] * 5 + [5] * 7 + [11] * 8 + [9] * 5 + [7] * 5
+
+
+def _varga_sign(n: int, sign: int, part: int) -> int:
+    """Varga sign for the 0-based part of a sign; used once at import to fill VARGA_TABLES."""
+    odd = sign % 2 == 0           # Aries, Gemini, ... (0-based even index)
+    modality = sign % 3           # 0 movable, 1 fixed, 2 dual
+    element = sign % 4            # 0 fire, 1 earth, 2 air, 3 water
+    if n == 1:
+        return sign
+    if n == 2:
+        return (4 if part == 0 else 3) if odd else (3 if part == 0 else 4)
+    if n == 3:
+        return (sign + 4 * part) % 12
+    if n == 4:
+        return (sign + 3 * part) % 12
+    if n == 7:
+        return (sign + (0 if odd else 6) + part) % 12
+    if n == 9:
+        return ([0, 9, 6, 3][element] + part) % 12
+    if n == 10:
+        return (sign + (0 if odd else 8) + part) % 12
+    if n == 12 or n == 60:
+        return (sign + part) % 12
+    if n == 16 or n == 45:
+        return ([0, 4, 8][modality] + part) % 12
+    if n == 20:
+        return ([0, 8, 4][modality] + part) % 12
+    if n == 24:
+        return ((4 if odd else 3) + part) % 12
+    if n == 27:
+        return ([0, 3, 6, 9][element] + part) % 12
+    if n == 30:
+        return _D30_ODD[part] if odd else _D30_EVEN[part]
+    if n == 40:
+        return ((0 if odd else 6) + part) % 12
+    raise ValueError(f"Unsupported division type: {n}")
+
+
+# Lookup tables (sign x part -> varga sign index) for every Shodashavarga division
+VARGA_TABLES = {
+    n: np.array([[_varga_sign(n, sign, part) for part in range(n)] for sign in range(12)], dtype=np.int8)
+    for n in VARGA_DIVISIONS
+}
+
+
+def varga_signs(longitudes, divisions: Optional[List[int]] = None) -> np.ndarray:
+    """Map sidereal longitudes to varga sign indices (0-11) for several divisions at once.
+
+    ``longitudes`` may be a scalar or any array; the result has the input's shape plus a
+    trailing axis with one column per entry of ``divisions`` (default: all of
+    VARGA_DIVISIONS). Part boundaries belong to the later part.
+    """
+    divisions = divisions or VARGA_DIVISIONS
+    lon = np.mod(np.asarray(longitudes, dtype=np.float64), 360.0)
+    sign = np.minimum((lon // 30.0).astype(np.int64), 11)
+    deg = lon - 30.0 * sign
+    out = np.empty(lon.shape + (len(divisions),), dtype=np.int8)
+    for k, n in enumerate(divisions):
+        part = np.minimum((deg * n // 30.0).astype(np.int64), n - 1)
+        out[..., k] = VARGA_TABLES[n][sign, part]
+    return out
+
+
+def ashtakavarga_bitmasks(sign_indices) -> np.ndarray:
+    """Bindu masks for contributor sign indices shaped (..., 8) -> (..., 7, 8).
+
+    ``sign_indices`` holds the Rashi index (0-11) of the seven planets (MAITRI_PLANETS order)
+    and the Lagna. Entry [p, c] has bit s set when contributor c gives planet p a bindu in
+    sign s: the contribution mask rotated left by the contributor's sign.
+    """
+    signs = np.asarray(sign_indices, dtype=np.int64)[..., None, :]
+    return ((ASHTAKAVARGA_MASKS << signs) | (ASHTAKAVARGA_MASKS >> (12 - signs))) & 0xFFF
+
+
+def bhinnashtakavarga_batch(sign_indices) -> np.ndarray:
+    """Bindus per sign of each planet's Bhinnashtakavarga, (..., 8) sign indices -> (..., 7, 12)."""
+    masks = ashtakavarga_bitmasks(sign_indices)
+    return np.sum((masks[..., None] >> np.arange(12)) & 1, axis=-2)
+
+
+def bhinnashtakavarga_matrix(ashtakavarga: Dict[str, Any]) -> np.ndarray:
+    """(7, 12) bindus, MAITRI_PLANETS by sign, from a calculate_ashtakavarga result."""
+    bav = ashtakavarga['bhinnashtakavarga']
+    return np.array([[bav[planet][sign] for sign in ZODIAC_SIGNS] for planet in MAITRI_PLANETS], dtype=np.int64)
+
+
+def ashtakavarga_transit_bindus(bhinnashtakavarga, transit_signs) -> Tuple[np.ndarray, np.ndarray]:
+    """Score transits against a natal Ashtakavarga.
+
+    ``bhinnashtakavarga`` is (7, 12) from bhinnashtakavarga_batch and ``transit_signs`` holds
+    the transiting planets' sign indices shaped (..., 7). Returns the bindus each planet
+    finds in its own Bhinnashtakavarga and the Sarvashtakavarga bindus of its sign.
+    """
+    bav = np.asarray(bhinnashtakavarga)
+    signs = np.asarray(transit_signs, dtype=np.int64)
+    return bav[np.arange(7), signs], bav.sum(axis=0)[signs]
+
+
+def _reduce_to_180_batch(arc) -> np.ndarray:
+    arc = np.mod(arc, 360.0)
+    return np.where(arc > 180.0, 360.0 - arc, arc)
+
+
+def uchcha_bala_batch(longitudes) -> np.ndarray:
+    """Uchcha Bala (distance from debilitation / 3) for longitudes shaped (..., 7) in MAITRI_PLANETS order."""
+    debilitation = np.array([SHADBALA_CONSTANTS['uchcha_bala_data'][planet]['debilitation_degree']
+                             for planet in MAITRI_PLANETS], dtype=np.float64)
+    return _reduce_to_180_batch(np.asarray(longitudes, dtype=np.float64) - debilitation) / 3.0
+
+
+def dig_bala_batch(longitudes, cusps) -> np.ndarray:
+    """Dig Bala (distance from the powerless cusp / 3) for longitudes (..., 7) and cusps (..., 12)."""
+    cusps = np.asarray(cusps, dtype=np.float64)
+    powerless = cusps[..., DIG_BALA_POWERLESS_HOUSE - 1]
+    return np.minimum(_reduce_to_180_batch(np.asarray(longitudes, dtype=np.float64) - powerless) / 3.0, 60.0)
+
+
+def _chesta_mean_values(jd_ut) -> Dict[str, Any]:
+    """Mean longitudes (Sun, Mars, Jupiter, Saturn) and Seeghrochcha (Mercury, Venus) at jd_ut, any shape."""
+    days = np.asarray(jd_ut, dtype=np.float64) - CHESTA_EPOCH_JD
+    years = days / 365.25
+    values = {}
+    for planet, motion in CHESTA_MEAN_MOTIONS.items():
+        constant, per_year = CHESTA_CORRECTIONS.get(planet, (0.0, 0.0))
+        values[planet] = CHESTA_EPOCH_LONGITUDES[planet] + motion * days + constant + per_year * years
+    return values
+
+
+@lru_cache(maxsize=256)
+def _chesta_mean_longitudes(jd_ut: float) -> Dict[str, float]:
+    """_chesta_mean_values for one instant, cached so repeated passes over a chart skip the epoch arithmetic."""
+    return {planet: _degnorm(float(value)) for planet, value in _chesta_mean_values(jd_ut).items()}
+
+
+def _chesta_bala_column(planet: str, lons: np.ndarray, mean: Dict[str, Any], ayanamsa_value) -> np.ndarray:
+    """Chesta Bala of one planet; lons are shaped (..., 7) in MAITRI_PLANETS order."""
+    true_lon = lons[..., MAITRI_PLANETS.index(planet)]
+    if planet == 'Sun':
+        return _reduce_to_180_batch(true_lon + np.asarray(ayanamsa_value) + 90.0) / 3.0
+    if planet == 'Moon':
+        return _reduce_to_180_batch(true_lon - lons[..., MAITRI_PLANETS.index('Sun')]) / 3.0
+    if planet in ('Mercury', 'Venus'):
+        mean_lon, seeghrochcha = mean['Sun'], mean[planet]
+    else:
+        mean_lon, seeghrochcha = mean[planet], mean['Sun']
+    # Average along the short arc so a pair straddling 0 deg averages correctly
+    half_sum = mean_lon + (np.mod(true_lon - mean_lon + 180.0, 360.0) - 180.0) / 2.0
+    return _reduce_to_180_batch(seeghrochcha - half_sum) / 3.0
+
+
+def chesta_bala_batch(longitudes, jd_ut, ayanamsa_value) -> np.ndarray:
+    """Chesta Bala for sidereal longitudes shaped (..., 7) with jd_ut and ayanamsa_value shaped (...).
+
+    Mars to Saturn: Chesta Kendra = Seeghrochcha - (mean + true longitude) / 2, reduced to
+    180 degrees and divided by 3. Mercury and Venus take the Sun's mean longitude as mean and
+    their own Seeghrochcha; Mars, Jupiter and Saturn take the Sun's mean as Seeghrochcha.
+    Sun: (sayana Sun + 90) reduced, / 3. Moon: (Moon - Sun) reduced, / 3 (the variants used
+    for Ishta/Kashta Phala). _calculate_chesta_bala evaluates the same per-planet column, and
+    both take the mean longitudes of a single jd_ut from the _chesta_mean_longitudes cache.
+    """
+    lons = np.asarray(longitudes, dtype=np.float64)
+    mean = _chesta_mean_longitudes(float(jd_ut)) if np.ndim(jd_ut) == 0 else _chesta_mean_values(jd_ut)
+    chesta = np.empty(lons.shape, dtype=np.float64)
+    for i, planet in enumerate(MAITRI_PLANETS):
+        chesta[..., i] = _chesta_bala_column(planet, lons, mean, ayanamsa_value)
+    return chesta
+
+
+def ishta_kashta_phala(uchcha_bala, chesta_bala) -> Tuple[np.ndarray, np.ndarray]:
+    """Ishta and Kashta Phala from Uchcha and Chesta Bala (Reference/KashataPhala); any shapes."""
+    uchcha = np.clip(np.asarray(uchcha_bala, dtype=np.float64), 0.0, 60.0)
+    chesta = np.clip(np.asarray(chesta_bala, dtype=np.float64), 0.0, 60.0)
+    return np.sqrt(uchcha * chesta), np.sqrt((60.0 - uchcha) * (60.0 - chesta))
+
+
+def ishta_kashta_phala_batch(longitudes, jd_ut, ayanamsa_value) -> Tuple[np.ndarray, np.ndarray]:
+    """Ishta and Kashta Phala, each shaped (..., 7), straight from sidereal longitudes.
+
+    Lets thousands of charts be ranked without building them: pass one row of MAITRI_PLANETS
+    longitudes per chart with its jd_ut and ayanamsa value.
+    """
+    return ishta_kashta_phala(uchcha_bala_batch(longitudes),
+                              chesta_bala_batch(longitudes, jd_ut, ayanamsa_value))
+
+
+def yuddha_pairs(longitudes, orb: float = YUDDHA_ORB) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Planet pairs at war for longitudes shaped (N, 5) in YUDDHA_PLANETS order.
+
+    Sorted-longitude sweep: each row is sorted once and compared with its k-th successor
+    (wrapping through 0 Aries) for k = 1, 2, ...; the sweep stops at the first k where no
+    row has a pair inside the orb. Returns (row, first, second, separation) arrays with
+    first/second as YUDDHA_PLANETS indices, ``first`` having the lesser longitude.
+    """
+    lons = np.mod(np.atleast_2d(np.asarray(longitudes, dtype=np.float64)), 360.0)
+    n = lons.shape[1]
+    order = np.argsort(lons, axis=1)
+    ordered = np.take_along_axis(lons, order, axis=1)
+    extended = np.concatenate([ordered, ordered + 360.0], axis=1)
+    found = []
+    for k in range(1, n):
+        gaps = extended[:, k:k + n] - ordered
+        rows, cols = np.nonzero(gaps < orb)
+        if rows.size == 0:
+            break
+        a = order[rows, cols]
+        b = order[rows, (cols + k) % n]
+        first_is_a = lons[rows, a] < lons[rows, b]
+        found.append((rows, np.where(first_is_a, a, b), np.where(first_is_a, b, a), gaps[rows, cols]))
+    if not found:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty, empty, np.empty(0)
+    return tuple(np.concatenate(parts) for parts in zip(*found))
+
+
+def find_planetary_wars(planets_sidereal: Dict[str, float], orb: float = YUDDHA_ORB) -> List[Dict[str, Any]]:
+    """Planetary wars in one chart; the planet with the lesser longitude is the winner."""
+    lons = [planets_sidereal[planet] for planet in YUDDHA_PLANETS]
+    _, winners, losers, separations = yuddha_pairs(lons, orb)
+    return [{
+        'winner': YUDDHA_PLANETS[w],
+        'loser': YUDDHA_PLANETS[l],
+        'separation': round(float(sep), 4),
+    } for w, l, sep in zip(winners, losers, separations)]
+
+
+def _calculate_yuddha_bala(wars: List[Dict[str, Any]], strengths: Dict[str, float]) -> Dict[str, float]:
+    """Yuddha Bala per planet from the wars and each planet's Sthana + Dig + Kala Bala up to Hora Bala.
+
+    The strength difference divided by the difference of the disc diameters is added to
+    the winner and deducted from the loser. A planet in several wars collects every share.
+    """
+    yuddha = {}
+    for war in wars:
+        winner, loser = war['winner'], war['loser']
+        diameters = abs(PLANETARY_DISC_DIAMETERS[winner] - PLANETARY_DISC_DIAMETERS[loser])
+        amount = abs(strengths[winner] - strengths[loser]) / diameters
+        war['yuddha_bala'] = round(amount, 2)
+        yuddha[winner] = yuddha.get(winner, 0.0) + amount
+        yuddha[loser] = yuddha.get(loser, 0.0) - amount
+    return yuddha
+
+
+def _sidereal_longitude_series(jds: np.ndarray, planets: List[str], ayanamsa: str,
+                               ephemeris: str = 'fast') -> np.ndarray:
+    """Sidereal longitudes shaped (len(jds), len(planets)) for a series of instants.
+
+    One vectorized query of the fast ephemeris table; Swiss Ephemeris calls per instant with
+    ephemeris='swiss', or when the table is missing or does not cover the series.
+    """
+    sid_mode = _ayanamsa_mode(ayanamsa)
+    try:
+        fast_eph = _select_fast_ephemeris(ephemeris)
+    except FileNotFoundError:
+        fast_eph = None  # table not built yet: fall back to Swiss Ephemeris calls
+    if fast_eph is not None and fast_eph.covers(jds):
+        return fast_eph.sidereal(jds, sid_mode)[0][:, [fast_eph.body_index(p) for p in planets]]
+    swe.set_sid_mode(sid_mode)
+    iflag = _choose_iflag(None)
+    codes = [dict(PLANET_ORDER)[planet] for planet in planets]
+    return np.array([[swe.calc_ut(jd, code, iflag)[0][0] for code in codes] for jd in jds]).reshape(len(jds), len(planets))
+
+
+def daily_ashtakavarga_transits(ashtakavarga: Dict[str, Any], start_dt_utc: datetime, days: int,
+                                ayanamsa: str = 'lahiri', ephemeris: str = 'fast') -> Dict[str, Any]:
+    """Score each day's transits (at 0h UT) against a chart's Ashtakavarga in one pass.
+
+    Returns per-day bindus of each transiting planet in its own Bhinnashtakavarga and in the
+    Sarvashtakavarga, as lists aligned with ``dates``.
+    """
+    jd_start = _julday(start_dt_utc.replace(hour=0, minute=0, second=0, microsecond=0))
+    jds = jd_start + np.arange(days, dtype=np.float64)
+    lons = _sidereal_longitude_series(jds, MAITRI_PLANETS, ayanamsa, ephemeris)
+    signs = (np.mod(lons, 360.0) // 30.0).astype(np.int64)
+    own, sarva = ashtakavarga_transit_bindus(bhinnashtakavarga_matrix(ashtakavarga), signs)
+    return {
+        'dates': [_jd_to_datetime(jd).date().isoformat() for jd in jds],
+        'bindus': {planet: own[:, i].tolist() for i, planet in enumerate(MAITRI_PLANETS)},
+        'sarvashtakavarga_bindus': {planet: sarva[:, i].tolist() for i, planet in enumerate(MAITRI_PLANETS)},
+    }
+
+
+def planetary_wars_in_range(start_dt_utc: datetime, end_dt_utc: datetime, ayanamsa: str = 'lahiri',
+                            step_hours: float = 6.0, orb: float = YUDDHA_ORB,
+                            ephemeris: str = 'fast') -> List[Dict[str, Any]]:
+    """Flag planetary wars between two UTC datetimes from one vectorized ephemeris stream.
+
+    Positions for every step come from _sidereal_longitude_series, are swept with
+    yuddha_pairs and grouped into war periods per pair. Each period reports the sampled
+    start and end, the closest approach and the winner at that moment.
+    """
+    jd_start, jd_end = _julday(start_dt_utc), _julday(end_dt_utc)
+    jds = np.arange(jd_start, jd_end, step_hours / 24.0)
+    lons = _sidereal_longitude_series(jds, YUDDHA_PLANETS, ayanamsa, ephemeris)
+
+    rows, firsts, seconds, separations = yuddha_pairs(lons, orb)
+    # Key each sample by its unordered pair so a war survives the planets passing each other
+    samples: Dict[tuple, list] = {}
+    for row, a, b, sep in zip(rows, firsts, seconds, separations):
+        samples.setdefault((min(a, b), max(a, b)), []).append((int(row), int(a), float(sep)))
+
+    periods = []
+    for (a, b), hits in samples.items():
+        hits.sort()
+        run = [hits[0]]
+        for hit in hits[1:] + [None]:
+            if hit is not None and hit[0] == run[-1][0] + 1:
+                run.append(hit)
+                continue
+            closest = min(run, key=lambda h: h[2])
+            winner = YUDDHA_PLANETS[closest[1]]
+            periods.append({
+                'planets': [YUDDHA_PLANETS[a], YUDDHA_PLANETS[b]],
+                'start': _jd_to_datetime(jds[run[0][0]]).isoformat(),
+                'end': _jd_to_datetime(jds[run[-1][0]]).isoformat(),
+                'closest': _jd_to_datetime(jds[closest[0]]).isoformat(),
+                'min_separation': round(closest[2], 4),
+                'winner_at_closest': winner,
+            })
+            run = [hit]
+    periods.sort(key=lambda period: period['start'])
+    return periods
+
 
 def _julday(dt_utc: datetime) -> float:
     ut = dt_utc.hour + dt_utc.minute/60.0 + dt_utc.second/3600.0 + dt_utc.microsecond/3_600_000_000
     return swe.julday(dt_utc.year, dt_utc.month, dt_utc.day, ut)
 
 
+def _jd_to_datetime(jd_ut: float) -> datetime:
+    """Convert a Julian day (UT) back to an aware UTC datetime."""
+    y, m, d, h = swe.revjul(jd_ut)
+    return datetime(y, m, d, tzinfo=timezone.utc) + timedelta(hours=h)
+
+
 def _calculate_sunrise_sunset(birth_dt_local: datetime, lat: float, lon: float) -> tuple:
     """Calculate sunrise and sunset times for the birth location and date."""
     try:
@@ -304,8 +966,14 @@ def _calculate_ayana_bala(planet_name: str, nirayana_longitude: float, ayanamsa:
 
 def _ayanamsa_mode(name: str) -> int:
     n = (name or '').lower()
-    if n in ('lahiri','kp','krishnamurti'):
+    if n in ('lahiri','chitrapaksha'):
         return swe.SIDM_LAHIRI
+    if n in ('raman','b.v. raman','bv_raman'):
+        return swe.SIDM_RAMAN
+    if n in ('kp','krishnamurti'):
+        return swe.SIDM_KRISHNAMURTI
+    if n in ('fagan_bradley','fagan-bradley','fagan bradley','fagan'):
+        return swe.SIDM_FAGAN_BRADLEY
     # default to Lahiri
     return swe.SIDM_LAHIRI
 
@@ -314,7 +982,8 @@ def _house_system_code(name: str) -> bytes:
     n = (name or '').lower()
     if n in ('equal','e'):
         return b'E'
-    if n in ('placidus','p'):
+    if n in ('placidus','p','kp'):
+        # KP uses Placidus cusps
         return b'P'
     if n in ('koch','k'):
         return b'K'
@@ -342,34 +1011,95 @@ def _deg_in_sign(lon: float) -> float:
     return _degnorm(lon) % 30.0
 
 
-def _choose_iflag(ephe_dir: Optional[str]) -> int:
-    """Choose Swiss Ephemeris flags based on availability of ephemeris files."""
-    # Prefer SWIEPH if ephemeris files exist in ephe_dir; otherwise use MOSEPH
-    if ephe_dir and os.path.isdir(ephe_dir):
-        try:
-            swe.set_ephe_path(ephe_dir)
-            return swe.FLG_SIDEREAL | swe.FLG_SWIEPH
-        except Exception:
-            pass
-    return swe.FLG_SIDEREAL | swe.FLG_MOSEPH
+class EphemerisBackend:
+    """Swiss Ephemeris file detection done once per directory.
+
+    Scans for ``.se1`` data files when created and hands out calculation flags per request
+    precision: 'precise' uses SWIEPH when files were found (Moshier otherwise), 'moshier'
+    always uses the built-in Moshier theory. (The interpolated table is the separate
+    ephemeris='fast' option.)
+    """
+
+    def __init__(self, ephe_dir: Optional[str]):
+        self.ephe_dir = os.path.abspath(ephe_dir) if ephe_dir else None
+        self.files: List[str] = []
+        if self.ephe_dir and os.path.isdir(self.ephe_dir):
+            self.files = sorted(f for f in os.listdir(self.ephe_dir) if f.lower().endswith('.se1'))
+
+    @property
+    def has_swieph(self) -> bool:
+        return bool(self.files)
+
+    def flags(self, precision: str = 'precise') -> int:
+        """Ephemeris source flag (without FLG_SIDEREAL) for the requested precision."""
+        p = (precision or 'precise').lower()
+        if p not in EPHEMERIS_PRECISIONS:
+            raise ValueError(f"Unknown precision: {precision}")
+        if p == 'precise' and self.has_swieph:
+            return swe.FLG_SWIEPH
+        return swe.FLG_MOSEPH
+
+    def describe(self) -> Dict[str, Any]:
+        return {'ephe_dir': self.ephe_dir, 'files': self.files, 'has_swieph': self.has_swieph}
+
+
+EPHEMERIS_PRECISIONS = ('precise', 'moshier')
+
+# Directories searched at startup for Swiss Ephemeris files, first hit wins
+DEFAULT_EPHE_DIRS = [
+    os.environ.get('SE_EPHE_PATH'),
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'ephe'),
+    os.getcwd(),
+]
+
+_EPHEMERIS_BACKENDS: Dict[Optional[str], EphemerisBackend] = {}
+_ACTIVE_EPHE_PATH: Optional[str] = None
+
+
+def _detect_default_backend() -> EphemerisBackend:
+    for ephe_dir in DEFAULT_EPHE_DIRS:
+        if ephe_dir:
+            backend = EphemerisBackend(ephe_dir)
+            if backend.has_swieph:
+                return backend
+    return EphemerisBackend(None)
+
+
+def get_ephemeris_backend(ephe_dir: Optional[str] = None) -> EphemerisBackend:
+    """Return the cached backend for ephe_dir (None = startup default) and make it active.
+
+    ``swe.set_ephe_path`` is only called when the active directory actually changes.
+    """
+    global _ACTIVE_EPHE_PATH
+    key = os.path.abspath(ephe_dir) if ephe_dir else None
+    backend = _EPHEMERIS_BACKENDS.get(key)
+    if backend is None:
+        backend = EphemerisBackend(key) if key else _detect_default_backend()
+        _EPHEMERIS_BACKENDS[key] = backend
+    if backend.has_swieph and backend.ephe_dir != _ACTIVE_EPHE_PATH:
+        swe.set_ephe_path(backend.ephe_dir)
+        _ACTIVE_EPHE_PATH = backend.ephe_dir
+    return backend
+
+
+def _choose_iflag(ephe_dir: Optional[str], precision: str = 'precise') -> int:
+    """Sidereal calculation flags from the cached ephemeris backend for ephe_dir."""
+    return swe.FLG_SIDEREAL | get_ephemeris_backend(ephe_dir).flags(precision)
 
 
 class DivisionalChartCalculator:
-    """Calculate Divisional Charts (Vargas) using traditional BPHS rules."""
+    """Calculate Divisional Charts (Vargas) using traditional BPHS rules.
+
+    Positions come from the precomputed VARGA_TABLES; the per-chart methods are kept
+    for callers that need a single body in a single varga.
+    """
     
     def __init__(self):
-        self.divisional_names = {
-            2: "Hora (D2)",
-            3: "Drekkana (D3)", 
-            7: "Saptamsa (D7)",
-            9: "Navamsa (D9)",
-            12: "Dwadasamsa (D12)",
-            30: "Trimsamsa (D30)"
-        }
+        self.divisional_names = VARGA_NAMES
     
     def division_index(self, degree: float, n: int) -> int:
-        """Calculate division index for given degree and division number."""
-        return int(math.ceil(degree * n / 30.0))
+        """1-based part of the sign that degree falls in for division number n."""
+        return min(int(degree * n // 30.0), n - 1) + 1
     
     def get_sign_name_and_ruler(self, sign_index: int) -> tuple:
         """Get sign name and ruling planet for given sign index (0-11)."""
@@ -377,170 +1107,59 @@ class DivisionalChartCalculator:
         ruler = SIGN_RULERS[sign_index % 12]
         return sign_name, ruler
     
+    def calculate_varga(self, sign_index: int, degree: float, n: int) -> tuple:
+        """Varga position as (sign_index, degree_in_sign) for any Shodashavarga division."""
+        if n not in VARGA_TABLES:
+            raise ValueError(f"Unsupported division type: {n}")
+        return int(VARGA_TABLES[n][sign_index % 12, self.division_index(degree, n) - 1]), 15.0
+    
     def calculate_hora_d2(self, sign_index: int, degree: float) -> tuple:
-        """Calculate Hora (D2) position."""
-        division_num = self.division_index(degree, 2)
-        
-        if (sign_index + 1) % 2 == 1:  # Odd signs (1,3,5,7,9,11)
-            if division_num == 1:
-                result_sign = 4  # Leo (Sun)
-            else:
-                result_sign = 3  # Cancer (Moon)
-        else:  # Even signs (2,4,6,8,10,12)
-            if division_num == 1:
-                result_sign = 3  # Cancer (Moon)
-            else:
-                result_sign = 4  # Leo (Sun)
-        
-        # Return (sign_index, degree_in_sign) format
-        result_degree = 15.0  # Default middle degree for divisional charts
-        return result_sign, result_degree
+        """Calculate Hora (D2) position: Leo then Cancer in odd signs, reversed in even."""
+        return self.calculate_varga(sign_index, degree, 2)
     
     def calculate_drekkana_d3(self, sign_index: int, degree: float) -> tuple:
-        """Calculate Drekkana (D3) position."""
-        division_num = self.division_index(degree, 3)
-        
-        # First drekkana: same sign
-        # Second drekkana: 5th sign from current
-        # Third drekkana: 9th sign from current
-        if division_num == 1:
-            result_sign = sign_index
-        elif division_num == 2:
-            result_sign = (sign_index + 4) % 12  # 5th sign (0-indexed)
-        else:  # division_num == 3
-            result_sign = (sign_index + 8) % 12  # 9th sign (0-indexed)
-        
-        # Return (sign_index, degree_in_sign) format
-        result_degree = 15.0  # Default middle degree for divisional charts
-        return result_sign, result_degree
+        """Calculate Drekkana (D3) position: same, 5th and 9th sign."""
+        return self.calculate_varga(sign_index, degree, 3)
     
     def calculate_saptamsa_d7(self, sign_index: int, degree: float) -> tuple:
-        """Calculate Saptamsa (D7) position."""
-        division_num = self.division_index(degree, 7)
-        
-        if (sign_index + 1) % 2 == 1:  # Odd signs
-            # Start from same sign
-            result_sign = (sign_index + division_num - 1) % 12
-        else:  # Even signs  
-            # Start from 7th sign
-            result_sign = (sign_index + 6 + division_num - 1) % 12
-        
-        return result_sign, 15.0  # Return (sign_index, degree_in_sign) format
+        """Calculate Saptamsa (D7) position: from the sign itself (odd) or the 7th (even)."""
+        return self.calculate_varga(sign_index, degree, 7)
     
     def calculate_navamsa_d9(self, sign_index: int, degree: float) -> tuple:
-        """Calculate Navamsa (D9) position using traditional BPHS method."""
-        
-        # Each navamsa is 3° 20' (3.333... degrees)
-        navamsa_in_sign = int(degree / (30.0 / 9))  # 0-8
-        
-        # Fire signs (Aries, Leo, Sagittarius): start from Aries (0)
-        # Earth signs (Taurus, Virgo, Capricorn): start from Capricorn (9)
-        # Air signs (Gemini, Libra, Aquarius): start from Libra (6)  
-        # Water signs (Cancer, Scorpio, Pisces): start from Cancer (3)
-        
-        element = sign_index % 4
-        
-        if element == 0:  # Fire signs (0, 4, 8) - Aries, Leo, Sagittarius
-            start_sign = 0  # Start from Aries
-        elif element == 1:  # Earth signs (1, 5, 9) - Taurus, Virgo, Capricorn
-            start_sign = 9  # Start from Capricorn
-        elif element == 2:  # Air signs (2, 6, 10) - Gemini, Libra, Aquarius
-            start_sign = 6  # Start from Libra
-        else:  # Water signs (3, 7, 11) - Cancer, Scorpio, Pisces
-            start_sign = 3  # Start from Cancer
-        
-        result_sign = (start_sign + navamsa_in_sign) % 12
-        return result_sign, 15.0  # Return (sign_index, degree_in_sign) format
+        """Calculate Navamsa (D9) position: from Aries/Capricorn/Libra/Cancer by element."""
+        return self.calculate_varga(sign_index, degree, 9)
     
     def calculate_dwadasamsa_d12(self, sign_index: int, degree: float) -> tuple:
-        """Calculate Dwadasamsa (D12) position."""
-        division_num = self.division_index(degree, 12)
-        
-        # Count signs forward from same sign
-        result_sign = (sign_index + division_num - 1) % 12
-        
-        return result_sign, 15.0  # Return (sign_index, degree_in_sign) format
+        """Calculate Dwadasamsa (D12) position: counted from the sign itself."""
+        return self.calculate_varga(sign_index, degree, 12)
     
     def calculate_trimsamsa_d30(self, sign_index: int, degree: float) -> tuple:
-        """Calculate Trimsamsa (D30) position using traditional BPHS method."""
-        
-        # Each trimsamsa is 1 degree (30 divisions per sign)
-        trimsamsa_in_sign = int(degree)  # 0-29
-        
-        # Traditional D30 rulership pattern within each sign
-        if (sign_index + 1) % 2 == 1:  # Odd signs (1,3,5,7,9,11)
-            # Pattern: Mars(0-4°), Saturn(5-9°), Jupiter(10-17°), Mercury(18-24°), Venus(25-29°)
-            if 0 <= trimsamsa_in_sign <= 4:
-                ruler = 'Mars'
-                start_sign = 0  # Aries
-            elif 5 <= trimsamsa_in_sign <= 9:
-                ruler = 'Saturn'  
-                start_sign = 10  # Aquarius
-            elif 10 <= trimsamsa_in_sign <= 17:
-                ruler = 'Jupiter'
-                start_sign = 8  # Sagittarius
-            elif 18 <= trimsamsa_in_sign <= 24:
-                ruler = 'Mercury'
-                start_sign = 2  # Gemini
-            else:  # 25-29
-                ruler = 'Venus'
-                start_sign = 1  # Taurus
-        else:  # Even signs (2,4,6,8,10,12)
-            # Reverse pattern: Venus(0-4°), Mercury(5-11°), Jupiter(12-19°), Saturn(20-24°), Mars(25-29°)
-            if 0 <= trimsamsa_in_sign <= 4:
-                ruler = 'Venus'
-                start_sign = 6  # Libra
-            elif 5 <= trimsamsa_in_sign <= 11:
-                ruler = 'Mercury'
-                start_sign = 5  # Virgo
-            elif 12 <= trimsamsa_in_sign <= 19:
-                ruler = 'Jupiter'
-                start_sign = 11  # Pisces
-            elif 20 <= trimsamsa_in_sign <= 24:
-                ruler = 'Saturn'
-                start_sign = 9  # Capricorn
-            else:  # 25-29
-                ruler = 'Mars'
-                start_sign = 7  # Scorpio
-        
-        # Calculate the exact longitude within the D30 chart
-        # The position depends on the trimsamsa within its rulership range
-        if (sign_index + 1) % 2 == 1:  # Odd signs
-            if 0 <= trimsamsa_in_sign <= 4:
-                pos_in_range = trimsamsa_in_sign  # 0-4
-                total_range = 5
-            elif 5 <= trimsamsa_in_sign <= 9:
-                pos_in_range = trimsamsa_in_sign - 5  # 0-4
-                total_range = 5
-            elif 10 <= trimsamsa_in_sign <= 17:
-                pos_in_range = trimsamsa_in_sign - 10  # 0-7
-                total_range = 8
-            elif 18 <= trimsamsa_in_sign <= 24:
-                pos_in_range = trimsamsa_in_sign - 18  # 0-6
-                total_range = 7
-            else:  # 25-29
-                pos_in_range = trimsamsa_in_sign - 25  # 0-4
-                total_range = 5
-        else:  # Even signs
-            if 0 <= trimsamsa_in_sign <= 4:
-                pos_in_range = trimsamsa_in_sign  # 0-4
-                total_range = 5
-            elif 5 <= trimsamsa_in_sign <= 11:
-                pos_in_range = trimsamsa_in_sign - 5  # 0-6
-                total_range = 7
-            elif 12 <= trimsamsa_in_sign <= 19:
-                pos_in_range = trimsamsa_in_sign - 12  # 0-7
-                total_range = 8
-            elif 20 <= trimsamsa_in_sign <= 24:
-                pos_in_range = trimsamsa_in_sign - 20  # 0-4
-                total_range = 5
-            else:  # 25-29
-                pos_in_range = trimsamsa_in_sign - 25  # 0-4
-                total_range = 5
-        
-        # Map to the appropriate sign based on ruler and calculate final position
-        result_sign = start_sign
-        return result_sign, 15.0  # Return (sign_index, degree_in_sign) format
+        """Calculate Trimsamsa (D30) position from the planetary degree ranges."""
+        return self.calculate_varga(sign_index, degree, 30)
+    
+    def _positions(self, base_positions: Dict[str, tuple], divisions: List[int]) -> Dict[int, Dict[str, Dict]]:
+        longitudes = np.array([30.0 * sign_index + degree for sign_index, degree in base_positions.values()])
+        return self.positions_from_longitudes(list(base_positions), longitudes, divisions)
+    
+    def positions_from_longitudes(self, bodies: List[str], longitudes: np.ndarray,
+                                  divisions: List[int]) -> Dict[int, Dict[str, Dict]]:
+        """Varga positions of bodies straight from their sidereal longitudes, one lookup per division."""
+        lon = np.mod(np.asarray(longitudes, dtype=np.float64), 360.0)
+        degrees = lon - 30.0 * np.minimum(lon // 30.0, 11)
+        signs = varga_signs(lon, divisions)
+        charts = {}
+        for k, n in enumerate(divisions):
+            parts = (np.minimum(degrees * n // 30.0, n - 1) + 1).astype(np.int64).tolist()
+            chart_data = {}
+            for i, body in enumerate(bodies):
+                sign_name, ruler = self.get_sign_name_and_ruler(int(signs[i, k]))
+                chart_data[body] = {
+                    'sign': sign_name,
+                    'ruler': ruler,
+                    'division_index': parts[i]
+                }
+            charts[n] = chart_data
+        return charts
     
     def get_divisional_chart(self, base_positions: Dict[str, tuple], division_type: int) -> Dict[str, Dict]:
         """
@@ -548,40 +1167,18 @@ class DivisionalChartCalculator:
         
         Args:
             base_positions: Dict of body -> (sign_index [0-11], degree_in_sign [0-30])
-            division_type: 2, 3, 7, 9, 12, or 30
+            division_type: any entry of VARGA_DIVISIONS
         
         Returns:
-            Dict of body -> {'sign': str, 'ruler': str}
+            Dict of body -> {'sign': str, 'ruler': str, 'division_index': int}
         """
-        chart_data = {}
-        
-        for body, (sign_index, degree) in base_positions.items():
-            if division_type == 2:
-                sign_name, ruler = self.calculate_hora_d2(sign_index, degree)
-            elif division_type == 3:
-                sign_name, ruler = self.calculate_drekkana_d3(sign_index, degree)
-            elif division_type == 7:
-                sign_name, ruler = self.calculate_saptamsa_d7(sign_index, degree)
-            elif division_type == 9:
-                sign_name, ruler = self.calculate_navamsa_d9(sign_index, degree)
-            elif division_type == 12:
-                sign_name, ruler = self.calculate_dwadasamsa_d12(sign_index, degree)
-            elif division_type == 30:
-                sign_name, ruler = self.calculate_trimsamsa_d30(sign_index, degree)
-            else:
-                raise ValueError(f"Unsupported division type: {division_type}")
-            
-            chart_data[body] = {
-                'sign': sign_name,
-                'ruler': ruler,
-                'division_index': self.division_index(degree, division_type)
-            }
-        
-        return chart_data
+        if division_type not in VARGA_TABLES:
+            raise ValueError(f"Unsupported division type: {division_type}")
+        return self._positions(base_positions, [division_type])[division_type]
     
     def get_all_charts(self, base_positions: Dict[str, tuple]) -> Dict[str, Dict]:
         """
-        Calculate all divisional charts.
+        Calculate all sixteen divisional charts in one table lookup.
         
         Args:
             base_positions: Dict of body -> (sign_index [0-11], degree_in_sign [0-30])
@@ -589,112 +1186,68 @@ class DivisionalChartCalculator:
         Returns:
             Dict mapping chart name -> chart data
         """
-        all_charts = {}
-        
-        for div_type in [2, 3, 7, 9, 12, 30]:
-            chart_name = f"D{div_type}"
-            chart_full_name = self.divisional_names[div_type]
-            
-            try:
-                chart_data = self.get_divisional_chart(base_positions, div_type)
-                all_charts[chart_name] = {
-                    'name': chart_full_name,
-                    'division': div_type,
-                    'positions': chart_data
-                }
-            except Exception as e:
-                all_charts[chart_name] = {
-                    'name': chart_full_name,
-                    'division': div_type,
-                    'error': f"Calculation failed: {str(e)}",
-                    'positions': {}
-                }
-        
-        return all_charts
+        longitudes = np.array([30.0 * sign_index + degree for sign_index, degree in base_positions.values()])
+        return self.get_all_charts_from_longitudes(list(base_positions), longitudes)
+    
+    def get_all_charts_from_longitudes(self, bodies: List[str], longitudes: np.ndarray) -> Dict[str, Dict]:
+        """get_all_charts for bodies given as sidereal longitudes."""
+        positions = self.positions_from_longitudes(bodies, longitudes, VARGA_DIVISIONS)
+        return {
+            f"D{n}": {
+                'name': self.divisional_names[n],
+                'division': n,
+                'positions': positions[n]
+            }
+            for n in VARGA_DIVISIONS
+        }
 
 
 class PanchadhaMaitriCalculator:
-    """Calculate Panchadha Maitri (Five-fold Friendship) tables."""
+    """Calculate Panchadha Maitri (Five-fold Friendship) tables.
+
+    Relationships are resolved on the integer matrices (NAISARGIKA_MATRIX, modular sign
+    offsets and PANCHADHA_LOOKUP); names are only produced for the output tables.
+    """
     
     def __init__(self):
-        self.planets = ['Sun', 'Moon', 'Mars', 'Mercury', 'Jupiter', 'Venus', 'Saturn']
+        self.planets = MAITRI_PLANETS
         self.friend_houses = [2, 3, 4, 10, 11, 12]  # II, III, IV, X, XI, XII
         self.enemy_houses = [1, 5, 6, 7, 8, 9]      # I, V, VI, VII, VIII, IX
     
+    def _present(self, planets_sidereal: Dict[str, float]) -> List[int]:
+        return [i for i, planet in enumerate(self.planets) if planet in planets_sidereal]
+    
+    def _sign_indices(self, planets_sidereal: Dict[str, float]) -> np.ndarray:
+        # Missing planets get -1 (relations resolve to Neutral); they are dropped from the named tables
+        return np.array([int(planets_sidereal[planet] // 30) % 12 if planet in planets_sidereal else -1
+                         for planet in self.planets])
+    
+    def tatkaala_matrix(self, planets_sidereal: Dict[str, float]) -> np.ndarray:
+        """7x7 Tatkaala codes (MAITRI_LEVELS indices, -1 on the diagonal)."""
+        return tatkaala_maitri_matrices(self._sign_indices(planets_sidereal))
+    
+    def panchadha_matrix(self, planets_sidereal: Dict[str, float]) -> np.ndarray:
+        """7x7 Panchadha codes (PANCHADHA_LEVELS indices, -1 on the diagonal)."""
+        return panchadha_maitri_matrices(self._sign_indices(planets_sidereal))
+    
+    def _named_table(self, matrix: np.ndarray, names: List[str], rows: List[int]) -> Dict[str, Dict[str, str]]:
+        return {
+            self.planets[i]: {self.planets[j]: "Self" if i == j else names[matrix[i, j]] for j in rows}
+            for i in rows
+        }
+    
     def build_naisargika_maitri_table(self) -> Dict[str, Dict[str, str]]:
         """Module 1: Build Naisargika (Natural/Permanent) Friendship table."""
-        
-        naisargika_table = {}
-        
-        for planet_data in PERMANENT_FRIENDSHIP:
-            planet = planet_data["planet"]
-            naisargika_table[planet] = {}
-            
-            for other_planet in self.planets:
-                if planet == other_planet:
-                    naisargika_table[planet][other_planet] = "Self"
-                elif other_planet in planet_data["friend"]:
-                    naisargika_table[planet][other_planet] = "Friend"
-                elif other_planet in planet_data["neutral"]:
-                    naisargika_table[planet][other_planet] = "Neutral"
-                elif other_planet in planet_data["enemy"]:
-                    naisargika_table[planet][other_planet] = "Enemy"
-                else:
-                    # Default to neutral if not explicitly listed
-                    naisargika_table[planet][other_planet] = "Neutral"
-        
-        return naisargika_table
+        return self._named_table(NAISARGIKA_MATRIX, MAITRI_LEVELS, list(range(7)))
     
     def build_tatkaala_maitri_table(self, planets_sidereal: Dict[str, float]) -> Dict[str, Dict[str, str]]:
-        """Module 2: Build Tatkaala (Temporary) Friendship table based on house positions."""
-        
-        tatkaala_table = {}
-        
-        # Convert longitudes to sign numbers (1-12)
-        planet_signs = {}
-        for planet, longitude in planets_sidereal.items():
-            if planet in self.planets:
-                planet_signs[planet] = int(longitude // 30) + 1
+        """Module 2: Build Tatkaala (Temporary) Friendship table based on house positions.
         
-        for planet_a in self.planets:
-            if planet_a not in planet_signs:
-                continue
-                
-            tatkaala_table[planet_a] = {}
-            sign_a = planet_signs[planet_a]
-            
-            for planet_b in self.planets:
-                if planet_b not in planet_signs:
-                    continue
-                    
-                if planet_a == planet_b:
-                    tatkaala_table[planet_a][planet_b] = "Self"
-                    continue
-                
-                sign_b = planet_signs[planet_b]
-                
-                # Calculate house position from planet_a's perspective
-                # Planet_A is always in house 1 from its own perspective
-                # Other planets are in houses based on sign difference
-                house_position = (sign_b - sign_a) % 12
-                if house_position <= 0:
-                    house_position += 12
-                # Convert to 1-indexed (planet_a itself would be house 1, next sign is house 2, etc.)
-                house_position += 1
-                if house_position > 12:
-                    house_position -= 12
-                
-                # Determine temporary relationship based on house position
-                # Friend Houses: 2, 3, 4, 10, 11, 12
-                # Enemy Houses: 1, 5, 6, 7, 8, 9
-                if house_position in self.friend_houses:
-                    tatkaala_table[planet_a][planet_b] = "Friend"
-                elif house_position in self.enemy_houses:
-                    tatkaala_table[planet_a][planet_b] = "Enemy"
-                else:
-                    tatkaala_table[planet_a][planet_b] = "Neutral"
-        
-        return tatkaala_table
+        A planet in the 2nd, 3rd, 4th, 10th, 11th or 12th sign from another is its
+        temporary friend; anywhere else it is a temporary enemy.
+        """
+        return self._named_table(self.tatkaala_matrix(planets_sidereal), MAITRI_LEVELS,
+                                 self._present(planets_sidereal))
     
     def build_panchadha_maitri_table(self, naisargika_table: Dict[str, Dict[str, str]], 
                                    tatkaala_table: Dict[str, Dict[str, str]]) -> Dict[str, Dict[str, Dict[str, str]]]:
@@ -723,20 +1276,11 @@ class PanchadhaMaitriCalculator:
                 
                 naisargik = naisargika_table[planet_a][planet_b]
                 temporary = tatkaala_table[planet_a][planet_b]
-                
-                # Find matching rule in PANCHADHA_MAITRI_RULES
-                resultant = "Neutral"  # Default
-                code = "N"
-                
-                for rule in PANCHADHA_MAITRI_RULES:
-                    if rule["naisargik"] == naisargik and rule["temporary"] == temporary:
-                        resultant = rule["resultant"]
-                        code = rule["code"]
-                        break
+                level = PANCHADHA_LOOKUP[MAITRI_LEVELS.index(naisargik), MAITRI_LEVELS.index(temporary)]
                 
                 panchadha_table[planet_a][planet_b] = {
-                    "resultant": resultant,
-                    "code": code,
+                    "resultant": PANCHADHA_LEVELS[level],
+                    "code": PANCHADHA_CODES[level],
                     "naisargik": naisargik,
                     "temporary": temporary
                 }
@@ -746,18 +1290,31 @@ class PanchadhaMaitriCalculator:
     def calculate_all_maitri_tables(self, planets_sidereal: Dict[str, float]) -> Dict[str, Any]:
         """Calculate all three Maitri tables and return comprehensive data."""
         
-        # Module 1: Naisargika Maitri
-        naisargika_table = self.build_naisargika_maitri_table()
-        
-        # Module 2: Tatkaala Maitri  
-        tatkaala_table = self.build_tatkaala_maitri_table(planets_sidereal)
+        rows = self._present(planets_sidereal)
+        tatkaala = self.tatkaala_matrix(planets_sidereal)
+        panchadha = self.panchadha_matrix(planets_sidereal)
         
-        # Module 3: Panchadha Maitri
-        panchadha_table = self.build_panchadha_maitri_table(naisargika_table, tatkaala_table)
+        panchadha_table = {}
+        for i in rows:
+            planet_a = self.planets[i]
+            panchadha_table[planet_a] = {}
+            for j in rows:
+                planet_b = self.planets[j]
+                if i == j:
+                    panchadha_table[planet_a][planet_b] = {
+                        "resultant": "Self", "code": "S", "naisargik": "Self", "temporary": "Self"
+                    }
+                else:
+                    panchadha_table[planet_a][planet_b] = {
+                        "resultant": PANCHADHA_LEVELS[panchadha[i, j]],
+                        "code": PANCHADHA_CODES[panchadha[i, j]],
+                        "naisargik": MAITRI_LEVELS[NAISARGIKA_MATRIX[i, j]],
+                        "temporary": MAITRI_LEVELS[tatkaala[i, j]]
+                    }
         
         return {
-            "naisargika_maitri": naisargika_table,
-            "tatkaala_maitri": tatkaala_table,
+            "naisargika_maitri": self.build_naisargika_maitri_table(),
+            "tatkaala_maitri": self._named_table(tatkaala, MAITRI_LEVELS, rows),
             "panchadha_maitri": panchadha_table,
             "planet_signs": {planet: int(longitude // 30) + 1 
                            for planet, longitude in planets_sidereal.items() 
@@ -814,20 +1371,10 @@ class SaptavarigiyaBalaCalculator:
     def get_panchadha_relationship(self, planet: str, other_planet: str, panchadha_maitri: Dict) -> str:
         """Get relationship using dynamic Panchadha Maitri calculation."""
         if planet in panchadha_maitri and other_planet in panchadha_maitri[planet]:
-            relationship_data = panchadha_maitri[planet][other_planet]
-            resultant = relationship_data.get('resultant', 'Neutral')
-            
-            # Map Panchadha Maitri results to SaptavarigiyaBala categories
-            if resultant == 'Extreme Friend':
-                return "Fast Friend"
-            elif resultant == 'Friend':
-                return "Friend"
-            elif resultant == 'Neutral':
-                return "Neutral"
-            elif resultant == 'Enemy':
-                return "Enemy"
-            elif resultant == 'Extreme Enemy':
-                return "Bitter Enemy"
+            resultant = panchadha_maitri[planet][other_planet].get('resultant', 'Neutral')
+            if resultant in PANCHADHA_LEVELS:
+                # Map Panchadha Maitri results to SaptavarigiyaBala categories
+                return SAPTAVARGIYA_RELATIONSHIPS[PANCHADHA_LEVELS.index(resultant)]
         
         return "Neutral"  # Default
     
@@ -866,63 +1413,24 @@ class SaptavarigiyaBalaCalculator:
         maitri_data = self.maitri_calculator.calculate_all_maitri_tables(planets_sidereal)
         panchadha_maitri = maitri_data["panchadha_maitri"]
         
-        # Calculate all divisional charts
+        # Calculate all divisional charts with one table lookup
+        bodies = [planet for planet in planets_sidereal if planet in self.planets]
+        varga_matrix = varga_signs([planets_sidereal[planet] for planet in bodies], self.seven_charts)
         divisional_charts = {}
-        for division in self.seven_charts:
-            if division == 1:
-                # Rashi chart - use original positions
-                chart_data = {}
-                for planet, longitude in planets_sidereal.items():
-                    if planet in self.planets:
-                        sign_index = _sign_index(longitude)
-                        degree_in_sign = _deg_in_sign(longitude)
-                        sign_name, ruler = self.divisional_calculator.get_sign_name_and_ruler(sign_index)
-                        chart_data[planet] = {
-                            'sign_index': sign_index,
-                            'sign_name': sign_name,
-                            'degree_in_sign': degree_in_sign,
-                            'ruler': ruler
-                        }
-                divisional_charts[division] = chart_data
-            else:
-                # Calculate divisional chart positions
-                chart_data = {}
-                for planet, longitude in planets_sidereal.items():
-                    if planet in self.planets:
-                        sign_index = _sign_index(longitude)
-                        degree_in_sign = _deg_in_sign(longitude)
-                        
-                        try:
-                            if division == 2:
-                                div_sign_index, div_degree = self.divisional_calculator.calculate_hora_d2(sign_index, degree_in_sign)
-                            elif division == 3:
-                                div_sign_index, div_degree = self.divisional_calculator.calculate_drekkana_d3(sign_index, degree_in_sign)
-                            elif division == 7:
-                                div_sign_index, div_degree = self.divisional_calculator.calculate_saptamsa_d7(sign_index, degree_in_sign)
-                            elif division == 9:
-                                div_sign_index, div_degree = self.divisional_calculator.calculate_navamsa_d9(sign_index, degree_in_sign)
-                            elif division == 12:
-                                div_sign_index, div_degree = self.divisional_calculator.calculate_dwadasamsa_d12(sign_index, degree_in_sign)
-                            elif division == 30:
-                                div_sign_index, div_degree = self.divisional_calculator.calculate_trimsamsa_d30(sign_index, degree_in_sign)
-                            
-                            sign_name, ruler = self.divisional_calculator.get_sign_name_and_ruler(div_sign_index)
-                            chart_data[planet] = {
-                                'sign_index': div_sign_index,
-                                'sign_name': sign_name,
-                                'degree_in_sign': div_degree,
-                                'ruler': ruler
-                            }
-                        except Exception as e:
-                            chart_data[planet] = {
-                                'error': f"Calculation failed: {str(e)}",
-                                'sign_index': None,
-                                'sign_name': None,
-                                'degree_in_sign': None,
-                                'ruler': None
-                            }
-                
-                divisional_charts[division] = chart_data
+        for k, division in enumerate(self.seven_charts):
+            chart_data = {}
+            for i, planet in enumerate(bodies):
+                longitude = planets_sidereal[planet]
+                div_sign_index = int(varga_matrix[i, k])
+                sign_name, ruler = self.divisional_calculator.get_sign_name_and_ruler(div_sign_index)
+                chart_data[planet] = {
+                    'sign_index': div_sign_index,
+                    'sign_name': sign_name,
+                    # Rashi keeps the real degree for the Mooltrikona check
+                    'degree_in_sign': _deg_in_sign(longitude) if division == 1 else 15.0,
+                    'ruler': ruler
+                }
+            divisional_charts[division] = chart_data
         
         # Calculate actual relationships and assign points for each planet in each chart
         planet_chart_scores = {}
@@ -978,6 +1486,159 @@ class SaptavarigiyaBalaCalculator:
         }
 
 
+class DrikBalaCalculator:
+    """Calculate Drik Bala (Aspectual Strength) from the full planet-to-planet Drishti matrix."""
+    
+    def __init__(self):
+        self.planets = MAITRI_PLANETS
+    
+    def calculate_drik_bala(self, planets_sidereal: Dict[str, float]) -> Dict[str, Any]:
+        """Drishti matrix, benefic/malefic split, Drishti Pinda and Drik Bala for the planets present."""
+        # Absent planets are NaN in the matrices: they cast no Drishti and are left out of the tables
+        lons = np.array([planets_sidereal.get(planet, np.nan) for planet in self.planets], dtype=np.float64)
+        present = [i for i, planet in enumerate(self.planets) if planet in planets_sidereal]
+        values = np.nan_to_num(drishti_matrices(lons, lons))
+        np.fill_diagonal(values, 0.0)
+        signs = benefic_signs(lons)
+        signed = values * signs[:, None]
+        shubha = np.where(signs[:, None] > 0, signed, 0.0).sum(axis=0)
+        ashubha = np.where(signs[:, None] < 0, signed, 0.0).sum(axis=0)
+        pinda = shubha + ashubha
+        
+        return {
+            'aspect_matrix': {
+                self.planets[i]: {self.planets[j]: round(float(values[i, j]), 2) for j in present if i != j}
+                for i in present
+            },
+            'benefic': {self.planets[i]: bool(signs[i] > 0) for i in present},
+            'shubha_drishti': {self.planets[j]: round(float(shubha[j]), 2) for j in present},
+            'ashubha_drishti': {self.planets[j]: round(float(ashubha[j]), 2) for j in present},
+            'drishti_pinda': {self.planets[j]: round(float(pinda[j]), 2) for j in present},
+            'drik_bala': {self.planets[j]: float(pinda[j] / 4.0) for j in present},
+        }
+
+
+class BhavaBalaCalculator:
+    """Calculate Bhava Bala (house strength) as in Reference/BhavaBala.txt.
+
+    The house cusps are taken as Bhava Madhya, the same convention Dig Bala uses.
+    """
+    
+    def calculate_bhava_bala(self, planets_sidereal: Dict[str, float], cusps_map: Dict[int, float],
+                             shadbala_scores: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """Bhavadhipati Bala, Bhava Digbala, Bhava Drishti and their total for houses 1-12.
+
+        Planets missing from planets_sidereal (or shadbala_scores) cast no Drishti and, as
+        house lords, contribute no Bhavadhipati Bala.
+        """
+        lons = np.array([planets_sidereal.get(planet, np.nan) for planet in MAITRI_PLANETS], dtype=np.float64)
+        madhya = np.array([cusps_map[house] for house in range(1, 13)])
+        totals = np.array([shadbala_scores[planet]['total_shadbala'] if planet in shadbala_scores else 0.0
+                           for planet in MAITRI_PLANETS])
+        
+        lords = SIGN_LORD_INDEX[(np.mod(madhya, 360.0) // 30.0).astype(np.int64)]
+        adhipati = totals[lords]
+        digbala = bhava_digbala(madhya)
+        drishti = bhava_drishti(lons, madhya)
+        total = adhipati + digbala + drishti
+        ranks = np.argsort(np.argsort(-total)) + 1
+        
+        houses = {}
+        for i in range(12):
+            houses[str(i + 1)] = {
+                'lord': MAITRI_PLANETS[lords[i]],
+                'bhavadhipati_bala': round(float(adhipati[i]), 2),
+                'bhava_digbala': round(float(digbala[i]), 2),
+                'bhava_drishti_bala': round(float(drishti[i]), 2),
+                'total_bhava_bala': round(float(total[i]), 2),
+                'total_rupas': round(float(total[i]) / 60.0, 2),
+                'rank': int(ranks[i]),
+            }
+        return houses
+
+
+class AshtakavargaCalculator:
+    """Calculate Bhinnashtakavarga for the seven planets and the Sarvashtakavarga (BPHS tables)."""
+    
+    def calculate_ashtakavarga(self, planets_sidereal: Dict[str, float], asc_sid: float) -> Dict[str, Any]:
+        """Bindus per sign for each planet and in total, plus the Sarvashtakavarga by house."""
+        signs = np.array([_sign_index(planets_sidereal[planet]) for planet in MAITRI_PLANETS]
+                         + [_sign_index(asc_sid)])
+        masks = ashtakavarga_bitmasks(signs)
+        bav = bhinnashtakavarga_batch(signs)
+        sav = bav.sum(axis=0)
+        asc_sign = signs[-1]
+        
+        return {
+            'bhinnashtakavarga': {
+                planet: {ZODIAC_SIGNS[sign]: int(bav[i, sign]) for sign in range(12)}
+                for i, planet in enumerate(MAITRI_PLANETS)
+            },
+            'bhinnashtakavarga_totals': {planet: int(POPCOUNT_12[masks[i]].sum())
+                                         for i, planet in enumerate(MAITRI_PLANETS)},
+            'sarvashtakavarga': {ZODIAC_SIGNS[sign]: int(sav[sign]) for sign in range(12)},
+            'sarvashtakavarga_by_house': {str(house): int(sav[(asc_sign + house - 1) % 12])
+                                          for house in range(1, 13)},
+            'sarvashtakavarga_total': int(sav.sum()),
+        }
+
+
+class VimshopakaBalaCalculator:
+    """Calculate Vimshopaka Bala (twenty-point varga strength) for all four classical schemes."""
+    
+    def __init__(self):
+        self.planets = ['Sun', 'Moon', 'Mars', 'Mercury', 'Jupiter', 'Venus', 'Saturn']
+        self.maitri_calculator = PanchadhaMaitriCalculator()
+        self.schemes = list(VIMSHOPAKA_SCHEMES)
+        # Vargas x schemes weight matrix so every scheme comes out of one product
+        self.weights = np.array([[VIMSHOPAKA_SCHEMES[scheme].get(n, 0.0) for scheme in self.schemes]
+                                 for n in VARGA_DIVISIONS])
+        self.points = np.array(VIMSHOPAKA_POINTS, dtype=np.float64)
+    
+    def relationship_matrix(self, panchadha: np.ndarray) -> np.ndarray:
+        """Planets x signs matrix of VIMSHOPAKA_RELATIONSHIPS indices from the 7x7 Panchadha codes."""
+        # Own sign first, otherwise the compound relation to the sign lord (shifted past 'Own')
+        matrix = panchadha[:, SIGN_LORD_INDEX] + 1
+        for i, planet in enumerate(self.planets):
+            matrix[i, SHADBALA_CONSTANTS['own_signs'][planet]] = 0
+        return matrix
+    
+    def calculate_vimshopaka_bala(self, planets_sidereal: Dict[str, float],
+                                  panchadha: Optional[np.ndarray] = None) -> Dict[str, Any]:
+        """Score every planet in Shadvarga, Saptavarga, Dashavarga and Shodashavarga in one pass."""
+        if panchadha is None:
+            panchadha = self.maitri_calculator.panchadha_matrix(planets_sidereal)
+        
+        bodies = [planet for planet in self.planets if planet in planets_sidereal]
+        rows = np.array([self.planets.index(planet) for planet in bodies], dtype=np.int64)
+        
+        # Planets x vargas sign matrix, then relationship and points by table lookup
+        varga_matrix = varga_signs([planets_sidereal[planet] for planet in bodies])
+        relations = self.relationship_matrix(panchadha)[rows[:, None], varga_matrix]
+        scores = self.points[relations] @ self.weights / 20.0
+        
+        planet_scores = {}
+        planet_details = {}
+        for i, planet in enumerate(bodies):
+            planet_scores[planet] = {scheme: round(float(scores[i, k]), 2) for k, scheme in enumerate(self.schemes)}
+            planet_details[planet] = {
+                f"D{n}": {
+                    'sign': ZODIAC_SIGNS[int(varga_matrix[i, k])],
+                    'relationship': VIMSHOPAKA_RELATIONSHIPS[int(relations[i, k])],
+                    'points': VIMSHOPAKA_POINTS[int(relations[i, k])]
+                }
+                for k, n in enumerate(VARGA_DIVISIONS)
+            }
+        
+        return {
+            'planet_scores': planet_scores,
+            'planet_details': planet_details,
+            'schemes': {scheme: {f"D{n}": weight for n, weight in weights.items()}
+                        for scheme, weights in VIMSHOPAKA_SCHEMES.items()},
+            'point_system': dict(zip(VIMSHOPAKA_RELATIONSHIPS, VIMSHOPAKA_POINTS))
+        }
+
+
 class YugmayugmaBalaCalculator:
     """Calculator for YugmayugmaBala (Odd/Even Sign Strength)."""
     
@@ -1308,7 +1969,28 @@ class DreshkonBalaCalculator:
 
 
 def compute_chart(birth_dt_local: datetime, lat: float, lon: float, tz_offset_hours: float, ayanamsa: str, house_system: str,
-                  ephe_dir: Optional[str] = None, node_type: str = 'mean') -> Dict[str, Any]:
+                  ephe_dir: Optional[str] = None, node_type: str = 'mean', ephemeris: str = 'swiss',
+                  precision: str = 'precise', ayanamsas: Optional[List[str]] = None,
+                  house_systems: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Compute the full chart.
+
+    ``ayanamsas`` optionally lists extra sidereal frames (e.g. ['lahiri', 'raman', 'kp',
+    'fagan_bradley']) returned under 'ayanamsa_frames'; they share one set of tropical
+    positions and house cusps and only redo the sidereal-dependent sections.
+
+    ``house_systems`` optionally lists extra house systems (e.g. ['equal', 'placidus',
+    'whole', 'kp']) returned under 'house_systems'; they reuse the chart's planets and
+    sidereal time and only redo cusps and the house-dependent sections.
+    """
+    return compute_chart_model(birth_dt_local, lat, lon, tz_offset_hours, ayanamsa, house_system, ephe_dir,
+                               node_type, ephemeris, precision, ayanamsas, house_systems).to_dict()
+
+
+def compute_chart_model(birth_dt_local: datetime, lat: float, lon: float, tz_offset_hours: float, ayanamsa: str,
+                        house_system: str, ephe_dir: Optional[str] = None, node_type: str = 'mean',
+                        ephemeris: str = 'swiss', precision: str = 'precise', ayanamsas: Optional[List[str]] = None,
+                        house_systems: Optional[List[str]] = None) -> 'ChartModel':
+    """Compute the compact ChartModel; takes the same arguments as compute_chart."""
     # Convert local time by provided offset to UTC
     birth_dt_utc = birth_dt_local - timedelta(hours=tz_offset_hours)
     birth_dt_utc = birth_dt_utc.replace(tzinfo=timezone.utc)
@@ -1316,32 +1998,76 @@ def compute_chart(birth_dt_local: datetime, lat: float, lon: float, tz_offset_ho
 
     # Configure Swiss Ephemeris for sidereal zodiac; choose SWIEPH if ephemeris files are present
     swe.set_sid_mode(_ayanamsa_mode(ayanamsa))
-    iflag = _choose_iflag(ephe_dir)
-
-    # Planets
-    planets_sidereal: Dict[str, float] = {}
-    for name, ipl in PLANET_ORDER:
-        xx, ret = swe.calc_ut(jd_ut, ipl, iflag)
-        planet_lon = xx[0]  # Fixed: use different variable name to avoid collision
-        planets_sidereal[name] = _degnorm(planet_lon)
-    # Nodes
-    node_code = swe.MEAN_NODE if (node_type.lower() in ('mean','m')) else swe.TRUE_NODE
-    xxn, ret = swe.calc_ut(jd_ut, node_code, iflag)
-    node_lon = xxn[0]
-    planets_sidereal['Rahu'] = _degnorm(node_lon)
-    planets_sidereal['Ketu'] = _degnorm(node_lon + 180.0)
+    iflag = _choose_iflag(ephe_dir, precision)
+    fast_eph = _select_fast_ephemeris(ephemeris)
 
-    # Houses and Ascendant - calculate correctly using tropical then convert to sidereal
-    hsys = _house_system_code(house_system)
-    
-    # Calculate houses in tropical mode (without sidereal flag)
-    tropical_iflag = swe.FLG_SWIEPH if os.path.exists('sedelx18.se1') else swe.FLG_MOSEPH
-    houses_res = swe.houses_ex(jd_ut, lat, lon, hsys, tropical_iflag)
-    cusps, ascmc = houses_res
-    asc_tropical = ascmc[0]  # Ascendant in tropical coordinates
-    
-    # Get ayanamsa and convert to sidereal
-    ayanamsa_value = swe.get_ayanamsa_ut(jd_ut)
+    return _build_chart_model(birth_dt_local, jd_ut, lat, lon, tz_offset_hours, ayanamsa, house_system, iflag,
+                              node_type, fast_eph=fast_eph, house_systems=house_systems, ayanamsas=ayanamsas)
+
+
+def _select_fast_ephemeris(ephemeris: str):
+    """Return the precomputed table for ephemeris='fast', or None for Swiss Ephemeris calls."""
+    mode = (ephemeris or 'swiss').lower()
+    if mode == 'swiss':
+        return None
+    if mode == 'fast':
+        from .fast_ephemeris import get_fast_ephemeris
+        return get_fast_ephemeris()
+    raise ValueError(f"Unknown ephemeris mode: {ephemeris}")
+
+
+def _sidereal_positions_and_speeds(jd_ut: float, iflag: int, node_type: str, ayanamsa: str,
+                                   fast_eph=None) -> tuple:
+    """Sidereal longitudes and daily speeds of the seven planets and both nodes at jd_ut.
+
+    With a fast ephemeris table covering jd_ut the values are interpolated from it;
+    otherwise they come from ``swe.calc_ut`` (with FLG_SPEED) in the current sidereal mode.
+    Negative speed means retrograde.
+    """
+    mean_node = node_type.lower() in ('mean','m')
+    positions: Dict[str, float] = {}
+    speeds: Dict[str, float] = {}
+    if fast_eph is not None and fast_eph.covers(jd_ut):
+        lons, rates = fast_eph.sidereal(jd_ut, _ayanamsa_mode(ayanamsa))
+        for name, _ in PLANET_ORDER:
+            col = fast_eph.body_index(name)
+            positions[name] = float(lons[0, col])
+            speeds[name] = float(rates[0, col])
+        col = fast_eph.body_index('MeanNode' if mean_node else 'TrueNode')
+        node_lon, node_speed = float(lons[0, col]), float(rates[0, col])
+    else:
+        for name, ipl in PLANET_ORDER:
+            xx, ret = swe.calc_ut(jd_ut, ipl, iflag | swe.FLG_SPEED)
+            positions[name] = _degnorm(xx[0])
+            speeds[name] = xx[3]
+        node_code = swe.MEAN_NODE if mean_node else swe.TRUE_NODE
+        xxn, ret = swe.calc_ut(jd_ut, node_code, iflag | swe.FLG_SPEED)
+        node_lon, node_speed = xxn[0], xxn[3]
+    positions['Rahu'] = _degnorm(node_lon)
+    positions['Ketu'] = _degnorm(node_lon + 180.0)
+    speeds['Rahu'] = speeds['Ketu'] = node_speed
+    return positions, speeds
+
+
+def _sidereal_positions(jd_ut: float, iflag: int, node_type: str, ayanamsa: str, fast_eph=None) -> Dict[str, float]:
+    """Sidereal longitudes of the seven planets and both nodes at jd_ut."""
+    return _sidereal_positions_and_speeds(jd_ut, iflag, node_type, ayanamsa, fast_eph)[0]
+
+
+def _ayanamsa_offsets(jd_ut: float, sid_mode: int, tropical_iflag: int, fast_eph=None) -> Tuple[float, float]:
+    """Ayanamsa to subtract from tropical planets (with nutation, as ``FLG_SIDEREAL`` does) and
+    from tropical cusps (``get_ayanamsa_ut``, as ``_build_chart_model`` does) for sid_mode.
+
+    Sets the sidereal mode when Swiss Ephemeris has to be asked.
+    """
+    if fast_eph is not None and fast_eph.covers(jd_ut) and sid_mode in fast_eph.ayanamsas:
+        return float(fast_eph.offset(jd_ut, sid_mode)[0]), float(fast_eph.ayanamsa(jd_ut, sid_mode)[0])
+    swe.set_sid_mode(sid_mode)
+    return swe.get_ayanamsa_ex_ut(jd_ut, tropical_iflag)[1], swe.get_ayanamsa_ut(jd_ut)
+
+
+def _sidereal_cusps(cusps, asc_tropical: float, ayanamsa_value: float, house_system: str) -> tuple:
+    """Sidereal ascendant and cusp map from tropical ``swe.houses_ex`` output (whole-sign rebuilt from the ascendant)."""
     asc_sid = _degnorm(asc_tropical - ayanamsa_value)
 
     # If user asked for whole-sign, rebuild cusps from asc sidereal at 0 deg of asc sign
@@ -1351,172 +2077,357 @@ def compute_chart(birth_dt_local: datetime, lat: float, lon: float, tz_offset_ho
     else:
         # cusps tuple is 12 elements, index 0..11 - convert from tropical to sidereal
         cusps_map = {i+1: _degnorm(cusps[i] - ayanamsa_value) for i in range(12)}
+    return asc_sid, cusps_map
 
-    # Transit now (sidereal)
-    now_utc = datetime.utcnow().replace(tzinfo=timezone.utc)
-    jd_now = _julday(now_utc)
-    swe.set_sid_mode(_ayanamsa_mode(ayanamsa))
-    trans_sid: Dict[str, float] = {}
-    for name, ipl in PLANET_ORDER:
-        xx_now, _ = swe.calc_ut(jd_now, ipl, iflag)
-        planet_lon = xx_now[0]  # Fixed: use different variable name
-        trans_sid[name] = _degnorm(planet_lon)
-    xxn_now, _ = swe.calc_ut(jd_now, node_code, iflag)
-    node_lon_now = xxn_now[0]
-    trans_sid['Rahu'] = _degnorm(node_lon_now)
-    trans_sid['Ketu'] = _degnorm(node_lon_now + 180.0)
-
-    # Prepare outputs
-    def sign_name(lon):
-        return ZODIAC_SIGNS[_sign_index(lon)]
 
-    planets_out = {}
-    for name, lonv in planets_sidereal.items():
-        planets_out[name] = {
+def _format_positions(positions: Dict[str, float]) -> Dict[str, Dict[str, Any]]:
+    return {
+        name: {
             'longitude': round(lonv, 6),
-            'sign': sign_name(lonv),
+            'sign': ZODIAC_SIGNS[_sign_index(lonv)],
             'degInSign': round(_deg_in_sign(lonv), 2),
         }
+        for name, lonv in positions.items()
+    }
 
-    trans_out = {}
-    for name, lonv in trans_sid.items():
-        trans_out[name] = {
-            'longitude': round(lonv, 6),
-            'sign': sign_name(lonv),
-            'degInSign': round(_deg_in_sign(lonv), 2),
+
+def _ayanamsa_frames(birth_dt_local: datetime, jd_ut: float, house_system: str, iflag: int,
+                     tropical: Dict[str, float], cusps, asc_tropical: float, ayanamsas: List[str],
+                     fast_eph=None) -> Dict[str, Dict[str, Any]]:
+    """Derive several sidereal frames from the main chart's tropical planets, cusps and ascendant.
+
+    Nothing is recomputed from the ephemeris: each frame subtracts its ayanamsa (see
+    _ayanamsa_offsets) and rebuilds only nakshatras, divisional charts and dasha.
+    Leaves the sidereal mode set to the last frame; callers restore their own.
+    """
+    tropical_iflag = iflag & ~swe.FLG_SIDEREAL
+    frames = {}
+    for name in ayanamsas:
+        planet_offset, ayanamsa_value = _ayanamsa_offsets(jd_ut, _ayanamsa_mode(name), tropical_iflag, fast_eph)
+        planets_sidereal = {body: _degnorm(lonv - planet_offset) for body, lonv in tropical.items()}
+        asc_sid, cusps_map = _sidereal_cusps(cusps, asc_tropical, ayanamsa_value, house_system)
+
+        frames[name] = {
+            'ayanamsa_value': round(ayanamsa_value, 6),
+            'ascendant': round(asc_sid, 6),
+            'houses': {str(k): round(v, 6) for k, v in cusps_map.items()},
+            'planets': _format_positions(planets_sidereal),
+            'nakshatra_details': _get_nakshatra_details(planets_sidereal),
+            'divisional_charts': _calculate_divisional_charts(planets_sidereal, asc_sid),
+            'vimshottari': _compute_vimshottari(birth_dt_local, planets_sidereal['Moon']),
         }
+    return frames
 
-    # House assignment using cusp boundaries: a planet is in house i if it lies between cusp[i] and cusp[i+1] along zodiac
-    cusp_list = [cusps_map[i] for i in range(1,13)]
-    def in_arc(a, start, end):
-        start = _degnorm(start); end = _degnorm(end); a = _degnorm(a)
-        if start <= end:
-            return start <= a < end
-        else:
-            return a >= start or a < end
-    def house_index_for(lonv: float) -> int:
-        for i in range(12):
-            start = cusp_list[i]
-            end = cusp_list[(i+1) % 12]
-            if in_arc(lonv, start, end):
-                return i+1
-        return 12
 
+def _compute_vimshottari(birth_local: datetime, moon_lon_sidereal: float) -> Dict[str, Any]:
+    """Vimshottari Mahadasha/Antardasha/Pratyantardasha based on birth Moon nakshatra."""
+    # Determine nakshatra and its lord
+    nak_index = int(math.floor(_degnorm(moon_lon_sidereal) / NAK_LEN_DEG))  # 0..26
+    nak_offset_deg = _degnorm(moon_lon_sidereal) - nak_index * NAK_LEN_DEG
+    lord = NAK_LORDS[nak_index]
+    total_years = VIM_MD_YEARS[lord]
+    # Remaining proportion in current nakshatra
+    frac_remaining = 1.0 - (nak_offset_deg / NAK_LEN_DEG)
+    remaining_years_current = total_years * frac_remaining
+
+    # Compute the start of current MD by subtracting elapsed from birth
+    elapsed_years_current = total_years - remaining_years_current
+
+    def add_years_calendar(dt: datetime, years: int) -> datetime:
+        try:
+            return dt.replace(year=dt.year + years)
+        except ValueError:
+            # handle Feb 29 -> Feb 28 fallback
+            return dt.replace(month=2, day=28, year=dt.year + years)
+
+    def add_years_fractional(dt: datetime, years_fraction: float, sign: int = +1) -> datetime:
+        days = years_fraction * 365.2425
+        return dt + timedelta(days=sign * days)
+
+    # Start of current MD
+    start_current = birth_local
+    # Subtract integer years then fractional portion to get the MD start
+    int_elapsed = int(math.floor(elapsed_years_current))
+    frac_elapsed = elapsed_years_current - int_elapsed
+    if int_elapsed:
+        start_current = add_years_calendar(start_current, -int_elapsed)
+    if abs(frac_elapsed) > 1e-9:
+        start_current = add_years_fractional(start_current, frac_elapsed, sign=-1)
+
+    # Helper to rotate Vim sequence so it starts with a given lord
+    def rotate_seq(start_lord: str) -> List[str]:
+        idx = VIM_SEQUENCE.index(start_lord)
+        return VIM_SEQUENCE[idx:] + VIM_SEQUENCE[:idx]
+
+    # Build 9 Mahadashas from current lord following the sequence
+    mds = []
+    cur_md_start = start_current
+    for md_lord in rotate_seq(lord):
+        md_years = VIM_MD_YEARS[md_lord]
+        md_end = add_years_calendar(cur_md_start, md_years)
+
+        # Antardashas inside this Mahadasha
+        ads = []
+        cur_ad_start = cur_md_start
+        # AD duration proportion within MD: MD_length * (AD_lord_years / 120)
+        md_total_years = float(md_years)
+        ad_seq = rotate_seq(md_lord)
+        for i, ad_lord in enumerate(ad_seq):
+            frac = VIM_MD_YEARS[ad_lord] / 120.0
+            ad_years_equiv = md_total_years * frac
+            # use fractional-year addition for sub-periods
+            ad_end = add_years_fractional(cur_ad_start, ad_years_equiv, sign=+1)
+            # Ensure last AD ends exactly at MD end to avoid drift
+            if i == len(ad_seq) - 1:
+                ad_end = md_end
+
+            # Pratyantardashas inside this Antardasha
+            pds = []
+            cur_pd_start = cur_ad_start
+            ad_total_years = ad_years_equiv
+            pd_seq = rotate_seq(ad_lord)
+            for j, pd_lord in enumerate(pd_seq):
+                pd_frac = VIM_MD_YEARS[pd_lord] / 120.0
+                pd_years_equiv = ad_total_years * pd_frac
+                pd_end = add_years_fractional(cur_pd_start, pd_years_equiv, sign=+1)
+                if j == len(pd_seq) - 1:
+                    pd_end = ad_end
+                pds.append({
+                    'lord': pd_lord,
+                    'start': cur_pd_start.isoformat(),
+                    'end': pd_end.isoformat(),
+                })
+                cur_pd_start = pd_end
+
+            ads.append({
+                'lord': ad_lord,
+                'start': cur_ad_start.isoformat(),
+                'end': ad_end.isoformat(),
+                'pratyantardashas': pds,
+            })
+            cur_ad_start = ad_end
+
+        mds.append({
+            'lord': md_lord,
+            'start': cur_md_start.isoformat(),
+            'end': md_end.isoformat(),  # end is exclusive; display may show previous day
+            'years': md_years,
+            'antardashas': ads,
+        })
+        cur_md_start = md_end
+
+    return {
+        'nakshatraIndex': nak_index,
+        'nakshatraLord': lord,
+        'balanceAtBirthYears': remaining_years_current,
+        'mahadashas': mds,
+    }
+
+
+def _planets_by_house(planets_sidereal: Dict[str, float], cusps_map: Dict[int, float]) -> Dict[str, List[Dict[str, Any]]]:
+    """Group planets by house using cusp boundaries: house i runs from cusp[i] to cusp[i+1] along the zodiac."""
+    longitudes = np.array(list(planets_sidereal.values()), dtype=np.float64)
+    cusps = np.array([cusps_map[house] for house in range(1, 13)], dtype=np.float64)
+    return _group_by_house(list(planets_sidereal), longitudes, house_indices(longitudes, cusps))
+
+
+def _group_by_house(names: List[str], longitudes: np.ndarray, houses: np.ndarray) -> Dict[str, List[Dict[str, Any]]]:
+    """planetsByHouse from body names, their longitudes and their houses (house_indices)."""
     planets_by_house: Dict[str, List[Dict[str, Any]]] = {str(i): [] for i in range(1,13)}
-    for name, lonv in planets_sidereal.items():
-        hi = house_index_for(lonv)
-        planets_by_house[str(((hi - 1) % 12) + 1)].append({
+    for name, lonv, hi in zip(names, longitudes.tolist(), houses.tolist()):
+        planets_by_house[str(hi)].append({
             'name': name,
             'abbr': ABBR.get(name, name[:2]),
-            'sign': sign_name(lonv),
+            'sign': ZODIAC_SIGNS[_sign_index(lonv)],
             'degInSign': round(_deg_in_sign(lonv), 2),
         })
+    return planets_by_house
 
-    # Vimshottari Mahadasha/Antardasha/Pratyantardasha based on birth Moon nakshatra
-    def _vim_mds(birth_local: datetime, moon_lon_sidereal: float):
-        # Determine nakshatra and its lord
-        nak_index = int(math.floor(_degnorm(moon_lon_sidereal) / NAK_LEN_DEG))  # 0..26
-        nak_offset_deg = _degnorm(moon_lon_sidereal) - nak_index * NAK_LEN_DEG
-        lord = NAK_LORDS[nak_index]
-        total_years = VIM_MD_YEARS[lord]
-        # Remaining proportion in current nakshatra
-        frac_remaining = 1.0 - (nak_offset_deg / NAK_LEN_DEG)
-        remaining_years_current = total_years * frac_remaining
-
-        # Compute the start of current MD by subtracting elapsed from birth
-        elapsed_years_current = total_years - remaining_years_current
-
-        def add_years_calendar(dt: datetime, years: int) -> datetime:
-            try:
-                return dt.replace(year=dt.year + years)
-            except ValueError:
-                # handle Feb 29 -> Feb 28 fallback
-                return dt.replace(month=2, day=28, year=dt.year + years)
-
-        def add_years_fractional(dt: datetime, years_fraction: float, sign: int = +1) -> datetime:
-            days = years_fraction * 365.2425
-            return dt + timedelta(days=sign * days)
-
-        # Start of current MD
-        start_current = birth_local
-        # Subtract integer years then fractional portion to get the MD start
-        int_elapsed = int(math.floor(elapsed_years_current))
-        frac_elapsed = elapsed_years_current - int_elapsed
-        if int_elapsed:
-            start_current = add_years_calendar(start_current, -int_elapsed)
-        if abs(frac_elapsed) > 1e-9:
-            start_current = add_years_fractional(start_current, frac_elapsed, sign=-1)
-
-        # Helper to rotate Vim sequence so it starts with a given lord
-        def rotate_seq(start_lord: str) -> List[str]:
-            idx = VIM_SEQUENCE.index(start_lord)
-            return VIM_SEQUENCE[idx:] + VIM_SEQUENCE[:idx]
-
-        # Build 9 Mahadashas from current lord following the sequence
-        mds = []
-        cur_md_start = start_current
-        for md_lord in rotate_seq(lord):
-            md_years = VIM_MD_YEARS[md_lord]
-            md_end = add_years_calendar(cur_md_start, md_years)
-
-            # Antardashas inside this Mahadasha
-            ads = []
-            cur_ad_start = cur_md_start
-            # AD duration proportion within MD: MD_length * (AD_lord_years / 120)
-            md_total_years = float(md_years)
-            ad_seq = rotate_seq(md_lord)
-            for i, ad_lord in enumerate(ad_seq):
-                frac = VIM_MD_YEARS[ad_lord] / 120.0
-                ad_years_equiv = md_total_years * frac
-                # use fractional-year addition for sub-periods
-                ad_end = add_years_fractional(cur_ad_start, ad_years_equiv, sign=+1)
-                # Ensure last AD ends exactly at MD end to avoid drift
-                if i == len(ad_seq) - 1:
-                    ad_end = md_end
-
-                # Pratyantardashas inside this Antardasha
-                pds = []
-                cur_pd_start = cur_ad_start
-                ad_total_years = ad_years_equiv
-                pd_seq = rotate_seq(ad_lord)
-                for j, pd_lord in enumerate(pd_seq):
-                    pd_frac = VIM_MD_YEARS[pd_lord] / 120.0
-                    pd_years_equiv = ad_total_years * pd_frac
-                    pd_end = add_years_fractional(cur_pd_start, pd_years_equiv, sign=+1)
-                    if j == len(pd_seq) - 1:
-                        pd_end = ad_end
-                    pds.append({
-                        'lord': pd_lord,
-                        'start': cur_pd_start.isoformat(),
-                        'end': pd_end.isoformat(),
-                    })
-                    cur_pd_start = pd_end
-
-                ads.append({
-                    'lord': ad_lord,
-                    'start': cur_ad_start.isoformat(),
-                    'end': ad_end.isoformat(),
-                    'pratyantardashas': pds,
-                })
-                cur_ad_start = ad_end
-
-            mds.append({
-                'lord': md_lord,
-                'start': cur_md_start.isoformat(),
-                'end': md_end.isoformat(),  # end is exclusive; display may show previous day
-                'years': md_years,
-                'antardashas': ads,
-            })
-            cur_md_start = md_end
 
-        return {
-            'nakshatraIndex': nak_index,
-            'nakshatraLord': lord,
-            'balanceAtBirthYears': remaining_years_current,
-            'mahadashas': mds,
+def _house_system_variants(lat: float, armc: float, obliquity: float, ayanamsa_value: float,
+                           house_systems: List[str], planets_sidereal: Dict[str, float],
+                           shadbala_fixed: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """Cusps and house-dependent sections for several house systems from one sidereal time.
+
+    ``swe.houses_armc`` only needs ARMC and obliquity, which ``swe.houses_ex`` already produced
+    for the main chart, so each extra system costs a cusp computation. Bhava Bala needs the
+    lords' Shadbala under that system's cusps: only the cusp-dependent terms (Kendra/Sthana,
+    Dig and Yuddha Bala) are redone, on top of the main chart's ``shadbala_fixed`` terms.
+    """
+    variants = {}
+    kendra_calculator = KendraBalaCalculator()
+    bhava_calculator = BhavaBalaCalculator()
+    for name in house_systems:
+        cusps, ascmc = swe.houses_armc(armc, lat, obliquity, _house_system_code(name))
+        asc_sid, cusps_map = _sidereal_cusps(cusps, ascmc[0], ayanamsa_value, name)
+        planets_by_house = _planets_by_house(planets_sidereal, cusps_map)
+        house_analysis = _get_house_analysis(cusps_map, planets_by_house)
+        strengths, _ = _shadbala_strengths(shadbala_fixed, [cusps_map[house] for house in range(1, 13)])
+        totals = {planet: {'total_shadbala': round(strength['total'], 2)} for planet, strength in strengths.items()}
+        bhava_bala = bhava_calculator.calculate_bhava_bala(planets_sidereal, cusps_map, totals)
+        for house_num, strength in bhava_bala.items():
+            house_analysis[house_num]['bhava_bala'] = strength['total_bhava_bala']
+        variants[name] = {
+            'ascendant': round(asc_sid, 6),
+            'houses': {str(k): round(v, 6) for k, v in cusps_map.items()},
+            'planetsByHouse': planets_by_house,
+            'house_analysis': house_analysis,
+            'kendra_bala': kendra_calculator.calculate_kendra_bala(planets_sidereal, cusps_map),
+            'dig_bala': {planet: round(strength['dig'], 2) for planet, strength in strengths.items()},
+            'bhava_bala': bhava_bala,
         }
+    return variants
+
+
+class ChartModel:
+    """Compact state of a computed chart: positions, speeds and cusps in CHART_BODIES order.
+
+    A model holds a handful of floats and three small arrays, so caching charts costs little.
+    Every section of the chart (analysis, dasha, Shadbala, vargas, ...) is derived from it by
+    ``to_dict``, which returns the JSON-shaped dict compute_chart has always returned.
+    ``jd_now`` pins the transit instant when the model is computed, so every ``to_dict`` call
+    reports the same transits and current periods.
+    """
+
+    __slots__ = ('birth_dt_local', 'jd_ut', 'lat', 'lon', 'tz_offset_hours', 'ayanamsa', 'house_system',
+                 'node_type', 'iflag', 'fast_eph', 'ayanamsa_value', 'longitudes', 'speeds', 'cusps',
+                 'ascendant', 'armc', 'house_systems', 'ayanamsas', 'jd_now')
+
+    def __init__(self, birth_dt_local: datetime, jd_ut: float, lat: float, lon: float, tz_offset_hours: float,
+                 ayanamsa: str, house_system: str, node_type: str, iflag: int, fast_eph, ayanamsa_value: float,
+                 longitudes: np.ndarray, speeds: np.ndarray, cusps: np.ndarray, ascendant: float, armc: float,
+                 house_systems: Optional[List[str]] = None, ayanamsas: Optional[List[str]] = None,
+                 jd_now: Optional[float] = None):
+        self.birth_dt_local = birth_dt_local
+        self.jd_ut = jd_ut
+        self.lat = lat
+        self.lon = lon
+        self.tz_offset_hours = tz_offset_hours
+        self.ayanamsa = ayanamsa
+        self.house_system = house_system
+        self.node_type = node_type
+        self.iflag = iflag
+        self.fast_eph = fast_eph
+        self.ayanamsa_value = ayanamsa_value
+        self.longitudes = longitudes
+        self.speeds = speeds
+        self.cusps = cusps
+        self.ascendant = ascendant
+        self.armc = armc
+        self.house_systems = house_systems
+        self.ayanamsas = ayanamsas
+        self.jd_now = jd_now if jd_now is not None else _julday(datetime.now(timezone.utc))
+
+    @property
+    def planets_sidereal(self) -> Dict[str, float]:
+        return dict(zip(CHART_BODIES, self.longitudes.tolist()))
+
+    @property
+    def planet_speeds(self) -> Dict[str, float]:
+        return dict(zip(CHART_BODIES, self.speeds.tolist()))
+
+    @property
+    def cusps_map(self) -> Dict[int, float]:
+        return {house + 1: cusp for house, cusp in enumerate(self.cusps.tolist())}
+
+    @property
+    def houses(self) -> np.ndarray:
+        """House (1-12) of every body, CHART_BODIES order."""
+        return house_indices(self.longitudes, self.cusps)
+
+    @property
+    def now_local(self) -> datetime:
+        """The pinned transit instant in the chart's local time (naive, like the dasha dates)."""
+        return (_jd_to_datetime(self.jd_now) + timedelta(hours=self.tz_offset_hours)).replace(tzinfo=None)
+
+    def house(self, body: Body) -> int:
+        """House (1-12) occupied by a body."""
+        return int(self.houses[body])
+
+    def to_dict(self, include_static: bool = True, normalized: bool = False) -> Dict[str, Any]:
+        """The full chart dict, as returned by compute_chart.
+
+        With include_static=False the reference tables listed in STATIC_CHART_FIELDS are
+        left out and 'meta' names the chart_static_tables() version they come from.
+        With normalized=True every fact is sent once: fields repeating another part of the
+        chart are left out and expand_chart_payload() puts them back.
+        """
+        chart = _chart_sections(self)
+        if not include_static:
+            _strip_static_tables(chart)
+        if normalized:
+            _normalize_chart(chart)
+        return chart
+
+
+def _build_chart_model(birth_dt_local: datetime, jd_ut: float, lat: float, lon: float, tz_offset_hours: float,
+                       ayanamsa: str, house_system: str, iflag: int, node_type: str = 'mean', fast_eph=None,
+                       house_systems: Optional[List[str]] = None,
+                       ayanamsas: Optional[List[str]] = None) -> ChartModel:
+    """Compute the ChartModel for an instant once the ephemeris has been configured.
+
+    Expects ``swe.set_sid_mode`` to have been called for ``ayanamsa`` and ``iflag`` to come
+    from ``_choose_iflag``, so batch callers can do that setup once for many charts.
+    Pass the table from ``_select_fast_ephemeris`` as fast_eph to interpolate positions.
+    house_systems and ayanamsas add the 'house_systems' and 'ayanamsa_frames' sections.
+    """
+    # Planets and nodes, keeping the speeds for retrogression and Chesta Bala
+    planets_sidereal, planet_speeds = _sidereal_positions_and_speeds(jd_ut, iflag, node_type, ayanamsa, fast_eph)
 
-    vim = _vim_mds(birth_dt_local, planets_sidereal['Moon'])
+    # Houses and Ascendant - calculate correctly using tropical then convert to sidereal
+    hsys = _house_system_code(house_system)
+    
+    # Calculate houses in tropical mode (without sidereal flag), same ephemeris source
+    tropical_iflag = iflag & ~swe.FLG_SIDEREAL
+    houses_res = swe.houses_ex(jd_ut, lat, lon, hsys, tropical_iflag)
+    cusps, ascmc = houses_res
+    asc_tropical = ascmc[0]  # Ascendant in tropical coordinates
+    
+    # Get ayanamsa and convert to sidereal
+    if fast_eph is not None and fast_eph.covers(jd_ut):
+        ayanamsa_value = float(fast_eph.ayanamsa(jd_ut, _ayanamsa_mode(ayanamsa))[0])
+    else:
+        ayanamsa_value = swe.get_ayanamsa_ut(jd_ut)
+    asc_sid, cusps_map = _sidereal_cusps(cusps, asc_tropical, ayanamsa_value, house_system)
+
+    return ChartModel(
+        birth_dt_local, jd_ut, lat, lon, tz_offset_hours, ayanamsa, house_system, node_type, iflag, fast_eph,
+        ayanamsa_value,
+        longitudes=np.array([planets_sidereal[body] for body in CHART_BODIES], dtype=np.float64),
+        speeds=np.array([planet_speeds[body] for body in CHART_BODIES], dtype=np.float64),
+        cusps=np.array([cusps_map[house] for house in range(1, 13)], dtype=np.float64),
+        ascendant=asc_sid, armc=ascmc[2], house_systems=house_systems, ayanamsas=ayanamsas,
+    )
+
+
+def _build_chart(birth_dt_local: datetime, jd_ut: float, lat: float, lon: float, tz_offset_hours: float, ayanamsa: str,
+                 house_system: str, iflag: int, node_type: str = 'mean', fast_eph=None,
+                 house_systems: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Build the full chart dict for an instant; see _build_chart_model for the setup it expects."""
+    return _build_chart_model(birth_dt_local, jd_ut, lat, lon, tz_offset_hours, ayanamsa, house_system, iflag,
+                              node_type, fast_eph, house_systems).to_dict()
+
+
+def _chart_sections(model: ChartModel) -> Dict[str, Any]:
+    """Derive every chart section from a ChartModel (the body of ChartModel.to_dict)."""
+    birth_dt_local, jd_ut, lat, lon = model.birth_dt_local, model.jd_ut, model.lat, model.lon
+    tz_offset_hours, ayanamsa, house_system = model.tz_offset_hours, model.ayanamsa, model.house_system
+    iflag, node_type, fast_eph, ayanamsa_value = model.iflag, model.node_type, model.fast_eph, model.ayanamsa_value
+    planets_sidereal, planet_speeds = model.planets_sidereal, model.planet_speeds
+    asc_sid, cusps_map = model.ascendant, model.cusps_map
+    swe.set_sid_mode(_ayanamsa_mode(ayanamsa))
+
+    # Transit now (sidereal), at the instant pinned in the model
+    jd_now = model.jd_now
+    trans_sid = _sidereal_positions(jd_now, iflag, node_type, ayanamsa, fast_eph)
+
+    # Prepare outputs
+    planets_out = _format_positions(planets_sidereal)
+    trans_out = _format_positions(trans_sid)
+
+    planets_by_house = _group_by_house(CHART_BODIES, model.longitudes, model.houses)
+
+    vim = _compute_vimshottari(birth_dt_local, planets_sidereal['Moon'])
     
     # Generate comprehensive data for enhanced UI
     birth_info = {
@@ -1530,7 +2441,7 @@ def compute_chart(birth_dt_local: datetime, lat: float, lon: float, tz_offset_ho
     }
     
     # Enhanced planetary analysis
-    planetary_analysis = _get_planetary_analysis(planets_sidereal, planets_out, cusps_map)
+    planetary_analysis = _get_planetary_analysis(planets_sidereal, planets_out, cusps_map, planet_speeds)
     
     # House analysis with significances
     house_analysis = _get_house_analysis(cusps_map, planets_by_house)
@@ -1539,22 +2450,40 @@ def compute_chart(birth_dt_local: datetime, lat: float, lon: float, tz_offset_ho
     nakshatra_details = _get_nakshatra_details(planets_sidereal)
     
     # Current transits
-    current_transits = _get_current_transits(planets_sidereal, cusps_map)
+    current_transits = _get_current_transits(planets_sidereal, cusps_map, iflag, ayanamsa, jd_now=jd_now)
     
     # Yearly dasha calendar
     yearly_dasha = _get_yearly_dasha_calendar(birth_dt_local, vim)
     
     # Shadbala planetary strength analysis
-    shadbala_analysis = _calculate_shadbala(planets_sidereal, cusps_map, birth_dt_local, lat, lon)
+    shadbala_fixed = _shadbala_fixed_terms(model.longitudes, birth_dt_local, lat, lon, jd_ut, ayanamsa_value)
+    shadbala_analysis = _shadbala_from_arrays(model.longitudes, model.cusps, birth_dt_local, lat, lon,
+                                              speeds=model.speeds, fixed=shadbala_fixed)
+
+    # Ashtakavarga, with today's transits scored against it
+    ashtakavarga = AshtakavargaCalculator().calculate_ashtakavarga(planets_sidereal, asc_sid)
+    bav = bhinnashtakavarga_matrix(ashtakavarga)
+    sav = bav.sum(axis=0)
+    for planet, transit in current_transits.get('transits', {}).items():
+        sign = ZODIAC_SIGNS.index(transit['current_sign'])
+        if planet in MAITRI_PLANETS:
+            transit['ashtakavarga_bindus'] = int(bav[MAITRI_PLANETS.index(planet), sign])
+        transit['sarvashtakavarga_bindus'] = int(sav[sign])
+
+    # Bhava Bala from the lords' Shadbala and the Drishti onto each Bhava Madhya
+    bhava_bala = BhavaBalaCalculator().calculate_bhava_bala(planets_sidereal, cusps_map,
+                                                            shadbala_analysis['shadbala_scores'])
+    for house_num, strength in bhava_bala.items():
+        house_analysis[house_num]['bhava_bala'] = strength['total_bhava_bala']
 
     # Divisional Charts calculation
-    divisional_charts = _calculate_divisional_charts(planets_sidereal, asc_sid)
+    divisional_charts = _divisional_charts(['Lagna'] + CHART_BODIES, np.concatenate([[asc_sid], model.longitudes]))
 
     # Panchadha Maitri calculation
     maitri_calculator = PanchadhaMaitriCalculator()
     panchadha_maitri = maitri_calculator.calculate_all_maitri_tables(planets_sidereal)
 
-    return {
+    chart = {
         'meta': {
             'jd_ut': jd_ut,
             'ayanamsa': ayanamsa,
@@ -1573,12 +2502,326 @@ def compute_chart(birth_dt_local: datetime, lat: float, lon: float, tz_offset_ho
         'current_transits': current_transits,
         'yearly_dasha': yearly_dasha,
         'shadbala': shadbala_analysis,
+        'bhava_bala': bhava_bala,
+        'ashtakavarga': ashtakavarga,
         'divisional_charts': divisional_charts,
         'panchadha_maitri': panchadha_maitri,
     }
 
+    if model.house_systems:
+        # ARMC comes from the model's houses_ex call; obliquity is the true obliquity of date
+        obliquity = swe.calc_ut(jd_ut, swe.ECL_NUT, iflag & ~swe.FLG_SIDEREAL)[0][0]
+        chart['house_systems'] = _house_system_variants(lat, model.armc, obliquity, ayanamsa_value,
+                                                        model.house_systems, planets_sidereal, shadbala_fixed)
+    if model.ayanamsas:
+        # Back to tropical with the main frame's own offsets, so no planet or house pass is redone
+        planet_offset, _ = _ayanamsa_offsets(jd_ut, _ayanamsa_mode(ayanamsa), iflag & ~swe.FLG_SIDEREAL, fast_eph)
+        tropical = {body: _degnorm(lonv + planet_offset) for body, lonv in planets_sidereal.items()}
+        chart['ayanamsa_frames'] = _ayanamsa_frames(birth_dt_local, jd_ut, house_system, iflag, tropical,
+                                                    np.mod(model.cusps + ayanamsa_value, 360.0),
+                                                    _degnorm(asc_sid + ayanamsa_value), model.ayanamsas, fast_eph)
+        swe.set_sid_mode(_ayanamsa_mode(ayanamsa))
+    return chart
+
+
+# Chart fields that are the same for every chart: (table name, path), '*' matching every key.
+# Under a '*' the table is keyed by the key matched by the last '*' (house number, varga, ...).
+STATIC_CHART_FIELDS = [
+    ('divisional_chart_names', ('divisional_charts', '*', 'name')),
+    ('divisional_chart_names', ('ayanamsa_frames', '*', 'divisional_charts', '*', 'name')),
+    ('house_significances', ('house_analysis', '*', 'significances')),
+    ('house_significances', ('house_systems', '*', 'house_analysis', '*', 'significances')),
+    ('naisargika_maitri', ('panchadha_maitri', 'naisargika_maitri')),
+    ('maitri_rules', ('panchadha_maitri', 'rules_applied')),
+    ('saptavargiya_chart_names', ('shadbala', '_saptavargiya_analysis', 'chart_names')),
+    ('saptavargiya_chart_names', ('shadbala', '_saptavargiya_analysis', 'planet_chart_scores', '*', '*', 'chart_name')),
+    ('saptavargiya_point_system', ('shadbala', '_saptavargiya_analysis', 'point_system')),
+    ('mooltrikona_ranges', ('shadbala', '_saptavargiya_analysis', 'mooltrikona_ranges')),
+    ('vimshopaka_schemes', ('shadbala', '_vimshopaka_analysis', 'schemes')),
+    ('vimshopaka_point_system', ('shadbala', '_vimshopaka_analysis', 'point_system')),
+    ('yugmayugma_rules', ('shadbala', '_yugmayugma_analysis', 'calculation_rules')),
+    ('kendra_house_classifications', ('shadbala', '_kendra_analysis', 'house_classifications')),
+    ('kendra_point_system', ('shadbala', '_kendra_analysis', 'point_system')),
+    ('dreshkon_gender_classifications', ('shadbala', '_dreshkon_analysis', 'gender_classifications')),
+    ('dreshkon_strength_rules', ('shadbala', '_dreshkon_analysis', 'strength_rules')),
+    ('dreshkon_ranges', ('shadbala', '_dreshkon_analysis', 'dreshkon_ranges')),
+]
+
+
+def _static_matches(node: Any, path: tuple, prefix: tuple = ()):
+    """Yield (parent, key, concrete path) for every field matching a chart path; '*' also walks lists."""
+    head, rest = path[0], path[1:]
+    if isinstance(node, list):
+        keys = list(range(len(node))) if head == '*' else []
+    elif isinstance(node, dict):
+        keys = list(node) if head == '*' else [head] if head in node else []
+    else:
+        return
+    for key in keys:
+        if rest:
+            yield from _static_matches(node[key], rest, prefix + (key,))
+        else:
+            yield node, key, prefix + (key,)
+
+
+def _strip_static_tables(chart: Dict[str, Any]) -> None:
+    for _, path in STATIC_CHART_FIELDS:
+        for parent, key, _ in list(_static_matches(chart, path)):
+            del parent[key]
+    chart['meta']['static_tables'] = chart_static_tables()['version']
+
+
+# Chart fields repeating another field of the same chart: (target path, source path). Each '$'
+# in the source stands for the key matched by the corresponding '*' in the target.
+DUPLICATE_CHART_FIELDS = [
+    (('shadbala', '_saptavargiya_analysis', 'panchadha_maitri_used'), ('panchadha_maitri', 'panchadha_maitri')),
+    (('planetary_analysis', '*', 'longitude_sidereal'), ('planets', '$', 'longitude')),
+    (('planetary_analysis', '*', 'sign'), ('planets', '$', 'sign')),
+    (('planetary_analysis', '*', 'nakshatra', 'index'), ('nakshatra_details', '$', 'nakshatra_index')),
+    (('planetary_analysis', '*', 'nakshatra', 'lord'), ('nakshatra_details', '$', 'nakshatra_lord')),
+    (('planetary_analysis', '*', 'nakshatra', 'pada'), ('nakshatra_details', '$', 'pada')),
+    (('nakshatra_details', '*', 'longitude_sidereal'), ('planets', '$', 'longitude')),
+    (('ayanamsa_frames', '*', 'nakshatra_details', '*', 'longitude_sidereal'),
+     ('ayanamsa_frames', '$', 'planets', '$', 'longitude')),
+    (('current_transits', 'transits', '*', 'birth_longitude'), ('planets', '$', 'longitude')),
+]
+
+# planetsByHouse lists whose entries repeat a positions map: (list path, positions path, fields).
+# An entry is sent as the body name alone when it is exactly {name, abbr, *fields of positions[name]}.
+BODY_GROUP_LISTS = [
+    (('planetsByHouse', '*'), ('planets',), ('sign', 'degInSign')),
+    (('house_systems', '*', 'planetsByHouse', '*'), ('planets',), ('sign', 'degInSign')),
+    (('divisional_charts', '*', 'planetsByHouse', '*'), ('divisional_charts', '$', 'positions'),
+     ('sign', 'ruler', 'division_index')),
+    (('ayanamsa_frames', '*', 'divisional_charts', '*', 'planetsByHouse', '*'),
+     ('ayanamsa_frames', '$', 'divisional_charts', '$', 'positions'), ('sign', 'ruler', 'division_index')),
+]
+
+# Dasha period lists, outermost first. Each period starts where the previous one ends and the
+# first starts with its parent period, so those 'start' values are left out.
+CHAINED_PERIOD_LISTS = [
+    prefix + path
+    for prefix in ((), ('ayanamsa_frames', '*'))
+    for path in (
+        ('vimshottari', 'mahadashas'),
+        ('vimshottari', 'mahadashas', '*', 'antardashas'),
+        ('vimshottari', 'mahadashas', '*', 'antardashas', '*', 'pratyantardashas'),
+    )
+]
+
+
+def _resolve_chart_path(chart: Dict[str, Any], source: tuple, target: tuple, concrete: tuple) -> tuple:
+    """(found, value) for a source path, with '$' bound to the keys matched by '*' in target."""
+    bound = iter(key for part, key in zip(target, concrete) if part == '*')
+    node: Any = chart
+    for part in source:
+        key = next(bound) if part == '$' else part
+        if isinstance(node, dict) and key in node:
+            node = node[key]
+        elif isinstance(node, list) and isinstance(key, int) and key < len(node):
+            node = node[key]
+        else:
+            return False, None
+    return True, node
+
+
+def _body_group_entry(name: str, positions: Dict[str, Any], fields: tuple) -> Optional[Dict[str, Any]]:
+    if name not in positions:
+        return None
+    entry = {'name': name, 'abbr': ABBR.get(name, name[:2])}
+    entry.update((field, positions[name].get(field)) for field in fields)
+    return entry
+
+
+def _normalize_chart(chart: Dict[str, Any]) -> None:
+    """Leave out every field listed as a repeat of another one (see expand_chart_payload)."""
+    for target, source in DUPLICATE_CHART_FIELDS:
+        for parent, key, concrete in list(_static_matches(chart, target)):
+            found, value = _resolve_chart_path(chart, source, target, concrete)
+            if found and value == parent[key]:
+                del parent[key]
+
+    for path, source, fields in BODY_GROUP_LISTS:
+        for parent, key, concrete in list(_static_matches(chart, path)):
+            found, positions = _resolve_chart_path(chart, source, path, concrete)
+            if not found:
+                continue
+            parent[key] = [
+                entry['name'] if isinstance(entry, dict)
+                and entry == _body_group_entry(entry.get('name'), positions, fields) else entry
+                for entry in parent[key]
+            ]
+
+    # Innermost lists first, so each parent period still carries its own start
+    for path in reversed(CHAINED_PERIOD_LISTS):
+        for parent, key, _ in list(_static_matches(chart, path)):
+            previous_end = parent.get('start')
+            for period in parent[key]:
+                if previous_end is not None and period.get('start') == previous_end:
+                    del period['start']
+                previous_end = period.get('end')
+
+    chart['meta']['normalized'] = True
+
+
+def expand_chart_payload(chart: Dict[str, Any]) -> Dict[str, Any]:
+    """Restore in place the fields left out of a normalized chart (to_dict(normalized=True))."""
+    if not chart.get('meta', {}).pop('normalized', False):
+        return chart
+
+    for path in CHAINED_PERIOD_LISTS:
+        for parent, key, _ in list(_static_matches(chart, path)):
+            previous_end = parent.get('start')
+            for i, period in enumerate(parent[key]):
+                if 'start' not in period:
+                    parent[key][i] = period = {'start': previous_end, **period}
+                previous_end = period.get('end')
+
+    for path, source, fields in BODY_GROUP_LISTS:
+        for parent, key, concrete in list(_static_matches(chart, path)):
+            _, positions = _resolve_chart_path(chart, source, path, concrete)
+            parent[key] = [_body_group_entry(entry, positions, fields) if isinstance(entry, str) else entry
+                           for entry in parent[key]]
+
+    # Sources are never targets themselves, so the order of restoring does not matter
+    for target, source in DUPLICATE_CHART_FIELDS:
+        field = target[-1]
+        for grandparent, key, concrete in list(_static_matches(chart, target[:-1])):
+            parent = grandparent[key]
+            if isinstance(parent, dict) and field not in parent:
+                found, value = _resolve_chart_path(chart, source, target, concrete + (field,))
+                if found:
+                    parent[field] = value
+    return chart
+
+
+@lru_cache(maxsize=1)
+def chart_static_tables() -> Dict[str, Any]:
+    """Reference tables left out of charts built with include_static=False.
+
+    None of these fields depend on the chart, so they are read once from a reference chart
+    (J2000, Moshier) rather than duplicated here. For a '*' in a path the table is keyed by
+    the key matched by the last '*', e.g. house number. 'version' is a content hash, so it changes exactly
+    when a table does.
+    """
+    swe.set_sid_mode(_ayanamsa_mode('lahiri'))
+    chart = _build_chart_model(datetime(2000, 1, 1, 12, 0), 2451545.0, 0.0, 0.0, 0.0, 'lahiri', 'equal',
+                               swe.FLG_MOSEPH | swe.FLG_SIDEREAL, house_systems=['equal']).to_dict()
+    tables: Dict[str, Any] = {}
+    for name, path in STATIC_CHART_FIELDS:
+        if name in tables:
+            continue
+        wildcards = [i for i, part in enumerate(path) if part == '*']
+        for parent, key, concrete in _static_matches(chart, path):
+            if wildcards:
+                tables.setdefault(name, {})[concrete[wildcards[-1]]] = parent[key]
+            else:
+                tables[name] = parent[key]
+    normalization = {
+        'duplicates': [{'target': list(target), 'source': list(source)} for target, source in DUPLICATE_CHART_FIELDS],
+        'body_groups': [{'path': list(path), 'source': list(source), 'fields': list(fields)}
+                        for path, source, fields in BODY_GROUP_LISTS],
+        'chains': [list(path) for path in CHAINED_PERIOD_LISTS],
+        'abbreviations': ABBR,
+    }
+    body = json.dumps([tables, normalization], sort_keys=True, ensure_ascii=False)
+    return {
+        'version': hashlib.sha256(body.encode('utf-8')).hexdigest()[:12],
+        'tables': tables,
+        'fields': [{'table': name, 'path': list(path)} for name, path in STATIC_CHART_FIELDS],
+        'normalization': normalization,
+    }
+
+
+def _sun_longitude_and_speed(jd_ut: float, iflag: int, ayanamsa: str, fast_eph=None) -> tuple:
+    """Sidereal longitude and daily speed of the Sun, from the fast table when it covers jd_ut."""
+    if fast_eph is not None and fast_eph.covers(jd_ut):
+        lons, speeds = fast_eph.sidereal(jd_ut, _ayanamsa_mode(ayanamsa))
+        col = fast_eph.body_index('Sun')
+        return float(lons[0, col]), float(speeds[0, col])
+    xx, _ = swe.calc_ut(jd_ut, swe.SUN, iflag | swe.FLG_SPEED)
+    return xx[0], xx[3]
+
+
+def _solve_sun_longitude(target_lon: float, jd_guess: float, iflag: int, ayanamsa: str, fast_eph=None,
+                         tolerance_deg: float = 1e-7, max_iterations: int = 12) -> float:
+    """Find the Julian day (UT) near jd_guess when the Sun reaches target_lon.
+
+    Newton iteration on the Sun's longitude using its daily speed; the Sun never
+    retrogrades so the speed is always a safe divisor.
+    """
+    jd = jd_guess
+    for _ in range(max_iterations):
+        sun_lon, sun_speed = _sun_longitude_and_speed(jd, iflag, ayanamsa, fast_eph)
+        # Signed difference in (-180, 180] so the step goes the short way round
+        diff = (sun_lon - target_lon + 180.0) % 360.0 - 180.0
+        if abs(diff) < tolerance_deg:
+            break
+        jd -= diff / sun_speed
+    return jd
+
+
+def compute_solar_returns(birth_dt_local: datetime, lat: float, lon: float, tz_offset_hours: float, ayanamsa: str,
+                          house_system: str, start_year: Optional[int] = None, end_year: Optional[int] = None,
+                          ephe_dir: Optional[str] = None, node_type: str = 'mean',
+                          include_charts: bool = True, ephemeris: str = 'swiss',
+                          precision: str = 'precise') -> Dict[str, Any]:
+    """Compute Varshaphal (solar return) instants and annual charts for a span of years.
+
+    Each return is the moment the Sun comes back to its natal sidereal longitude, solved by
+    Newton iteration. Ephemeris setup is done once for the whole series; the previous return
+    seeds the next solve, so each year typically converges in two or three ``calc_ut`` calls.
+    Annual charts are cast for lat/lon (pass the current residence for a relocated Varshaphal)
+    and expressed in local time using tz_offset_hours. ephemeris='fast' solves against the
+    precomputed table instead of ``swe.calc_ut``.
+    """
+    birth_dt_utc = (birth_dt_local - timedelta(hours=tz_offset_hours)).replace(tzinfo=timezone.utc)
+    jd_birth = _julday(birth_dt_utc)
+
+    swe.set_sid_mode(_ayanamsa_mode(ayanamsa))
+    iflag = _choose_iflag(ephe_dir, precision)
+    fast_eph = _select_fast_ephemeris(ephemeris)
+
+    natal_sun_lon = _degnorm(_sun_longitude_and_speed(jd_birth, iflag, ayanamsa, fast_eph)[0])
+
+    if start_year is None:
+        start_year = birth_dt_local.year + 1
+    if end_year is None:
+        end_year = start_year
+    if end_year < start_year:
+        raise ValueError(f"end_year ({end_year}) must not be before start_year ({start_year})")
+
+    returns = []
+    jd_guess = jd_birth + (start_year - birth_dt_local.year) * SIDEREAL_YEAR_DAYS
+    for year in range(start_year, end_year + 1):
+        jd_return = _solve_sun_longitude(natal_sun_lon, jd_guess, iflag, ayanamsa, fast_eph)
+        jd_guess = jd_return + SIDEREAL_YEAR_DAYS
+
+        return_dt_utc = _jd_to_datetime(jd_return)
+        return_dt_local = return_dt_utc.replace(tzinfo=None) + timedelta(hours=tz_offset_hours)
 
-def _get_planetary_analysis(planets_sidereal: Dict, planets_out: Dict, cusps_map: Dict) -> Dict[str, Any]:
+        entry = {
+            'year': year,
+            'age': year - birth_dt_local.year,
+            'jd_ut': jd_return,
+            'datetime_utc': return_dt_utc.isoformat(),
+            'datetime_local': return_dt_local.isoformat(),
+        }
+        if include_charts:
+            entry['chart'] = _build_chart(return_dt_local, jd_return, lat, lon, tz_offset_hours,
+                                          ayanamsa, house_system, iflag, node_type, fast_eph=fast_eph)
+        returns.append(entry)
+
+    return {
+        'natal_sun_longitude': round(natal_sun_lon, 6),
+        'ayanamsa': ayanamsa,
+        'house_system': house_system,
+        'returns': returns,
+    }
+
+
+def _get_planetary_analysis(planets_sidereal: Dict, planets_out: Dict, cusps_map: Dict,
+                            planet_speeds: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
     """Enhanced planetary analysis with detailed positions, aspects, and strengths."""
     analysis = {}
     
@@ -1628,8 +2871,8 @@ def _get_planetary_analysis(planets_sidereal: Dict, planets_out: Dict, cusps_map
                 'lord': nak_lord,
                 'pada': pada
             },
-            'is_retrograde': False,  # planets_out doesn't have speed data
-            'speed': 0  # planets_out doesn't have speed data
+            'is_retrograde': bool(planet_speeds and planet_speeds.get(planet, 0) < 0),
+            'speed': round(planet_speeds.get(planet, 0), 6) if planet_speeds else 0
         }
     
     return analysis
@@ -1673,13 +2916,7 @@ def _get_house_analysis(cusps_map: Dict, planets_by_house: Dict) -> Dict[str, An
 
 def _get_nakshatra_details(planets_sidereal: Dict) -> Dict[str, Any]:
     """Detailed nakshatra analysis for all planets."""
-    nakshatra_names = [
-        "Ashwini", "Bharani", "Krittika", "Rohini", "Mrigashira", "Ardra", "Punarvasu",
-        "Pushya", "Ashlesha", "Magha", "Purva Phalguni", "Uttara Phalguni", "Hasta",
-        "Chitra", "Swati", "Vishakha", "Anuradha", "Jyeshtha", "Mula", "Purva Ashadha",
-        "Uttara Ashadha", "Shravana", "Dhanishta", "Shatabhisha", "Purva Bhadrapada",
-        "Uttara Bhadrapada", "Revati"
-    ]
+    nakshatra_names = NAKSHATRA_NAMES
     
     details = {}
     for planet, lon_sid in planets_sidereal.items():
@@ -1703,17 +2940,24 @@ def _get_nakshatra_details(planets_sidereal: Dict) -> Dict[str, Any]:
     return details
 
 
-def _get_current_transits(planets_sidereal: Dict, cusps_map: Dict) -> Dict[str, Any]:
-    """Calculate current planetary transits relative to birth chart."""
+def _get_current_transits(planets_sidereal: Dict, cusps_map: Dict, iflag: Optional[int] = None,
+                          ayanamsa: str = 'lahiri', jd_now: Optional[float] = None) -> Dict[str, Any]:
+    """Calculate current planetary transits relative to birth chart (at jd_now when given)."""
     from datetime import datetime
     
+    if iflag is None:
+        iflag = _choose_iflag(None)
+    
     try:
         # Get current planetary positions
-        current_dt = datetime.now()
-        jd_now = _julday(current_dt.replace(tzinfo=timezone.utc))
+        if jd_now is None:
+            current_dt = datetime.now()
+            jd_now = _julday(current_dt.replace(tzinfo=timezone.utc))
+        else:
+            current_dt = _jd_to_datetime(jd_now)
         
         # Set sidereal mode
-        swe.set_sid_mode(swe.SIDM_LAHIRI)
+        swe.set_sid_mode(_ayanamsa_mode(ayanamsa))
         
         current_transits = {}
         current_planets = {}
@@ -1721,7 +2965,7 @@ def _get_current_transits(planets_sidereal: Dict, cusps_map: Dict) -> Dict[str,
         # Calculate current positions
         for name, planet_id in PLANET_ORDER:
             try:
-                pos, _ = swe.calc_ut(jd_now, planet_id, swe.FLG_SIDEREAL | swe.FLG_MOSEPH)
+                pos, _ = swe.calc_ut(jd_now, planet_id, iflag)
                 current_planets[name] = pos[0]
             except:
                 current_planets[name] = 0
@@ -1858,32 +3102,143 @@ def _get_quarterly_summary(year_periods: List[Dict]) -> Dict[str, str]:
 
 
 def _calculate_shadbala(planets_sidereal: Dict[str, float], cusps_map: Dict[int, float], 
-                       birth_dt_local: datetime, lat: float, lon: float) -> Dict[str, Any]:
-    """Calculate Shadbala (Six-fold strength) for all planets with comprehensive SaptavarigiyaBala analysis."""
+                       birth_dt_local: datetime, lat: float, lon: float,
+                       planet_speeds: Optional[Dict[str, float]] = None, jd_ut: Optional[float] = None,
+                       ayanamsa_value: Optional[float] = None) -> Dict[str, Any]:
+    """Calculate Shadbala (Six-fold strength) for all planets with comprehensive SaptavarigiyaBala analysis.
+    
+    With jd_ut and ayanamsa_value, Chesta Bala follows Reference/Chestabala.txt; without them
+    the old per-planet constants are used. planet_speeds only feeds the retrograde flags.
+    Ishta/Kashta Phala (Reference/KashataPhala) are derived from the same Uchcha and Chesta Bala.
+    Dict front end of _shadbala_from_arrays; bodies missing from planets_sidereal become NaN.
+    """
+    longitudes = np.array([planets_sidereal.get(body, np.nan) for body in CHART_BODIES], dtype=np.float64)
+    speeds = None
+    if planet_speeds is not None:
+        speeds = np.array([planet_speeds.get(body, 0.0) for body in CHART_BODIES], dtype=np.float64)
+    cusps = np.array([cusps_map[house] for house in range(1, 13)], dtype=np.float64)
+    return _shadbala_from_arrays(longitudes, cusps, birth_dt_local, lat, lon, speeds, jd_ut, ayanamsa_value)
+
+
+def _shadbala_fixed_terms(longitudes: np.ndarray, birth_dt_local: datetime, lat: float, lon: float,
+                          jd_ut: Optional[float] = None, ayanamsa_value: Optional[float] = None) -> Dict[str, Any]:
+    """Shadbala terms that do not depend on the cusps, for longitudes in CHART_BODIES order (NaN if missing).
+
+    Per planet: Uchcha, Kala (before Yuddha), Chesta, Naisargika and Drik Bala; also the
+    planetary wars and the Drik analysis. House-system variants reuse them unchanged.
+    """
+    lons = np.asarray(longitudes, dtype=np.float64)
+    planets_sidereal = {body: lonv for body, lonv in zip(CHART_BODIES, lons.tolist()) if not math.isnan(lonv)}
+    maitri_lons = lons[:len(MAITRI_PLANETS)]
+    uchcha_values = uchcha_bala_batch(maitri_lons).tolist()
+    chesta_values = None
+    if jd_ut is not None and ayanamsa_value is not None:
+        chesta_values = chesta_bala_batch(maitri_lons, jd_ut, ayanamsa_value).tolist()
+    
+    # Drik Bala for all planets from one Drishti matrix
+    drik_analysis = DrikBalaCalculator().calculate_drik_bala(planets_sidereal)
+    
+    terms = {}
+    for i, planet_name in enumerate(MAITRI_PLANETS):
+        if planet_name not in planets_sidereal:
+            continue
+        terms[planet_name] = {
+            'uchcha': uchcha_values[i],
+            'kala': _calculate_kala_bala(planet_name, birth_dt_local, lat, lon, planets_sidereal),
+            'chesta': chesta_values[i] if chesta_values is not None else _calculate_chesta_bala(planet_name),
+            'naisargika': SHADBALA_CONSTANTS['naisargika_bala'][planet_name],
+            'drik': drik_analysis['drik_bala'][planet_name],
+        }
+    
+    planetary_wars = []
+    if all(planet in planets_sidereal for planet in YUDDHA_PLANETS):
+        planetary_wars = find_planetary_wars(planets_sidereal)
+    return {'planets_sidereal': planets_sidereal, 'planets': terms, 'planetary_wars': planetary_wars,
+            'drik_analysis': drik_analysis}
+
+
+def _shadbala_strengths(fixed: Dict[str, Any], cusps: np.ndarray) -> Tuple[Dict[str, Dict[str, float]],
+                                                                            List[Dict[str, Any]]]:
+    """Cusp-dependent Shadbala for one set of 12 cusps on top of _shadbala_fixed_terms.
+
+    Kendra Bala (and so Sthana Bala) and Dig Bala follow the cusps, and Yuddha Bala weighs
+    Sthana + Dig + Kala Bala, so those and the totals are redone here. Returns per-planet
+    strengths and a copy of the planetary wars carrying this pass's Yuddha Bala.
+    """
+    planets_sidereal = fixed['planets_sidereal']
+    cusps = np.asarray(cusps, dtype=np.float64)
+    cusps_map = {house + 1: cusp for house, cusp in enumerate(cusps.tolist())}
+    maitri_lons = np.array([planets_sidereal.get(planet, np.nan) for planet in MAITRI_PLANETS], dtype=np.float64)
+    houses = house_indices(maitri_lons, cusps).tolist()
+    dig_values = dig_bala_batch(maitri_lons, cusps).tolist()
+    
+    strengths = {}
+    for planet_name, terms in fixed['planets'].items():
+        i = MAITRI_PLANETS.index(planet_name)
+        planet_lon = planets_sidereal[planet_name]
+        strengths[planet_name] = {
+            'house': houses[i],
+            'sthana': _calculate_sthana_bala(planet_name, planet_lon, _sign_index(planet_lon), cusps_map,
+                                             terms['uchcha'], planet_house=houses[i]),
+            'dig': dig_values[i],
+        }
+    
+    # Yuddha Bala: strength up to Hora Bala excludes Ayana Bala
+    planetary_wars = [dict(war) for war in fixed['planetary_wars']]
+    war_strengths = {}
+    for war in planetary_wars:
+        for planet_name in (war['winner'], war['loser']):
+            ayana = _calculate_ayana_bala(planet_name, planets_sidereal[planet_name])
+            war_strengths[planet_name] = (strengths[planet_name]['sthana'] + strengths[planet_name]['dig']
+                                          + fixed['planets'][planet_name]['kala'] - ayana)
+    yuddha_adjustments = _calculate_yuddha_bala(planetary_wars, war_strengths)
+    
+    for planet_name, strength in strengths.items():
+        terms = fixed['planets'][planet_name]
+        strength['yuddha'] = yuddha_adjustments.get(planet_name, 0.0)
+        strength['kala'] = terms['kala'] + strength['yuddha']
+        strength['total'] = (strength['sthana'] + strength['dig'] + strength['kala'] + terms['chesta']
+                             + terms['naisargika'] + terms['drik'])
+    return strengths, planetary_wars
+
+
+def _shadbala_from_arrays(longitudes: np.ndarray, cusps: np.ndarray, birth_dt_local: datetime, lat: float,
+                          lon: float, speeds: Optional[np.ndarray] = None, jd_ut: Optional[float] = None,
+                          ayanamsa_value: Optional[float] = None,
+                          fixed: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Shadbala from body longitudes (CHART_BODIES order, NaN for a missing body) and the 12 cusps.
+
+    The cusp-independent terms come from _shadbala_fixed_terms (pass ``fixed`` to reuse them)
+    and _shadbala_strengths adds the cusp-dependent ones; the rule-table analyses
+    (Saptavargiya, Yugmayugma, Dreshkon, ...) get the dict view.
+    """
+    if fixed is None:
+        fixed = _shadbala_fixed_terms(longitudes, birth_dt_local, lat, lon, jd_ut, ayanamsa_value)
+    planets_sidereal = fixed['planets_sidereal']
+    cusps_map = {house + 1: cusp for house, cusp in enumerate(np.asarray(cusps, dtype=np.float64).tolist())}
+    retrograde = [speeds is not None and bool(speeds[i] < 0) for i in range(len(MAITRI_PLANETS))]
+    strengths, planetary_wars = _shadbala_strengths(fixed, cusps)
+    drik_analysis = fixed['drik_analysis']
     
     # Calculate comprehensive SaptavarigiyaBala analysis
     saptavargiya_calculator = SaptavarigiyaBalaCalculator()
     saptavargiya_analysis = saptavargiya_calculator.calculate_saptavargiya_bala(planets_sidereal)
     
     shadbala_scores = {}
-    
-    for planet_name in ['Sun', 'Moon', 'Mars', 'Mercury', 'Jupiter', 'Venus', 'Saturn']:
-        if planet_name not in planets_sidereal:
-            continue
-            
+    for planet_name, terms in fixed['planets'].items():
         planet_lon = planets_sidereal[planet_name]
         planet_sign = _sign_index(planet_lon)
         
-        # Initialize strength components
-        sthana_bala = _calculate_sthana_bala(planet_name, planet_lon, planet_sign, cusps_map)
-        dig_bala = _calculate_dig_bala(planet_name, planet_lon, cusps_map)
-        kala_bala = _calculate_kala_bala(planet_name, birth_dt_local, lat, lon, planets_sidereal)
-        chesta_bala = _calculate_chesta_bala(planet_name)
-        naisargika_bala = SHADBALA_CONSTANTS['naisargika_bala'][planet_name]
-        drik_bala = _calculate_drik_bala(planet_name, planets_sidereal)
+        # Strength components
+        strength = strengths[planet_name]
+        uchcha_bala, chesta_bala = terms['uchcha'], terms['chesta']
+        sthana_bala, dig_bala, kala_bala = strength['sthana'], strength['dig'], strength['kala']
+        yuddha_bala = strength['yuddha']
+        naisargika_bala = terms['naisargika']
+        drik_bala = terms['drik']
         
         # Total Shadbala
-        total_shadbala = sthana_bala + dig_bala + kala_bala + chesta_bala + naisargika_bala + drik_bala
+        total_shadbala = strength['total']
         
         # Calculate strength percentage
         required_strength = SHADBALA_CONSTANTS['minimum_required'][planet_name]
@@ -1900,13 +3255,23 @@ def _calculate_shadbala(planets_sidereal: Dict[str, float], cusps_map: Dict[int,
             category = "Weak"
         
         # Get detailed Sthana Bala breakdown including UchchaBala and SaptavarigiyaBala
-        sthana_bala_details = _calculate_sthana_bala_detailed(planet_name, planet_lon, planet_sign, cusps_map, saptavargiya_analysis)
+        sthana_bala_details = _calculate_sthana_bala_detailed(planet_name, planet_lon, planet_sign, cusps_map,
+                                                              saptavargiya_analysis, uchcha_bala,
+                                                              planet_house=strength['house'])
+        
+        # Ishta/Kashta Phala from the Uchcha and Chesta Bala above
+        ishta_phala, kashta_phala = (float(v) for v in ishta_kashta_phala(uchcha_bala, chesta_bala))
         
         shadbala_scores[planet_name] = {
             'total_shadbala': round(total_shadbala, 2),
             'required_strength': required_strength,
             'strength_percentage': round(strength_percentage, 1),
             'category': category,
+            'is_retrograde': retrograde[MAITRI_PLANETS.index(planet_name)],
+            'yuddha_bala': round(yuddha_bala, 2),
+            'ishta_phala': round(ishta_phala, 2),
+            'kashta_phala': round(kashta_phala, 2),
+            'phala_nature': 'Ishta' if ishta_phala > kashta_phala else 'Kashta',
             'components': {
                 'sthana_bala': round(sthana_bala, 2),
                 'dig_bala': round(dig_bala, 2),
@@ -1936,33 +3301,45 @@ def _calculate_shadbala(planets_sidereal: Dict[str, float], cusps_map: Dict[int,
     dreshkon_calculator = DreshkonBalaCalculator()
     dreshkon_analysis = dreshkon_calculator.calculate_dreshkon_bala(planets_sidereal)
     
+    # Calculate Vimshopaka Bala for all four schemes
+    vimshopaka_calculator = VimshopakaBalaCalculator()
+    vimshopaka_analysis = vimshopaka_calculator.calculate_vimshopaka_bala(planets_sidereal)
+    
     # Add comprehensive analysis to the result
     result = {
         'shadbala_scores': shadbala_scores,
         '_saptavargiya_analysis': saptavargiya_analysis,
         '_yugmayugma_analysis': yugmayugma_analysis,
         '_kendra_analysis': kendra_analysis,
-        '_dreshkon_analysis': dreshkon_analysis
+        '_dreshkon_analysis': dreshkon_analysis,
+        '_vimshopaka_analysis': vimshopaka_analysis,
+        '_drik_analysis': drik_analysis,
+        'planetary_wars': planetary_wars
     }
     
     return result
 
 
-def _calculate_sthana_bala(planet_name: str, planet_lon: float, planet_sign: int, cusps_map: Dict[int, float]) -> float:
-    """Calculate Sthana Bala (Positional Strength) - Traditional Shadbala max ~120 points."""
+def _calculate_uchcha_bala(planet_name: str, planet_lon: float) -> float:
+    """Uchcha Bala (Exaltation/Debilitation strength) - Max 60 shashtiamsas.
     
-    # Uchcha Bala (Exaltation/Debilitation strength) - Max 60 shashtiamsas
-    # Formula: (Planet_Longitude - Debilitation_Point) / 3
-    # If difference > 180°, use (360 - difference) / 3
+    Formula: (Planet_Longitude - Debilitation_Point) / 3, using 360 - difference when the
+    difference exceeds 180 degrees.
+    """
     debilitation_degree = SHADBALA_CONSTANTS['uchcha_bala_data'][planet_name]['debilitation_degree']
-    
-    # Calculate distance from debilitation point
     distance_from_debilitation = abs(planet_lon - debilitation_degree)
     if distance_from_debilitation > 180:
         distance_from_debilitation = 360 - distance_from_debilitation
+    return distance_from_debilitation / 3
+
+
+def _calculate_sthana_bala(planet_name: str, planet_lon: float, planet_sign: int, cusps_map: Dict[int, float],
+                           uchcha_bala: Optional[float] = None, planet_house: Optional[int] = None) -> float:
+    """Calculate Sthana Bala (Positional Strength) - Traditional Shadbala max ~120 points."""
     
-    # UchchaBala = distance_from_debilitation / 3 (classical formula)
-    uchcha_bala = distance_from_debilitation / 3
+    # Uchcha Bala (Exaltation/Debilitation strength) - Max 60 shashtiamsas
+    if uchcha_bala is None:
+        uchcha_bala = _calculate_uchcha_bala(planet_name, planet_lon)
     
     # Saptavargaja Bala - For calculation within _calculate_sthana_bala, use simplified version
     # (The comprehensive SaptavarigiyaBala is calculated separately and included in analysis)
@@ -1975,7 +3352,8 @@ def _calculate_sthana_bala(planet_name: str, planet_lon: float, planet_sign: int
     ojayugma_bala = 15 if (is_odd_planet and is_odd_sign) or (not is_odd_planet and not is_odd_sign) else 0
     
     # Kendra Bala (Angular house strength) - Max 30 points  
-    planet_house = _get_planet_house(planet_lon, cusps_map)
+    if planet_house is None:
+        planet_house = _get_planet_house(planet_lon, cusps_map)
     if planet_house in [1, 4, 7, 10]:
         kendra_bala = 30  # Angular houses
     elif planet_house in [2, 5, 8, 11]:
@@ -1996,15 +3374,13 @@ def _calculate_sthana_bala(planet_name: str, planet_lon: float, planet_sign: int
     return min(total_sthana, 120)  # Cap at traditional maximum
 
 
-def _calculate_sthana_bala_detailed(planet_name: str, planet_lon: float, planet_sign: int, cusps_map: Dict[int, float], saptavargiya_analysis: Dict[str, Any]) -> Dict[str, float]:
+def _calculate_sthana_bala_detailed(planet_name: str, planet_lon: float, planet_sign: int, cusps_map: Dict[int, float], saptavargiya_analysis: Dict[str, Any],
+                                    uchcha_bala: Optional[float] = None, planet_house: Optional[int] = None) -> Dict[str, float]:
     """Calculate detailed breakdown of Sthana Bala components for display."""
     
     # UchchaBala - Distance from debilitation point method (classical)
-    debilitation_degree = SHADBALA_CONSTANTS['uchcha_bala_data'][planet_name]['debilitation_degree']
-    distance_from_debilitation = abs(planet_lon - debilitation_degree)
-    if distance_from_debilitation > 180:
-        distance_from_debilitation = 360 - distance_from_debilitation
-    uchcha_bala = distance_from_debilitation / 3
+    if uchcha_bala is None:
+        uchcha_bala = _calculate_uchcha_bala(planet_name, planet_lon)
     
     # SaptavarigiyaBala - Use comprehensive calculation from SaptavarigiyaBalaCalculator
     saptavargaja_bala = saptavargiya_analysis.get('planet_totals', {}).get(planet_name, 0)
@@ -2015,7 +3391,8 @@ def _calculate_sthana_bala_detailed(planet_name: str, planet_lon: float, planet_
     ojayugma_bala = 15 if (is_odd_planet and is_odd_sign) or (not is_odd_planet and not is_odd_sign) else 0
     
     # Kendra Bala
-    planet_house = _get_planet_house(planet_lon, cusps_map)
+    if planet_house is None:
+        planet_house = _get_planet_house(planet_lon, cusps_map)
     if planet_house in [1, 4, 7, 10]:
         kendra_bala = 30
     elif planet_house in [2, 5, 8, 11]:
@@ -2241,7 +3618,7 @@ def _calculate_kala_bala(planet_name: str, birth_dt_local: datetime, lat: float,
     ayana_bala = _calculate_ayana_bala(planet_name, planets_sidereal.get(planet_name, 0) if planets_sidereal else 0)
     
     # 9. YUDDHA BALA (Planetary War Strength) - Variable
-    yuddha_bala = 0  # Will be calculated separately for conjunct planets
+    yuddha_bala = 0  # Needs every warring planet's strength; _calculate_shadbala adds it
     
     # Sum all components
     total_kala_bala = (nathonnatha_bala + paksha_bala + tribhaga_bala + 
@@ -2251,8 +3628,16 @@ def _calculate_kala_bala(planet_name: str, birth_dt_local: datetime, lat: float,
     return round(total_kala_bala, 2)
 
 
-def _calculate_chesta_bala(planet_name: str) -> float:
-    """Calculate Chesta Bala (Motional Strength) - Max 60 points."""
+def _calculate_chesta_bala(planet_name: str, planets_sidereal: Optional[Dict[str, float]] = None,
+                           jd_ut: Optional[float] = None, ayanamsa_value: Optional[float] = None) -> float:
+    """Calculate Chesta Bala (Motional Strength) - Max 60 points.
+    
+    With positions, jd_ut and ayanamsa_value this is one column of chesta_bala_batch; planets
+    missing from planets_sidereal are passed as NaN.
+    """
+    if planets_sidereal is not None and jd_ut is not None and ayanamsa_value is not None:
+        lons = np.array([planets_sidereal.get(planet, np.nan) for planet in MAITRI_PLANETS], dtype=np.float64)
+        return float(_chesta_bala_column(planet_name, lons, _chesta_mean_longitudes(float(jd_ut)), ayanamsa_value))
     
     # Simplified motional strength based on planetary characteristics
     if planet_name == 'Sun':
@@ -2274,56 +3659,20 @@ def _calculate_chesta_bala(planet_name: str) -> float:
 
 
 def _calculate_drik_bala(planet_name: str, planets_sidereal: Dict[str, float]) -> float:
-    """Calculate Drik Bala (Aspectual Strength) - Max ~30 points."""
-    
-    planet_lon = planets_sidereal[planet_name]
-    drik_strength = 15  # Base neutral strength
-    
-    # Check aspects from other planets
-    for other_planet, other_lon in planets_sidereal.items():
-        if other_planet == planet_name or other_planet in ['Rahu', 'Ketu']:
-            continue
-        
-        # Calculate angular distance
-        angular_distance = abs(planet_lon - other_lon)
-        if angular_distance > 180:
-            angular_distance = 360 - angular_distance
-        
-        # Check for major aspects with smaller influence
-        if angular_distance <= 8:  # Conjunction (tighter orb)
-            if other_planet in ['Jupiter', 'Venus']:
-                drik_strength += 5  # Benefic conjunction
-            else:
-                drik_strength -= 3  # Malefic conjunction
-        elif 112 <= angular_distance <= 128:  # Trine (120°)
-            if other_planet in ['Jupiter', 'Venus']:
-                drik_strength += 3  # Benefic trine
-            else:
-                drik_strength += 1  # Even malefic trines help slightly
-        elif 172 <= angular_distance <= 188:  # Opposition (180°)
-            drik_strength -= 2  # Opposition generally challenging
-        elif 82 <= angular_distance <= 98:  # Square (90°)
-            drik_strength -= 1  # Square creates tension
-    
-    return max(0, min(drik_strength, 30))  # Keep between 0-30
+    """Calculate Drik Bala (Aspectual Strength) per Reference/DRIKBALA - one fourth of the Drishti Pinda."""
+    return DrikBalaCalculator().calculate_drik_bala(planets_sidereal)['drik_bala'][planet_name]
 
 
 def _calculate_divisional_charts(planets_sidereal: Dict[str, float], asc_sid: float) -> Dict[str, Any]:
     """Calculate all divisional charts for planets and Lagna."""
-    
-    # Prepare base positions in required format: (sign_index [0-11], degree_in_sign [0-30])
-    base_positions = {}
-    
-    # Add Lagna
-    base_positions['Lagna'] = (_sign_index(asc_sid), _deg_in_sign(asc_sid))
-    
-    # Add all planets
-    for planet_name, longitude in planets_sidereal.items():
-        base_positions[planet_name] = (_sign_index(longitude), _deg_in_sign(longitude))
-    
-    # Calculate all divisional charts
+    return _divisional_charts(['Lagna'] + list(planets_sidereal),
+                              np.array([asc_sid] + list(planets_sidereal.values()), dtype=np.float64))
+
+
+def _divisional_charts(bodies: List[str], longitudes: np.ndarray) -> Dict[str, Any]:
+    """All divisional charts for bodies (the Lagna included) given as sidereal longitudes."""
     calculator = DivisionalChartCalculator()
-    all_charts = calculator.get_all_charts(base_positions)
+    all_charts = calculator.get_all_charts_from_longitudes(bodies, longitudes)
     
     # Create chart-by-house format for UI display (similar to main chart)
     charts_by_house = {}
@@ -0,0 +1,196 @@
+"""Ashtakoota (Guna Milan) compatibility scoring from precomputed Moon-position tables.
+
+Every koota depends only on the Moon's nakshatra or sign. A nakshatra pada (3 deg 20 min)
+never straddles a sign boundary, so the 108 padas fix both, and each koota is a 108 x 108
+table indexed [boy pada, girl pada]. The tables are built once at import; scoring N boys
+against M girls is a single fancy-indexing lookup into the (108, 108) total table.
+
+Moon positions for a batch of births come from the Moon-only column of the fast ephemeris
+table (one vectorized query), falling back to one Swiss Ephemeris Moon call per birth.
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Any, List, Optional, Sequence
+
+import numpy as np
+
+from .core import (
+    MAITRI_PLANETS, NAISARGIKA_MATRIX, NAKSHATRA_NAMES, NAK_LEN_DEG, SIGN_LORD_INDEX, ZODIAC_SIGNS,
+    _julday, _sidereal_longitude_series,
+)
+
+PADA_LEN_DEG = NAK_LEN_DEG / 4.0
+PADA_COUNT = 108
+
+KOOTAS = ['Varna', 'Vashya', 'Tara', 'Yoni', 'Graha Maitri', 'Gana', 'Bhakoot', 'Nadi']
+KOOTA_MAX_POINTS = {'Varna': 1, 'Vashya': 2, 'Tara': 3, 'Yoni': 4, 'Graha Maitri': 5,
+                    'Gana': 6, 'Bhakoot': 7, 'Nadi': 8}
+
+# Varna by Moon sign: 4 Brahmin, 3 Kshatriya, 2 Vaishya, 1 Shudra
+VARNA_BY_SIGN = [3, 2, 1, 4, 3, 2, 1, 4, 3, 2, 1, 4]
+
+# Vashya: signs each sign holds under control (Aries controls Leo and Scorpio, ...)
+VASHYA_SIGNS = {
+    0: [4, 7], 1: [3, 6], 2: [5], 3: [7, 8], 4: [6], 5: [11, 2],
+    6: [9, 5], 7: [3], 8: [11], 9: [0, 10], 10: [0], 11: [9],
+}
+
+# Tara: count from one nakshatra to the other, remainder mod 9; these are inauspicious
+INAUSPICIOUS_TARAS = {3, 5, 7}
+
+YONI_ANIMALS = ['Horse', 'Elephant', 'Sheep', 'Serpent', 'Dog', 'Cat', 'Rat', 'Cow',
+                'Buffalo', 'Tiger', 'Deer', 'Monkey', 'Mongoose', 'Lion']
+YONI_BY_NAKSHATRA = [0, 1, 2, 3, 3, 4, 5, 2, 5, 6, 6, 7, 8, 9, 8, 9, 10, 10, 4, 11, 12, 11, 13, 0, 13, 7, 1]
+YONI_POINTS = np.array([
+    [4, 2, 2, 3, 2, 2, 2, 1, 0, 1, 3, 3, 2, 1],
+    [2, 4, 3, 3, 2, 2, 2, 2, 3, 1, 2, 3, 2, 0],
+    [2, 3, 4, 2, 1, 2, 1, 3, 3, 1, 2, 0, 3, 1],
+    [3, 3, 2, 4, 2, 1, 1, 1, 1, 2, 2, 2, 0, 2],
+    [2, 2, 1, 2, 4, 2, 1, 2, 2, 1, 0, 2, 1, 1],
+    [2, 2, 2, 1, 2, 4, 0, 2, 2, 1, 3, 3, 2, 1],
+    [2, 2, 1, 1, 1, 0, 4, 2, 2, 2, 2, 2, 1, 2],
+    [1, 2, 3, 1, 2, 2, 2, 4, 3, 0, 3, 2, 2, 1],
+    [0, 3, 3, 1, 2, 2, 2, 3, 4, 1, 2, 2, 2, 1],
+    [1, 1, 1, 2, 1, 1, 2, 0, 1, 4, 1, 1, 2, 1],
+    [3, 2, 2, 2, 0, 3, 2, 3, 2, 1, 4, 2, 2, 1],
+    [3, 3, 0, 2, 2, 3, 2, 2, 2, 1, 2, 4, 3, 2],
+    [2, 2, 3, 0, 1, 2, 1, 2, 2, 2, 2, 3, 4, 2],
+    [1, 0, 1, 2, 1, 1, 2, 1, 1, 1, 1, 2, 2, 4],
+])
+
+# Graha Maitri: points by (boy's lord -> girl's lord, girl's lord -> boy's lord) naisargika
+# codes (0 friend, 1 neutral, 2 enemy); the same lord scores the full 5
+GRAHA_MAITRI_POINTS = np.array([[5, 4, 1], [4, 3, 0.5], [1, 0.5, 0]])
+
+GANAS = ['Deva', 'Manushya', 'Rakshasa']
+GANA_BY_NAKSHATRA = [0, 1, 2, 1, 0, 1, 0, 0, 2, 2, 1, 1, 0, 2, 0, 2, 0, 2, 2, 1, 1, 0, 2, 2, 1, 1, 0]
+GANA_POINTS = np.array([[6, 5, 1], [6, 6, 0], [0, 0, 6]])  # [boy gana, girl gana]
+
+# Bhakoot: sign counts 2/12, 5/9 and 6/8 between the Moon signs score nothing
+INAUSPICIOUS_BHAKOOT = {1, 11, 4, 8, 5, 7}  # sign offsets (count - 1)
+
+NADIS = ['Adi', 'Madhya', 'Antya']
+NADI_BY_NAKSHATRA = [[0, 1, 2, 2, 1, 0][n % 6] for n in range(27)]
+
+
+def _build_koota_tables() -> Dict[str, np.ndarray]:
+    pada = np.arange(PADA_COUNT)
+    nak = pada // 4
+    sign = pada // 9  # nine padas per sign
+    boy_nak, girl_nak = nak[:, None], nak[None, :]
+    boy_sign, girl_sign = sign[:, None], sign[None, :]
+
+    varna = np.array(VARNA_BY_SIGN)
+    vashya_matrix = np.zeros((12, 12))
+    for a in range(12):
+        for b in range(12):
+            if a == b or (b in VASHYA_SIGNS[a] and a in VASHYA_SIGNS[b]):
+                vashya_matrix[a, b] = 2
+            elif b in VASHYA_SIGNS[a] or a in VASHYA_SIGNS[b]:
+                vashya_matrix[a, b] = 1
+
+    def tara_ok(start, end):
+        return ~np.isin(((end - start) % 27 + 1) % 9, list(INAUSPICIOUS_TARAS))
+
+    boy_lord, girl_lord = SIGN_LORD_INDEX[boy_sign], SIGN_LORD_INDEX[girl_sign]
+    maitri = GRAHA_MAITRI_POINTS[np.maximum(NAISARGIKA_MATRIX[boy_lord, girl_lord], 0),
+                                 np.maximum(NAISARGIKA_MATRIX[girl_lord, boy_lord], 0)]
+    yoni = np.array(YONI_BY_NAKSHATRA)
+    gana = np.array(GANA_BY_NAKSHATRA)
+    nadi = np.array(NADI_BY_NAKSHATRA)
+
+    shape = (PADA_COUNT, PADA_COUNT)
+    tables = {
+        'Varna': np.broadcast_to(varna[boy_sign] >= varna[girl_sign], shape).astype(np.float32),
+        'Vashya': vashya_matrix[boy_sign, girl_sign],
+        'Tara': 1.5 * tara_ok(girl_nak, boy_nak) + 1.5 * tara_ok(boy_nak, girl_nak),
+        'Yoni': YONI_POINTS[yoni[boy_nak], yoni[girl_nak]],
+        'Graha Maitri': np.where(boy_lord == girl_lord, 5.0, maitri),
+        'Gana': GANA_POINTS[gana[boy_nak], gana[girl_nak]],
+        'Bhakoot': np.where(np.isin((boy_sign - girl_sign) % 12, list(INAUSPICIOUS_BHAKOOT)), 0.0, 7.0),
+        'Nadi': np.where(nadi[boy_nak] == nadi[girl_nak], 0.0, 8.0),
+    }
+    return {name: np.ascontiguousarray(np.broadcast_to(table, shape), dtype=np.float32)
+            for name, table in tables.items()}
+
+
+KOOTA_TABLES = _build_koota_tables()
+GUNA_MILAN_TABLE = sum(KOOTA_TABLES[name] for name in KOOTAS)
+
+
+def moon_pada_index(moon_longitude) -> np.ndarray:
+    """Nakshatra pada index (0-107) for sidereal Moon longitudes of any shape."""
+    lon = np.mod(np.asarray(moon_longitude, dtype=np.float64), 360.0)
+    return np.minimum((lon // PADA_LEN_DEG).astype(np.int64), PADA_COUNT - 1)
+
+
+def moon_longitudes(birth_dts_local: Sequence[datetime], tz_offsets_hours: Sequence[float],
+                    ayanamsa: str = 'lahiri', ephemeris: str = 'fast') -> np.ndarray:
+    """Sidereal Moon longitudes for many births, without building charts."""
+    jds = np.array([
+        _julday((dt - timedelta(hours=tz)).replace(tzinfo=timezone.utc))
+        for dt, tz in zip(birth_dts_local, tz_offsets_hours)
+    ], dtype=np.float64)
+    return _sidereal_longitude_series(jds, ['Moon'], ayanamsa, ephemeris)[:, 0]
+
+
+def guna_milan_scores(boy_padas, girl_padas, koota: Optional[str] = None) -> np.ndarray:
+    """Guna Milan totals (out of 36) for every boy x girl pair, shaped (N, M).
+
+    Pass pada indices from moon_pada_index. With ``koota`` set, returns that koota's points.
+    """
+    table = GUNA_MILAN_TABLE if koota is None else KOOTA_TABLES[koota]
+    boys = np.atleast_1d(np.asarray(boy_padas, dtype=np.int64))
+    girls = np.atleast_1d(np.asarray(girl_padas, dtype=np.int64))
+    return table[boys[:, None], girls[None, :]]
+
+
+def _moon_profile(pada: int) -> Dict[str, Any]:
+    nak = pada // 4
+    sign = pada // 9
+    return {
+        'nakshatra': NAKSHATRA_NAMES[nak],
+        'pada': pada % 4 + 1,
+        'sign': ZODIAC_SIGNS[sign],
+        'sign_lord': MAITRI_PLANETS[SIGN_LORD_INDEX[sign]],
+        'yoni': YONI_ANIMALS[YONI_BY_NAKSHATRA[nak]],
+        'gana': GANAS[GANA_BY_NAKSHATRA[nak]],
+        'nadi': NADIS[NADI_BY_NAKSHATRA[nak]],
+    }
+
+
+def calculate_guna_milan(boy_moon_longitude: float, girl_moon_longitude: float) -> Dict[str, Any]:
+    """Koota-by-koota Guna Milan for one couple from their sidereal Moon longitudes."""
+    boy, girl = int(moon_pada_index(boy_moon_longitude)), int(moon_pada_index(girl_moon_longitude))
+    kootas = {name: {'points': float(KOOTA_TABLES[name][boy, girl]), 'max_points': KOOTA_MAX_POINTS[name]}
+              for name in KOOTAS}
+    total = float(GUNA_MILAN_TABLE[boy, girl])
+    if total >= 28:
+        verdict = 'Excellent'
+    elif total >= 24:
+        verdict = 'Very Good'
+    elif total >= 18:
+        verdict = 'Acceptable'
+    else:
+        verdict = 'Not Recommended'
+    return {
+        'boy': _moon_profile(boy),
+        'girl': _moon_profile(girl),
+        'kootas': kootas,
+        'total_points': total,
+        'max_points': 36,
+        'verdict': verdict,
+        'nadi_dosha': kootas['Nadi']['points'] == 0,
+        'bhakoot_dosha': kootas['Bhakoot']['points'] == 0,
+    }
+
+
+def rank_candidates(moon_longitude: float, candidate_moon_longitudes, is_boy: bool = True,
+                    top: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Score one profile against many candidates and return them best first."""
+    profile = moon_pada_index([moon_longitude])
+    candidates = moon_pada_index(candidate_moon_longitudes)
+    scores = (guna_milan_scores(profile, candidates)[0] if is_boy
+              else guna_milan_scores(candidates, profile)[:, 0])
+    order = np.argsort(-scores, kind='stable')[:top]
+    return [{'index': int(i), 'total_points': float(scores[i])} for i in order]
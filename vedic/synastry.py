@@ -0,0 +1,148 @@
+"""Synastry (inter-chart aspects and house overlays) and composite charts for groups of charts.
+
+Charts are reduced to a compact form: sidereal longitudes of the nine bodies and the twelve
+cusps, taken from ``compute_chart`` output, so no ephemeris work is repeated. For a group of
+K charts every quantity is computed for all K x K ordered pairs at once:
+
+* ``separation[a, b, i, j]``: angle from body i of chart a to body j of chart b (0-180)
+* ``aspects[a, b, i, j]``: index into SYNASTRY_ASPECTS of the closest aspect within orb, or -1
+* ``overlays[a, b, i]``: house of chart b's cusps that body i of chart a falls in
+
+House lookup uses a cusp index built once per chart (cusps unrolled from the 1st cusp), the
+same start-inclusive boundaries as ``_get_planet_house``.
+"""
+
+from typing import Dict, Any, List, Optional, Sequence
+
+import numpy as np
+
+from .core import ZODIAC_SIGNS, _sign_index
+
+SYNASTRY_BODIES = ['Sun', 'Moon', 'Mars', 'Mercury', 'Jupiter', 'Venus', 'Saturn', 'Rahu', 'Ketu']
+
+# Aspect name, exact angle and default orb in degrees
+SYNASTRY_ASPECTS = [
+    ('Conjunction', 0.0, 8.0),
+    ('Sextile', 60.0, 6.0),
+    ('Square', 90.0, 7.0),
+    ('Trine', 120.0, 8.0),
+    ('Opposition', 180.0, 8.0),
+]
+_ASPECT_ANGLES = np.array([angle for _, angle, _ in SYNASTRY_ASPECTS])
+_ASPECT_ORBS = np.array([orb for _, _, orb in SYNASTRY_ASPECTS])
+
+
+def compact_charts(charts: Sequence[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    """Stack compute_chart outputs into (K, 9) body longitudes and (K, 12) cusps."""
+    return {
+        'planets': np.array([[chart['planets'][body]['longitude'] for body in SYNASTRY_BODIES]
+                             for chart in charts], dtype=np.float64),
+        'cusps': np.array([[chart['houses'][str(house)] for house in range(1, 13)]
+                           for chart in charts], dtype=np.float64),
+    }
+
+
+def cusp_index(cusps) -> np.ndarray:
+    """Cusps shaped (K, 12) unrolled to offsets from each chart's 1st cusp (non-decreasing)."""
+    cusps = np.atleast_2d(np.asarray(cusps, dtype=np.float64))
+    return np.mod(cusps - cusps[:, :1], 360.0)
+
+
+def house_overlays(planets, cusps, index: Optional[np.ndarray] = None) -> np.ndarray:
+    """House (1-12) of every chart's bodies in every chart's houses, shaped (K, K, P).
+
+    ``planets`` is (K, P) and ``cusps`` (K, 12); entry [a, b, i] places body i of chart a in
+    the houses of chart b, so the diagonal is each chart's own house placement.
+    """
+    planets = np.atleast_2d(np.asarray(planets, dtype=np.float64))
+    cusps = np.atleast_2d(np.asarray(cusps, dtype=np.float64))
+    index = cusp_index(cusps) if index is None else index
+    overlays = np.empty((planets.shape[0], cusps.shape[0], planets.shape[1]), dtype=np.int8)
+    for b in range(cusps.shape[0]):
+        # Every chart's bodies against chart b's cusps in one search
+        offsets = np.mod(planets - cusps[b, 0], 360.0)
+        overlays[:, b, :] = np.searchsorted(index[b], offsets, side='right')
+    return overlays
+
+
+def cross_aspects(planets_a, planets_b, orb_scale: float = 1.0) -> Dict[str, np.ndarray]:
+    """Aspects from every body of each chart in ``planets_a`` (K, P) to each in ``planets_b`` (L, Q).
+
+    Returns ``separation`` (K, L, P, Q) in degrees and ``aspects`` (same shape, int8) holding
+    the SYNASTRY_ASPECTS index of the tightest aspect within orb, -1 where there is none, and
+    ``orb`` the distance from exact for that aspect.
+    """
+    a = np.atleast_2d(np.asarray(planets_a, dtype=np.float64))
+    b = np.atleast_2d(np.asarray(planets_b, dtype=np.float64))
+    diff = b[None, :, None, :] - a[:, None, :, None]
+    separation = np.abs(np.mod(diff + 180.0, 360.0) - 180.0)
+    distance = np.abs(separation[..., None] - _ASPECT_ANGLES)
+    closest = np.argmin(distance, axis=-1)
+    orb = np.take_along_axis(distance, closest[..., None], axis=-1)[..., 0]
+    within = orb <= _ASPECT_ORBS[closest] * orb_scale
+    return {
+        'separation': separation,
+        'aspects': np.where(within, closest, -1).astype(np.int8),
+        'orb': orb,
+    }
+
+
+def _midpoints(a, b) -> np.ndarray:
+    """Midpoint of the shorter arc between longitudes a and b."""
+    return np.mod(a + (np.mod(b - a + 180.0, 360.0) - 180.0) / 2.0, 360.0)
+
+
+def composite_positions(planets, cusps) -> Dict[str, np.ndarray]:
+    """Midpoint composite bodies (K, K, P) and cusps (K, K, 12) for every pair of charts."""
+    planets = np.atleast_2d(np.asarray(planets, dtype=np.float64))
+    cusps = np.atleast_2d(np.asarray(cusps, dtype=np.float64))
+    return {
+        'planets': _midpoints(planets[:, None, :], planets[None, :, :]),
+        'cusps': _midpoints(cusps[:, None, :], cusps[None, :, :]),
+    }
+
+
+def synastry_batch(charts: Sequence[Dict[str, Any]], orb_scale: float = 1.0) -> Dict[str, np.ndarray]:
+    """All K x K cross-aspects, house overlays and composite positions for a group of charts."""
+    compact = compact_charts(charts)
+    aspects = cross_aspects(compact['planets'], compact['planets'], orb_scale)
+    return {
+        'bodies': SYNASTRY_BODIES,
+        'separation': aspects['separation'],
+        'aspects': aspects['aspects'],
+        'orb': aspects['orb'],
+        'overlays': house_overlays(compact['planets'], compact['cusps']),
+        'composite': composite_positions(compact['planets'], compact['cusps']),
+    }
+
+
+def calculate_synastry(chart_a: Dict[str, Any], chart_b: Dict[str, Any], orb_scale: float = 1.0) -> Dict[str, Any]:
+    """Synastry report for two charts returned by compute_chart."""
+    batch = synastry_batch([chart_a, chart_b], orb_scale)
+    aspects: List[Dict[str, Any]] = []
+    for i, j in zip(*np.nonzero(batch['aspects'][0, 1] >= 0)):
+        name, _, _ = SYNASTRY_ASPECTS[batch['aspects'][0, 1, i, j]]
+        aspects.append({
+            'a': SYNASTRY_BODIES[i],
+            'b': SYNASTRY_BODIES[j],
+            'aspect': name,
+            'orb': round(float(batch['orb'][0, 1, i, j]), 2),
+        })
+    aspects.sort(key=lambda aspect: aspect['orb'])
+
+    def overlay(a, b):
+        return {body: int(batch['overlays'][a, b, i]) for i, body in enumerate(SYNASTRY_BODIES)}
+
+    composite_planets = batch['composite']['planets'][0, 1]
+    composite_cusps = batch['composite']['cusps'][0, 1]
+    return {
+        'aspects': aspects,
+        'a_in_b_houses': overlay(0, 1),
+        'b_in_a_houses': overlay(1, 0),
+        'composite': {
+            'ascendant': round(float(composite_cusps[0]), 6),
+            'houses': {str(h + 1): round(float(composite_cusps[h]), 6) for h in range(12)},
+            'planets': {body: {'longitude': round(float(lon), 6), 'sign': ZODIAC_SIGNS[_sign_index(lon)]}
+                        for body, lon in zip(SYNASTRY_BODIES, composite_planets)},
+        },
+    }
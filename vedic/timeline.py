@@ -0,0 +1,225 @@
+"""Lifetime transit timelines (Sade Sati, slow-planet returns) built on a shared ingress table."""
+
+from bisect import bisect_right
+from datetime import datetime, timezone
+from typing import Dict, Any, List, Optional, Tuple
+import threading
+import swisseph as swe
+
+from .core import (
+    ZODIAC_SIGNS, _ayanamsa_mode, _choose_iflag, _degnorm, _sign_index, _julday, _jd_to_datetime
+)
+
+# Span covered by the shared ingress table
+INGRESS_TABLE_START_YEAR = 1900
+INGRESS_TABLE_END_YEAR = 2100
+
+# Slow bodies tracked in the ingress table with their scan step in days. The step must be
+# shorter than the quickest sign round-trip a body can make near a station.
+SLOW_PLANETS = {
+    'Saturn': (swe.SATURN, 4.0),
+    'Jupiter': (swe.JUPITER, 2.0),
+    'Rahu': (None, 1.0),  # Node code depends on node_type
+}
+
+# Mean sidereal periods in days: sign stays of one body closer together than half of this
+# are retrograde re-entries of the same return
+RETURN_PERIOD_DAYS = {'Saturn': 10759.2, 'Jupiter': 4332.6, 'Rahu': 6793.5}
+
+# Sade Sati phases keyed by Saturn's sign offset from the natal Moon sign
+SADE_SATI_PHASES = {11: 'Rising', 0: 'Peak', 1: 'Setting'}
+
+_INGRESS_CACHE: Dict[Tuple[int, str], Dict[str, Dict[str, list]]] = {}
+_INGRESS_LOCK = threading.Lock()
+
+
+def _body_sign(jd_ut: float, ipl: int, iflag: int) -> int:
+    xx, _ = swe.calc_ut(jd_ut, ipl, iflag)
+    return _sign_index(xx[0])
+
+
+def _refine_ingress(jd_lo: float, jd_hi: float, sign_lo: int, ipl: int, iflag: int,
+                    tolerance_days: float = 1e-5) -> Tuple[float, int]:
+    """Bisect a scan step that contains a sign change down to about a second."""
+    sign_hi = _body_sign(jd_hi, ipl, iflag)
+    while jd_hi - jd_lo > tolerance_days:
+        jd_mid = 0.5 * (jd_lo + jd_hi)
+        sign_mid = _body_sign(jd_mid, ipl, iflag)
+        if sign_mid == sign_lo:
+            jd_lo = jd_mid
+        else:
+            jd_hi, sign_hi = jd_mid, sign_mid
+    return jd_hi, sign_hi
+
+
+def _scan_ingresses(ipl: int, step_days: float, jd_start: float, jd_end: float, iflag: int) -> Dict[str, list]:
+    """Scan a body from jd_start to jd_end and record every sign ingress."""
+    jds = [jd_start]
+    signs = [_body_sign(jd_start, ipl, iflag)]
+
+    jd_prev, sign_prev = jd_start, signs[0]
+    jd = jd_start + step_days
+    while jd <= jd_end:
+        sign = _body_sign(jd, ipl, iflag)
+        if sign != sign_prev:
+            jd_ingress, sign_entered = _refine_ingress(jd_prev, jd, sign_prev, ipl, iflag)
+            jds.append(jd_ingress)
+            signs.append(sign_entered)
+        jd_prev, sign_prev = jd, sign
+        jd += step_days
+
+    return {'jd': jds, 'sign': signs}
+
+
+def get_ingress_table(ayanamsa: str = 'lahiri', node_type: str = 'mean') -> Dict[str, Dict[str, list]]:
+    """Return the shared slow-planet ingress table, building it on first use.
+
+    The table covers 1900-2100 and is cached per (ayanamsa, node type). For each of
+    Saturn, Jupiter and Rahu it holds parallel lists ``jd`` and ``sign``: the body is in
+    ``sign[i]`` from ``jd[i]`` until ``jd[i + 1]``. The first entry is the sign occupied at
+    the start of the table rather than an ingress.
+    """
+    sid_mode = _ayanamsa_mode(ayanamsa)
+    node = 'mean' if (node_type or 'mean').lower() in ('mean', 'm') else 'true'
+    key = (sid_mode, node)
+
+    table = _INGRESS_CACHE.get(key)
+    if table is not None:
+        return table
+
+    with _INGRESS_LOCK:
+        table = _INGRESS_CACHE.get(key)
+        if table is not None:
+            return table
+
+        swe.set_sid_mode(sid_mode)
+        iflag = _choose_iflag(None)
+        jd_start = swe.julday(INGRESS_TABLE_START_YEAR, 1, 1, 0.0)
+        jd_end = swe.julday(INGRESS_TABLE_END_YEAR, 12, 31, 24.0)
+
+        table = {}
+        for name, (ipl, step_days) in SLOW_PLANETS.items():
+            if name == 'Rahu':
+                ipl = swe.MEAN_NODE if node == 'mean' else swe.TRUE_NODE
+            table[name] = _scan_ingresses(ipl, step_days, jd_start, jd_end, iflag)
+
+        _INGRESS_CACHE[key] = table
+        return table
+
+
+def _sign_intervals(ingresses: Dict[str, list], jd_from: float, jd_to: float) -> List[Tuple[float, float, int]]:
+    """Slice an ingress series into (start, end, sign) intervals covering [jd_from, jd_to)."""
+    jds, signs = ingresses['jd'], ingresses['sign']
+    i = max(bisect_right(jds, jd_from) - 1, 0)
+    intervals = []
+    while i < len(jds) and jds[i] < jd_to:
+        start = max(jds[i], jd_from)
+        end = jds[i + 1] if i + 1 < len(jds) else jd_to
+        intervals.append((start, min(end, jd_to), signs[i]))
+        i += 1
+    return intervals
+
+
+def _iso(jd_ut: float) -> str:
+    return _jd_to_datetime(jd_ut).isoformat()
+
+
+def _periods_in_signs(intervals: List[Tuple[float, float, int]], signs: set) -> List[List[Tuple[float, float, int]]]:
+    """Group consecutive intervals whose sign is in ``signs`` into uninterrupted runs."""
+    runs, current = [], []
+    for interval in intervals:
+        if interval[2] in signs:
+            current.append(interval)
+        elif current:
+            runs.append(current)
+            current = []
+    if current:
+        runs.append(current)
+    return runs
+
+
+def _format_period(run: List[Tuple[float, float, int]], jd_to: float) -> Dict[str, Any]:
+    start, end = run[0][0], run[-1][1]
+    return {
+        'start': _iso(start),
+        'end': _iso(end),
+        'duration_days': round(end - start, 2),
+        'ongoing_at_span_end': end >= jd_to,
+    }
+
+
+def compute_transit_timeline(chart: Dict[str, Any], span_years: float = 100.0,
+                             start: Optional[datetime] = None) -> Dict[str, Any]:
+    """Derive a lifetime slow-transit timeline for a chart returned by compute_chart.
+
+    Reports Sade Sati (Saturn in the 12th, 1st and 2nd signs from the natal Moon) with its
+    phases, Ashtama Shani (Saturn in the 8th from the Moon) and the Saturn, Jupiter and Rahu
+    returns to their natal signs. A return runs from the first ingress to the final egress,
+    retrograde re-entries included, and the natal occupancy at birth is not a return. Everything is looked up in the shared ingress table, so no
+    ephemeris calls are made per chart once the table exists. The span runs from birth (or
+    ``start``) and is clipped to the table range.
+    """
+    meta = chart.get('meta', {})
+    ayanamsa = meta.get('ayanamsa', 'lahiri')
+    node_type = chart.get('birth_info', {}).get('node_type', 'mean')
+    table = get_ingress_table(ayanamsa, node_type)
+
+    if start is None:
+        jd_from = meta['jd_ut']
+    else:
+        start_utc = start.astimezone(timezone.utc) if start.tzinfo else start.replace(tzinfo=timezone.utc)
+        jd_from = _julday(start_utc)
+    table_start = table['Saturn']['jd'][0]
+    table_end = swe.julday(INGRESS_TABLE_END_YEAR, 12, 31, 24.0)
+    jd_from = max(jd_from, table_start)
+    jd_to = min(jd_from + span_years * 365.2425, table_end)
+
+    natal = {name: _degnorm(data['longitude']) for name, data in chart['planets'].items()}
+    moon_sign = _sign_index(natal['Moon'])
+
+    saturn = _sign_intervals(table['Saturn'], jd_from, jd_to)
+    jupiter = _sign_intervals(table['Jupiter'], jd_from, jd_to)
+    rahu = _sign_intervals(table['Rahu'], jd_from, jd_to)
+
+    # Sade Sati: one entry per uninterrupted stay of Saturn in the three-sign window
+    sade_sati_signs = {(moon_sign + offset) % 12 for offset in SADE_SATI_PHASES}
+    sade_sati = []
+    for run in _periods_in_signs(saturn, sade_sati_signs):
+        period = _format_period(run, jd_to)
+        period['phases'] = [{
+            'phase': SADE_SATI_PHASES[(sign - moon_sign) % 12],
+            'sign': ZODIAC_SIGNS[sign],
+            'start': _iso(s),
+            'end': _iso(e),
+        } for s, e, sign in run]
+        sade_sati.append(period)
+
+    ashtama_shani = [_format_period(run, jd_to)
+                     for run in _periods_in_signs(saturn, {(moon_sign + 7) % 12})]
+
+    def returns(intervals, planet):
+        natal_sign = _sign_index(natal[planet])
+        merged = []
+        for run in _periods_in_signs(intervals, {natal_sign}):
+            if merged and run[0][0] - merged[-1][-1][1] < 0.5 * RETURN_PERIOD_DAYS[planet]:
+                merged[-1] = merged[-1] + run
+            else:
+                merged.append(run)
+        periods = []
+        for run in merged:
+            if run[0][0] == meta['jd_ut']:
+                continue  # the body still in its natal sign at birth
+            period = _format_period(run, jd_to)
+            period['sign'] = ZODIAC_SIGNS[natal_sign]
+            periods.append(period)
+        return periods
+
+    return {
+        'span': {'start': _iso(jd_from), 'end': _iso(jd_to)},
+        'natal_moon_sign': ZODIAC_SIGNS[moon_sign],
+        'sade_sati': sade_sati,
+        'ashtama_shani': ashtama_shani,
+        'saturn_returns': returns(saturn, 'Saturn'),
+        'jupiter_returns': returns(jupiter, 'Jupiter'),
+        'rahu_returns': returns(rahu, 'Rahu'),
+    }
@@ -0,0 +1,379 @@
+"""Yoga detection from declarative rules compiled into shared NumPy predicates.
+
+Rules are nested tuples over a compact chart: the Rashi index of the nine bodies and of the
+Lagna, with house lordship taken from ``SIGN_RULERS`` on whole-sign houses. Bodies are named
+directly ('Jupiter', 'Lagna') or by lordship ('L9' is the lord of the 9th from the Lagna).
+Leaf predicates are:
+
+    ('from', ref, base, houses)   ref sits in one of ``houses`` counted from base's sign
+    ('house', ref, houses)        shorthand for ('from', ref, 'Lagna', houses)
+    ('dignity', ref, kind)        kind is 'exalted', 'debilitated', 'own' or 'own_or_exalted'
+    ('conjunct', a, b)            two different bodies in the same sign
+    ('exchange', a, b)            Parivartana: each in a sign ruled by the other; for two house
+                                  lords ('L1', 'L4'), each lord sits in the other's house
+    ('aspects', a, b)             a casts a sign-based Graha Drishti on b's sign
+    ('mutual_aspect', a, b)       both directions of 'aspects'
+    ('same', a, b)                a and b are the same body (one planet owns both houses)
+
+and they combine with ('all', ...), ('any', ...) and ('not', expr). ``compile_yoga_rules``
+turns a rule list into a flat program in which every distinct sub-expression, down to the
+sign of 'L5' or the offset between two bodies, is a single node evaluated once. The program
+is emitted as straight-line Python twice: over plain ints for one chart and over NumPy
+arrays for a batch.
+"""
+
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+
+from .core import MAITRI_PLANETS, SHADBALA_CONSTANTS, SIGN_RULERS, ZODIAC_SIGNS, _sign_index
+
+YOGA_BODIES = MAITRI_PLANETS + ['Rahu', 'Ketu', 'Lagna']
+_BODY_INDEX = {name: i for i, name in enumerate(YOGA_BODIES)}
+_LAGNA = _BODY_INDEX['Lagna']
+
+KENDRA = (1, 4, 7, 10)
+TRIKONA = (1, 5, 9)
+DUSTHANA = (6, 8, 12)
+UPACHAYA = (3, 6, 10, 11)
+
+_BENEFICS = ['Mercury', 'Jupiter', 'Venus']
+_MALEFICS = ['Sun', 'Mars', 'Saturn', 'Rahu', 'Ketu']
+_STAR_PLANETS = ['Mars', 'Mercury', 'Jupiter', 'Venus', 'Saturn']
+
+# Lord of each sign as a YOGA_BODIES index
+_SIGN_LORD = np.array([_BODY_INDEX[SIGN_RULERS[sign]] for sign in range(12)])
+
+
+def _dignity_tables() -> Dict[str, np.ndarray]:
+    tables = {kind: np.zeros((len(YOGA_BODIES), 12), dtype=bool) for kind in ('exalted', 'debilitated', 'own')}
+    for planet in MAITRI_PLANETS:
+        i = _BODY_INDEX[planet]
+        uchcha = SHADBALA_CONSTANTS['uchcha_bala_data'][planet]
+        tables['exalted'][i, int(uchcha['exaltation_degree'] // 30)] = True
+        tables['debilitated'][i, int(uchcha['debilitation_degree'] // 30)] = True
+        tables['own'][i, SHADBALA_CONSTANTS['own_signs'][planet]] = True
+    tables['own_or_exalted'] = tables['own'] | tables['exalted']
+    return tables
+
+
+DIGNITY_TABLES = _dignity_tables()
+
+# Sign-based Graha Drishti: row = aspecting body, column = sign offset of the aspected sign
+ASPECT_TABLE = np.zeros((len(YOGA_BODIES), 12), dtype=bool)
+ASPECT_TABLE[:_LAGNA, 6] = True
+for _planet, _houses in {'Mars': (4, 8), 'Jupiter': (5, 9), 'Saturn': (3, 10)}.items():
+    ASPECT_TABLE[_BODY_INDEX[_planet], [h - 1 for h in _houses]] = True
+
+
+def _house_pairs(houses: List[int]) -> List[Tuple[int, int]]:
+    return [(a, b) for i, a in enumerate(houses) for b in houses[i + 1:]]
+
+
+def _relation_rules(category: str, label: str, a: str, b: str) -> List[Dict[str, Any]]:
+    return [
+        {'name': f"{label} ({a}-{b} conjunction)", 'category': category, 'rule': ('conjunct', a, b)},
+        {'name': f"{label} ({a}-{b} exchange)", 'category': category, 'rule': ('exchange', a, b)},
+        {'name': f"{label} ({a}-{b} mutual aspect)", 'category': category, 'rule': ('mutual_aspect', a, b)},
+    ]
+
+
+def _default_rules() -> List[Dict[str, Any]]:
+    """The built-in rule catalogue (163 rules)."""
+    rules = []
+
+    for name, planet in [('Ruchaka', 'Mars'), ('Bhadra', 'Mercury'), ('Hamsa', 'Jupiter'),
+                         ('Malavya', 'Venus'), ('Sasa', 'Saturn')]:
+        rules.append({'name': name, 'category': 'Pancha Mahapurusha',
+                      'rule': ('all', ('house', planet, KENDRA), ('dignity', planet, 'own_or_exalted'))})
+
+    def any_from(planets, base, houses):
+        return ('any',) + tuple(('from', p, base, houses) for p in planets)
+
+    rules += [
+        {'name': 'Gajakesari', 'category': 'Chandra', 'rule': ('from', 'Jupiter', 'Moon', KENDRA)},
+        {'name': 'Sunapha', 'category': 'Chandra', 'rule': any_from(_STAR_PLANETS, 'Moon', (2,))},
+        {'name': 'Anapha', 'category': 'Chandra', 'rule': any_from(_STAR_PLANETS, 'Moon', (12,))},
+        {'name': 'Durudhara', 'category': 'Chandra',
+         'rule': ('all', any_from(_STAR_PLANETS, 'Moon', (2,)), any_from(_STAR_PLANETS, 'Moon', (12,)))},
+        {'name': 'Kemadruma', 'category': 'Chandra', 'rule': ('not', any_from(_STAR_PLANETS, 'Moon', (2, 12)))},
+        {'name': 'Chandra-Mangala', 'category': 'Chandra', 'rule': ('conjunct', 'Moon', 'Mars')},
+        {'name': 'Adhi', 'category': 'Chandra',
+         'rule': ('all',) + tuple(('from', p, 'Moon', (6, 7, 8)) for p in _BENEFICS)},
+        {'name': 'Shakata', 'category': 'Chandra', 'rule': ('from', 'Moon', 'Jupiter', DUSTHANA)},
+        {'name': 'Vasumati', 'category': 'Chandra',
+         'rule': ('all',) + tuple(('from', p, 'Moon', UPACHAYA) for p in _BENEFICS)},
+        {'name': 'Amala (from Moon)', 'category': 'Chandra', 'rule': any_from(_BENEFICS, 'Moon', (10,))},
+        {'name': 'Amala (from Lagna)', 'category': 'Lagna', 'rule': any_from(_BENEFICS, 'Lagna', (10,))},
+        {'name': 'Vesi', 'category': 'Surya', 'rule': any_from(_STAR_PLANETS, 'Sun', (2,))},
+        {'name': 'Vosi', 'category': 'Surya', 'rule': any_from(_STAR_PLANETS, 'Sun', (12,))},
+        {'name': 'Ubhayachari', 'category': 'Surya',
+         'rule': ('all', any_from(_STAR_PLANETS, 'Sun', (2,)), any_from(_STAR_PLANETS, 'Sun', (12,)))},
+        {'name': 'Budha-Aditya', 'category': 'Surya', 'rule': ('conjunct', 'Sun', 'Mercury')},
+        {'name': 'Guru-Mangala', 'category': 'Lagna', 'rule': ('conjunct', 'Jupiter', 'Mars')},
+        {'name': 'Lagnadhi', 'category': 'Lagna',
+         'rule': ('all',) + tuple(('from', p, 'Lagna', (6, 7, 8)) for p in _BENEFICS)},
+        {'name': 'Shubha Kartari', 'category': 'Lagna',
+         'rule': ('all', any_from(_BENEFICS, 'Lagna', (2,)), any_from(_BENEFICS, 'Lagna', (12,)))},
+        {'name': 'Papa Kartari', 'category': 'Lagna',
+         'rule': ('all', any_from(_MALEFICS, 'Lagna', (2,)), any_from(_MALEFICS, 'Lagna', (12,)))},
+        {'name': 'Chatussagara', 'category': 'Lagna',
+         'rule': ('all',) + tuple(any_from(YOGA_BODIES[:_LAGNA], 'Lagna', (k,)) for k in KENDRA)},
+        # Sign-based: every planet within the seven signs from Rahu, or from Ketu
+        {'name': 'Kala Sarpa', 'category': 'Lagna',
+         'rule': ('any',) + tuple(('all',) + tuple(('from', p, node, tuple(range(1, 8))) for p in MAITRI_PLANETS)
+                                  for node in ('Rahu', 'Ketu'))},
+        {'name': 'Lakshmi', 'category': 'Dhana',
+         'rule': ('all', ('dignity', 'L9', 'own_or_exalted'), ('house', 'L9', KENDRA + (5, 9)),
+                  ('house', 'L1', KENDRA + (5, 9)))},
+    ]
+
+    # Neecha Bhanga: debilitated planet with the lord of its debilitation or exaltation sign
+    # in a kendra from the Lagna or the Moon
+    for planet in MAITRI_PLANETS:
+        uchcha = SHADBALA_CONSTANTS['uchcha_bala_data'][planet]
+        cancellers = {SIGN_RULERS[int(uchcha['debilitation_degree'] // 30)],
+                      SIGN_RULERS[int(uchcha['exaltation_degree'] // 30)]}
+        rules.append({'name': f"Neecha Bhanga ({planet})", 'category': 'Neecha Bhanga',
+                      'rule': ('all', ('dignity', planet, 'debilitated'),
+                               ('any',) + tuple(('from', lord, base, KENDRA)
+                                                for lord in sorted(cancellers) for base in ('Lagna', 'Moon')))})
+
+    for name, house in [('Harsha', 6), ('Sarala', 8), ('Vimala', 12)]:
+        rules.append({'name': f"Vipareeta Raja ({name})", 'category': 'Vipareeta Raja',
+                      'rule': ('house', f"L{house}", DUSTHANA)})
+
+    for kendra in (4, 7, 10):
+        for trikona in (5, 9):
+            rules.append({'name': f"Yogakaraka (L{kendra}-L{trikona})", 'category': 'Raja',
+                          'rule': ('same', f"L{kendra}", f"L{trikona}")})
+
+    for kendra in KENDRA:
+        for trikona in (5, 9):
+            label = 'Dharma-Karmadhipati' if (kendra, trikona) == (10, 9) else 'Raja'
+            rules += _relation_rules('Raja', label, f"L{kendra}", f"L{trikona}")
+
+    for a, b in _house_pairs([1, 2, 5, 9, 11]):
+        rules += _relation_rules('Dhana', 'Dhana', f"L{a}", f"L{b}")
+
+    for a, b in _house_pairs(list(range(1, 13))):
+        if a in DUSTHANA or b in DUSTHANA:
+            kind = 'Dainya'
+        elif a == 3 or b == 3:
+            kind = 'Khala'
+        else:
+            kind = 'Maha'
+        rules.append({'name': f"{kind} Parivartana (L{a}-L{b})", 'category': 'Parivartana',
+                      'rule': ('exchange', f"L{a}", f"L{b}")})
+
+    return rules
+
+
+YOGA_RULES = _default_rules()
+
+
+class YogaEngine:
+    """Compiled form of a yoga rule list: a flat program of unique nodes evaluated in order."""
+
+    def __init__(self, rules: Optional[List[Dict[str, Any]]] = None):
+        self.rules = YOGA_RULES if rules is None else rules
+        self.names = [rule['name'] for rule in self.rules]
+        self._nodes: List[tuple] = []
+        self._index: Dict[tuple, int] = {}
+        self._outputs = [self._compile(rule['rule']) for rule in self.rules]
+        self._scalar_program = None
+        self._vector_program = None
+
+    @property
+    def node_count(self) -> int:
+        return len(self._nodes)
+
+    # Compilation: every node key is canonical, so equal sub-expressions share one slot
+    def _node(self, key: tuple) -> int:
+        slot = self._index.get(key)
+        if slot is None:
+            slot = len(self._nodes)
+            self._nodes.append(key)
+            self._index[key] = slot
+        return slot
+
+    def _who(self, ref: str) -> int:
+        if ref in _BODY_INDEX:
+            return self._node(('body', _BODY_INDEX[ref]))
+        if ref[:1] == 'L' and ref[1:].isdigit() and 1 <= int(ref[1:]) <= 12:
+            return self._node(('lord', int(ref[1:])))
+        raise ValueError(f"Unknown yoga reference: {ref}")
+
+    def _sign(self, ref: str) -> int:
+        return self._node(('sign', self._who(ref)))
+
+    def _offset(self, ref: str, base: str) -> int:
+        return self._node(('offset', self._sign(ref), self._sign(base)))
+
+    @staticmethod
+    def _lord_house(ref: str) -> Optional[int]:
+        if ref not in _BODY_INDEX and ref[:1] == 'L' and ref[1:].isdigit():
+            return int(ref[1:])
+        return None
+
+    def _compile(self, expr: tuple) -> int:
+        op, args = expr[0], expr[1:]
+        if op in ('all', 'any'):
+            children = [self._compile(child) for child in args]
+            if len(children) == 1:
+                return children[0]
+            return self._node((op, tuple(sorted(set(children)))))
+        if op == 'not':
+            return self._node(('not', self._compile(args[0])))
+        if op == 'house':
+            return self._compile(('from', args[0], 'Lagna', args[1]))
+        if op == 'from':
+            ref, base, houses = args
+            mask = np.zeros(12, dtype=bool)
+            mask[[h - 1 for h in houses]] = True
+            return self._node(('in_houses', self._offset(ref, base), tuple(mask)))
+        if op == 'dignity':
+            ref, kind = args
+            if kind not in DIGNITY_TABLES:
+                raise ValueError(f"Unknown dignity: {kind}")
+            return self._node(('dignity', self._who(ref), self._sign(ref), kind))
+        if op == 'exchange' and None not in map(self._lord_house, args):
+            # Lord of house a in house b and vice versa: a Mars-Moon exchange with Aries Lagna
+            # is L1-L4 only, although Mars also lords the 8th
+            a, b = args
+            return self._compile(('all', ('house', a, (self._lord_house(b),)),
+                                  ('house', b, (self._lord_house(a),))))
+        if op in ('conjunct', 'exchange', 'mutual_aspect', 'same'):
+            a, b = sorted(args)  # symmetric relations
+            if op == 'mutual_aspect':
+                return self._node(('all', tuple(sorted({self._compile(('aspects', a, b)),
+                                                        self._compile(('aspects', b, a))}))))
+            differ = self._node(('differ', *sorted((self._who(a), self._who(b)))))
+            if op == 'same':
+                return self._node(('not', differ))
+            if op == 'conjunct':
+                same_sign = self._node(('equal', *sorted((self._sign(a), self._sign(b)))))
+                return self._node(('all', tuple(sorted((same_sign, differ)))))
+            owns_a = self._node(('rules', self._who(b), self._sign(a)))
+            owns_b = self._node(('rules', self._who(a), self._sign(b)))
+            return self._node(('all', tuple(sorted((owns_a, owns_b, differ)))))
+        if op == 'aspects':
+            a, b = args
+            return self._node(('aspect', self._who(a), self._offset(b, a)))
+        raise ValueError(f"Unknown yoga operator: {op}")
+
+    # Code generation: the node list becomes straight-line Python, once for plain ints (one
+    # chart) and once for NumPy arrays (a batch); both share the node numbering
+    def _source(self, vector: bool) -> str:
+        lines = []
+        for slot, node in enumerate(self._nodes):
+            op, args = node[0], node[1:]
+            v = [f"v{a}" for a in args if isinstance(a, int)]
+            if op == 'body':
+                expr = str(args[0])
+            elif op == 'lord':
+                expr = f"LORD[(lagna + {args[0] - 1}) % 12]"
+            elif op == 'sign':
+                who = self._nodes[args[0]]
+                if who[0] == 'body':
+                    expr = f"signs[:, {who[1]}]" if vector else f"signs[{who[1]}]"
+                else:
+                    expr = f"signs[rows, v{args[0]}]" if vector else f"signs[v{args[0]}]"
+            elif op == 'offset':
+                expr = f"({v[0]} - {v[1]}) % 12"
+            elif op == 'in_houses':
+                expr = f"HOUSES[{slot}][{v[0]}]"
+            elif op == 'dignity':
+                expr = (f"DIGNITY['{args[2]}'][v{args[0]}, v{args[1]}]" if vector
+                        else f"DIGNITY['{args[2]}'][v{args[0]}][v{args[1]}]")
+            elif op == 'differ':
+                expr = f"{v[0]} != {v[1]}"
+            elif op == 'equal':
+                expr = f"{v[0]} == {v[1]}"
+            elif op == 'rules':
+                expr = f"LORD[v{args[1]}] == v{args[0]}"
+            elif op == 'aspect':
+                expr = f"ASPECT[v{args[0]}, v{args[1]}]" if vector else f"ASPECT[v{args[0]}][v{args[1]}]"
+            elif op == 'not':
+                expr = f"{v[0]} ^ True"
+            else:  # 'all' / 'any'
+                joiner = ' & ' if op == 'all' else ' | '
+                expr = joiner.join(f"v{child}" for child in args[0])
+            lines.append(f"    v{slot} = {expr}")
+        outputs = ', '.join(f"v{slot}" for slot in self._outputs)
+        header = "def program(signs, lagna, rows):" if vector else "def program(signs, lagna):"
+        return '\n'.join([header] + lines + [f"    return ({outputs},)"])
+
+    def _build(self, vector: bool):
+        houses = {slot: node[2] for slot, node in enumerate(self._nodes) if node[0] == 'in_houses'}
+        if vector:
+            namespace = {'LORD': _SIGN_LORD, 'ASPECT': ASPECT_TABLE, 'DIGNITY': DIGNITY_TABLES,
+                         'HOUSES': {slot: np.array(mask) for slot, mask in houses.items()}}
+        else:
+            namespace = {'LORD': tuple(int(x) for x in _SIGN_LORD),
+                         'ASPECT': tuple(tuple(bool(x) for x in row) for row in ASPECT_TABLE),
+                         'DIGNITY': {kind: tuple(tuple(bool(x) for x in row) for row in table)
+                                     for kind, table in DIGNITY_TABLES.items()},
+                         'HOUSES': houses}
+        exec(compile(self._source(vector), '<yoga rules>', 'exec'), namespace)
+        return namespace['program']
+
+    def evaluate(self, body_signs, lagna_signs) -> np.ndarray:
+        """Boolean matrix (N, len(rules)) for body signs shaped (N, 9) and Lagna signs (N,).
+
+        Body columns follow YOGA_BODIES without the Lagna (seven planets, Rahu, Ketu).
+        """
+        if self._vector_program is None:
+            self._vector_program = self._build(vector=True)
+        lagna = np.atleast_1d(np.asarray(lagna_signs, dtype=np.int64))
+        signs = np.concatenate([np.atleast_2d(np.asarray(body_signs, dtype=np.int64)), lagna[:, None]], axis=1)
+        rows = np.arange(signs.shape[0])
+        outputs = self._vector_program(signs, lagna, rows)
+        return np.stack([np.broadcast_to(value, rows.shape) for value in outputs], axis=1)
+
+    def evaluate_one(self, body_signs: List[int], lagna_sign: int) -> Tuple[bool, ...]:
+        """Rule results for a single chart, computed on plain Python ints."""
+        if self._scalar_program is None:
+            self._scalar_program = self._build(vector=False)
+        return self._scalar_program(list(body_signs) + [lagna_sign], lagna_sign)
+
+    def detect(self, planets_sidereal: Dict[str, float], asc_sid: float) -> List[Dict[str, Any]]:
+        """Yogas present in one chart, in rule order."""
+        body_signs = [_sign_index(planets_sidereal[body]) for body in YOGA_BODIES[:_LAGNA]]
+        present = self.evaluate_one(body_signs, _sign_index(asc_sid))
+        return [{'name': rule['name'], 'category': rule['category']}
+                for rule, hit in zip(self.rules, present) if hit]
+
+
+_DEFAULT_ENGINE: Optional[YogaEngine] = None
+
+
+def compile_yoga_rules(rules: Optional[List[Dict[str, Any]]] = None) -> YogaEngine:
+    """Compile a rule list (default: YOGA_RULES, compiled once and reused)."""
+    global _DEFAULT_ENGINE
+    if rules is not None:
+        return YogaEngine(rules)
+    if _DEFAULT_ENGINE is None:
+        _DEFAULT_ENGINE = YogaEngine()
+    return _DEFAULT_ENGINE
+
+
+def detect_yogas(chart: Dict[str, Any], engine: Optional[YogaEngine] = None) -> Dict[str, Any]:
+    """Detect yogas in a chart returned by compute_chart."""
+    engine = engine or compile_yoga_rules()
+    planets = {name: data['longitude'] for name, data in chart['planets'].items()}
+    yogas = engine.detect(planets, chart['ascendant'])
+    return {
+        'lagna': ZODIAC_SIGNS[_sign_index(chart['ascendant'])],
+        'yogas': yogas,
+        'count': len(yogas),
+        'rules_checked': len(engine.rules),
+    }
+
+
+def detect_yogas_batch(body_longitudes, lagna_longitudes, engine: Optional[YogaEngine] = None) -> np.ndarray:
+    """Boolean matrix (N, rules) for longitudes shaped (N, 9) (YOGA_BODIES order) and (N,)."""
+    engine = engine or compile_yoga_rules()
+    body_signs = (np.mod(np.asarray(body_longitudes, dtype=np.float64), 360.0) // 30.0).astype(np.int64)
+    lagna_signs = (np.mod(np.asarray(lagna_longitudes, dtype=np.float64), 360.0) // 30.0).astype(np.int64)
+    return engine.evaluate(body_signs, lagna_signs)